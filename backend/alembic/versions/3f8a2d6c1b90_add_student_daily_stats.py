@@ -0,0 +1,102 @@
+"""add student_daily_stats rollup table
+
+Revision ID: 3f8a2d6c1b90
+Revises: 9c4d1e6f2a87
+Create Date: 2026-10-18 14:05:12.418230
+
+"""
+from collections import defaultdict
+from datetime import timedelta, timezone
+from typing import Sequence, Union
+from uuid import uuid4
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a2d6c1b90'
+down_revision: Union[str, None] = '9c4d1e6f2a87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _kst_date_str(dt) -> str:
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt + timedelta(hours=9)).date().isoformat()
+
+
+def upgrade() -> None:
+    daily_stats = op.create_table(
+        'student_daily_stats',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('student_id', sa.String(36), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True),
+        sa.Column('date', sa.String(10), nullable=False, comment='YYYY-MM-DD (KST)'),
+        sa.Column('tests_completed', sa.Integer(), nullable=False, server_default='0', comment='완료 테스트 수'),
+        sa.Column('questions_answered', sa.Integer(), nullable=False, server_default='0', comment='문제 수 (total_count 합)'),
+        sa.Column('correct_count', sa.Integer(), nullable=False, server_default='0', comment='정답 수'),
+        sa.Column('time_spent_seconds', sa.Integer(), nullable=False, server_default='0', comment='풀이 시간 합 (초)'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint('student_id', 'date', name='uix_student_daily_stat'),
+    )
+    op.create_index('ix_student_daily_stat_date', 'student_daily_stats', ['date', 'student_id'])
+
+    # 기존 완료 시도로 집계 채우기
+    attempts = sa.table(
+        'test_attempts',
+        sa.column('id', sa.String()),
+        sa.column('student_id', sa.String()),
+        sa.column('started_at', sa.DateTime(timezone=True)),
+        sa.column('completed_at', sa.DateTime(timezone=True)),
+        sa.column('total_count', sa.Integer()),
+        sa.column('correct_count', sa.Integer()),
+    )
+    logs = sa.table(
+        'answer_logs',
+        sa.column('attempt_id', sa.String()),
+        sa.column('time_spent_seconds', sa.Integer()),
+    )
+    time_spent = (
+        sa.select(sa.func.coalesce(sa.func.sum(logs.c.time_spent_seconds), 0))
+        .where(logs.c.attempt_id == attempts.c.id)
+        .scalar_subquery()
+    )
+    rows = op.get_bind().execute(
+        sa.select(
+            attempts.c.student_id,
+            attempts.c.started_at,
+            attempts.c.completed_at,
+            attempts.c.total_count,
+            attempts.c.correct_count,
+            time_spent.label('time_spent'),
+        ).where(attempts.c.completed_at.isnot(None))
+    ).all()
+
+    totals: dict[tuple[str, str], list[int]] = defaultdict(lambda: [0, 0, 0, 0])
+    for row in rows:
+        anchor = row.started_at or row.completed_at
+        t = totals[(row.student_id, _kst_date_str(anchor))]
+        t[0] += 1
+        t[1] += row.total_count or 0
+        t[2] += row.correct_count or 0
+        t[3] += int(row.time_spent or 0)
+
+    if totals:
+        op.bulk_insert(daily_stats, [
+            {
+                'id': str(uuid4()),
+                'student_id': student_id,
+                'date': day,
+                'tests_completed': t[0],
+                'questions_answered': t[1],
+                'correct_count': t[2],
+                'time_spent_seconds': t[3],
+            }
+            for (student_id, day), t in totals.items()
+        ])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_student_daily_stat_date', table_name='student_daily_stats')
+    op.drop_table('student_daily_stats')
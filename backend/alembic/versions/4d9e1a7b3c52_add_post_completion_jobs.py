@@ -0,0 +1,42 @@
+"""add post_completion_jobs table
+
+Revision ID: 4d9e1a7b3c52
+Revises: 7b2e9f4a6c13
+Create Date: 2026-10-18 21:05:12.418530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d9e1a7b3c52'
+down_revision: Union[str, None] = '7b2e9f4a6c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'post_completion_jobs',
+        sa.Column('attempt_id', sa.String(36), sa.ForeignKey('test_attempts.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('student_id', sa.String(36), nullable=False),
+        sa.Column('grade', sa.String(20), nullable=True),
+        sa.Column('status', sa.String(20), nullable=False, comment='pending / running / completed / failed'),
+        sa.Column('mission_counts', sa.JSON(), nullable=False, comment='미션 종류별 진행 수'),
+        sa.Column('steps_completed', sa.JSON(), nullable=False),
+        sa.Column('tries', sa.Integer(), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index('ix_post_completion_jobs_student_id', 'post_completion_jobs', ['student_id'])
+    op.create_index('ix_post_completion_jobs_status', 'post_completion_jobs', ['status'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_post_completion_jobs_status', table_name='post_completion_jobs')
+    op.drop_index('ix_post_completion_jobs_student_id', table_name='post_completion_jobs')
+    op.drop_table('post_completion_jobs')
@@ -0,0 +1,40 @@
+"""add ai_response_cache table
+
+Revision ID: 7b2e9f4a6c13
+Revises: 3f8a2d6c1b90
+Create Date: 2026-10-18 16:42:37.905114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e9f4a6c13'
+down_revision: Union[str, None] = '3f8a2d6c1b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ai_response_cache',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('cache_key', sa.String(64), nullable=False, comment='sha256 hex'),
+        sa.Column('kind', sa.String(20), nullable=False, comment='grade / feedback'),
+        sa.Column('question_id', sa.String(36), sa.ForeignKey('questions.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('payload', sa.JSON(), nullable=False, comment='AI 응답 결과'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint('cache_key', name='uq_ai_response_cache_key'),
+    )
+    op.create_index('ix_ai_response_cache_question_id', 'ai_response_cache', ['question_id'])
+    op.create_index('ix_ai_response_cache_expires_at', 'ai_response_cache', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ai_response_cache_expires_at', table_name='ai_response_cache')
+    op.drop_index('ix_ai_response_cache_question_id', table_name='ai_response_cache')
+    op.drop_table('ai_response_cache')
@@ -8,9 +8,11 @@ from uuid import uuid4
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text, select, func
+from sqlalchemy import bindparam, text, select, func
 
 from app.core.database import get_db, sync_engine
+from app.core.query_profiler import query_profiler
+from app.core.security import password_hasher
 from app.api.v1.auth import require_role
 from app.schemas.common import ApiResponse, PaginatedResponse, UserRole, ConceptMethod
 from app.schemas.auth import UserResponse, UpdateUserRequest
@@ -18,7 +20,13 @@ from app.models.user import User
 from app.services.auth_service import AuthService
 from app.models.question import Question
 from app.models.concept import Concept
+from app.services.ai_generation_scheduler import GenerationScheduler
+from app.services.ai_response_cache import ai_response_cache
 from app.services.ai_service import AIService
+from app.services.gemini_client import get_gemini_client
+from app.services.template_variant_pool import template_variant_pool
+from app.services.token_cache import token_cache
+from app.services.unlock_frontier import unlock_frontier
 from app.api.v1.questions import validate_options_no_duplicates
 
 logger = logging.getLogger(__name__)
@@ -156,11 +164,18 @@ async def update_user(
     if update_request.is_active is not None:
         user.is_active = update_request.is_active
     if update_request.password is not None:
-        auth_service = AuthService(db)
-        user.hashed_password = auth_service.hash_password(update_request.password)
+        user.hashed_password = await password_hasher.hash(update_request.password)
 
     await db.commit()
 
+    # 비밀번호/역할 변경, 비활성화 시 기존 로그인 세션 즉시 종료
+    if (
+        update_request.password is not None
+        or update_request.role is not None
+        or update_request.is_active is False
+    ):
+        await AuthService(db).revoke_all_user_tokens(user.id)
+
     return ApiResponse(
         success=True,
         data={
@@ -181,7 +196,7 @@ async def reset_student_data(
 ):
     """특정 학생의 학습 데이터만 초기화 (계정은 유지).
 
-    삭제: AnswerLog, TestAttempt, DailyTestRecord, ConceptMastery, ChapterProgress
+    삭제: AnswerLog, TestAttempt, DailyTestRecord, ConceptMastery, ChapterProgress, StudentDailyStat
     초기화: level=1, total_xp=0, streak=0
     """
     from app.models.test_attempt import TestAttempt
@@ -201,8 +216,10 @@ async def reset_student_data(
     attempt_ids = list((await db.scalars(attempt_ids_stmt)).all())
     if attempt_ids:
         await db.execute(
-            text("DELETE FROM answer_logs WHERE attempt_id IN :ids"),
-            {"ids": tuple(attempt_ids)},
+            text("DELETE FROM answer_logs WHERE attempt_id IN :ids").bindparams(
+                bindparam("ids", expanding=True)
+            ),
+            {"ids": attempt_ids},
         )
 
     # 2) TestAttempt
@@ -229,7 +246,13 @@ async def reset_student_data(
         {"sid": student_id},
     )
 
-    # 6) User 통계 초기화
+    # 6) 일별 집계(롤업) — 원시 SQL 삭제는 TestAttempt 이벤트로 차감되지 않음
+    await db.execute(
+        text("DELETE FROM student_daily_stats WHERE student_id = :sid"),
+        {"sid": student_id},
+    )
+
+    # 7) User 통계 초기화
     student.level = 1
     student.total_xp = 0
     student.current_streak = 0
@@ -237,6 +260,8 @@ async def reset_student_data(
     student.level_down_defense = 3
 
     await db.commit()
+    # 원시 SQL 삭제는 ORM 이벤트가 없으므로 해금 현황 캐시 직접 무효화
+    unlock_frontier.invalidate(student_id)
 
     logger.info(f"Student {student_id} ({student.name}) data reset by {current_user.name}")
     return ApiResponse(
@@ -377,7 +402,6 @@ async def update_chapter_data(
     import app.main as main_module
 
     # main.py의 동기 함수를 비동기 래핑 (전체 학년 매핑 + 일일테스트 정리 포함)
-    import asyncio
     loop = asyncio.get_event_loop()
     await loop.run_in_executor(None, main_module.update_chapter_concept_ids)
 
@@ -458,33 +482,45 @@ async def admin_generate_questions(
             "concept_method": request.concept_method
         })
 
-    all_generated: list[dict] = []
+    # 타스크별로 10개씩 배치를 나눠 병렬 생성 (배치마다 겹치지 않는 시퀀스 구간 배정)
+    BATCH_SIZE = 10
+    jobs = []
+    seq = 1
+
+    def _job(task: dict, batch_count: int, start_seq: int):
+        return lambda: _ai_service.generate_questions(
+            concept_name=concept_name,
+            concept_id=request.concept_id,
+            grade=grade,
+            category=task["category"],
+            part=part,
+            question_type=task["type"],
+            count=batch_count,
+            difficulty_min=task["diff_min"],
+            difficulty_max=task["diff_max"],
+            concept_method=task.get("concept_method"),
+            existing_contents=existing_contents,
+            id_prefix=f"ai-{request.concept_id.replace('concept-', '')}",
+            start_seq=start_seq,
+        )
 
     for task in generation_tasks:
-        # 각 타스크별로 배치 생성 (10개씩 끊어서 호출)
-        BATCH_SIZE = 10
         for i in range(0, task["count"], BATCH_SIZE):
             batch_count = min(BATCH_SIZE, task["count"] - i)
-            batch = await _ai_service.generate_questions(
-                concept_name=concept_name,
-                concept_id=request.concept_id,
-                grade=grade,
-                category=task["category"],
-                part=part,
-                question_type=task["type"],
-                count=batch_count,
-                difficulty_min=task["diff_min"],
-                difficulty_max=task["diff_max"],
-                concept_method=task.get("concept_method"),
-                existing_contents=existing_contents + [q["content"] for q in all_generated],
-                id_prefix=f"ai-{request.concept_id.replace('concept-', '')}",
-                start_seq=len(all_generated) + 1,
-            )
-            if batch:
-                all_generated.extend(batch)
-
-            # Rate limit 배려
-            await asyncio.sleep(0.5)
+            jobs.append(_job(task, batch_count, seq))
+            seq += batch_count
+
+    # 도착 순서대로 기존/생성분과 중복되는 문제 제외
+    seen_contents = {c.strip() for c in existing_contents if c}
+
+    def _accept(question: dict) -> bool:
+        content = str(question.get("content", "")).strip()
+        if content in seen_contents:
+            return False
+        seen_contents.add(content)
+        return True
+
+    all_generated = await GenerationScheduler().run(jobs, accept=_accept)
 
     if not all_generated:
         raise HTTPException(
@@ -696,3 +732,26 @@ async def get_concept_method_stats(
             "distribution": stats
         }
     )
+
+
+@router.get("/metrics", response_model=ApiResponse[dict])
+async def get_runtime_metrics(
+    current_user: UserResponse = Depends(
+        require_role(UserRole.MASTER, UserRole.ADMIN)
+    ),
+):
+    """런타임 지표 조회 (라우트별 쿼리 수/DB 시간, 캐시·풀 상태)."""
+    gemini_client = get_gemini_client()
+    return ApiResponse(
+        success=True,
+        data={
+            "query_profiling": query_profiler.enabled,
+            "routes": query_profiler.metrics(),
+            "gemini": gemini_client.metrics() if gemini_client else None,
+            "ai_response_cache": ai_response_cache.metrics(),
+            "password_hasher": password_hasher.metrics(),
+            "token_cache": token_cache.metrics(),
+            "template_variant_pool": template_variant_pool.metrics(),
+            "unlock_frontier": unlock_frontier.metrics(),
+        },
+    )
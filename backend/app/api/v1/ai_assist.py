@@ -2,8 +2,10 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.database import get_db
 from app.api.v1.auth import get_current_user, limiter
 from app.schemas.auth import UserResponse
 from app.services.ai_service import AIService
@@ -35,6 +37,7 @@ async def grade_fill_blank(
     request: Request,
     req: GradeRequest,
     current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """빈칸 채우기 답안을 유연하게 채점합니다. 표기 차이(3/4 vs 0.75)를 허용합니다."""
     result = await _ai_service.grade_fill_blank(
@@ -42,7 +45,9 @@ async def grade_fill_blank(
         correct_answer=req.correct_answer,
         student_answer=req.student_answer,
         accept_formats=req.accept_formats,
+        db=db,
     )
+    await db.commit()  # 캐시 저장분 반영
     if not result:
         return GradeResponse(
             is_correct=False,
@@ -75,6 +80,7 @@ async def generate_feedback(
     request: Request,
     req: FeedbackRequest,
     current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """학생의 오답에 대해 맞춤 피드백을 생성합니다."""
     if not settings.GEMINI_API_KEY:
@@ -89,7 +95,9 @@ async def generate_feedback(
         student_answer=req.student_answer,
         explanation=req.explanation,
         student_grade=req.student_grade,
+        db=db,
     )
+    await db.commit()  # 캐시 저장분 반영
     if not result:
         return FeedbackResponse(
             feedback=f"정답은 {req.correct_answer}입니다. {req.explanation}",
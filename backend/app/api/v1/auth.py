@@ -34,6 +34,7 @@ from app.schemas import (
 )
 from app.schemas.common import UserRole
 from app.services.auth_service import AuthService
+from app.services.token_cache import token_cache
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 security = HTTPBearer(auto_error=False)
@@ -54,7 +55,10 @@ def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
 ) -> UserResponse:
-    """현재 사용자 조회 (JWT 페이로드에서 직접 반환, DB 조회 없음)."""
+    """현재 사용자 조회 (JWT 페이로드에서 직접 반환, DB 조회 없음).
+
+    검증을 마친 토큰은 토큰 캐시에서 바로 반환한다.
+    """
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -67,8 +71,13 @@ async def get_current_user(
             },
         )
 
-    payload = _verify_jwt(credentials.credentials)
-    if not payload:
+    token = credentials.credentials
+    cached_user = token_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+
+    payload = _verify_jwt(token)
+    if not payload or token_cache.is_revoked(token, payload):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
@@ -83,7 +92,7 @@ async def get_current_user(
     # JWT 페이로드에 사용자 정보가 있으면 DB 조회 없이 반환
     try:
         now = datetime.now(timezone.utc)
-        return UserResponse(
+        user = UserResponse(
             id=payload["sub"],
             login_id=payload.get("login_id", ""),
             name=payload.get("name", ""),
@@ -108,6 +117,9 @@ async def get_current_user(
             },
         )
 
+    token_cache.put(token, user, payload)
+    return user
+
 
 def require_role(*roles: UserRole):
     """역할 권한 검증 의존성."""
@@ -200,8 +212,12 @@ async def refresh_token(
             },
         )
 
-    # 기존 토큰 검증
-    stored_token = await auth_service.get_refresh_token(refresh_token_cookie)
+    # 토큰 페이로드 검증 + 폐기 목록 확인 (폐기된 토큰은 DB 조회 없이 거부)
+    payload = auth_service.verify_token(refresh_token_cookie)
+    if payload and token_cache.is_revoked(refresh_token_cookie, payload):
+        payload = None
+    # 저장된 토큰 확인 (다른 워커에서 폐기된 경우)
+    stored_token = await auth_service.get_refresh_token(refresh_token_cookie) if payload else None
     if not stored_token:
         # 무효한 토큰이면 쿠키 삭제
         response.delete_cookie(key=REFRESH_TOKEN_COOKIE_NAME, path="/api/v1/auth")
@@ -216,25 +232,10 @@ async def refresh_token(
             },
         )
 
-    # 토큰 페이로드 검증
-    payload = auth_service.verify_token(refresh_token_cookie)
-    if not payload:
-        response.delete_cookie(key=REFRESH_TOKEN_COOKIE_NAME, path="/api/v1/auth")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INVALID_TOKEN",
-                    "message": "유효하지 않은 토큰입니다.",
-                },
-            },
-        )
-
     user_id = payload["sub"]
 
     # 기존 토큰 무효화
-    await auth_service.revoke_refresh_token(refresh_token_cookie)
+    await auth_service.revoke_refresh_token(refresh_token_cookie, stored=stored_token)
 
     # 새 토큰 발급 (사용자 정보 포함)
     user = await auth_service.get_user_by_id(user_id)
@@ -269,11 +270,14 @@ async def refresh_token(
 @router.post("/logout", response_model=ApiResponse[LogoutResponse])
 async def logout(
     response: Response,
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
     refresh_token_cookie: str | None = Cookie(default=None, alias=REFRESH_TOKEN_COOKIE_NAME),
     current_user: UserResponse = Depends(get_current_user),
     auth_service: AuthService = Depends(get_auth_service),
 ):
-    """로그아웃 (HttpOnly 쿠키에서 refresh token 읽기)."""
+    """로그아웃 (HttpOnly 쿠키에서 refresh token 읽기). 액세스 토큰도 즉시 폐기."""
+    auth_service.revoke_access_token(credentials.credentials)
+
     # 쿠키에서 refresh token이 있으면 무효화
     if refresh_token_cookie:
         await auth_service.revoke_refresh_token(refresh_token_cookie)
@@ -1,11 +1,9 @@
 """빠른 연습 API 엔드포인트."""
 
-import random
-from uuid import uuid4
-
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -14,20 +12,26 @@ from app.models.test import Test
 from app.models.test_attempt import TestAttempt
 from app.models.concept import Concept
 from app.schemas import ApiResponse, QuestionResponse, StartTestResponse, TestWithQuestionsResponse
-from app.schemas.common import Grade
+from app.schemas.common import Grade, QuestionCategory
 from app.api.v1.auth import get_current_user
 from app.schemas import UserResponse
+from app.services.adaptive_service import MAX_DIFFICULTY, MIN_DIFFICULTY, AdaptiveService
+from app.services.question_pool_index import question_pool_index
 from app.services.template_generator import TemplateGenerator
 
 router = APIRouter(prefix="/practice", tags=["practice"])
 
+PRACTICE_DEFAULT_COUNT = 10
+# (학년, 카테고리)별 공유 연습 풀 테스트 ID 접두사
+PRACTICE_TEST_PREFIX = "practice-"
+
 
 class PracticeStartRequest(BaseModel):
     """빠른 연습 시작 요청."""
 
     grade: Grade
-    category: str
-    count: int = Field(default=10, ge=5, le=30)
+    category: QuestionCategory
+    count: int = Field(default=PRACTICE_DEFAULT_COUNT, ge=5, le=30)
     starting_difficulty: int = Field(default=5, ge=1, le=10)
 
 
@@ -43,7 +47,7 @@ async def start_practice(
     current_user: UserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """빠른 연습 시작 - 동적 적응형 테스트 생성."""
+    """빠른 연습 시작 - 공유 연습 풀 기반 적응형 시도 생성."""
 
     # 1. 해당 학년의 개념 ID 조회
     concept_stmt = select(Concept.id).where(Concept.grade == request.grade)
@@ -61,21 +65,18 @@ async def start_practice(
             },
         )
 
-    # 2. 해당 카테고리의 문제 조회
-    q_stmt = (
-        select(Question)
-        .where(
-            Question.concept_id.in_(concept_ids),
-            Question.category == request.category,
-            Question.is_active == True,  # noqa: E712
-        )
-    )
-    all_questions = list((await db.scalars(q_stmt)).all())
+    # 2. 해당 카테고리의 문제 수 (풀 인덱스의 난이도 뷰, 본문 미조회)
+    category = request.category.value
+    pool_test_id = f"{PRACTICE_TEST_PREFIX}{request.grade.value}-{category}"
+    await question_pool_index.ensure_loaded(db, concept_ids)
+    pool_size = sum(map(len, _pool_buckets(pool_test_id, concept_ids, category)))
 
     # 2-1. 시드 문제가 부족하면 템플릿으로 보충
-    if len(all_questions) < request.count and request.category == "computation":
+    if pool_size < request.count and request.category == QuestionCategory.COMPUTATION:
         tpl_gen = TemplateGenerator()
-        existing_ids = {q.id for q in all_questions}
+        existing_ids = {
+            qid for bucket in _pool_buckets(pool_test_id, concept_ids, category) for qid in bucket
+        }
         for cid in concept_ids:
             if not tpl_gen.has_templates(cid):
                 continue
@@ -85,11 +86,11 @@ async def start_practice(
                     new_q = Question(**{k: v for k, v in q_dict.items() if k != "is_active"})
                     db.add(new_q)
                     existing_ids.add(q_dict["id"])
-        await db.flush()
-        # 재조회
-        all_questions = list((await db.scalars(q_stmt)).all())
+        await db.commit()
+        # 재조회 (저장된 문제는 커밋 시 ORM 이벤트로 인덱스에 반영됨)
+        pool_size = sum(map(len, _pool_buckets(pool_test_id, concept_ids, category)))
 
-    if not all_questions:
+    if not pool_size:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -101,26 +102,12 @@ async def start_practice(
             },
         )
 
-    # 3. 동적 테스트 생성
-    category_label = "연산" if request.category == "computation" else "개념"
-    practice_test = Test(
-        id=f"practice-{uuid4().hex[:12]}",
-        title=f"{category_label} 빠른 연습 (Lv.{request.starting_difficulty})",
-        description="빠른 연습 모드 - 적응형",
-        grade=request.grade,
-        concept_ids=concept_ids,
-        question_ids=[q.id for q in all_questions],
-        question_count=request.count,
-        time_limit_minutes=None,
-        is_adaptive=True,
-        is_active=True,
-    )
-    db.add(practice_test)
-    await db.flush()
+    # 3. (학년, 카테고리)별 공유 연습 풀 테스트 (문제가 있을 때만 생성, 문제 목록은 저장하지 않음)
+    practice_test = await _get_or_create_pool_test(db, request, pool_test_id, concept_ids)
 
-    # 4. 시작 난이도에 가장 가까운 첫 문제 선택
-    first_question = _select_closest_question(
-        all_questions, request.starting_difficulty, exclude_ids=[]
+    # 4. 시작 난이도에 가장 가까운 첫 문제 선택 (난이도별 풀 인덱스)
+    first_question = await AdaptiveService(db).select_question_at(
+        practice_test, request.starting_difficulty
     )
     if not first_question:
         await db.rollback()
@@ -135,7 +122,7 @@ async def start_practice(
             },
         )
 
-    # 5. TestAttempt 생성
+    # 5. TestAttempt 생성 (출제한 문제 ID만 attempt에 기록)
     attempt = TestAttempt(
         test_id=practice_test.id,
         student_id=current_user.id,
@@ -145,6 +132,7 @@ async def start_practice(
         initial_difficulty=request.starting_difficulty,
         current_difficulty=request.starting_difficulty,
         adaptive_question_ids=[first_question.id],
+        adaptive_recent_results=[],
     )
     db.add(attempt)
     await db.commit()
@@ -153,18 +141,44 @@ async def start_practice(
     return ApiResponse(data=PracticeStartData(attempt_id=attempt.id))
 
 
-def _select_closest_question(
-    questions: list[Question], target: int, exclude_ids: list[str]
-) -> Question | None:
-    """target 난이도에 가장 가까운 문제 선택."""
-    for spread in range(10):
-        candidates = []
-        for diff in [target + spread, target - spread]:
-            if diff < 1 or diff > 10:
-                continue
-            for q in questions:
-                if q.difficulty == diff and q.id not in exclude_ids:
-                    candidates.append(q)
-        if candidates:
-            return random.choice(candidates)
-    return None
+def _pool_buckets(pool_test_id: str, concept_ids: list[str], category: str) -> list[list[str]]:
+    """연습 풀의 난이도별 활성 문제 ID (풀 테스트 단위 난이도 뷰 캐시 재사용)."""
+    return [
+        question_pool_index.get_pool(concept_ids, diff, test_key=pool_test_id, category=category)
+        for diff in range(MIN_DIFFICULTY, MAX_DIFFICULTY + 1)
+    ]
+
+
+async def _get_or_create_pool_test(
+    db: AsyncSession, request: PracticeStartRequest, pool_test_id: str, concept_ids: list[str]
+) -> Test:
+    """(학년, 카테고리)별 공유 연습 풀 테스트 조회/생성 (학년 개념 구성이 바뀌면 갱신)."""
+    test = await db.get(Test, pool_test_id)
+    if test is not None:
+        if set(test.concept_ids or []) != set(concept_ids):
+            test.concept_ids = concept_ids
+        return test
+
+    category_label = "연산" if request.category == QuestionCategory.COMPUTATION else "개념"
+    test = Test(
+        id=pool_test_id,
+        title=f"{category_label} 빠른 연습",
+        description="빠른 연습 모드 - 적응형",
+        grade=request.grade,
+        category=request.category.value,
+        concept_ids=concept_ids,
+        question_ids=[],
+        question_count=PRACTICE_DEFAULT_COUNT,
+        time_limit_minutes=None,
+        is_adaptive=True,
+        adaptive_pool_config={"category": request.category.value},
+        is_active=True,
+    )
+    try:
+        db.add(test)
+        await db.commit()
+    except IntegrityError:
+        # 동시 요청으로 이미 생성됨 → 재조회
+        await db.rollback()
+        test = await db.get(Test, pool_test_id)
+    return test
@@ -30,6 +30,11 @@ class BulkActionRequest(BaseModel):
     action: str = Field(..., description="reset_password, change_class, delete")
     payload: dict | None = None
 
+
+class BulkCreateStudentsRequest(BaseModel):
+    """학생 일괄 생성 요청."""
+    students: list[RegisterStudentRequest] = Field(..., min_length=1, max_length=200)
+
 router = APIRouter(prefix="/students", tags=["students"])
 
 
@@ -151,6 +156,28 @@ async def create_student(
     return ApiResponse(data=UserResponse.model_validate(student))
 
 
+@router.post(
+    "/bulk",
+    response_model=ApiResponse[dict],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_students_bulk(
+    request: BulkCreateStudentsRequest,
+    current_user: UserResponse = Depends(require_role(UserRole.TEACHER, UserRole.ADMIN, UserRole.MASTER)),
+    student_service: StudentService = Depends(get_student_service),
+):
+    """학생 일괄 생성 (강사/관리자 전용). 중복 아이디는 건너뛰고 실패 목록으로 반환."""
+    students, failed = await student_service.create_students_bulk(request.students)
+
+    return ApiResponse(
+        data={
+            "created": [UserResponse.model_validate(s).model_dump(mode="json") for s in students],
+            "failed": failed,
+            "message": f"{len(students)}명 생성, {len(failed)}명 실패",
+        }
+    )
+
+
 @router.patch("/{student_id}", response_model=ApiResponse[UserResponse])
 async def update_student(
     student_id: str,
@@ -3,19 +3,25 @@
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, session_factory_for
+from app.models.answer_log import AnswerLog
+from app.models.post_completion_job import PostCompletionJob
 from app.models.question import Question
 from app.schemas import (
     ApiResponse,
     AvailableTestResponse,
+    BatchSubmitAnswerItem,
+    BatchSubmitAnswerRequest,
+    BatchSubmitAnswerResponse,
     CompleteTestResponse,
     GetAttemptResponse,
     Grade,
     NextQuestionResponse,
     PaginatedResponse,
+    PostCompletionStatusResponse,
     QuestionResponse,
     QuestionWithAnswer,
     ReviewResponse,
@@ -37,6 +43,7 @@ from app.services.adaptive_service import AdaptiveService
 from app.services.ai_service import AIService
 from app.services.review_service import ReviewService
 from app.api.v1.auth import get_current_user, require_role
+from app.api.v1.practice import PRACTICE_TEST_PREFIX
 
 router = APIRouter(prefix="/tests", tags=["tests"])
 
@@ -416,6 +423,8 @@ async def start_test(
         attempt.initial_difficulty = initial_diff
         attempt.current_difficulty = initial_diff
         attempt.adaptive_question_ids = [first_question.id]
+        attempt.adaptive_recent_results = []
+        attempt.ability_state = adaptive_service.initial_engine_state(test, initial_diff)
         attempt.max_score = first_question.points  # 첫 문제 점수로 시작
         await db.commit()
 
@@ -659,6 +668,8 @@ async def submit_answer(
             correct_answer=question.correct_answer,
             student_answer=request.selected_answer,
             accept_formats=None,
+            question_id=question.id,
+            db=db,
         )
         if ai_grade and ai_grade["is_correct"] and ai_grade.get("confidence", 0) >= 0.8:
             # AI가 정답으로 판정 → DB 보정
@@ -677,6 +688,8 @@ async def submit_answer(
             student_answer=request.selected_answer,
             explanation=question.explanation or "",
             student_grade=current_user.grade.value if current_user.grade else "",
+            question_id=question.id,
+            db=db,
         )
         if fb:
             result["error_type"] = fb.get("error_type", "")
@@ -699,6 +712,114 @@ async def submit_answer(
     return ApiResponse(data=SubmitAnswerResponse(**result))
 
 
+@router.post(
+    "/attempts/{attempt_id}/submit-batch",
+    response_model=ApiResponse[BatchSubmitAnswerResponse],
+)
+async def submit_answers_batch(
+    attempt_id: str,
+    request: BatchSubmitAnswerRequest,
+    current_user: UserResponse = Depends(get_current_user),
+    test_service: TestService = Depends(get_test_service),
+    grading_service: GradingService = Depends(get_grading_service),
+    db: AsyncSession = Depends(get_db),
+):
+    """답안 일괄 제출 (오프라인 버퍼 재전송).
+
+    제출 순서대로 한 트랜잭션에서 채점한다. 이미 제출한 문제는 건너뛰므로
+    같은 버퍼를 다시 보내도 안전하다. AI 유연 채점/피드백은 적용하지 않는다.
+    """
+    attempt = await test_service.get_attempt_by_id(attempt_id)
+    if not attempt:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "NOT_FOUND",
+                    "message": "시도를 찾을 수 없습니다.",
+                },
+            },
+        )
+
+    if attempt.student_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "FORBIDDEN",
+                    "message": "접근 권한이 없습니다.",
+                },
+            },
+        )
+
+    if attempt.completed_at:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "ALREADY_COMPLETED",
+                    "message": "이미 완료된 테스트입니다.",
+                },
+            },
+        )
+
+    is_daily_test = attempt.test_id.startswith("daily-")
+    outcomes = await grading_service.submit_answers_batch(
+        attempt=attempt,
+        answers=[answer.model_dump() for answer in request.answers],
+        is_daily_test=is_daily_test,
+    )
+
+    # ── 오답 간격 반복 학습 훅 (기존 복습 기록 일괄 조회) ──
+    graded = [o for o in outcomes if o["status"] == "graded"]
+    try:
+        review_svc = ReviewService(db)
+        await review_svc.register_results(
+            current_user.id,
+            [(o["question_id"], o["result"]["is_correct"]) for o in graded],
+        )
+        await db.commit()
+    except Exception:
+        pass  # 복습 스케줄링 실패해도 채점 결과에 영향 없음
+
+    next_difficulty = None
+    if attempt.is_adaptive:
+        next_difficulty = await AdaptiveService(db).peek_next_difficulty(attempt)
+
+    items = []
+    for o in outcomes:
+        result = None
+        if o["result"] is not None:
+            result = SubmitAnswerResponse(**o["result"])
+        items.append(BatchSubmitAnswerItem(
+            question_id=o["question_id"], status=o["status"], result=result,
+        ))
+
+    if graded:
+        # 마지막 채점 결과가 이미 남은 문제 수를 담고 있음
+        questions_remaining = graded[-1]["result"]["questions_remaining"]
+    else:
+        # 모두 중복/미존재 → 채점 결과가 없으므로 제출 수만 조회
+        answered = await db.scalar(
+            select(func.count(AnswerLog.id)).where(AnswerLog.attempt_id == attempt.id)
+        ) or 0
+        questions_remaining = attempt.total_count - answered
+
+    return ApiResponse(
+        data=BatchSubmitAnswerResponse(
+            results=items,
+            graded_count=len(graded),
+            current_score=attempt.score,
+            questions_remaining=questions_remaining,
+            next_difficulty=next_difficulty,
+            retry_queue_count=len(attempt.retry_queue or []) if is_daily_test else None,
+        )
+    )
+
+
 @router.post(
     "/attempts/{attempt_id}/next",
     response_model=ApiResponse[NextQuestionResponse],
@@ -891,88 +1012,34 @@ async def complete_test(
         adaptive_result=adaptive_result,
     )
 
-    # 개념 숙련도 업데이트 및 자동 해제
-    from app.services.mastery_service import MasteryService
-    from app.services.chapter_service import ChapterService
-
-    mastery_service = MasteryService(db)
-    chapter_service = ChapterService(db)
-
-    # 개념별 숙련도 업데이트
-    await mastery_service.update_mastery_from_attempt(current_user.id, attempt_id)
-
-    # 관련 단원 진행률 업데이트 (테스트의 개념들이 속한 단원)
-    from app.models.answer_log import AnswerLog
-    from app.models.question import Question
-    from app.models.chapter import Chapter
-
-    # 1. 이번 시도에서 다룬 개념들 추출
-    logs_stmt = select(AnswerLog.question_id).where(AnswerLog.attempt_id == attempt_id)
-    question_ids = list((await db.scalars(logs_stmt)).all())
-
-    if question_ids:
-        concepts_stmt = select(Question.concept_id).where(
-            Question.id.in_(question_ids),
-            Question.concept_id.isnot(None)
-        ).distinct()
-        concept_ids_set = set((await db.scalars(concepts_stmt)).all())
-
-        if concept_ids_set:
-            # 2. 학생 학년의 단원들을 조회하여 해당 개념 포함 여부 확인
-            chapters_stmt = select(Chapter).where(Chapter.is_active == True)  # noqa: E712
-            if current_user.grade:
-                chapters_stmt = chapters_stmt.where(Chapter.grade == current_user.grade)
-            all_chapters = list((await db.scalars(chapters_stmt)).all())
-
-            # 3. 개념이 속한 단원만 필터링하여 진행률 업데이트
-            for ch in all_chapters:
-                ch_concepts = set(ch.concept_ids or [])
-                if ch_concepts & concept_ids_set:
-                    await chapter_service.update_chapter_progress(current_user.id, ch.id)
-
     # 일일 테스트 기록 동기화
     from app.services.daily_test_service import DailyTestService
     daily_service = DailyTestService(db)
     await daily_service.try_complete_daily_test(attempt_id)
 
-    # 업적 달성 체크
-    from app.services.achievement_service import AchievementService
-    achievement_service = AchievementService(db)
-    
-    # 완료된 테스트 수 조회 (필요 시 StatsService 등 활용, 여기서는 간단히 count query 생략하고 0으로 가정하거나 별도 조회 필요)
-    # AchievementService 내부에서 처리하도록 변경하거나 여기서 조회해서 넘김.
-    # 효율성을 위해 StatsService.get_student_stats() 재사용 권장하지만, 일단 여기서 count query
-    # 혹은 AchievementService.check_achievements 내부에서 처리
-    
-    # 테스트 완료 횟수 조회 (간단 구현)
+    # 업적 달성 체크 (결과 화면에 바로 표시하므로 응답 전에 처리)
     from app.models.test_attempt import TestAttempt
-    from sqlalchemy import func
-    count_stmt = select(func.count(TestAttempt.id)).where(
-        TestAttempt.student_id == current_user.id,
-        TestAttempt.completed_at.isnot(None),
+    from app.services.achievement_service import AchievementService
+    completed_count = await db.scalar(
+        select(func.count(TestAttempt.id)).where(
+            TestAttempt.student_id == current_user.id,
+            TestAttempt.completed_at.isnot(None),
+        )
     )
-    completed_count = await db.scalar(count_stmt)
-
-    new_achievements = await achievement_service.check_achievements(
+    new_achievements = await AchievementService(db).check_achievements(
         student_id=current_user.id,
         attempt=completed_attempt,
-        user=current_user,
-        completed_count=completed_count
+        user=user,
+        completed_count=completed_count,
     )
 
-    # 일일 미션 진행도 업데이트
-    from app.services.mission_service import MissionService
-    mission_service = MissionService(db)
-    
-    # 1. 테스트 완료 미션
-    await mission_service.update_mission_progress(current_user.id, "complete_tests", 1)
-    
-    # 2. 문제 풀이 미션 (전체 문항 수)
-    await mission_service.update_mission_progress(current_user.id, "solve_questions", completed_attempt.total_count)
-    
-    # 3. 만점 미션 (100점)
-    if completed_attempt.score >= 100:  # or max_score check
-        await mission_service.update_mission_progress(current_user.id, "perfect_score", 1)
+    # 숙련도/단원 진행률/미션은 후처리 큐에서 비동기 처리
+    from app.services.post_completion_queue import post_completion_queue
+    job = await post_completion_queue.enqueue(
+        completed_attempt,
+        grade=current_user.grade,
+        session_factory=session_factory_for(db),
+    )
 
     # 답안 기록 조회
     details = await test_service.get_attempt_with_details(attempt_id)
@@ -991,6 +1058,66 @@ async def complete_test(
             achievements_earned=new_achievements,
             level_down_defense=gamification_result.get("level_down_defense"),
             level_down_action=gamification_result.get("level_down_action", "none"),
+            post_completion_status=job["status"],
+        )
+    )
+
+
+@router.get(
+    "/attempts/{attempt_id}/post-completion",
+    response_model=ApiResponse[PostCompletionStatusResponse],
+)
+async def get_post_completion_status(
+    attempt_id: str,
+    current_user: UserResponse = Depends(get_current_user),
+    test_service: TestService = Depends(get_test_service),
+    db: AsyncSession = Depends(get_db),
+):
+    """테스트 완료 후처리(숙련도/단원/미션) 진행 상태 조회.
+
+    작업 상태는 post_completion_jobs 테이블에서 읽으므로 처리한 워커와 무관하다.
+    """
+    attempt = await test_service.get_attempt_by_id(attempt_id)
+    if not attempt:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "NOT_FOUND",
+                    "message": "시도를 찾을 수 없습니다.",
+                },
+            },
+        )
+
+    if attempt.student_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "FORBIDDEN",
+                    "message": "접근 권한이 없습니다.",
+                },
+            },
+        )
+
+    job = await db.get(PostCompletionJob, attempt_id, populate_existing=True)
+    if not job:
+        # 작업 기록 없음 (미완료 시도 또는 후처리 큐 도입 이전에 완료된 시도)
+        return ApiResponse(
+            data=PostCompletionStatusResponse(
+                attempt_id=attempt_id,
+                status="pending" if not attempt.completed_at else "unknown",
+            )
+        )
+
+    return ApiResponse(
+        data=PostCompletionStatusResponse(
+            attempt_id=attempt_id,
+            status=job.status,
+            steps_completed=job.steps_completed or [],
+            error=job.error,
         )
     )
 
@@ -1058,6 +1185,10 @@ async def get_attempt(
 
     # 문제 포함 테스트 정보 조회
     test = details["test"]
+    # 공유 연습 풀 테스트는 세션마다 문항 수가 다르므로 시도의 문항 수를 보고
+    question_count = (
+        attempt.total_count if test.id.startswith(PRACTICE_TEST_PREFIX) else test.question_count
+    )
 
     if attempt.is_adaptive and attempt.adaptive_question_ids:
         # 적응형: adaptive_question_ids 순서대로 문제 복원
@@ -1126,7 +1257,7 @@ async def get_attempt(
                         description=test.description,
                         grade=test.grade,
                         concept_ids=test.concept_ids,
-                        question_count=test.question_count,
+                        question_count=question_count,
                         time_limit_minutes=test.time_limit_minutes,
                         is_active=test.is_active,
                         is_adaptive=test.is_adaptive,
@@ -1193,7 +1324,7 @@ async def get_attempt(
                 description=test.description,
                 grade=test.grade,
                 concept_ids=test.concept_ids,
-                question_count=test.question_count,
+                question_count=question_count,
                 time_limit_minutes=test.time_limit_minutes,
                 is_active=test.is_active,
                 is_adaptive=test.is_adaptive,
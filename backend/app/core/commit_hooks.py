@@ -0,0 +1,90 @@
+"""커밋 시점 반영용 변경 보관.
+
+프로세스 전역 인메모리 인덱스/캐시는 flush 시점의 ORM 이벤트에서 바로 고치면
+롤백된 변경이 남는다. 이벤트에서는 stage()로 변경을 모아 두고 커밋 후 반영한다.
+- 변경은 세션의 현재 트랜잭션(세이브포인트 포함) 단위로 보관
+- 세이브포인트가 커밋(RELEASE)되면 바깥 트랜잭션으로 합치고, 최상위 커밋 시 apply 콜백 호출
+- 롤백된 트랜잭션에 모인 변경은 버림 (on_rollback 콜백이 있으면 대신 호출)
+"""
+
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+# session.info 키: {트랜잭션: {보관 키: {식별자: 변경}}}
+_STAGED_KEY = "commit_hooks_staged"
+
+Changes = dict[Hashable, Any]
+
+
+class _Hook(NamedTuple):
+    apply: Callable[[Changes], None]
+    on_rollback: Callable[[Changes], None] | None
+
+
+_hooks: dict[str, _Hook] = {}
+
+
+def register(
+    key: str,
+    apply: Callable[[Changes], None],
+    on_rollback: Callable[[Changes], None] | None = None,
+) -> None:
+    """보관 키별 반영 콜백 등록. 콜백은 {식별자: 변경}(같은 식별자는 마지막 변경)을 받는다."""
+    _hooks[key] = _Hook(apply, on_rollback)
+
+
+def stage(session: Session | None, key: str, ident: Hashable, change: Any = None) -> None:
+    """변경을 현재 트랜잭션에 보관. 세션이 없으면(분리된 객체) 즉시 반영."""
+    if session is None:
+        _hooks[key].apply({ident: change})
+        return
+    transaction = session.get_nested_transaction() or session.get_transaction()
+    if transaction is None:
+        _hooks[key].apply({ident: change})
+        return
+    staged = session.info.setdefault(_STAGED_KEY, {})
+    staged.setdefault(transaction, {}).setdefault(key, {})[ident] = change
+
+
+def _boundary(transaction: SessionTransaction) -> SessionTransaction:
+    """세이브포인트 또는 최상위 트랜잭션 (flush용 하위 트랜잭션은 건너뜀)."""
+    while transaction.parent is not None and not transaction.nested:
+        transaction = transaction.parent
+    return transaction
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    staged = session.info.get(_STAGED_KEY)
+    if not staged:
+        return
+    # after_commit은 최상위 커밋과 세이브포인트 RELEASE 모두에서 호출된다
+    transaction = session.get_nested_transaction() or session.get_transaction()
+    changes = staged.pop(transaction, None)
+    if not changes:
+        return
+    if transaction.nested:
+        parent = staged.setdefault(_boundary(transaction.parent), {})
+        for key, items in changes.items():
+            parent.setdefault(key, {}).update(items)
+        return
+    for key, items in changes.items():
+        _hooks[key].apply(items)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _on_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    # 커밋으로 처리되지 않고 남은 변경 = 롤백된 트랜잭션의 변경
+    staged = session.info.get(_STAGED_KEY)
+    if not staged:
+        return
+    changes = staged.pop(transaction, None)
+    if not staged:
+        session.info.pop(_STAGED_KEY, None)
+    for key, items in (changes or {}).items():
+        hook = _hooks[key]
+        if hook.on_rollback is not None:
+            hook.on_rollback(items)
@@ -15,13 +15,21 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 1
+    PASSWORD_HASH_WORKERS: int = 4  # bcrypt 해싱/검증 스레드 수 (CPU 점유 상한)
 
     # Environment
     ENV: str = "development"  # development, staging, production
 
+    # 쿼리 계측 (요청별 SQL 수/DB 시간, 개발 환경은 응답 헤더로 노출)
+    QUERY_PROFILING: bool = False
+    SLOW_QUERY_MS: float = 200.0  # 이 시간 이상 걸린 쿼리는 경고 로그
+
     # Gemini AI
     GEMINI_API_KEY: str = ""
     GEMINI_MODEL_NAME: str = "gemini-2.0-flash"
+    GEMINI_MAX_CONCURRENCY: int = 8  # 프로세스 전체 동시 호출 수
+    GEMINI_TIMEOUT_SECONDS: float = 30.0  # 호출별 기본 마감 시간 (대기 시간 포함)
+    GEMINI_REQUESTS_PER_SECOND: float = 4.0  # 문제 생성 요청 속도 제한 (토큰 버킷)
 
     # CORS - 환경변수에서 JSON 배열 파싱
     BACKEND_CORS_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:3000"]
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker as sync_sessionmaker
@@ -40,6 +42,14 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+SessionFactory = Callable[[], AsyncSession]
+
+
+def session_factory_for(db: AsyncSession) -> SessionFactory:
+    """Session factory bound to the same engine as the given (request) session."""
+    return async_sessionmaker(bind=db.bind, class_=AsyncSession, expire_on_commit=False)
+
+
 # Sync engine (for init_db / create_all / Alembic)
 if settings.DATABASE_URL.startswith("sqlite"):
     sync_engine = create_engine(
@@ -0,0 +1,205 @@
+"""요청 단위 SQL 쿼리 계측 (옵트인).
+
+QUERY_PROFILING=true 일 때 엔진 커서 이벤트와 ASGI 미들웨어로 요청마다
+SQL 실행 수 / DB 시간 / 느린 쿼리를 기록한다.
+- 개발 환경: 응답 헤더 X-DB-Query-Count, X-DB-Time-Ms
+- 운영 환경: GET /api/v1/admin/metrics 에서 라우트별 누적 지표 조회
+- SLOW_QUERY_MS 이상 걸린 쿼리는 요청 밖(백그라운드 작업 등)에서도 경고 로그
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 라우트별/요청별 보관하는 느린 쿼리 수
+SLOWEST_KEPT = 5
+# 느린 쿼리 기록 시 SQL 문 최대 길이
+STATEMENT_MAX_CHARS = 300
+# 개발 환경 응답 헤더 (브라우저에서 읽으려면 CORS expose_headers에도 포함)
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+DB_TIME_HEADER = "X-DB-Time-Ms"
+
+
+@dataclass
+class QueryStats:
+    """한 요청(또는 계측 구간)의 쿼리 지표."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    # [(소요 ms, SQL)] 느린 순
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+
+    def record(self, elapsed_ms: float, statement: str) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        _keep_slowest(self.slowest, elapsed_ms, statement)
+
+
+def _keep_slowest(slowest: list[tuple[float, str]], elapsed_ms: float, statement: str) -> None:
+    if len(slowest) < SLOWEST_KEPT or elapsed_ms > slowest[-1][0]:
+        slowest.append((elapsed_ms, " ".join(statement.split())[:STATEMENT_MAX_CHARS]))
+        slowest.sort(key=lambda item: item[0], reverse=True)
+        del slowest[SLOWEST_KEPT:]
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+class QueryProfiler:
+    """엔진 이벤트 기반 쿼리 계측기 + 라우트별 누적 지표."""
+
+    def __init__(self, slow_query_ms: float = settings.SLOW_QUERY_MS):
+        self.slow_query_ms = slow_query_ms
+        self._engines: list[Engine] = []
+        # {"GET /api/v1/...": {...}}
+        self._routes: dict[str, dict] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._engines)
+
+    def install(self, engine: Engine | AsyncEngine) -> None:
+        """엔진에 커서 이벤트 리스너 등록."""
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        if sync_engine in self._engines:
+            return
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines.append(sync_engine)
+
+    def uninstall(self) -> None:
+        """등록한 리스너 제거."""
+        for sync_engine in self._engines:
+            event.remove(sync_engine, "before_cursor_execute", _before_cursor_execute)
+            event.remove(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines.clear()
+
+    @contextmanager
+    def track(self) -> Iterator[QueryStats]:
+        """구간 내 쿼리 계측 (중첩 시 안쪽 구간만 집계)."""
+        stats = QueryStats()
+        token = _current.set(stats)
+        try:
+            yield stats
+        finally:
+            _current.reset(token)
+
+    def record_route(self, route: str, stats: QueryStats) -> None:
+        """요청 지표를 라우트별 누적 지표에 합산."""
+        entry = self._routes.setdefault(route, {
+            "requests": 0,
+            "statements": 0,
+            "max_statements": 0,
+            "db_ms": 0.0,
+            "max_db_ms": 0.0,
+            "slowest": [],
+        })
+        entry["requests"] += 1
+        entry["statements"] += stats.count
+        entry["max_statements"] = max(entry["max_statements"], stats.count)
+        entry["db_ms"] += stats.total_ms
+        entry["max_db_ms"] = max(entry["max_db_ms"], stats.total_ms)
+        for elapsed_ms, statement in stats.slowest:
+            _keep_slowest(entry["slowest"], elapsed_ms, statement)
+
+    def metrics(self) -> dict:
+        """라우트별 지표 스냅샷 (요청당 평균 쿼리 수 내림차순)."""
+        routes = {}
+        for route, entry in self._routes.items():
+            requests = entry["requests"]
+            routes[route] = {
+                "requests": requests,
+                "avg_statements": round(entry["statements"] / requests, 1),
+                "max_statements": entry["max_statements"],
+                "avg_db_ms": round(entry["db_ms"] / requests, 1),
+                "max_db_ms": round(entry["max_db_ms"], 1),
+                "slowest": [
+                    {"ms": round(ms, 1), "statement": statement}
+                    for ms, statement in entry["slowest"]
+                ],
+            }
+        return dict(sorted(routes.items(), key=lambda item: item[1]["avg_statements"], reverse=True))
+
+    def reset(self) -> None:
+        """누적 지표 초기화."""
+        self._routes.clear()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.pop("query_profiler_started", None)
+        if started is None:
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        stats = _current.get()
+        if stats is not None:
+            stats.record(elapsed_ms, statement)
+        if elapsed_ms >= self.slow_query_ms:
+            logger.warning("Slow query (%.1fms): %s", elapsed_ms, " ".join(statement.split())[:STATEMENT_MAX_CHARS])
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info["query_profiler_started"] = time.perf_counter()
+
+
+class QueryProfilerMiddleware:
+    """요청마다 쿼리 지표를 수집하는 ASGI 미들웨어."""
+
+    def __init__(self, app, profiler: "QueryProfiler | None" = None, expose_headers: bool = False):
+        self.app = app
+        self.profiler = profiler or query_profiler
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.profiler.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        with self.profiler.track() as stats:
+            async def send_with_headers(message):
+                if message["type"] == "http.response.start" and self.expose_headers:
+                    headers = list(message.get("headers", []))
+                    headers += [
+                        (QUERY_COUNT_HEADER.lower().encode(), str(stats.count).encode()),
+                        (DB_TIME_HEADER.lower().encode(), f"{stats.total_ms:.1f}".encode()),
+                    ]
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                path = _route_template(scope)
+                if path:
+                    self.profiler.record_route(f"{scope['method']} {path}", stats)
+
+
+def _route_template(scope) -> str | None:
+    """매칭된 라우트의 전체 경로 템플릿 (예: /api/v1/tests/{test_id}).
+
+    FastAPI 버전에 따라 scope["route"]가 include_router prefix 없는 원본 라우트이므로,
+    경로 파라미터로 채운 라우트 경로를 요청 경로에서 빼고 남은 앞부분을 prefix로 붙인다.
+    """
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    path_format = getattr(route, "path_format", None)
+    if not path or path_format is None:
+        return path
+    concrete = path_format.format(**scope.get("path_params", {}))
+    request_path = scope["path"]
+    if request_path != concrete and request_path.endswith(concrete):
+        return request_path[:-len(concrete)] + path
+    return path
+
+
+# 프로세스 전역 계측기
+query_profiler = QueryProfiler()
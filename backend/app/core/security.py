@@ -1,3 +1,7 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
@@ -23,6 +27,116 @@ def get_password_hash(password: str) -> str:
     ).decode("utf-8")
 
 
+class PasswordHasher:
+    """bcrypt 해싱/검증 전용 스레드 풀.
+
+    bcrypt 한 번에 수백 ms가 걸리므로 이벤트 루프에서 직접 호출하면 그동안
+    다른 요청이 모두 멈춘다. bcrypt는 연산 중 GIL을 놓으므로 스레드 풀로 충분하고,
+    워커 수(PASSWORD_HASH_WORKERS)로 CPU 점유 상한을 둔다.
+    대기열 깊이/대기 시간 지표는 metrics()로 확인한다.
+    """
+
+    def __init__(self, max_workers: int = settings.PASSWORD_HASH_WORKERS):
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "max_queue_depth": 0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
+        }
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="password-hash",
+                    )
+        return self._executor
+
+    def _track(self, func, *args):
+        """제출 시점부터 대기열 지표를 기록하는 작업 생성 (반환 함수는 워커 스레드에서 실행)."""
+        enqueued_at = time.perf_counter()
+        with self._lock:
+            self._stats["submitted"] += 1
+            self._queued += 1
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._queued)
+
+        def run():
+            wait_ms = (time.perf_counter() - enqueued_at) * 1000
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._stats["total_wait_ms"] += wait_ms
+                self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], wait_ms)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._stats["completed"] += 1
+
+        return run
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (이벤트 루프 비차단)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), self._track(verify_password, plain_password, hashed_password)
+        )
+
+    async def hash(self, password: str) -> str:
+        """비밀번호 해싱 (이벤트 루프 비차단)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), self._track(get_password_hash, password)
+        )
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        """여러 비밀번호를 워커 수만큼 병렬 해싱 (입력 순서 유지)."""
+        return list(await asyncio.gather(*(self.hash(password) for password in passwords)))
+
+    def hash_many_sync(self, passwords: list[str]) -> list[str]:
+        """동기 코드(init_db 등)용 병렬 해싱."""
+        executor = self._get_executor()
+        futures = [executor.submit(self._track(get_password_hash, p)) for p in passwords]
+        return [future.result() for future in futures]
+
+    def metrics(self) -> dict:
+        """대기열 지표 스냅샷."""
+        with self._lock:
+            started = self._stats["submitted"] - self._queued
+            return {
+                **self._stats,
+                "queued": self._queued,
+                "running": self._running,
+                "max_workers": self.max_workers,
+                "avg_wait_ms": round(self._stats["total_wait_ms"] / started, 1) if started else 0.0,
+            }
+
+    def reset_metrics(self) -> None:
+        """지표 초기화."""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def shutdown(self) -> None:
+        """워커 종료 (앱 종료 시)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 프로세스 전역 비밀번호 해싱 풀
+password_hasher = PasswordHasher()
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -32,7 +146,8 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
         expire = datetime.now(timezone.utc) + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-    to_encode.update({"exp": expire})
+    # iat는 소수점 초 단위로 기록 (사용자 토큰 전체 폐기 시각과 비교)
+    to_encode.update({"exp": expire, "iat": time.time()})
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
@@ -42,7 +157,7 @@ def create_refresh_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     # Add unique JWT ID to prevent duplicate tokens
-    to_encode.update({"exp": expire, "jti": str(uuid4())})
+    to_encode.update({"exp": expire, "iat": time.time(), "jti": str(uuid4())})
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
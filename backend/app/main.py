@@ -13,7 +13,14 @@ from slowapi.errors import RateLimitExceeded
 from sqlalchemy import text as sa_text
 
 from app.core.config import settings
-from app.core.database import Base, sync_engine, AsyncSessionLocal, SyncSessionLocal
+from app.core.database import Base, async_engine, sync_engine, AsyncSessionLocal, SyncSessionLocal
+from app.core.query_profiler import (
+    DB_TIME_HEADER,
+    QUERY_COUNT_HEADER,
+    QueryProfilerMiddleware,
+    query_profiler,
+)
+from app.core.security import password_hasher
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -33,7 +40,6 @@ def init_db():
         WrongAnswerReview, Assignment,
     )
     from app.models.user import RefreshToken
-    from app.services.auth_service import AuthService
 
     # 테이블 생성 (없는 테이블만 생성, 기존 데이터 보존)
     Base.metadata.create_all(bind=sync_engine)
@@ -42,7 +48,8 @@ def init_db():
     db = SyncSessionLocal()
     try:
         if not db.query(User).first():
-            auth_service = AuthService(db)
+            # 시드 계정 6개 비밀번호를 병렬 해싱
+            seed_hashes = iter(password_hasher.hash_many_sync(["password123"] * 6))
 
             # Create master (최고 관리자)
             master = User(
@@ -50,7 +57,7 @@ def init_db():
                 login_id="master01",
                 name="마스터 관리자",
                 role="master",
-                hashed_password=auth_service.hash_password("password123"),
+                hashed_password=next(seed_hashes),
                 is_active=True,
             )
             db.add(master)
@@ -62,7 +69,7 @@ def init_db():
                 login_id="admin01",
                 name="테스트 관리자",
                 role="admin",
-                hashed_password=auth_service.hash_password("password123"),
+                hashed_password=next(seed_hashes),
                 is_active=True,
             )
             db.add(admin)
@@ -74,7 +81,7 @@ def init_db():
                 login_id="teacher01",
                 name="테스트 강사",
                 role="teacher",
-                hashed_password=auth_service.hash_password("password123"),
+                hashed_password=next(seed_hashes),
                 is_active=True,
             )
             db.add(teacher)
@@ -107,7 +114,7 @@ def init_db():
                 role="student",
                 grade="middle_1",
                 class_id="class-001",
-                hashed_password=auth_service.hash_password("password123"),
+                hashed_password=next(seed_hashes),
                 is_active=True,
                 level=3,
                 total_xp=450,
@@ -121,7 +128,7 @@ def init_db():
                 role="student",
                 grade="elementary_3",
                 class_id="class-002",
-                hashed_password=auth_service.hash_password("password123"),
+                hashed_password=next(seed_hashes),
                 is_active=True,
                 level=1,
                 total_xp=0,
@@ -135,7 +142,7 @@ def init_db():
                 role="student",
                 grade="high_1",
                 class_id="class-003",
-                hashed_password=auth_service.hash_password("password123"),
+                hashed_password=next(seed_hashes),
                 is_active=True,
                 level=1,
                 total_xp=0,
@@ -415,6 +422,7 @@ def load_seed_data():
                     question_count=t.get("question_count", len(t["question_ids"])),
                     time_limit_minutes=t.get("time_limit_minutes"),
                     is_adaptive=t.get("is_adaptive", False),
+                    adaptive_pool_config=t.get("adaptive_pool_config"),
                     is_active=t.get("is_active", True),
                     use_question_pool=t.get("use_question_pool", False),
                     questions_per_attempt=t.get("questions_per_attempt"),
@@ -606,8 +614,12 @@ async def lifespan(app: FastAPI):
     await loop.run_in_executor(None, init_db)
     await loop.run_in_executor(None, load_seed_data)
     await loop.run_in_executor(None, update_chapter_concept_ids)
+    # 재시작 전 끝나지 않은 테스트 완료 후처리 작업 재개
+    from app.services.post_completion_queue import post_completion_queue
+    await post_completion_queue.recover(AsyncSessionLocal)
     yield
     # Shutdown
+    password_hasher.shutdown()
 
 
 app = FastAPI(
@@ -623,6 +635,9 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# 쿼리 계측 응답 헤더는 개발 환경에서만 노출
+expose_query_headers = settings.ENV == "development"
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -630,8 +645,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PATCH", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization", "Accept", "Origin", "X-Requested-With"],
+    expose_headers=[QUERY_COUNT_HEADER, DB_TIME_HEADER] if expose_query_headers else [],
 )
 
+# 쿼리 계측 (QUERY_PROFILING=true 일 때만 동작)
+if settings.QUERY_PROFILING:
+    query_profiler.install(async_engine)
+app.add_middleware(QueryProfilerMiddleware, expose_headers=expose_query_headers)
+
 
 @app.get("/health")
 async def health_check() -> dict[str, str]:
@@ -1,5 +1,6 @@
 # Models module
 
+from .ai_response_cache import AIResponseCache
 from .answer_log import AnswerLog
 from .chapter import Chapter
 from .chapter_progress import ChapterProgress
@@ -8,8 +9,10 @@ from .concept import Concept
 from .concept_mastery import ConceptMastery
 from .daily_test_record import DailyTestRecord
 from .focus_check import FocusCheckItem
+from .post_completion_job import PostCompletionJob
 from .question import Question
 from .question_report import QuestionReport
+from .student_daily_stat import StudentDailyStat
 from .test import Test
 from .test_attempt import TestAttempt
 from .user import RefreshToken, User
@@ -20,6 +23,7 @@ from .daily_mission import DailyMission
 from .item import Item, UserItem
 
 __all__ = [
+    "AIResponseCache",
     "AnswerLog",
     "Chapter",
     "ChapterProgress",
@@ -28,9 +32,11 @@ __all__ = [
     "ConceptMastery",
     "DailyTestRecord",
     "FocusCheckItem",
+    "PostCompletionJob",
     "Question",
     "QuestionReport",
     "RefreshToken",
+    "StudentDailyStat",
     "Test",
     "TestAttempt",
     "User",
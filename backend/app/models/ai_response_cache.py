@@ -0,0 +1,37 @@
+"""AI 응답 캐시 모델."""
+
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import JSON, DateTime, ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class AIResponseCache(Base):
+    """AI 유연 채점/오답 피드백 응답 캐시.
+
+    cache_key는 (종류, 문제 내용·정답·해설, 정규화된 학생 답[, 학년])의 해시이므로
+    문제가 수정되면 자연히 다른 키가 된다. question_id는 수정 시 일괄 정리용.
+    """
+
+    __tablename__ = "ai_response_cache"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    cache_key: Mapped[str] = mapped_column(String(64), unique=True, comment="sha256 hex")
+    kind: Mapped[str] = mapped_column(String(20), comment="grade / feedback")
+    question_id: Mapped[str | None] = mapped_column(
+        String(36), ForeignKey("questions.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+    payload: Mapped[dict] = mapped_column(JSON, comment="AI 응답 결과")
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+    def __repr__(self) -> str:
+        return f"<AIResponseCache {self.kind} {self.cache_key[:12]}>"
@@ -0,0 +1,39 @@
+"""테스트 완료 후처리 작업 모델."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class PostCompletionJob(Base):
+    """시도 완료 후처리(숙련도/단원 진행률/미션) 작업 상태.
+
+    시도당 한 행(멱등성 키)이며, 완료된 단계는 단계 처리와 같은 트랜잭션에 기록된다.
+    프로세스가 재시작되면 pending/running 작업을 다시 큐에 넣어 이어서 처리한다.
+    """
+
+    __tablename__ = "post_completion_jobs"
+
+    attempt_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("test_attempts.id", ondelete="CASCADE"), primary_key=True
+    )
+    student_id: Mapped[str] = mapped_column(String(36), index=True)
+    grade: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    status: Mapped[str] = mapped_column(
+        String(20), default="pending", index=True, comment="pending / running / completed / failed"
+    )
+    mission_counts: Mapped[dict] = mapped_column(JSON, default=dict, comment="미션 종류별 진행 수")
+    steps_completed: Mapped[list[str]] = mapped_column(JSON, default=list)
+    tries: Mapped[int] = mapped_column(Integer, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<PostCompletionJob {self.attempt_id} {self.status}>"
@@ -0,0 +1,44 @@
+"""학생 일별 학습 집계 모델."""
+
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class StudentDailyStat(Base):
+    """학생 × KST 날짜별 완료 테스트 집계 (통계 대시보드용 롤업).
+
+    TestAttempt 완료 시점에 증분 갱신되며, 날짜는 시도 시작 시각(started_at)의 KST 날짜다.
+    """
+
+    __tablename__ = "student_daily_stats"
+    __table_args__ = (
+        UniqueConstraint("student_id", "date", name="uix_student_daily_stat"),
+        Index("ix_student_daily_stat_date", "date", "student_id"),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    student_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    date: Mapped[str] = mapped_column(
+        String(10), comment="YYYY-MM-DD (KST)"
+    )
+
+    tests_completed: Mapped[int] = mapped_column(Integer, default=0, comment="완료 테스트 수")
+    questions_answered: Mapped[int] = mapped_column(Integer, default=0, comment="문제 수 (total_count 합)")
+    correct_count: Mapped[int] = mapped_column(Integer, default=0, comment="정답 수")
+    time_spent_seconds: Mapped[int] = mapped_column(Integer, default=0, comment="풀이 시간 합 (초)")
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<StudentDailyStat {self.student_id} {self.date} tests={self.tests_completed}>"
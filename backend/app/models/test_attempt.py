@@ -53,6 +53,12 @@ class TestAttempt(Base):
     current_difficulty: Mapped[int | None] = mapped_column(Integer, nullable=True)
     adaptive_question_ids: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
     initial_difficulty: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    adaptive_recent_results: Mapped[list[dict] | None] = mapped_column(
+        JSON, nullable=True, comment="최근 답안 윈도우 [{question_id, is_correct, difficulty}] (최신순)"
+    )
+    ability_state: Mapped[dict | None] = mapped_column(
+        JSON, nullable=True, comment="IRT 엔진 능력 추정 상태 {theta, se, answered, log_posterior}"
+    )
 
     # 문제 풀 & 셔플 설정
     selected_question_ids: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
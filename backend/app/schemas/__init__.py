@@ -30,10 +30,14 @@ from .auth import (
 from .test import (
     AnswerLogResponse,
     AvailableTestResponse,
+    BatchSubmitAnswerItem,
+    BatchSubmitAnswerRequest,
+    BatchSubmitAnswerResponse,
     CompleteTestResponse,
     ConceptCreate,
     ConceptResponse,
     GetAttemptResponse,
+    PostCompletionStatusResponse,
     QuestionCreate,
     QuestionOption,
     QuestionResponse,
@@ -111,10 +115,14 @@ __all__ = [
     # test
     "AnswerLogResponse",
     "AvailableTestResponse",
+    "BatchSubmitAnswerItem",
+    "BatchSubmitAnswerRequest",
+    "BatchSubmitAnswerResponse",
     "CompleteTestResponse",
     "ConceptCreate",
     "ConceptResponse",
     "GetAttemptResponse",
+    "PostCompletionStatusResponse",
     "QuestionCreate",
     "QuestionOption",
     "QuestionResponse",
@@ -242,6 +242,31 @@ class SubmitAnswerResponse(BaseModel):
     focus_check_message: str | None = None  # 집중 체크 안내 메시지
 
 
+class BatchSubmitAnswerRequest(BaseModel):
+    """답안 일괄 제출 요청 (오프라인 버퍼 재전송용, 제출 순서대로)."""
+
+    answers: list[SubmitAnswerRequest] = Field(..., min_length=1, max_length=100)
+
+
+class BatchSubmitAnswerItem(BaseModel):
+    """일괄 제출 답안별 결과."""
+
+    question_id: str
+    status: str  # graded / already_submitted / not_found
+    result: SubmitAnswerResponse | None = None
+
+
+class BatchSubmitAnswerResponse(BaseModel):
+    """답안 일괄 제출 응답."""
+
+    results: list[BatchSubmitAnswerItem]
+    graded_count: int
+    current_score: int
+    questions_remaining: int
+    next_difficulty: int | None = None
+    retry_queue_count: int | None = None
+
+
 class AnswerLogResponse(BaseModel):
     """답안 기록 응답."""
 
@@ -285,6 +310,17 @@ class CompleteTestResponse(BaseModel):
     # 레벨다운 방어 시스템
     level_down_defense: int | None = None
     level_down_action: str | None = None  # none / defense_consumed / defense_restored / level_down
+    # 후처리(숙련도/단원/미션) 상태: pending / running / completed / failed
+    post_completion_status: str | None = None
+
+
+class PostCompletionStatusResponse(BaseModel):
+    """테스트 완료 후처리 상태 응답."""
+
+    attempt_id: str
+    status: str  # pending / running / completed / failed / unknown
+    steps_completed: list[str] = []
+    error: str | None = None
 
 
 class GetAttemptResponse(BaseModel):
@@ -199,6 +199,7 @@ def seed_tests(db: Session, tests: list[dict], *, clear: bool, dry_run: bool) ->
             question_count=data.get("question_count", len(data["question_ids"])),
             time_limit_minutes=data.get("time_limit_minutes"),
             is_adaptive=data.get("is_adaptive", False),
+            adaptive_pool_config=data.get("adaptive_pool_config"),
             use_question_pool=data.get("use_question_pool", False),
             questions_per_attempt=data.get("questions_per_attempt"),
             shuffle_options=data.get("shuffle_options", True),
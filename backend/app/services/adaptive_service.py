@@ -1,6 +1,7 @@
 """적응형 난이도 서비스."""
 
 import random
+from typing import NamedTuple
 
 from sqlalchemy import select, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,10 +11,22 @@ from app.models.question import Question
 from app.models.test import Test
 from app.models.test_attempt import TestAttempt
 from app.models.user import User
+from app.services.question_pool_index import question_pool_index
 
 MIN_DIFFICULTY = 1
 MAX_DIFFICULTY = 10
 
+# attempt에 유지하는 최근 답안 윈도우 크기 (난이도 계산은 최근 2개만 사용)
+ADAPTIVE_WINDOW_SIZE = 2
+
+
+class AdaptiveResult(NamedTuple):
+    """최근 답안 윈도우 항목 (AnswerLog와 같은 필드명 사용)."""
+
+    question_id: str
+    is_correct: bool
+    question_difficulty: int | None
+
 
 class AdaptiveService:
     """적응형 난이도 서비스 (1-10 정수 난이도 체계)."""
@@ -51,6 +64,10 @@ class AdaptiveService:
         target = await self.determine_initial_difficulty(student_id, test.concept_ids)
         return await self._select_closest_question(test, target, exclude_ids=[])
 
+    async def select_question_at(self, test: Test, target: int) -> Question | None:
+        """지정한 시작 난이도에 가장 가까운 첫 번째 문제 선택 (빠른 연습)."""
+        return await self._select_closest_question(test, target, exclude_ids=[])
+
     async def get_initial_difficulty_for(
         self, test: Test, student_id: str
     ) -> int:
@@ -69,21 +86,25 @@ class AdaptiveService:
         if answered_count >= attempt.total_count:
             return None, attempt.current_difficulty or 6
 
-        # 최근 답안 기록 조회
-        logs = list(
-            (await self.db.scalars(
-                select(AnswerLog)
-                .where(AnswerLog.attempt_id == attempt.id)
-                .order_by(AnswerLog.created_at.desc())
-            )).all()
-        )
-
+        test = attempt.test
+        exclude_ids = attempt.adaptive_question_ids or []
         current = attempt.current_difficulty or 6
-        target = self._calculate_next_difficulty(current, logs)
+
+        engine = self._get_engine(test)
+        if engine and attempt.ability_state:
+            # IRT 엔진: 추정 정밀도가 충분하면 조기 종료, 아니면 정보량 최대 난이도
+            if engine.should_stop(attempt.ability_state):
+                return None, current
+            available = await self._available_difficulties(test, exclude_ids)
+            target = engine.best_difficulty(attempt.ability_state, available)
+            if target is None:
+                return None, current
+        else:
+            # 최근 답안 윈도우 (attempt에 저장된 상태, 로그 스캔 없음)
+            recent = await self._get_recent_results(attempt)
+            target = self._calculate_next_difficulty(current, recent)
 
         # 문제 풀에서 선택
-        test = attempt.test
-        exclude_ids = attempt.adaptive_question_ids or []
         question = await self._select_closest_question(test, target, exclude_ids)
 
         if not question:
@@ -107,19 +128,118 @@ class AdaptiveService:
         if answered_count >= attempt.total_count:
             return None
 
-        logs = list(
-            (await self.db.scalars(
-                select(AnswerLog)
-                .where(AnswerLog.attempt_id == attempt.id)
-                .order_by(AnswerLog.created_at.desc())
-            )).all()
-        )
+        engine = self._get_engine(attempt.test)
+        if engine and attempt.ability_state:
+            if engine.should_stop(attempt.ability_state):
+                return None
+            return engine.target_difficulty(attempt.ability_state)
+
+        recent = await self._get_recent_results(attempt)
 
         current = attempt.current_difficulty or 6
-        return self._calculate_next_difficulty(current, logs)
+        return self._calculate_next_difficulty(current, recent)
+
+    def initial_engine_state(self, test: Test, initial_difficulty: int) -> dict | None:
+        """테스트가 IRT 엔진을 쓰면 초기 능력 추정 상태 반환 (기본 엔진은 None)."""
+        engine = self._get_engine(test)
+        if not engine:
+            return None
+        return engine.initial_state(initial_difficulty)
+
+    @staticmethod
+    def record_result(
+        attempt: TestAttempt, question_id: str, is_correct: bool, difficulty: int | None
+    ) -> None:
+        """채점 시 최근 답안 윈도우 갱신 (최신 항목이 앞)."""
+        entry = {"question_id": question_id, "is_correct": is_correct, "difficulty": difficulty}
+        window = [entry] + list(attempt.adaptive_recent_results or [])
+        # JSON 컬럼 변경 감지를 위해 새 리스트로 할당
+        attempt.adaptive_recent_results = window[:ADAPTIVE_WINDOW_SIZE]
+
+        if attempt.ability_state and difficulty is not None:
+            from app.services.irt_engine import IRTEngine
+            attempt.ability_state = IRTEngine().update(attempt.ability_state, difficulty, is_correct)
+
+    @staticmethod
+    def mark_result_correct(attempt: TestAttempt, question_id: str) -> None:
+        """AI 유연 채점으로 정답 보정된 경우 윈도우 항목도 정답으로 변경."""
+        window = [dict(entry) for entry in (attempt.adaptive_recent_results or [])]
+        for entry in window:
+            if entry.get("question_id") == question_id:
+                if (
+                    not entry.get("is_correct")
+                    and attempt.ability_state
+                    and entry.get("difficulty") is not None
+                ):
+                    from app.services.irt_engine import IRTEngine
+                    attempt.ability_state = IRTEngine().flip_to_correct(
+                        attempt.ability_state, entry["difficulty"]
+                    )
+                entry["is_correct"] = True
+                break
+        attempt.adaptive_recent_results = window
+
+    @staticmethod
+    def _pool_category(test: Test | None) -> str | None:
+        """문제 풀 카테고리 제한 (adaptive_pool_config.category, 빠른 연습 풀)."""
+        config = test.adaptive_pool_config if test else None
+        return config.get("category") if config else None
+
+    @staticmethod
+    def _get_engine(test: Test | None):
+        """테스트별 적응형 엔진 선택 (adaptive_pool_config.engine == "irt")."""
+        from app.services.irt_engine import IRTEngine
+
+        config = test.adaptive_pool_config if test else None
+        if IRTEngine.is_enabled(config):
+            return IRTEngine(config)
+        return None
+
+    async def _available_difficulties(self, test: Test, exclude_ids: list[str]) -> list[int]:
+        """아직 출제하지 않은 문제가 남아 있는 난이도 목록 (인덱스 조회)."""
+        concept_ids = list(test.concept_ids or [])
+        await question_pool_index.ensure_loaded(self.db, concept_ids)
+        excluded = set(exclude_ids)
+        category = self._pool_category(test)
+        return [
+            diff
+            for diff in range(MIN_DIFFICULTY, MAX_DIFFICULTY + 1)
+            if any(
+                qid not in excluded
+                for qid in question_pool_index.get_pool(
+                    concept_ids, diff, test_key=test.id, category=category
+                )
+            )
+        ]
+
+    async def _get_recent_results(self, attempt: TestAttempt) -> list[AdaptiveResult]:
+        """최근 답안 윈도우 조회.
+
+        윈도우가 없는 이전 시도만 AnswerLog에서 최근 N개를 읽는다.
+        """
+        if attempt.adaptive_recent_results is not None:
+            return [
+                AdaptiveResult(
+                    entry.get("question_id", ""),
+                    bool(entry.get("is_correct")),
+                    entry.get("difficulty"),
+                )
+                for entry in attempt.adaptive_recent_results
+            ]
+
+        logs = (await self.db.scalars(
+            select(AnswerLog)
+            .where(AnswerLog.attempt_id == attempt.id)
+            .order_by(AnswerLog.created_at.desc())
+            .limit(ADAPTIVE_WINDOW_SIZE)
+        )).all()
+        return [
+            AdaptiveResult(log.question_id, log.is_correct, log.question_difficulty)
+            for log in logs
+        ]
 
     def _calculate_next_difficulty(
-        self, current: int, logs: list[AnswerLog]
+        self, current: int, logs: list[AnswerLog] | list[AdaptiveResult]
     ) -> int:
         """최근 답안 기반 다음 난이도 계산.
 
@@ -160,35 +280,43 @@ class AdaptiveService:
         """target 난이도에 가장 가까운 문제 선택.
 
         정확히 일치하는 문제 우선, 없으면 ±1, ±2... 범위 확장.
+        후보는 인메모리 문제 풀 인덱스에서 찾고, 선택된 문제만 DB에서 조회한다.
         """
+        concept_ids = list(test.concept_ids or [])
+        await question_pool_index.ensure_loaded(self.db, concept_ids)
+        excluded = set(exclude_ids)
+
+        while True:
+            candidate_id = self._pick_closest_candidate(test, concept_ids, target, excluded)
+            if candidate_id is None:
+                return None
+
+            question = await self.db.get(Question, candidate_id)
+            if question and question.is_active and question.concept_id in concept_ids:
+                return question
+
+            # 인덱스가 오래된 경우 (다른 프로세스에서 비활성화 등) → 제거 후 재선택
+            question_pool_index.discard(candidate_id)
+            excluded.add(candidate_id)
+
+    def _pick_closest_candidate(
+        self, test: Test, concept_ids: list[str], target: int, excluded: set[str]
+    ) -> str | None:
+        """인덱스에서 target에 가장 가까운 난이도의 후보 문제 ID 선택."""
+        category = self._pool_category(test)
         for spread in range(MAX_DIFFICULTY):
             candidates = []
-            for diff in [target + spread, target - spread]:
+            for diff in {target + spread, target - spread}:
                 if diff < MIN_DIFFICULTY or diff > MAX_DIFFICULTY:
                     continue
-                pool = await self._get_pool_by_difficulty(test, diff, exclude_ids)
-                candidates.extend(pool)
+                pool = question_pool_index.get_pool(
+                    concept_ids, diff, test_key=test.id, category=category
+                )
+                candidates.extend(qid for qid in pool if qid not in excluded)
             if candidates:
                 return random.choice(candidates)
         return None
 
-    async def _get_pool_by_difficulty(
-        self, test: Test, difficulty: int, exclude_ids: list[str]
-    ) -> list[Question]:
-        """특정 난이도의 사용 가능한 문제 풀 조회."""
-        stmt = (
-            select(Question)
-            .where(
-                Question.concept_id.in_(test.concept_ids),
-                Question.difficulty == difficulty,
-                Question.is_active == True,  # noqa: E712
-            )
-        )
-        if exclude_ids:
-            stmt = stmt.where(Question.id.notin_(exclude_ids))
-
-        return list((await self.db.scalars(stmt)).all())
-
     async def _get_concept_accuracy(
         self, student_id: str, concept_ids: list[str]
     ) -> float:
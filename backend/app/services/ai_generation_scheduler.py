@@ -0,0 +1,107 @@
+"""AI 문제 생성 병렬 스케줄러.
+
+개념/배치 단위 생성 요청을 동시에 실행하되, 토큰 버킷으로 Gemini 호출 속도를 제한한다.
+- 결과는 도착 순서대로 중복 검사(accept 콜백)를 거쳐 수집
+- 필요한 수량(limit)을 채우면 남은 요청은 취소
+- 전체 소요 시간은 호출 시간의 합이 아니라 가장 느린 호출 수준
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+GenerationJob = Callable[[], Awaitable[list[dict] | None]]
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 속도 제한기."""
+
+    def __init__(self, rate_per_second: float, capacity: int):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """토큰 하나를 얻을 때까지 대기."""
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate_per_second)
+
+
+class GenerationScheduler:
+    """생성 요청 팬아웃 + 도착 순 중복 제거 + 조기 종료."""
+
+    def __init__(self, rate_limiter: TokenBucket | None = None, timeout: float | None = None):
+        self.rate_limiter = rate_limiter or gemini_rate_limiter
+        # 요청별 마감 시간 (초과 시 해당 요청만 결과 없음 처리)
+        self.timeout = timeout
+
+    async def run(
+        self,
+        jobs: list[GenerationJob],
+        accept: Callable[[dict], bool] | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """생성 요청을 병렬 실행하고 채택된 문제 목록을 도착 순서대로 반환.
+
+        Args:
+            jobs: 생성 요청 (호출 시 코루틴을 반환하는 함수)
+            accept: 문제 채택 여부 판정 (중복 검사 등). None이면 모두 채택
+            limit: 채택 목표 수량. 채우면 남은 요청 취소
+        """
+        accepted: list[dict] = []
+        if not jobs:
+            return accepted
+
+        tasks = [asyncio.create_task(self._run_job(job)) for job in jobs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                batch = await next_done
+                for question in batch or []:
+                    if limit is not None and len(accepted) >= limit:
+                        break
+                    if accept is None or accept(question):
+                        accepted.append(question)
+                if limit is not None and len(accepted) >= limit:
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return accepted
+
+    async def _run_job(self, job: GenerationJob) -> list[dict] | None:
+        await self.rate_limiter.acquire()
+        try:
+            if self.timeout:
+                return await asyncio.wait_for(job(), timeout=self.timeout)
+            return await job()
+        except asyncio.TimeoutError:
+            logger.warning("AI generation request timed out after %.1fs", self.timeout)
+        except Exception:
+            logger.exception("AI generation request failed")
+        return None
+
+
+# 프로세스 전역 Gemini 생성 요청 속도 제한기
+gemini_rate_limiter = TokenBucket(
+    rate_per_second=settings.GEMINI_REQUESTS_PER_SECOND,
+    capacity=settings.GEMINI_MAX_CONCURRENCY,
+)
@@ -0,0 +1,180 @@
+"""AI 채점/피드백 응답 캐시.
+
+같은 문제의 같은 오답(부호 실수, 약분 안 한 분수 등)은 반 전체에서 반복되므로,
+Gemini 응답을 내용 주소(content-addressed) 키로 저장해 재사용한다.
+- 키: sha256(종류 | 문제 내용·정답·해설 | 정규화된 학생 답 | 부가 정보)
+- 프로세스 LRU(LRU_MAX_ENTRIES) → ai_response_cache 테이블 순으로 조회, TTL 경과 항목은 무시
+- 문제의 content/correct_answer/explanation 수정 시 해당 문제의 캐시 삭제 (Question ORM 이벤트)
+"""
+
+import hashlib
+import logging
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, event, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import get_history
+
+from app.models.ai_response_cache import AIResponseCache
+from app.models.question import Question
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL_SECONDS = 30 * 24 * 3600
+LRU_MAX_ENTRIES = 2048
+
+# 캐시 무효화 대상 문제 필드
+_QUESTION_FIELDS = ("content", "correct_answer", "explanation")
+
+_cache_table = AIResponseCache.__table__
+
+
+def normalize_answer(answer: str) -> str:
+    """학생 답 정규화 (전각/호환 문자, 공백, 마이너스 기호 통일)."""
+    text = unicodedata.normalize("NFKC", answer or "")
+    text = text.replace("−", "-").replace("–", "-")
+    return "".join(text.split())
+
+
+def make_cache_key(
+    kind: str,
+    question_content: str,
+    correct_answer: str,
+    explanation: str,
+    student_answer: str,
+    extra: str = "",
+) -> str:
+    """내용 주소 캐시 키."""
+    parts = (
+        kind, question_content or "", correct_answer or "", explanation or "",
+        normalize_answer(student_answer), extra,
+    )
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _timestamp(dt: datetime) -> float:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class AIResponseCacheStore:
+    """LRU + DB 2단 AI 응답 캐시."""
+
+    def __init__(self, max_entries: int = LRU_MAX_ENTRIES, ttl_seconds: float = CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # {cache_key: (payload, expires_at_ts, question_id)}
+        self._lru: OrderedDict[str, tuple[dict, float, str | None]] = OrderedDict()
+        self._by_question: dict[str, set[str]] = {}
+        self._stats = {"memory_hits": 0, "db_hits": 0, "misses": 0}
+
+    def clear(self) -> None:
+        """메모리 캐시 초기화."""
+        self._lru.clear()
+        self._by_question.clear()
+        for key in self._stats:
+            self._stats[key] = 0
+
+    def metrics(self) -> dict:
+        """캐시 적중 지표."""
+        return {**self._stats, "entries": len(self._lru)}
+
+    async def get(self, db: AsyncSession | None, cache_key: str) -> dict | None:
+        """캐시 조회 (LRU → DB). 없거나 만료되면 None."""
+        now = time.time()
+        entry = self._lru.get(cache_key)
+        if entry is not None:
+            payload, expires_at, _ = entry
+            if expires_at > now:
+                self._lru.move_to_end(cache_key)
+                self._stats["memory_hits"] += 1
+                return dict(payload)
+            self._evict(cache_key)
+
+        if db is not None:
+            row = (await db.execute(
+                select(
+                    AIResponseCache.payload, AIResponseCache.expires_at, AIResponseCache.question_id,
+                ).where(AIResponseCache.cache_key == cache_key)
+            )).first()
+            if row and _timestamp(row.expires_at) > now:
+                self._remember(cache_key, row.payload, _timestamp(row.expires_at), row.question_id)
+                self._stats["db_hits"] += 1
+                return dict(row.payload)
+
+        self._stats["misses"] += 1
+        return None
+
+    async def put(
+        self,
+        db: AsyncSession | None,
+        cache_key: str,
+        kind: str,
+        payload: dict,
+        question_id: str | None = None,
+    ) -> None:
+        """캐시 저장. DB 저장분은 호출자 세션의 커밋과 함께 반영된다."""
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds)
+        self._remember(cache_key, payload, expires_at.timestamp(), question_id)
+        if db is None:
+            return
+
+        try:
+            async with db.begin_nested():
+                row = await db.scalar(
+                    select(AIResponseCache).where(AIResponseCache.cache_key == cache_key)
+                )
+                if row:
+                    row.payload = payload
+                    row.expires_at = expires_at
+                    row.question_id = question_id
+                else:
+                    db.add(AIResponseCache(
+                        cache_key=cache_key,
+                        kind=kind,
+                        question_id=question_id,
+                        payload=payload,
+                        expires_at=expires_at,
+                    ))
+        except IntegrityError:
+            # 동시 요청이 먼저 저장한 경우
+            logger.debug("AI response cache key already stored: %s", cache_key[:12])
+
+    def invalidate_question(self, question_id: str) -> None:
+        """문제의 메모리 캐시 항목 제거."""
+        for cache_key in list(self._by_question.get(question_id, ())):
+            self._evict(cache_key)
+
+    def _remember(self, cache_key: str, payload: dict, expires_at: float, question_id: str | None) -> None:
+        self._evict(cache_key)
+        self._lru[cache_key] = (dict(payload), expires_at, question_id)
+        if question_id:
+            self._by_question.setdefault(question_id, set()).add(cache_key)
+        while len(self._lru) > self.max_entries:
+            self._evict(next(iter(self._lru)))
+
+    def _evict(self, cache_key: str) -> None:
+        entry = self._lru.pop(cache_key, None)
+        if entry and entry[2]:
+            keys = self._by_question.get(entry[2])
+            if keys:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._by_question[entry[2]]
+
+
+# 프로세스 전역 캐시
+ai_response_cache = AIResponseCacheStore()
+
+
+@event.listens_for(Question, "after_update")
+def _invalidate_on_question_change(mapper, connection, target: Question) -> None:
+    if not any(get_history(target, field).has_changes() for field in _QUESTION_FIELDS):
+        return
+    connection.execute(delete(_cache_table).where(_cache_table.c.question_id == target.id))
+    ai_response_cache.invalidate_question(target.id)
@@ -5,12 +5,14 @@ import logging
 import re
 from uuid import uuid4
 
-from google import genai
 from google.genai import types
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
 from app.services.prompt_context import format_prompt_context, CONCEPT_QUESTION_PROTOCOL, PROMPT_CONTEXTS
+from app.services.ai_response_cache import ai_response_cache, make_cache_key
+from app.services.answer_equivalence import compare_answers
 from app.services.concept_generator import ConceptGenerator
+from app.services.gemini_client import get_gemini_client
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +24,9 @@ GRADE_LABELS: dict[str, str] = {
     "high_1": "고1", "high_2": "고1",
 }
 
-# 싱글턴 클라이언트
-_client: genai.Client | None = None
-
-
-def _get_client() -> genai.Client | None:
-    """Gemini 클라이언트 반환. API 키 미설정 시 None."""
-    global _client
-    if not settings.GEMINI_API_KEY:
-        return None
-    if _client is None:
-        _client = genai.Client(api_key=settings.GEMINI_API_KEY)
-    return _client
+# 호출별 마감 시간 (초) - 채점/피드백은 학생 제출 응답 경로이므로 짧게
+GRADING_TIMEOUT_SECONDS = 8.0
+FEEDBACK_TIMEOUT_SECONDS = 15.0
 
 
 def _cross_validate_answer(q: dict, options: list) -> str | None:
@@ -166,8 +159,13 @@ class AIService:
         correct_answer: str,
         student_answer: str,
         accept_formats: list[str] | None,
+        question_id: str | None = None,
+        db: AsyncSession | None = None,
     ) -> dict | None:
-        """빈칸 채우기 유연 채점. 실패 시 None."""
+        """빈칸 채우기 유연 채점. 실패 시 None.
+
+        같은 (문제, 정규화된 학생 답)의 AI 판정은 캐시에서 재사용한다 (db 전달 시 DB 캐시 포함).
+        """
         # 1단계: 규칙 기반 매칭
         student = student_answer.strip().replace(" ", "")
         correct = correct_answer.strip().replace(" ", "")
@@ -179,11 +177,25 @@ class AIService:
         if student in accept:
             return {"is_correct": True, "confidence": 1.0, "reason": "허용 표기와 일치"}
 
-        # 2단계: Gemini 유연 채점
-        client = _get_client()
+        # 2단계: 로컬 동치 판정 (분수/소수/대분수/근호/단위/다항식 표기 차이).
+        # 동치가 확실할 때만 확정하고, 다르다고 본 답도 AI 유연 채점에 맡긴다 (0.333 ≈ 1/3 등)
+        if any(compare_answers(student_answer, c) for c in [correct_answer, *(accept_formats or [])]):
+            return {"is_correct": True, "confidence": 1.0, "reason": "수학적으로 동치"}
+
+        # 3단계: Gemini 유연 채점 (같은 오답의 판정은 캐시 재사용)
+        client = get_gemini_client()
         if not client:
             return None
 
+        # 허용 표기가 다르면 다른 문제로 보고 판정을 따로 보관
+        cache_key = make_cache_key(
+            "grade", question_content, correct_answer, "", student_answer,
+            json.dumps(sorted(accept_formats or []), ensure_ascii=False),
+        )
+        cached = await ai_response_cache.get(db, cache_key)
+        if cached is not None:
+            return cached
+
         prompt = (
             "수학 문제의 빈칸 채우기 답안을 채점하세요.\n\n"
             f"[문제] {question_content}\n"
@@ -199,10 +211,10 @@ class AIService:
         )
 
         try:
-            response = client.models.generate_content(
-                model=settings.GEMINI_MODEL_NAME,
+            response = await client.generate_content(
                 contents=prompt,
                 config=types.GenerateContentConfig(temperature=0.1, max_output_tokens=200),
+                timeout=GRADING_TIMEOUT_SECONDS,
             )
             text = response.text.strip()
             if "```" in text:
@@ -211,7 +223,7 @@ class AIService:
                     text = text[4:]
                 text = text.strip()
             result = json.loads(text)
-            return {
+            graded = {
                 "is_correct": bool(result.get("is_correct", False)),
                 "confidence": float(result.get("confidence", 0.5)),
                 "reason": str(result.get("reason", "")),
@@ -220,6 +232,9 @@ class AIService:
             logger.exception("AI fill-blank grading failed")
             return None
 
+        await ai_response_cache.put(db, cache_key, "grade", graded, question_id)
+        return graded
+
     async def generate_feedback(
         self,
         question_content: str,
@@ -227,13 +242,24 @@ class AIService:
         student_answer: str,
         explanation: str,
         student_grade: str,
+        question_id: str | None = None,
+        db: AsyncSession | None = None,
     ) -> dict | None:
-        """오답 맞춤 피드백 생성. 실패 시 None."""
-        client = _get_client()
+        """오답 맞춤 피드백 생성. 실패 시 None.
+
+        같은 (문제, 정규화된 학생 답, 학년)의 피드백은 캐시에서 재사용한다.
+        """
+        client = get_gemini_client()
         if not client:
             return None
 
         grade_label = GRADE_LABELS.get(student_grade, student_grade)
+        cache_key = make_cache_key(
+            "feedback", question_content, correct_answer, explanation, student_answer, grade_label
+        )
+        cached = await ai_response_cache.get(db, cache_key)
+        if cached is not None:
+            return cached
 
         prompt = (
             f"당신은 {grade_label} 학생의 수학 오답을 분석하는 전문 튜터입니다.\n\n"
@@ -254,10 +280,10 @@ class AIService:
         )
 
         try:
-            response = client.models.generate_content(
-                model=settings.GEMINI_MODEL_NAME,
+            response = await client.generate_content(
                 contents=prompt,
                 config=types.GenerateContentConfig(temperature=0.3, max_output_tokens=400),
+                timeout=FEEDBACK_TIMEOUT_SECONDS,
             )
             text = response.text.strip()
             if "```" in text:
@@ -266,7 +292,7 @@ class AIService:
                     text = text[4:]
                 text = text.strip()
             result = json.loads(text)
-            return {
+            feedback = {
                 "feedback": str(result.get("feedback", "")),
                 "error_type": str(result.get("error_type", "")),
                 "suggestion": str(result.get("suggestion", "")),
@@ -275,6 +301,9 @@ class AIService:
             logger.exception("AI feedback generation failed")
             return None
 
+        await ai_response_cache.put(db, cache_key, "feedback", feedback, question_id)
+        return feedback
+
     async def generate_questions(
         self,
         concept_name: str,
@@ -311,7 +340,7 @@ class AIService:
         Returns:
             Question 모델에 바로 넣을 수 있는 dict 리스트
         """
-        client = _get_client()
+        client = get_gemini_client()
         if not client:
             return None
 
@@ -491,8 +520,7 @@ class AIService:
         max_retries = 2
         for attempt in range(max_retries + 1):
             try:
-                response = client.models.generate_content(
-                    model=settings.GEMINI_MODEL_NAME,
+                response = await client.generate_content(
                     contents=prompt,
                     config=types.GenerateContentConfig(
                         temperature=0.4 + (attempt * 0.1),  # 재시도 시 창의성 약간 높임
@@ -0,0 +1,257 @@
+"""수학 답안 동치 판정 (로컬, 결정적).
+
+빈칸 답안의 표기 차이를 AI 호출 없이 판정한다. 템플릿/시드에서 쓰는 표기
+(`×`, 위첨자 지수, `√`, 대분수 `2(1/3)`, 단위 접미사)를 지원한다.
+- 수: 정수/소수/분수/대분수/근호 (3/4 = 0.75 = 6/8, √12 = 2√3)
+- 단위: 한쪽에만 있는 단위는 생략으로 보고 허용 (5cm = 5 cm = 5), 서로 다른 단위는 판정 불가
+- 거듭제곱 곱: 소인수분해 꼴 (2³×3² = 3^2*2^3 = 2×2×2×3×3)
+- 다항식: 동류항이 정리된 전개식의 항 순서/지수 표기 (x²+5x+6 = 5x+6+x^2)
+- 목록: 쉼표 구분 값 (방정식의 해는 순서 무관, 괄호로 감싼 좌표는 순서대로)
+
+판정 꼴이 다르거나(72 vs 2³×3²) 해석할 수 없는 답은 None(판정 불가)으로 돌려
+호출자가 AI 채점 등으로 넘길 수 있게 한다.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from fractions import Fraction
+from math import isqrt
+
+_SUPERSCRIPTS = {
+    "⁰": "0", "¹": "1", "²": "2", "³": "3", "⁴": "4",
+    "⁵": "5", "⁶": "6", "⁷": "7", "⁸": "8", "⁹": "9", "⁻": "-",
+}
+_SUPERSCRIPT_RUN = re.compile("[" + "".join(_SUPERSCRIPTS) + "]+")
+
+# 긴 것부터 비교 (cm^2가 m^2/cm보다 먼저). 위첨자는 normalize_math에서 ^지수로 바뀐 뒤 비교한다
+_UNITS = sorted(
+    [
+        "mm", "cm", "m", "km", "mm^2", "cm^2", "m^2", "km^2", "mm^3", "cm^3", "m^3",
+        "mg", "g", "kg", "mL", "L",
+        "°", "도", "개", "원", "명", "마리", "장", "번", "살", "권", "자루", "송이",
+        "시간", "분", "초", "일", "주", "회", "배", "쪽", "층", "대", "병", "컵",
+    ],
+    key=len,
+    reverse=True,
+)
+
+_NUMBER = r"\d+(?:\.\d+)?"
+_RE_MIXED_SPACED = re.compile(r"^([+-]?)(\d+)\s+(\d+)\s*/\s*(\d+)$")
+_RE_MIXED = re.compile(r"^([+-]?)(\d+)\((\d+)/(\d+)\)$")
+_RE_FRACTION = re.compile(rf"^([+-]?)({_NUMBER})/({_NUMBER})$")
+_RE_DECIMAL = re.compile(rf"^([+-]?)({_NUMBER})$")
+_RE_RADICAL = re.compile(rf"^([+-]?)({_NUMBER}(?:/{_NUMBER})?)?√\(?(\d+)\)?(?:/(\d+))?$")
+_RE_POWER = re.compile(r"^(\d+)(?:\^(\d+))?$")
+_RE_TERM = re.compile(rf"^({_NUMBER}(?:/\d+)?)?((?:[a-zA-Z](?:\^\d+)?)*)$")
+_RE_VAR = re.compile(r"([a-zA-Z])(?:\^(\d+))?")
+_RE_POLYNOMIAL = re.compile(r"^[+-]?[0-9a-zA-Z.^/]+(?:[+-][0-9a-zA-Z.^/]+)*$")
+
+
+def normalize_math(text: str) -> str:
+    """표기 정규화: 위첨자 → ^지수, 전각 → 반각, 곱셈/마이너스 기호 통일, 공백 제거."""
+    text = _SUPERSCRIPT_RUN.sub(
+        lambda m: "^" + "".join(_SUPERSCRIPTS[c] for c in m.group()), text or ""
+    )
+    text = unicodedata.normalize("NFKC", text)
+    text = (
+        text.replace("−", "-").replace("–", "-")
+        .replace("*", "×").replace("·", "×").replace("⋅", "×")
+        .replace("÷", "/")
+    )
+    return "".join(text.split())
+
+
+def _to_fraction(sign: str, value: str) -> Fraction:
+    result = Fraction(value)
+    return -result if sign == "-" else result
+
+
+def _simplify_radical(coef: Fraction, radicand: int) -> tuple[Fraction, int]:
+    """c√n → 근호 안을 제곱 인수 없는 수로 정리."""
+    if radicand == 0:
+        return Fraction(0), 1
+    outside = 1
+    factor = 2
+    n = radicand
+    while factor * factor <= n:
+        while n % (factor * factor) == 0:
+            outside *= factor
+            n //= factor * factor
+        factor += 1
+    root = isqrt(n)
+    if root * root == n:
+        outside *= root
+        n = 1
+    return coef * outside, n
+
+
+def _strip_unit(text: str) -> tuple[str, str | None]:
+    for unit in _UNITS:
+        if text.endswith(unit) and len(text) > len(unit):
+            rest = text[: -len(unit)]
+            if rest[-1].isdigit() or rest[-1] in ")√":
+                return rest, unit
+    return text, None
+
+
+def _parse_number(text: str) -> tuple[Fraction, int] | None:
+    """수 해석: (유리 계수, 제곱 인수 없는 근호 안 수). 유리수는 근호 안 수 1."""
+    if text.startswith("(") and text.endswith(")") and "(" not in text[1:-1]:
+        text = text[1:-1]
+
+    if m := _RE_MIXED.match(text):
+        sign, whole, num, den = m.groups()
+        if int(den) == 0:
+            return None
+        value = int(whole) + Fraction(int(num), int(den))
+        return (-value if sign == "-" else value), 1
+
+    if m := _RE_FRACTION.match(text):
+        sign, num, den = m.groups()
+        if Fraction(den) == 0:
+            return None
+        return _to_fraction(sign, num) / Fraction(den), 1
+
+    if m := _RE_DECIMAL.match(text):
+        return _to_fraction(*m.groups()), 1
+
+    if m := _RE_RADICAL.match(text):
+        sign, coef, radicand, den = m.groups()
+        if coef and "/" in coef:
+            num, coef_den = coef.split("/")
+            value = Fraction(num) / Fraction(coef_den)
+        else:
+            value = Fraction(coef) if coef else Fraction(1)
+        if den:
+            if int(den) == 0:
+                return None
+            value /= int(den)
+        if sign == "-":
+            value = -value
+        return _simplify_radical(value, int(radicand))
+
+    return None
+
+
+def _parse_power_product(text: str) -> Counter | None:
+    """거듭제곱 곱 해석 (2^3×3^2 → {2: 3, 3: 2}). 곱셈 기호나 지수가 있어야 한다."""
+    if "×" not in text and "^" not in text:
+        return None
+    factors: Counter = Counter()
+    for part in text.split("×"):
+        m = _RE_POWER.match(part)
+        if not m:
+            return None
+        base, exponent = int(m.group(1)), int(m.group(2) or 1)
+        if base == 1:
+            continue
+        factors[base] += exponent
+    return factors
+
+
+def _parse_polynomial(text: str) -> dict | None:
+    """괄호 없이 동류항이 정리된 다항식 해석 ({((변수, 지수), ...): 계수})."""
+    if not re.search(r"[a-zA-Z]", text) or not _RE_POLYNOMIAL.match(text):
+        return None
+    terms: dict[tuple, Fraction] = {}
+    for sign, body in re.findall(r"([+-]?)([^+-]+)", text):
+        m = _RE_TERM.match(body)
+        if not m:
+            return None
+        coef_text, variables = m.groups()
+        if coef_text and "/" in coef_text:
+            num, den = coef_text.split("/")
+            if Fraction(den) == 0:
+                return None
+            coef = Fraction(num) / Fraction(den)
+        else:
+            coef = Fraction(coef_text) if coef_text else Fraction(1)
+        if sign == "-":
+            coef = -coef
+
+        powers: Counter = Counter()
+        for var, exponent in _RE_VAR.findall(variables):
+            powers[var] += int(exponent or 1)
+        key = tuple(sorted((var, exp) for var, exp in powers.items() if exp))
+        if key in terms:
+            # 동류항이 정리되지 않은 식은 판정하지 않음 (2a+3a는 "동류항 정리" 문제의 답이 아님)
+            return None
+        terms[key] = coef
+    return {key: coef for key, coef in terms.items() if coef != 0}
+
+
+def _parse(text: str) -> tuple[str, object, str | None] | None:
+    """답안 해석: (종류, 정규형, 단위)."""
+    stripped = (text or "").strip()
+    if m := _RE_MIXED_SPACED.match(stripped):
+        sign, whole, num, den = m.groups()
+        stripped = f"{sign}{whole}({num}/{den})"
+
+    normalized = normalize_math(stripped)
+    if not normalized:
+        return None
+
+    body, unit = _strip_unit(normalized)
+    if (number := _parse_number(body)) is not None:
+        return "number", number, unit
+    if (product := _parse_power_product(normalized)) is not None:
+        return "product", product, None
+    if (polynomial := _parse_polynomial(normalized)) is not None:
+        return "polynomial", polynomial, None
+    return None
+
+
+def _list_equivalent(student: str, correct: str) -> bool:
+    """정규화된 쉼표 구분 목록 동치 여부 (괄호로 감싼 좌표만 순서 비교)."""
+    student_items = student.strip("()").split(",")
+    correct_items = correct.strip("()").split(",")
+    if len(student_items) != len(correct_items):
+        return False
+    if correct.startswith("(") and correct.endswith(")"):
+        return all(compare_answers(s, c) for s, c in zip(student_items, correct_items))
+
+    # 해 목록: 동치 관계이므로 앞에서부터 짝을 지어도 최대 매칭과 같다
+    remaining = list(correct_items)
+    for item in student_items:
+        match = next((c for c in remaining if compare_answers(item, c)), None)
+        if match is None:
+            return False
+        remaining.remove(match)
+    return True
+
+
+def compare_answers(student_answer: str, correct_answer: str) -> bool | None:
+    """답안 동치 판정.
+
+    Returns:
+        True: 동치 / False: 같은 꼴인데 값이 다름 / None: 판정 불가 (꼴이 다르거나 해석 불가)
+    """
+    student = normalize_math(student_answer)
+    correct = normalize_math(correct_answer)
+    if student == correct:
+        return True
+
+    # 쉼표 구분 목록: 좌표 (a, b)는 순서대로, 해 목록은 순서 무관하게 비교.
+    # 목록은 꼴이 다양하므로(해의 일부만 입력, 부등식 조건 등) 불일치는 판정 불가로 넘긴다
+    if "," in correct:
+        return True if _list_equivalent(student, correct) else None
+
+    parsed_student = _parse(student_answer)
+    parsed_correct = _parse(correct_answer)
+    if parsed_student is None or parsed_correct is None:
+        return None
+
+    kind, value, unit = parsed_student
+    correct_kind, correct_value, correct_unit = parsed_correct
+    if kind != correct_kind:
+        return None
+    if unit and correct_unit and unit != correct_unit:
+        # 단위 환산은 하지 않음 (50mm vs 5cm 등은 판정 불가)
+        return None
+    return value == correct_value
+
+
+def answers_equivalent(student_answer: str, correct_answer: str) -> bool:
+    """동치가 확실한 경우만 True."""
+    return compare_answers(student_answer, correct_answer) is True
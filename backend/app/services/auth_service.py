@@ -10,11 +10,19 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     get_password_hash,
+    password_hasher,
     verify_password,
     verify_token,
 )
 from app.models.user import RefreshToken, User
 from app.schemas.auth import UserCreate, UserResponse
+from app.services.token_cache import token_cache
+
+
+def _expires_ts(expires_at: datetime) -> float:
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at.timestamp()
 
 
 class AuthService:
@@ -76,7 +84,7 @@ class AuthService:
         if not user:
             logger.warning("Login failed: user '%s' not found", login_id)
             return None
-        if not self.verify_password(password, user.hashed_password):
+        if not await password_hasher.verify(password, user.hashed_password):
             logger.warning("Login failed: wrong password for user '%s'", login_id)
             return None
         if not user.is_active:
@@ -90,7 +98,7 @@ class AuthService:
         if not self.db:
             raise ValueError("Database session required")
 
-        hashed_password = self.hash_password(user_data.password)
+        hashed_password = await password_hasher.hash(user_data.password)
         user = User(
             login_id=user_data.login_id,
             hashed_password=hashed_password,
@@ -132,17 +140,28 @@ class AuthService:
         )
         return await self.db.scalar(stmt)
 
-    async def revoke_refresh_token(self, token: str) -> bool:
-        """리프레시 토큰 무효화."""
+    async def revoke_refresh_token(self, token: str, stored: RefreshToken | None = None) -> bool:
+        """리프레시 토큰 무효화.
+
+        Args:
+            stored: 이미 조회한 토큰 행 (있으면 재조회 생략)
+        """
         if not self.db:
             raise ValueError("Database session required")
-        refresh_token = await self.get_refresh_token(token)
+        refresh_token = stored or await self.get_refresh_token(token)
         if not refresh_token:
             return False
         refresh_token.is_revoked = True
         await self.db.commit()
+        token_cache.revoke(token, _expires_ts(refresh_token.expires_at))
         return True
 
+    def revoke_access_token(self, token: str) -> None:
+        """액세스 토큰 즉시 폐기 (로그아웃)."""
+        payload = verify_token(token)
+        if payload:
+            token_cache.revoke(token, payload.get("exp"))
+
     async def revoke_all_user_tokens(self, user_id: str) -> None:
         """사용자의 모든 리프레시 토큰 무효화."""
         if not self.db:
@@ -155,3 +174,6 @@ class AuthService:
         for token in tokens:
             token.is_revoked = True
         await self.db.commit()
+        for token in tokens:
+            token_cache.revoke(token.token, _expires_ts(token.expires_at))
+        token_cache.revoke_user(user_id)
@@ -0,0 +1,163 @@
+"""개념 → 단원 역인덱스.
+
+Chapter.concept_ids(JSON)는 DB 인덱스를 탈 수 없으므로, 개념이 속한 단원 조회를
+프로세스 단위 인메모리 역인덱스로 처리한다.
+- 최초 사용 시 단원 전체(id, 학년, 활성 여부, concept_ids)를 한 번만 로드 (TTL 경과 시 재로드)
+- Chapter INSERT/UPDATE/DELETE ORM 이벤트로 단원 편집을 세션에 모아 두었다가 커밋 시 반영
+  (롤백되면 폐기)
+"""
+
+import time
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import object_session
+
+from app.core import commit_hooks
+from app.models.chapter import Chapter
+
+# 다른 워커 프로세스의 변경을 반영하기 위한 재로드 주기 (초)
+INDEX_TTL_SECONDS = 300
+
+# 커밋 시 반영할 변경 보관 키: {chapter_id: on_chapter_changed 인자 | None(삭제)}
+_PENDING_KEY = "chapter_concept_index_changes"
+
+
+class ChapterInfo(NamedTuple):
+    chapter_id: str
+    grade: str | None
+    is_active: bool
+    concept_ids: tuple[str, ...]
+
+
+def _grade_value(grade) -> str | None:
+    return grade.value if hasattr(grade, "value") else grade
+
+
+class ChapterConceptIndex:
+    """개념 ID → 단원 ID 목록 역인덱스."""
+
+    def __init__(self, ttl_seconds: float = INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        # {chapter_id: ChapterInfo} (로드 순서 유지)
+        self._chapters: dict[str, ChapterInfo] = {}
+        # {concept_id: [chapter_id, ...]}
+        self._by_concept: dict[str, list[str]] = {}
+        self._loaded_at: float | None = None
+
+    def clear(self) -> None:
+        """인덱스 전체 초기화."""
+        self._chapters.clear()
+        self._by_concept.clear()
+        self._loaded_at = None
+
+    def is_loaded(self) -> bool:
+        """로드되어 있고 TTL 이내인지 여부."""
+        if self._loaded_at is None:
+            return False
+        return time.monotonic() - self._loaded_at < self.ttl_seconds
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """미로드 또는 TTL 경과 시 단원 전체를 한 번의 쿼리로 재구성."""
+        if self.is_loaded():
+            return
+
+        stmt = select(Chapter.id, Chapter.grade, Chapter.is_active, Chapter.concept_ids)
+        rows = (await db.execute(stmt)).all()
+
+        self._chapters.clear()
+        self._by_concept.clear()
+        for chapter_id, grade, is_active, concept_ids in rows:
+            self._add(ChapterInfo(chapter_id, _grade_value(grade), bool(is_active), tuple(concept_ids or ())))
+        self._loaded_at = time.monotonic()
+
+    def get(self, chapter_id: str) -> ChapterInfo | None:
+        """단원 정보 조회."""
+        return self._chapters.get(chapter_id)
+
+    def chapters_for_concept(
+        self, concept_id: str, grade: str | None = None, active_only: bool = False
+    ) -> list[ChapterInfo]:
+        """개념이 속한 단원 목록."""
+        return self.chapters_for_concepts([concept_id], grade, active_only)
+
+    def chapters_for_concepts(
+        self, concept_ids: Iterable[str], grade: str | None = None, active_only: bool = False
+    ) -> list[ChapterInfo]:
+        """개념들 중 하나라도 포함하는 단원 목록 (중복 제거, 로드 순서 유지)."""
+        grade = _grade_value(grade)
+        chapter_ids: dict[str, None] = {}
+        for concept_id in concept_ids:
+            for chapter_id in self._by_concept.get(concept_id, ()):
+                chapter_ids[chapter_id] = None
+
+        result = []
+        for chapter_id in chapter_ids:
+            info = self._chapters[chapter_id]
+            if grade and info.grade != grade:
+                continue
+            if active_only and not info.is_active:
+                continue
+            result.append(info)
+        return result
+
+    def on_chapter_changed(self, chapter_id: str, grade, is_active: bool | None,
+                           concept_ids: list[str] | None) -> None:
+        """단원 생성/수정 반영."""
+        if self._loaded_at is None:
+            return
+        self._remove(chapter_id)
+        self._add(ChapterInfo(
+            chapter_id, _grade_value(grade), is_active is not False, tuple(concept_ids or ())
+        ))
+
+    def discard(self, chapter_id: str) -> None:
+        """단원 삭제 반영."""
+        self._remove(chapter_id)
+
+    def _add(self, info: ChapterInfo) -> None:
+        self._chapters[info.chapter_id] = info
+        for concept_id in dict.fromkeys(info.concept_ids):
+            self._by_concept.setdefault(concept_id, []).append(info.chapter_id)
+
+    def _remove(self, chapter_id: str) -> None:
+        info = self._chapters.pop(chapter_id, None)
+        if not info:
+            return
+        for concept_id in set(info.concept_ids):
+            chapter_ids = self._by_concept.get(concept_id)
+            if chapter_ids and chapter_id in chapter_ids:
+                chapter_ids.remove(chapter_id)
+                if not chapter_ids:
+                    del self._by_concept[concept_id]
+
+
+# 프로세스 전역 인덱스
+chapter_concept_index = ChapterConceptIndex()
+
+
+def _apply(changes: dict[str, tuple | None]) -> None:
+    for chapter_id, change in changes.items():
+        if change is None:
+            chapter_concept_index.discard(chapter_id)
+        else:
+            chapter_concept_index.on_chapter_changed(chapter_id, *change)
+
+
+commit_hooks.register(_PENDING_KEY, _apply)
+
+
+@event.listens_for(Chapter, "after_insert")
+@event.listens_for(Chapter, "after_update")
+def _sync_chapter_index(mapper, connection, target: Chapter) -> None:
+    commit_hooks.stage(
+        object_session(target), _PENDING_KEY, target.id,
+        (target.grade, target.is_active, list(target.concept_ids or [])),
+    )
+
+
+@event.listens_for(Chapter, "after_delete")
+def _remove_chapter_from_index(mapper, connection, target: Chapter) -> None:
+    commit_hooks.stage(object_session(target), _PENDING_KEY, target.id, None)
@@ -4,29 +4,14 @@ import json
 import logging
 from uuid import uuid4
 
-from google import genai
 from google.genai import types
 
-from app.core.config import settings
 from app.schemas.common import ConceptMethod, QuestionType, ProblemPart
+from app.services.gemini_client import get_gemini_client
 
 logger = logging.getLogger(__name__)
 
 
-# 싱글턴 클라이언트
-_client: genai.Client | None = None
-
-
-def _get_client() -> genai.Client | None:
-    """Gemini 클라이언트 반환. API 키 미설정 시 None."""
-    global _client
-    if not settings.GEMINI_API_KEY:
-        return None
-    if _client is None:
-        _client = genai.Client(api_key=settings.GEMINI_API_KEY)
-    return _client
-
-
 class ConceptGenerator:
     """개념 문항 전용 생성기."""
 
@@ -41,7 +26,7 @@ class ConceptGenerator:
         start_seq: int = 1,
     ) -> list[dict] | None:
         """Type A: 점진적 빈칸 소거 (Gradual Fading) 문항 4단계 생성."""
-        client = _get_client()
+        client = get_gemini_client()
         if not client:
             return None
 
@@ -54,8 +39,7 @@ class ConceptGenerator:
                  "출력: 핵심 문장 1개만 출력 (설명 제외)"
              )
              try:
-                 resp = client.models.generate_content(
-                     model=settings.GEMINI_MODEL_NAME,
+                 resp = await client.generate_content(
                      contents=key_summary_prompt,
                  )
                  key_summary = resp.text.strip()
@@ -90,8 +74,7 @@ class ConceptGenerator:
         )
 
         try:
-            response = client.models.generate_content(
-                model=settings.GEMINI_MODEL_NAME,
+            response = await client.generate_content(
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     temperature=0.2, # 정형화된 출력을 위해 낮음
@@ -149,7 +132,7 @@ class ConceptGenerator:
         start_seq: int = 1,
     ) -> list[dict] | None:
         """Type B: 오개념 분석 (Error Analysis) 문항 생성."""
-        client = _get_client()
+        client = get_gemini_client()
         if not client:
             return None
 
@@ -179,8 +162,7 @@ class ConceptGenerator:
         )
 
         try:
-            response = client.models.generate_content(
-                model=settings.GEMINI_MODEL_NAME,
+            response = await client.generate_content(
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     temperature=0.4,
@@ -232,7 +214,7 @@ class ConceptGenerator:
         start_seq: int = 1,
     ) -> list[dict] | None:
         """Type C: 시각적 해체 (Visual Decoding) 문항 생성."""
-        client = _get_client()
+        client = get_gemini_client()
         if not client:
             return None
 
@@ -264,8 +246,7 @@ class ConceptGenerator:
         )
 
         try:
-            response = client.models.generate_content(
-                model=settings.GEMINI_MODEL_NAME,
+            response = await client.generate_content(
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     temperature=0.3,
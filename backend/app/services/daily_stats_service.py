@@ -0,0 +1,189 @@
+"""학생 일별 학습 집계(롤업) 서비스.
+
+StudentDailyStat 테이블을 TestAttempt ORM 이벤트로 증분 갱신하고,
+통계/추이 API는 날짜 범위 쿼리 한 번으로 일별 값을 읽는다.
+- 시도 완료(completed_at 설정) 시: 테스트 1건 + 문제/정답 수 + 풀이 시간 합산
+- 완료 후 정답 수 정정(AI 재채점 등) 시: 변경분만 반영
+- 완료된 시도 삭제 시: 차감
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import get_history
+
+from app.models.answer_log import AnswerLog
+from app.models.student_daily_stat import StudentDailyStat
+from app.models.test_attempt import TestAttempt
+
+_daily_table = StudentDailyStat.__table__
+
+
+def kst_date_str(dt: datetime) -> str:
+    """UTC datetime(naive 또는 aware)을 KST 날짜 문자열로 변환."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt + timedelta(hours=9)).date().isoformat()
+
+
+class DailyStatsService:
+    """학생 일별 집계 조회 서비스."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_daily_totals(
+        self, student_ids: list[str], start_day: date, end_day: date
+    ) -> dict[str, dict]:
+        """학생 집합의 날짜별 합계 (단일 범위 쿼리).
+
+        Returns:
+            {"YYYY-MM-DD": {"active_students", "tests_completed",
+                            "questions_answered", "correct_count", "time_spent_seconds"}}
+        """
+        if not student_ids:
+            return {}
+
+        stmt = (
+            select(
+                StudentDailyStat.date,
+                func.count(StudentDailyStat.student_id).label("active_students"),
+                func.sum(StudentDailyStat.tests_completed).label("tests_completed"),
+                func.sum(StudentDailyStat.questions_answered).label("questions_answered"),
+                func.sum(StudentDailyStat.correct_count).label("correct_count"),
+                func.sum(StudentDailyStat.time_spent_seconds).label("time_spent_seconds"),
+            )
+            .where(
+                StudentDailyStat.student_id.in_(student_ids),
+                StudentDailyStat.date >= start_day.isoformat(),
+                StudentDailyStat.date <= end_day.isoformat(),
+                StudentDailyStat.tests_completed > 0,
+            )
+            .group_by(StudentDailyStat.date)
+        )
+        return {
+            row.date: {
+                "active_students": row.active_students or 0,
+                "tests_completed": row.tests_completed or 0,
+                "questions_answered": row.questions_answered or 0,
+                "correct_count": row.correct_count or 0,
+                "time_spent_seconds": row.time_spent_seconds or 0,
+            }
+            for row in await self.db.execute(stmt)
+        }
+
+
+def _insert(connection: Connection):
+    """DB 방언별 INSERT ... ON CONFLICT 생성기."""
+    dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+    return dialect.insert(_daily_table)
+
+
+def _apply_delta(
+    connection: Connection,
+    student_id: str,
+    day: str,
+    tests: int,
+    questions: int,
+    correct: int,
+    seconds: int,
+) -> None:
+    """(학생, 날짜) 행에 증감 반영. 행이 없으면 생성 (동시 완료에도 안전한 단일 upsert)."""
+    if not (tests or questions or correct or seconds):
+        return
+
+    stmt = _insert(connection).values(
+        id=str(uuid4()),
+        student_id=student_id,
+        date=day,
+        tests_completed=tests,
+        questions_answered=questions,
+        correct_count=correct,
+        time_spent_seconds=seconds,
+    )
+    connection.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["student_id", "date"],
+            set_={
+                "tests_completed": _daily_table.c.tests_completed + tests,
+                "questions_answered": _daily_table.c.questions_answered + questions,
+                "correct_count": _daily_table.c.correct_count + correct,
+                "time_spent_seconds": _daily_table.c.time_spent_seconds + seconds,
+                "updated_at": func.now(),
+            },
+        )
+    )
+
+
+def _attempt_day(connection: Connection, target: TestAttempt) -> str | None:
+    """집계 날짜 (시작 시각 기준). started_at은 서버 기본값이므로 DB에서 읽는다."""
+    started_at = connection.scalar(
+        select(TestAttempt.started_at).where(TestAttempt.id == target.id)
+    )
+    anchor = started_at or target.completed_at
+    return kst_date_str(anchor) if anchor else None
+
+
+def _record_completion(connection: Connection, target: TestAttempt, sign: int = 1) -> None:
+    """완료된 시도 한 건을 집계에 더하거나(sign=1) 뺀다(sign=-1)."""
+    day = _attempt_day(connection, target)
+    if not day:
+        return
+    logs = target.__dict__.get("answer_logs") if sign < 0 else None
+    if logs is not None:
+        # 삭제 시에는 cascade로 답안 기록이 먼저 삭제되므로 로드된 목록 사용
+        seconds = sum(log.time_spent_seconds or 0 for log in logs)
+    else:
+        seconds = connection.scalar(
+            select(func.coalesce(func.sum(AnswerLog.time_spent_seconds), 0))
+            .where(AnswerLog.attempt_id == target.id)
+        ) or 0
+    _apply_delta(
+        connection, target.student_id, day,
+        tests=sign,
+        questions=sign * (target.total_count or 0),
+        correct=sign * (target.correct_count or 0),
+        seconds=sign * int(seconds),
+    )
+
+
+def _history_delta(target: TestAttempt, key: str) -> int:
+    history = get_history(target, key)
+    if not history.added or not history.deleted:
+        return 0
+    return (history.added[0] or 0) - (history.deleted[0] or 0)
+
+
+@event.listens_for(TestAttempt, "after_insert")
+def _rollup_on_insert(mapper, connection, target: TestAttempt) -> None:
+    if target.completed_at is not None:
+        _record_completion(connection, target)
+
+
+@event.listens_for(TestAttempt, "after_update")
+def _rollup_on_update(mapper, connection, target: TestAttempt) -> None:
+    if target.completed_at is None:
+        return
+
+    completed = get_history(target, "completed_at")
+    if completed.added and not any(completed.deleted):
+        _record_completion(connection, target)
+        return
+
+    # 완료 후 정정: 변경분만 반영
+    questions = _history_delta(target, "total_count")
+    correct = _history_delta(target, "correct_count")
+    if questions or correct:
+        day = _attempt_day(connection, target)
+        if day:
+            _apply_delta(connection, target.student_id, day, 0, questions, correct, 0)
+
+
+@event.listens_for(TestAttempt, "before_delete")
+def _rollup_on_delete(mapper, connection, target: TestAttempt) -> None:
+    if target.completed_at is not None:
+        _record_completion(connection, target, sign=-1)
@@ -1,15 +1,13 @@
 """일일 테스트 서비스."""
 
-import asyncio
 import logging
 import random
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, or_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.chapter import Chapter
 from app.models.chapter_progress import ChapterProgress
 from app.models.concept import Concept
 from app.models.concept_mastery import ConceptMastery
@@ -19,10 +17,14 @@ from app.models.test import Test
 from app.models.test_attempt import TestAttempt
 from app.models.user import User
 from app.schemas.common import QuestionType, ConceptMethod
+from app.services.ai_generation_scheduler import GenerationScheduler
 from app.services.ai_service import AIService
-from app.services.template_generator import TemplateGenerator
+from app.services.question_pool_index import QuestionMeta, question_pool_index
+from app.services.template_generator import variant_seed
+from app.services.template_variant_pool import template_variant_pool
 from app.services.review_service import ReviewService
 from app.services.test_service import TestService
+from app.services.unlock_frontier import unlock_frontier
 
 logger = logging.getLogger(__name__)
 
@@ -303,14 +305,9 @@ class DailyTestService:
         ]
 
         # ── 1) 약점 보강 문제 (난이도 제한 없이 넓게 조회) ──
-        weak_pool: list[Question] = []
+        weak_pool: list[str] = []
         if weak_concept_ids:
-            weak_query = select(Question).where(
-                Question.is_active == True,  # noqa: E712
-                Question.concept_id.in_(weak_concept_ids),
-            )
-            weak_query = self._build_category_filter(weak_query, category)
-            weak_pool = list((await self.db.scalars(weak_query)).all())
+            weak_pool = [q.id for q in await self._get_category_candidates(weak_concept_ids, category)]
 
         # ── 2) 일반 문제 풀 (약점 개념 제외, 기존 난이도 범위) ──
         normal_concept_ids = [
@@ -318,24 +315,26 @@ class DailyTestService:
             if cid not in weak_concept_ids
         ] if weak_concept_ids else available_concept_ids
 
-        base_query = select(Question).where(
-            Question.is_active == True,  # noqa: E712
-            Question.difficulty >= diff_min,
-            Question.difficulty <= diff_max,
-            ~Question.id.in_(recently_used) if recently_used else True,
-        )
-        base_query = self._build_category_filter(base_query, category)
-        if normal_concept_ids:
-            base_query = base_query.where(
-                Question.concept_id.in_(normal_concept_ids)
-            )
-        elif available_concept_ids:
+        if available_concept_ids:
             # 모든 개념이 약점이면 전체에서 출제 (약점 슬롯 + 일반 슬롯 모두 약점)
-            base_query = base_query.where(
-                Question.concept_id.in_(available_concept_ids)
+            recently_used_set = set(recently_used)
+            all_questions = [
+                q.id
+                for q in await self._get_category_candidates(
+                    normal_concept_ids or available_concept_ids, category
+                )
+                if diff_min <= q.difficulty <= diff_max and q.id not in recently_used_set
+            ]
+        else:
+            # 해금 개념이 없으면(학년 미지정) 개념 제한 없이 ID만 조회
+            base_query = select(Question.id).where(
+                Question.is_active == True,  # noqa: E712
+                Question.difficulty >= diff_min,
+                Question.difficulty <= diff_max,
+                ~Question.id.in_(recently_used) if recently_used else True,
             )
-
-        all_questions = list((await self.db.scalars(base_query)).all())
+            base_query = self._build_category_filter(base_query, category)
+            all_questions = list((await self.db.scalars(base_query)).all())
 
         if not all_questions and not weak_pool:
             return await self._select_questions_fallback(
@@ -345,7 +344,7 @@ class DailyTestService:
         # ── 3) 오답 복습 (스케줄 기반) ──
         review_svc = ReviewService(self.db)
         review_question_ids = await review_svc.get_due_question_ids(student_id, limit=count)
-        all_question_ids = {q.id for q in all_questions} | {q.id for q in weak_pool}
+        all_question_ids = set(all_questions) | set(weak_pool)
         review_ids_filtered = [qid for qid in review_question_ids if qid in all_question_ids]
 
         # ── 4) 슬롯 배분 ──
@@ -363,14 +362,14 @@ class DailyTestService:
         # 약점 보강 (최근 사용 제외 안 함 — 잊지 않도록 반복)
         selected_set = set(selected)
         if weak_pool:
-            weak_candidates = [q.id for q in weak_pool if q.id not in selected_set]
+            weak_candidates = [qid for qid in weak_pool if qid not in selected_set]
             pick = min(weak_slot, len(weak_candidates))
             if pick > 0:
                 selected += random.sample(weak_candidates, pick)
                 selected_set = set(selected)
 
         # 일반 문제
-        normal_candidates = [q.id for q in all_questions if q.id not in selected_set]
+        normal_candidates = [qid for qid in all_questions if qid not in selected_set]
         pick = min(normal_slot, len(normal_candidates))
         if pick > 0:
             selected += random.sample(normal_candidates, pick)
@@ -379,7 +378,7 @@ class DailyTestService:
         if len(selected) < count:
             remaining = count - len(selected)
             selected_set = set(selected)
-            leftover = [q.id for q in (all_questions + weak_pool) if q.id not in selected_set]
+            leftover = [qid for qid in (all_questions + weak_pool) if qid not in selected_set]
             # 중복 제거
             leftover = list(dict.fromkeys(leftover))
             selected += random.sample(leftover, min(remaining, len(leftover)))
@@ -409,6 +408,33 @@ class DailyTestService:
             )
         return query
 
+    async def _get_category_candidates(
+        self, concept_ids: list[str], category: str
+    ) -> list[QuestionMeta]:
+        """개념별 활성 문제 메타데이터에 카테고리 필터 적용 (_build_category_filter와 같은 조건).
+
+        fill_in_blank 부적절 패턴은 본문 검사가 필요해 해당 문제 ID만 DB에서 조회한다.
+        """
+        await question_pool_index.ensure_loaded(self.db, concept_ids)
+        questions = question_pool_index.get_questions(concept_ids)
+        if category == "fill_in_blank":
+            questions = [q for q in questions if q.question_type == QuestionType.FILL_IN_BLANK]
+            if not questions:
+                return questions
+            bad_stmt = select(Question.id).where(
+                Question.concept_id.in_(concept_ids),
+                Question.question_type == QuestionType.FILL_IN_BLANK,
+                or_(*(Question.content.contains(pat) for pat in self._FB_BAD_PATTERNS)),
+            )
+            bad_ids = set((await self.db.scalars(bad_stmt)).all())
+            return [q for q in questions if q.id not in bad_ids]
+        elif category in ("concept", "computation"):
+            return [
+                q for q in questions
+                if q.category == category and q.question_type != QuestionType.FILL_IN_BLANK
+            ]
+        return questions
+
     async def _select_questions_fallback(
         self,
         student_id: str,
@@ -491,53 +517,10 @@ class DailyTestService:
         return list(set(used))
 
     async def _get_student_available_concept_ids(self, student_id: str, grade: str | None) -> list[str]:
-        """학생이 해금한 개념 ID만 반환 (ChapterProgress.is_unlocked + ConceptMastery.is_unlocked 기반)."""
-        from app.models.chapter_progress import ChapterProgress
-
-        # 1. 해금된 챕터의 개념 ID 목록 수집
-        unlocked_ch_stmt = (
-            select(Chapter)
-            .join(ChapterProgress, Chapter.id == ChapterProgress.chapter_id)
-            .where(
-                ChapterProgress.student_id == student_id,
-                ChapterProgress.is_unlocked == True,  # noqa: E712
-                Chapter.grade == grade,
-            )
-        )
-        unlocked_chapters = list((await self.db.scalars(unlocked_ch_stmt)).all())
-        chapter_concept_ids = set()
-        for ch in unlocked_chapters:
-            chapter_concept_ids.update(ch.concept_ids or [])
-
-        if not chapter_concept_ids:
-            # 폴백: 해금된 챕터가 없으면 첫 챕터 첫 개념 자동 해금
-            from app.services.mastery_service import MasteryService
-            first_chapter_stmt = (
-                select(Chapter)
-                .where(Chapter.grade == grade, Chapter.semester == 1, Chapter.chapter_number == 1)
-            )
-            first_chapter = await self.db.scalar(first_chapter_stmt)
-            if not first_chapter or not first_chapter.concept_ids:
-                return []
-
-            mastery_service = MasteryService(self.db)
-            first_concept_id = first_chapter.concept_ids[0]
-            await mastery_service.ensure_first_concept_unlocked(student_id, first_chapter.id)
-            await self.db.flush()
-            return [first_concept_id]
-
-        # 2. 해금된 개념 중 해금된 챕터에 속한 것만 반환
-        stmt = (
-            select(ConceptMastery.concept_id)
-            .join(Concept, ConceptMastery.concept_id == Concept.id)
-            .where(
-                ConceptMastery.student_id == student_id,
-                ConceptMastery.is_unlocked == True,  # noqa: E712
-                Concept.grade == grade,
-                ConceptMastery.concept_id.in_(chapter_concept_ids),
-            )
+        """학생이 해금한 개념 ID만 반환 (해금 현황 캐시 경유)."""
+        return await unlock_frontier.available_concept_ids(
+            self.db, student_id, grade
         )
-        return list((await self.db.scalars(stmt)).all())
 
     async def _get_mastery_map(self, student_id: str) -> dict[str, int]:
         """학생의 개념별 숙련도 맵."""
@@ -636,74 +619,33 @@ class DailyTestService:
         count: int,
         exclude_ids: set[str] | None = None,
     ) -> list[str]:
-        """템플릿으로 연산 문제 생성 -> DB 저장 -> ID 반환.
+        """템플릿 연산 문제 ID 반환 (선생성 풀에서 미출제 변형을 꺼냄).
 
         숫자를 랜덤으로 바꿔 무한 변형 생성. AI 비용 0원.
         """
-        generator = TemplateGenerator()
-        if not generator.get_available_concepts():
-            return []
-
         available_concept_ids = await self._get_student_available_concept_ids(
             student_id, grade
         )
         if not available_concept_ids:
             return []
 
-        # 기존 DB의 tpl- ID 조회 (중복 방지)
-        existing_tpl_stmt = select(Question.id).where(
-            Question.id.like("tpl-%"),
-            Question.concept_id.in_(available_concept_ids),
-        )
-        existing_tpl_ids = set(
-            (await self.db.scalars(existing_tpl_stmt)).all()
-        )
-        all_exclude = (exclude_ids or set()) | existing_tpl_ids
-
-        variants = generator.generate_for_grade(
-            grade, count,
-            available_concept_ids=available_concept_ids,
-            exclude_ids=all_exclude,
-        )
-
-        generated_ids = []
-        for v in variants:
-            # 이미 DB에 있으면 재사용
-            existing = await self.db.get(Question, v["id"])
-            if existing:
-                generated_ids.append(v["id"])
-                continue
-
-            q = Question(
-                id=v["id"],
-                concept_id=v["concept_id"],
-                category=v["category"],
-                part=v["part"],
-                question_type=v["question_type"],
-                difficulty=v["difficulty"],
-                content=v["content"],
-                options=v.get("options"),
-                correct_answer=v["correct_answer"],
-                explanation=v.get("explanation", ""),
-                points=v.get("points", 10),
-                blank_config=v.get("blank_config"),
-                is_active=True,
+        try:
+            generated_ids = await template_variant_pool.claim(
+                self.db, grade, count,
+                available_concept_ids=available_concept_ids,
+                exclude_ids=exclude_ids,
+                seed=variant_seed(student_id, self.get_today_str()),
             )
-            self.db.add(q)
-            generated_ids.append(v["id"])
+        except IntegrityError:
+            await self.db.rollback()
+            logger.warning("[Template] DB 저장 중 중복 ID 충돌, 스킵")
+            return []
 
         if generated_ids:
-            try:
-                await self.db.flush()
-                logger.info(
-                    f"[Template] {grade} 연산 문제 {len(generated_ids)}개 생성 "
-                    f"(학생: {student_id})"
-                )
-            except IntegrityError:
-                await self.db.rollback()
-                logger.warning("[Template] DB 저장 중 중복 ID 충돌, 스킵")
-                return []
-
+            logger.info(
+                f"[Template] {grade} 연산 문제 {len(generated_ids)}개 생성 "
+                f"(학생: {student_id})"
+            )
         return generated_ids
 
     async def _generate_ai_questions(
@@ -757,91 +699,83 @@ class DailyTestService:
         existing_contents = list((await self.db.scalars(existing_stmt)).all())
         existing_set = set(c.strip() for c in existing_contents if c)
 
-        # 개념별로 분배하여 생성 (한 개념에 몰리지 않게)
+        # 개념별로 분배하여 생성 요청 계획 (한 개념에 몰리지 않게)
         ai_service = AIService()
         generated_ids: list[str] = []
-        remaining = count
-        current_seq = next_seq
+        per_concept = max(3, count // len(concepts) + 2)
+        existing_snapshot = list(existing_set)[:20]
+
+        def _job(concept: Concept, batch: int, start_seq: int):
+            return lambda: ai_service.generate_questions(
+                concept_name=concept.name,
+                concept_id=concept.id,
+                grade=grade_str,
+                category=category if category != "fill_in_blank" else (concept.category.value if hasattr(concept.category, "value") else concept.category),
+                part=concept.part.value if hasattr(concept.part, "value") else str(concept.part),
+                question_type=q_type,
+                count=batch,
+                # [Phase 6] 학년군별 차등 비율 적용 (Phase 6 보완)
+                concept_method=self._pick_random_concept_method(grade_str) if category == "concept" else None,
+                existing_contents=existing_snapshot,
+                id_prefix=id_prefix,
+                start_seq=start_seq,
+            )
 
+        # 요청마다 겹치지 않는 시퀀스 구간 배정, 실패/중복 대비 한 요청분 여유
+        jobs = []
+        planned = 0
         random.shuffle(concepts)
         for concept in concepts:
-            if remaining <= 0:
+            if planned >= count + per_concept:
                 break
-
-            # 이 개념에 대해 생성할 수 (중복 제거 마진을 위해 +2)
-            batch = min(remaining + 2, max(3, count // len(concepts) + 2))
-
-            # AI 문제 생성 (기존 문제 전달 + 시드 패턴 ID) - 10초 타임아웃
+            batch = min(count - planned + 2, per_concept) if planned < count else per_concept
+            jobs.append(_job(concept, batch, next_seq + planned))
+            planned += batch
+
+        def _accept(q_dict: dict) -> bool:
+            # 중복 체크: content가 기존/이번 생성분과 동일하면 건너뛰기
+            content = q_dict.get("content", "").strip()
+            if content in existing_set:
+                logger.debug("Skipping duplicate AI question: %s", content[:50])
+                return False
+            existing_set.add(content)
+            return True
+
+        # 병렬 생성 (요청별 10초 타임아웃, 초과 시 요청 취소) - 목표 수량 충족 시 나머지 취소
+        accepted = await GenerationScheduler(timeout=10.0).run(jobs, accept=_accept, limit=count)
+
+        # DB에 저장 (영구 저장 → 다음에 시드처럼 재활용)
+        for q_dict in accepted:
+            content = q_dict.get("content", "").strip()
             try:
-                result = await asyncio.wait_for(
-                    ai_service.generate_questions(
-                        concept_name=concept.name,
-                        concept_id=concept.id,
-                        grade=grade_str,
-                        category=category if category != "fill_in_blank" else (concept.category.value if hasattr(concept.category, "value") else concept.category),
-                        part=concept.part.value if hasattr(concept.part, "value") else str(concept.part),
-                        question_type=q_type,
-                        count=batch,
-                        # [Phase 6] 학년군별 차등 비율 적용 (Phase 6 보완)
-                        concept_method=self._pick_random_concept_method(grade_str) if category == "concept" else None,
-                        existing_contents=list(existing_set)[:20],
-                        id_prefix=id_prefix,
-                        start_seq=current_seq,
-                    ),
-                    timeout=10.0,
+                q = Question(
+                    id=q_dict["id"],
+                    concept_id=q_dict["concept_id"],
+                    category=q_dict["category"],
+                    part=q_dict["part"],
+                    question_type=q_dict["question_type"],
+                    difficulty=q_dict["difficulty"],
+                    content=content,
+                    options=q_dict.get("options"),
+                    correct_answer=q_dict["correct_answer"],
+                    explanation=q_dict.get("explanation", ""),
+                    points=q_dict.get("points", 10),
+                    blank_config=q_dict.get("blank_config"),
+                    concept_method=q_dict.get("concept_method"), # DB 저장
+                    is_active=True,
                 )
-            except asyncio.TimeoutError:
-                logger.warning("AI question generation timed out for concept %s", concept.name)
-                result = None
-
-            if not result:
+                self.db.add(q)
+                generated_ids.append(q.id)
+            except Exception:
+                logger.warning("Failed to save AI question: %s", q_dict.get("id"))
                 continue
 
-            # DB에 저장 (영구 저장 → 다음에 시드처럼 재활용)
-            for q_dict in result:
-                if remaining <= 0:
-                    break
-
-                # 중복 체크: content가 기존과 동일하면 건너뛰기
-                content = q_dict.get("content", "").strip()
-                if content in existing_set:
-                    logger.debug("Skipping duplicate AI question: %s", content[:50])
-                    current_seq += 1
-                    continue
-
-                try:
-                    q = Question(
-                        id=q_dict["id"],
-                        concept_id=q_dict["concept_id"],
-                        category=q_dict["category"],
-                        part=q_dict["part"],
-                        question_type=q_dict["question_type"],
-                        difficulty=q_dict["difficulty"],
-                        content=content,
-                        options=q_dict.get("options"),
-                        correct_answer=q_dict["correct_answer"],
-                        explanation=q_dict.get("explanation", ""),
-                        points=q_dict.get("points", 10),
-                        blank_config=q_dict.get("blank_config"),
-                        concept_method=q_dict.get("concept_method"), # DB 저장
-                        is_active=True,
-                    )
-                    self.db.add(q)
-                    generated_ids.append(q.id)
-                    existing_set.add(content)
-                    remaining -= 1
-                    current_seq += 1
-                except Exception:
-                    logger.warning("Failed to save AI question: %s", q_dict.get("id"))
-                    current_seq += 1
-                    continue
-
         if generated_ids:
             await self.db.flush()
             self._ai_generated_count += len(generated_ids)
             logger.info(
                 "AI generated %d questions [%s-%03d~%03d] for student %s (saved to DB)",
-                len(generated_ids), id_prefix, next_seq, current_seq - 1,
+                len(generated_ids), id_prefix, next_seq, next_seq + planned - 1,
                 student_id[:8],
             )
 
@@ -0,0 +1,126 @@
+"""Gemini 비동기 호출 계층.
+
+동기 `client.models.generate_content`는 호출 시간 내내 이벤트 루프를 멈추게 하므로,
+모든 AI 호출은 SDK의 비동기 API(`client.aio`)를 이 모듈을 통해 사용한다.
+- 프로세스 전역 동시 호출 제한 (GEMINI_MAX_CONCURRENCY)
+- 호출별 마감 시간: 대기 시간을 포함하며, 초과 시 요청 자체를 취소
+- 호출 수/실패/타임아웃/지연 시간 지표 (metrics)
+"""
+
+import asyncio
+import logging
+import time
+
+from google import genai
+from google.genai import types
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiClient:
+    """동시성 제한과 마감 시간이 적용된 Gemini 비동기 클라이언트."""
+
+    def __init__(
+        self,
+        client: genai.Client,
+        max_concurrency: int = settings.GEMINI_MAX_CONCURRENCY,
+        timeout_seconds: float = settings.GEMINI_TIMEOUT_SECONDS,
+    ):
+        self._client = client
+        self.max_concurrency = max_concurrency
+        self.timeout_seconds = timeout_seconds
+        # 세마포어는 이벤트 루프에 묶이므로 루프별로 생성
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight = 0
+        self._stats = {
+            "calls": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "total_latency_ms": 0.0,
+            "max_latency_ms": 0.0,
+        }
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def generate_content(
+        self,
+        contents,
+        config: types.GenerateContentConfig | None = None,
+        timeout: float | None = None,
+        model: str | None = None,
+    ) -> types.GenerateContentResponse:
+        """Gemini 응답 생성.
+
+        Raises:
+            asyncio.TimeoutError: 마감 시간 초과 (진행 중인 요청은 취소됨)
+            Exception: SDK 호출 실패
+        """
+        self._stats["calls"] += 1
+        started = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(
+                self._call(contents, config, model or settings.GEMINI_MODEL_NAME),
+                timeout=timeout or self.timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            self._stats["timed_out"] += 1
+            logger.warning("Gemini call timed out after %.1fs", timeout or self.timeout_seconds)
+            raise
+        except Exception:
+            self._stats["failed"] += 1
+            raise
+        finally:
+            latency_ms = (time.perf_counter() - started) * 1000
+            self._stats["total_latency_ms"] += latency_ms
+            self._stats["max_latency_ms"] = max(self._stats["max_latency_ms"], latency_ms)
+
+        self._stats["succeeded"] += 1
+        return response
+
+    async def _call(self, contents, config, model: str):
+        async with self._get_semaphore():
+            self._in_flight += 1
+            try:
+                return await self._client.aio.models.generate_content(
+                    model=model, contents=contents, config=config,
+                )
+            finally:
+                self._in_flight -= 1
+
+    def metrics(self) -> dict:
+        """호출 지표 스냅샷."""
+        calls = self._stats["calls"]
+        return {
+            **self._stats,
+            "in_flight": self._in_flight,
+            "max_concurrency": self.max_concurrency,
+            "avg_latency_ms": round(self._stats["total_latency_ms"] / calls, 1) if calls else 0.0,
+        }
+
+    def reset_metrics(self) -> None:
+        """지표 초기화."""
+        for key in self._stats:
+            self._stats[key] = 0
+
+
+# 싱글턴 클라이언트
+_client: GeminiClient | None = None
+
+
+def get_gemini_client() -> GeminiClient | None:
+    """Gemini 비동기 클라이언트 반환. API 키 미설정 시 None."""
+    global _client
+    if not settings.GEMINI_API_KEY:
+        return None
+    if _client is None:
+        _client = GeminiClient(genai.Client(api_key=settings.GEMINI_API_KEY))
+    return _client
@@ -1,5 +1,7 @@
 """채점 서비스."""
 
+from datetime import datetime, timedelta, timezone
+
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -7,6 +9,9 @@ from app.models.question import Question
 from app.models.test_attempt import TestAttempt
 from app.models.answer_log import AnswerLog
 from app.models.focus_check import FocusCheckItem
+from app.schemas.common import QuestionType
+from app.services.adaptive_service import AdaptiveService
+from app.services.answer_equivalence import answers_equivalent
 
 # 재도전 관련 상수
 MAX_RETRY_COUNT = 4  # 최대 재도전 횟수 (4회 틀리면 집중체크로)
@@ -24,14 +29,18 @@ class GradingService:
         selected_answer: str | dict,
         correct_answer: str | dict,
         points: int,
+        question_type: QuestionType | str | None = None,
     ) -> dict:
-        """답안 채점 (빈칸 채우기 지원)."""
+        """답안 채점 (빈칸 채우기 지원). 객관식은 보기 기호만 비교한다."""
         # 빈칸 채우기 타입 (dict)
         if isinstance(correct_answer, dict):
             return self._grade_fill_in_blank(selected_answer, correct_answer, points)
 
-        # 일반 문제 (string)
-        is_correct = selected_answer.strip().upper() == correct_answer.strip().upper()
+        # 일반 문제 (string): 객관식 외에는 표기 차이를 로컬 동치 판정 (3/4 = 0.75, x²+1 = 1+x^2 등)
+        is_correct = selected_answer.strip().upper() == correct_answer.strip().upper() or (
+            question_type != QuestionType.MULTIPLE_CHOICE
+            and answers_equivalent(selected_answer, correct_answer)
+        )
         points_earned = points if is_correct else 0
 
         return {
@@ -62,6 +71,7 @@ class GradingService:
             1 for blank_id, correct_data in correct_answers.items()
             if student_answers.get(blank_id, "").strip().upper()
                == correct_data.get("answer", "").strip().upper()
+            or answers_equivalent(student_answers.get(blank_id, ""), correct_data.get("answer", ""))
         )
 
         is_correct = correct_count == total_blanks
@@ -131,6 +141,8 @@ class GradingService:
         attempt.xp_earned += xp_earned
         attempt.correct_count += 1
         attempt.combo_max = max(attempt.combo_max, new_combo)
+        if attempt.is_adaptive:
+            AdaptiveService.mark_result_correct(attempt, question.id)
 
         try:
             await self.db.commit()
@@ -181,6 +193,7 @@ class GradingService:
             selected_answer=selected_answer,
             correct_answer=correct_answer,
             points=question.points,
+            question_type=question.question_type,
         )
 
         is_correct = result["is_correct"]
@@ -218,6 +231,10 @@ class GradingService:
             if is_correct:
                 attempt.correct_count += 1
             attempt.combo_max = max(attempt.combo_max, new_combo)
+            if attempt.is_adaptive:
+                AdaptiveService.record_result(
+                    attempt, question.id, is_correct, question.difficulty
+                )
 
             await self.db.commit()
             await self.db.refresh(attempt)
@@ -270,67 +287,205 @@ class GradingService:
         # 일일 테스트가 아니면 기본 결과 반환
         if not is_daily_test:
             return result
-        
-        # 재도전 로직 (오답인 경우에만)
-        if not result["is_correct"]:
-            # SQLAlchemy 변경 감지를 위해 복사본 생성 (JSON 타입 컬럼의 변경 추적 문제 해결)
-            # list()와 dict()를 사용하여 명시적으로 새로운 객체를 생성해야 SQLAlchemy가 변경사항을 감지함
-            retry_counts = dict(attempt.retry_counts or {})
-            retry_queue = list(attempt.retry_queue or [])
-            
-            # 해당 문제의 틀린 횟수 증가
-            current_count = retry_counts.get(question.id, 0) + 1
-            retry_counts[question.id] = current_count
-            
-            if current_count >= MAX_RETRY_COUNT:
-                # 4회 이상 틀림 → 집중 체크에 저장
-                focus_item = FocusCheckItem(
-                    student_id=attempt.student_id,
-                    question_id=question.id,
-                    attempt_id=attempt.id,
-                    wrong_count=current_count,
-                )
-                self.db.add(focus_item)
-                result["moved_to_focus_check"] = True
-                result["focus_check_message"] = "이 문제는 집중 체크 목록에 추가되었습니다."
-                
-                # 재도전 큐에서 제거 (이미 있다면)
-                if question.id in retry_queue:
-                    retry_queue.remove(question.id)
-            else:
-                # 재도전 큐 뒤에 추가
-                if question.id not in retry_queue:
-                    retry_queue.append(question.id)
-                result["retry_scheduled"] = True
-                result["retry_count"] = current_count
-            
-            # 힌트 정보 추가
-            result["hint"] = self.get_hint_for_retry(question, current_count)
-            
-            # attempt 업데이트
-            attempt.retry_counts = retry_counts
-            attempt.retry_queue = retry_queue
-            
+
+        # 재도전 로직 (오답이면 큐 추가/집중 체크, 정답이면 큐에서 제거)
+        if self._apply_retry(attempt, question, result["is_correct"], result):
             try:
                 await self.db.commit()
                 await self.db.refresh(attempt)
             except Exception:
                 await self.db.rollback()
                 raise
-        else:
-            # 정답인 경우 재도전 큐에서 제거
-            retry_queue = list(attempt.retry_queue or [])
-            if question.id in retry_queue:
-                retry_queue.remove(question.id)
-                attempt.retry_queue = retry_queue
-                await self.db.commit()
-                await self.db.refresh(attempt)
-        
+
         # 남은 문제 계산 (재도전 포함)
         result["retry_queue_count"] = len(attempt.retry_queue or [])
-        
+
         return result
 
+    def _apply_retry(
+        self, attempt: TestAttempt, question: Question, is_correct: bool, result: dict
+    ) -> bool:
+        """재도전 큐/집중 체크 반영 (커밋하지 않음).
+
+        Returns:
+            attempt 상태가 변경되었는지 여부
+        """
+        # SQLAlchemy 변경 감지를 위해 복사본 생성 (JSON 타입 컬럼의 변경 추적 문제 해결)
+        # list()와 dict()를 사용하여 명시적으로 새로운 객체를 생성해야 SQLAlchemy가 변경사항을 감지함
+        retry_queue = list(attempt.retry_queue or [])
+
+        if is_correct:
+            # 정답인 경우 재도전 큐에서 제거
+            if question.id not in retry_queue:
+                return False
+            retry_queue.remove(question.id)
+            attempt.retry_queue = retry_queue
+            return True
+
+        retry_counts = dict(attempt.retry_counts or {})
+
+        # 해당 문제의 틀린 횟수 증가
+        current_count = retry_counts.get(question.id, 0) + 1
+        retry_counts[question.id] = current_count
+
+        if current_count >= MAX_RETRY_COUNT:
+            # 4회 이상 틀림 → 집중 체크에 저장
+            focus_item = FocusCheckItem(
+                student_id=attempt.student_id,
+                question_id=question.id,
+                attempt_id=attempt.id,
+                wrong_count=current_count,
+            )
+            self.db.add(focus_item)
+            result["moved_to_focus_check"] = True
+            result["focus_check_message"] = "이 문제는 집중 체크 목록에 추가되었습니다."
+
+            # 재도전 큐에서 제거 (이미 있다면)
+            if question.id in retry_queue:
+                retry_queue.remove(question.id)
+        else:
+            # 재도전 큐 뒤에 추가
+            if question.id not in retry_queue:
+                retry_queue.append(question.id)
+            result["retry_scheduled"] = True
+            result["retry_count"] = current_count
+
+        # 힌트 정보 추가
+        result["hint"] = self.get_hint_for_retry(question, current_count)
+
+        # attempt 업데이트
+        attempt.retry_counts = retry_counts
+        attempt.retry_queue = retry_queue
+        return True
+
+    async def submit_answers_batch(
+        self,
+        attempt: TestAttempt,
+        answers: list[dict],
+        is_daily_test: bool = False,
+    ) -> list[dict]:
+        """여러 답안을 제출 순서대로 한 트랜잭션에서 채점 (오프라인 재전송용).
+
+        기존 답안/콤보는 한 번에 조회하고, 콤보·재도전 큐·적응형 윈도우는 메모리에서
+        순차 계산한 뒤 마지막에 한 번만 커밋한다. AI 유연 채점/피드백은 하지 않는다.
+
+        Args:
+            answers: [{"question_id", "selected_answer", "time_spent_seconds"}, ...]
+
+        Returns:
+            [{"question_id", "status", "result"}, ...]
+            status: graded / already_submitted / not_found
+        """
+        if not self.db:
+            raise ValueError("Database session required")
+
+        # 기존 답안 (최신순) → 제출한 문제 집합 + 현재 콤보
+        log_rows = (await self.db.execute(
+            select(AnswerLog.question_id, AnswerLog.is_correct)
+            .where(AnswerLog.attempt_id == attempt.id)
+            .order_by(AnswerLog.created_at.desc())
+        )).all()
+        answered_ids = {row.question_id for row in log_rows}
+        combo = 0
+        for row in log_rows:
+            if not row.is_correct:
+                break
+            combo += 1
+
+        # 문제 일괄 조회
+        question_ids = list({a["question_id"] for a in answers})
+        questions = {
+            q.id: q
+            for q in (await self.db.scalars(
+                select(Question).where(Question.id.in_(question_ids))
+            )).all()
+        }
+
+        shuffle_config = attempt.question_shuffle_config or {}
+        answered_count = len(answered_ids)
+        # 같은 트랜잭션의 답안도 제출 순서가 보존되도록 created_at을 명시
+        base_time = datetime.now(timezone.utc)
+        outcomes = []
+
+        for index, answer in enumerate(answers):
+            question_id = answer["question_id"]
+            question = questions.get(question_id)
+            if question_id in answered_ids:
+                outcomes.append({"question_id": question_id, "status": "already_submitted", "result": None})
+                continue
+            if not question:
+                outcomes.append({"question_id": question_id, "status": "not_found", "result": None})
+                continue
+
+            correct_answer = (
+                shuffle_config.get(question_id, {}).get("correct_answer")
+                or question.correct_answer
+            )
+            selected_answer = answer["selected_answer"]
+            is_correct = self.grade_answer(
+                question_id=question_id,
+                selected_answer=selected_answer,
+                correct_answer=correct_answer,
+                points=question.points,
+                question_type=question.question_type,
+            )["is_correct"]
+
+            if is_correct:
+                combo += 1
+                points_with_bonus = self.calculate_combo_bonus(combo, question.points)
+            else:
+                combo = 0
+                points_with_bonus = 0
+            xp_earned = points_with_bonus // 2 if is_correct else 0
+
+            self.db.add(AnswerLog(
+                attempt_id=attempt.id,
+                question_id=question_id,
+                selected_answer=selected_answer,
+                is_correct=is_correct,
+                time_spent_seconds=answer.get("time_spent_seconds", 0),
+                combo_count=combo,
+                points_earned=points_with_bonus,
+                question_difficulty=question.difficulty,
+                question_category=question.category.value if hasattr(question.category, "value") else question.category,
+                created_at=base_time + timedelta(microseconds=index),
+            ))
+            answered_ids.add(question_id)
+            answered_count += 1
+
+            attempt.score = min(attempt.score + points_with_bonus, attempt.max_score)
+            attempt.xp_earned += xp_earned
+            if is_correct:
+                attempt.correct_count += 1
+            attempt.combo_max = max(attempt.combo_max, combo)
+            if attempt.is_adaptive:
+                AdaptiveService.record_result(attempt, question_id, is_correct, question.difficulty)
+
+            result = {
+                "is_correct": is_correct,
+                "correct_answer": correct_answer,
+                "explanation": question.explanation,
+                "points_earned": points_with_bonus,
+                "combo_count": combo,
+                "xp_earned": xp_earned,
+                "current_score": attempt.score,
+                "questions_remaining": attempt.total_count - answered_count,
+            }
+            if is_daily_test:
+                self._apply_retry(attempt, question, is_correct, result)
+                result["retry_queue_count"] = len(attempt.retry_queue or [])
+
+            outcomes.append({"question_id": question_id, "status": "graded", "result": result})
+
+        try:
+            await self.db.commit()
+            await self.db.refresh(attempt)
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        return outcomes
+
     def get_hint_for_retry(self, question: Question, retry_count: int) -> dict | None:
         """재도전 횟수에 따른 힌트 생성.
         
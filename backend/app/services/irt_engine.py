@@ -0,0 +1,128 @@
+"""문항반응이론(IRT) 기반 능력 추정 엔진.
+
+Rasch(1PL) 모형으로 학생 능력(theta)을 추정하고, 현재 추정치에서 정보량이 최대인
+난이도의 문제를 고른다. 사후분포는 고정 격자(theta -4.0 ~ 4.0) 위의 로그 값으로
+attempt에 저장하여, 답안 하나당 격자 크기만큼만 갱신한다 (시도 길이와 무관).
+
+Test.adaptive_pool_config 예시:
+    {"engine": "irt", "se_threshold": 0.5, "min_questions": 5}
+"""
+
+import math
+from collections.abc import Iterable
+
+from app.services.adaptive_service import MAX_DIFFICULTY, MIN_DIFFICULTY
+
+ENGINE_NAME = "irt"
+
+# theta 격자 (-4.0 ~ 4.0, 0.2 간격)
+THETA_GRID = [round(-4.0 + 0.2 * i, 1) for i in range(41)]
+
+# 난이도 1-10 ↔ 문항 난이도 b (-3 ~ +3) 변환 계수
+DIFFICULTY_CENTER = 5.5
+DIFFICULTY_SCALE = 1.5
+
+# 조기 종료 기본값
+DEFAULT_SE_THRESHOLD = 0.5
+DEFAULT_MIN_QUESTIONS = 5
+
+
+def difficulty_to_b(difficulty: int) -> float:
+    """정수 난이도(1-10)를 Rasch 문항 난이도로 변환."""
+    return (difficulty - DIFFICULTY_CENTER) / DIFFICULTY_SCALE
+
+
+def theta_to_difficulty(theta: float) -> int:
+    """능력 추정치에 대응하는 정수 난이도."""
+    difficulty = round(theta * DIFFICULTY_SCALE + DIFFICULTY_CENTER)
+    return max(MIN_DIFFICULTY, min(MAX_DIFFICULTY, difficulty))
+
+
+def _p_correct(theta: float, b: float) -> float:
+    return 1.0 / (1.0 + math.exp(b - theta))
+
+
+class IRTEngine:
+    """Rasch 모형 능력 추정 (격자 기반 EAP)."""
+
+    def __init__(self, config: dict | None = None):
+        config = config or {}
+        self.se_threshold = float(config.get("se_threshold", DEFAULT_SE_THRESHOLD))
+        self.min_questions = int(config.get("min_questions", DEFAULT_MIN_QUESTIONS))
+
+    @staticmethod
+    def is_enabled(config: dict | None) -> bool:
+        """테스트 설정이 IRT 엔진을 선택했는지 여부."""
+        return bool(config) and config.get("engine") == ENGINE_NAME
+
+    def initial_state(self, initial_difficulty: int) -> dict:
+        """초기 난이도를 평균으로 하는 정규 사전분포 N(mu, 1)."""
+        mu = difficulty_to_b(initial_difficulty)
+        log_posterior = [-0.5 * (theta - mu) ** 2 for theta in THETA_GRID]
+        return self._summarize(log_posterior, answered=0)
+
+    def update(self, state: dict, difficulty: int, is_correct: bool) -> dict:
+        """응답 하나를 사후분포에 반영."""
+        b = difficulty_to_b(difficulty)
+        log_posterior = [
+            lp + math.log(p if is_correct else 1.0 - p)
+            for lp, p in zip(
+                state["log_posterior"], (_p_correct(theta, b) for theta in THETA_GRID)
+            )
+        ]
+        return self._summarize(log_posterior, answered=state.get("answered", 0) + 1)
+
+    def flip_to_correct(self, state: dict, difficulty: int) -> dict:
+        """오답으로 반영된 응답을 정답으로 정정 (AI 유연 채점 보정)."""
+        b = difficulty_to_b(difficulty)
+        log_posterior = [
+            lp - math.log(1.0 - p) + math.log(p)
+            for lp, p in zip(
+                state["log_posterior"], (_p_correct(theta, b) for theta in THETA_GRID)
+            )
+        ]
+        return self._summarize(log_posterior, answered=state.get("answered", 0))
+
+    @staticmethod
+    def item_information(theta: float, difficulty: int) -> float:
+        """Rasch 문항 정보량 P(1-P)."""
+        p = _p_correct(theta, difficulty_to_b(difficulty))
+        return p * (1.0 - p)
+
+    def best_difficulty(self, state: dict, available: Iterable[int]) -> int | None:
+        """출제 가능한 난이도 중 현재 추정치에서 정보량 최대인 난이도."""
+        theta = state["theta"]
+        best = None
+        best_info = -1.0
+        for difficulty in sorted(set(available)):
+            info = self.item_information(theta, difficulty)
+            if info > best_info:
+                best, best_info = difficulty, info
+        return best
+
+    def target_difficulty(self, state: dict) -> int:
+        """추정 능력에 대응하는 목표 난이도 (UI 힌트용)."""
+        return theta_to_difficulty(state["theta"])
+
+    def should_stop(self, state: dict) -> bool:
+        """추정 정밀도(표준오차)가 충분하면 조기 종료."""
+        return (
+            state.get("answered", 0) >= self.min_questions
+            and state["se"] <= self.se_threshold
+        )
+
+    @staticmethod
+    def _summarize(log_posterior: list[float], answered: int) -> dict:
+        """사후분포 정규화 후 EAP 추정치와 표준오차 계산."""
+        peak = max(log_posterior)
+        weights = [math.exp(lp - peak) for lp in log_posterior]
+        total = sum(weights)
+        mean = sum(w * theta for w, theta in zip(weights, THETA_GRID)) / total
+        var = sum(w * (theta - mean) ** 2 for w, theta in zip(weights, THETA_GRID)) / total
+        return {
+            # 최댓값 기준으로 이동해 수치 안정성 유지
+            "log_posterior": [round(lp - peak, 6) for lp in log_posterior],
+            "theta": round(mean, 4),
+            "se": round(math.sqrt(var), 4),
+            "answered": answered,
+        }
@@ -0,0 +1,188 @@
+"""XP 랭킹 인메모리 인덱스.
+
+학년별(및 전체) 학생 XP를 정렬 배열로 유지하여 순위/상위 N명을 이분 탐색으로 조회한다.
+- 최초 사용 시 학생 전체를 한 번 로드하고, RECONCILE_INTERVAL_SECONDS마다 DB와 재동기화
+- User INSERT/UPDATE/DELETE ORM 이벤트로 XP·학년 변경을 세션에 모아 두었다가 커밋 시 반영
+  (GamificationService.update_user_gamification, 상점/미션/초기화 등 모든 XP 변경 경로),
+  롤백되면 폐기
+- 외부 의존성 없이 프로세스 단위로 동작 (워커 간 차이는 재동기화로 수렴)
+"""
+
+import time
+from bisect import bisect_left, insort
+from typing import NamedTuple
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import object_session
+
+from app.core import commit_hooks
+from app.models.user import User
+from app.schemas.common import UserRole
+
+# 다른 워커 프로세스의 변경을 반영하기 위한 재동기화 주기 (초)
+RECONCILE_INTERVAL_SECONDS = 300
+
+# 전체 랭킹 버킷 키
+ALL_GRADES = "__all__"
+
+# 커밋 시 반영할 변경 보관 키: {user_id: on_user_changed 인자 | None(삭제)}
+_PENDING_KEY = "leaderboard_index_changes"
+
+
+class LeaderboardEntry(NamedTuple):
+    user_id: str
+    name: str
+    level: int
+    total_xp: int
+    grade: str | None
+
+
+def _grade_value(grade) -> str | None:
+    return grade.value if hasattr(grade, "value") else grade
+
+
+def _sort_key(total_xp: int, user_id: str) -> tuple[int, str]:
+    # XP 내림차순, 동점은 user_id 순으로 고정
+    return (-total_xp, user_id)
+
+
+class LeaderboardIndex:
+    """학년 → (-XP, user_id) 정렬 배열 인덱스."""
+
+    def __init__(self, reconcile_seconds: float = RECONCILE_INTERVAL_SECONDS):
+        self.reconcile_seconds = reconcile_seconds
+        self._entries: dict[str, LeaderboardEntry] = {}
+        self._buckets: dict[str, list[tuple[int, str]]] = {}
+        self._loaded_at: float | None = None
+
+    def clear(self) -> None:
+        """인덱스 전체 초기화."""
+        self._entries.clear()
+        self._buckets.clear()
+        self._loaded_at = None
+
+    def is_loaded(self) -> bool:
+        """로드되어 있고 재동기화 주기 이내인지 여부."""
+        if self._loaded_at is None:
+            return False
+        return time.monotonic() - self._loaded_at < self.reconcile_seconds
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """미로드 또는 재동기화 주기 경과 시 학생 전체를 한 번의 쿼리로 재구성."""
+        if self.is_loaded():
+            return
+
+        stmt = select(
+            User.id, User.name, User.level, User.total_xp, User.grade
+        ).where(User.role == UserRole.STUDENT)
+        rows = (await db.execute(stmt)).all()
+
+        entries = {
+            row.id: LeaderboardEntry(
+                row.id, row.name, row.level or 1, row.total_xp or 0, _grade_value(row.grade)
+            )
+            for row in rows
+        }
+        buckets: dict[str, list[tuple[int, str]]] = {ALL_GRADES: []}
+        for entry in entries.values():
+            key = _sort_key(entry.total_xp, entry.user_id)
+            buckets[ALL_GRADES].append(key)
+            if entry.grade:
+                buckets.setdefault(entry.grade, []).append(key)
+        for keys in buckets.values():
+            keys.sort()
+
+        self._entries = entries
+        self._buckets = buckets
+        self._loaded_at = time.monotonic()
+
+    def get(self, user_id: str) -> LeaderboardEntry | None:
+        """학생 항목 조회."""
+        return self._entries.get(user_id)
+
+    def rank_for_xp(self, total_xp: int, grade: str | None = None) -> int:
+        """해당 XP의 순위 (나보다 XP가 높은 학생 수 + 1, 동점은 같은 순위)."""
+        keys = self._buckets.get(_grade_value(grade) or ALL_GRADES, [])
+        return bisect_left(keys, (-total_xp, "")) + 1
+
+    def top(self, limit: int, grade: str | None = None) -> list[LeaderboardEntry]:
+        """상위 N명 (XP 내림차순)."""
+        keys = self._buckets.get(_grade_value(grade) or ALL_GRADES, [])
+        return [self._entries[user_id] for _, user_id in keys[:limit]]
+
+    def on_user_changed(self, user_id: str, role, name: str, level: int | None,
+                        total_xp: int | None, grade: str | None) -> None:
+        """학생 정보 변경 반영 (XP/학년이 바뀐 경우에만 재배치)."""
+        if self._loaded_at is None:
+            return
+
+        old = self._entries.get(user_id)
+        if role != UserRole.STUDENT:
+            if old:
+                self._remove(old)
+            return
+
+        entry = LeaderboardEntry(user_id, name, level or 1, total_xp or 0, grade)
+        if old and old.total_xp == entry.total_xp and old.grade == entry.grade:
+            self._entries[user_id] = entry
+            return
+        if old:
+            self._remove(old)
+        self._add(entry)
+
+    def discard(self, user_id: str) -> None:
+        """학생을 인덱스에서 제거."""
+        old = self._entries.get(user_id)
+        if old:
+            self._remove(old)
+
+    def _add(self, entry: LeaderboardEntry) -> None:
+        key = _sort_key(entry.total_xp, entry.user_id)
+        self._entries[entry.user_id] = entry
+        insort(self._buckets.setdefault(ALL_GRADES, []), key)
+        if entry.grade:
+            insort(self._buckets.setdefault(entry.grade, []), key)
+
+    def _remove(self, entry: LeaderboardEntry) -> None:
+        key = _sort_key(entry.total_xp, entry.user_id)
+        self._entries.pop(entry.user_id, None)
+        for bucket in (ALL_GRADES, entry.grade):
+            keys = self._buckets.get(bucket) if bucket else None
+            if not keys:
+                continue
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+
+
+# 프로세스 전역 인덱스
+leaderboard_index = LeaderboardIndex()
+
+
+def _apply(changes: dict[str, tuple | None]) -> None:
+    for user_id, change in changes.items():
+        if change is None:
+            leaderboard_index.discard(user_id)
+        else:
+            leaderboard_index.on_user_changed(user_id, *change)
+
+
+commit_hooks.register(_PENDING_KEY, _apply)
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+def _sync_leaderboard(mapper, connection, target: User) -> None:
+    commit_hooks.stage(object_session(target), _PENDING_KEY, target.id, (
+        target.role,
+        target.name,
+        target.level,
+        target.total_xp,
+        _grade_value(target.grade),
+    ))
+
+
+@event.listens_for(User, "after_delete")
+def _remove_from_leaderboard(mapper, connection, target: User) -> None:
+    commit_hooks.stage(object_session(target), _PENDING_KEY, target.id, None)
@@ -8,9 +8,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.concept_mastery import ConceptMastery
 from app.models.concept import Concept, concept_prerequisites
 from app.models.answer_log import AnswerLog
+from app.models.question import Question
 from app.models.test_attempt import TestAttempt
 from app.models.chapter import Chapter
 from app.models.chapter_progress import ChapterProgress
+from app.services.chapter_concept_index import chapter_concept_index
 
 MASTERY_THRESHOLD = 90  # 90% 이상이면 마스터
 
@@ -62,31 +64,37 @@ class MasteryService:
         Returns:
             dict: 업데이트된 개념별 숙련도 {concept_id: mastery_percentage}
         """
-        # 시도 조회
-        attempt = await self.db.get(TestAttempt, attempt_id)
-        if not attempt or not attempt.completed_at:
+        # 시도 완료 여부 조회 (관계 로딩 없이 컬럼만)
+        completed_at = await self.db.scalar(
+            select(TestAttempt.completed_at).where(TestAttempt.id == attempt_id)
+        )
+        if not completed_at:
             return {}
 
-        # 시도의 모든 답안 조회
+        # 시도의 모든 답안 조회 (채점 컬럼 + 문제의 개념/배점만, 문제 본문 미조회)
         stmt = (
-            select(AnswerLog)
+            select(
+                AnswerLog.is_correct,
+                AnswerLog.points_earned,
+                Question.concept_id,
+                Question.points,
+            )
+            .join(Question, AnswerLog.question_id == Question.id)
             .where(AnswerLog.attempt_id == attempt_id)
             .order_by(AnswerLog.created_at)
         )
-        answer_logs = list((await self.db.scalars(stmt)).all())
+        answer_rows = (await self.db.execute(stmt)).all()
 
-        if not answer_logs:
+        if not answer_rows:
             return {}
 
         # 개념별로 그룹화
         concept_stats: dict[str, dict] = {}
 
-        for log in answer_logs:
-            if not log.question or not log.question.concept_id:
+        for is_correct, points_earned, concept_id, points in answer_rows:
+            if not concept_id:
                 continue
 
-            concept_id = log.question.concept_id
-
             if concept_id not in concept_stats:
                 concept_stats[concept_id] = {
                     "total": 0,
@@ -96,17 +104,31 @@ class MasteryService:
                 }
 
             concept_stats[concept_id]["total"] += 1
-            concept_stats[concept_id]["points_total"] += log.question.points
+            concept_stats[concept_id]["points_total"] += points
 
-            if log.is_correct:
+            if is_correct:
                 concept_stats[concept_id]["correct"] += 1
-                concept_stats[concept_id]["points_earned"] += log.points_earned
+                concept_stats[concept_id]["points_earned"] += points_earned
+
+        # 기존 숙련도 일괄 조회 (응시 개념 + 단원 내 다음 개념, 개념 → 단원 역인덱스)
+        await chapter_concept_index.ensure_loaded(self.db)
+        next_concepts = {
+            concept_id: self._next_concept_in_chapter(concept_id)
+            for concept_id in concept_stats
+        }
+        masteries = await self._get_masteries(
+            student_id,
+            set(concept_stats) | {cid for cid in next_concepts.values() if cid},
+        )
 
-        # 각 개념의 숙련도 업데이트
+        # 각 개념의 숙련도 업데이트 (메모리에서 계산 후 한 번에 flush)
         updated_masteries = {}
+        now = datetime.now(timezone.utc)
 
         for concept_id, stats in concept_stats.items():
-            mastery = await self.get_or_create_mastery(student_id, concept_id)
+            mastery = masteries.get(concept_id)
+            if mastery is None:
+                mastery = masteries[concept_id] = self._new_mastery(student_id, concept_id)
 
             # 누적 통계 업데이트
             mastery.total_attempts += stats["total"]
@@ -130,20 +152,53 @@ class MasteryService:
             newly_mastered = False
             if mastery.mastery_percentage >= MASTERY_THRESHOLD and not mastery.is_mastered:
                 mastery.is_mastered = True
-                mastery.mastered_at = datetime.now(timezone.utc)
+                mastery.mastered_at = now
                 newly_mastered = True
 
-            mastery.last_practiced = datetime.now(timezone.utc)
+            mastery.last_practiced = now
 
             updated_masteries[concept_id] = mastery.mastery_percentage
 
             # 마스터 달성 시 같은 챕터의 다음 개념 해금
-            if newly_mastered:
-                await self.unlock_next_concept_in_chapter(student_id, concept_id)
+            next_concept_id = next_concepts[concept_id]
+            if newly_mastered and next_concept_id:
+                next_mastery = masteries.get(next_concept_id)
+                if next_mastery is None:
+                    next_mastery = masteries[next_concept_id] = self._new_mastery(
+                        student_id, next_concept_id
+                    )
+                if not next_mastery.is_unlocked:
+                    next_mastery.is_unlocked = True
+                    next_mastery.unlocked_at = now
 
         await self.db.commit()
         return updated_masteries
 
+    async def _get_masteries(
+        self, student_id: str, concept_ids: set[str]
+    ) -> dict[str, ConceptMastery]:
+        """여러 개념의 기존 숙련도를 한 번에 조회."""
+        stmt = select(ConceptMastery).where(
+            ConceptMastery.student_id == student_id,
+            ConceptMastery.concept_id.in_(concept_ids),
+        )
+        return {m.concept_id: m for m in (await self.db.scalars(stmt)).all()}
+
+    def _new_mastery(self, student_id: str, concept_id: str) -> ConceptMastery:
+        """새 숙련도 행 (flush 전 계산에 쓰도록 기본값을 명시)."""
+        mastery = ConceptMastery(
+            student_id=student_id,
+            concept_id=concept_id,
+            mastery_percentage=0,
+            total_attempts=0,
+            correct_count=0,
+            average_score=0.0,
+            is_unlocked=False,  # 기본적으로 잠김
+            is_mastered=False,
+        )
+        self.db.add(mastery)
+        return mastery
+
     async def get_student_masteries(
         self, student_id: str, grade: str | None = None
     ) -> list[dict]:
@@ -221,30 +276,39 @@ class MasteryService:
         Returns:
             해금된 개념 ID 또는 None
         """
-        # 이 개념이 속한 챕터 찾기
-        stmt = select(Chapter).where(Chapter.concept_ids.contains([concept_id]))
-        chapter = await self.db.scalar(stmt)
-        if not chapter or not chapter.concept_ids:
+        await chapter_concept_index.ensure_loaded(self.db)
+        next_concept_id = self._next_concept_in_chapter(concept_id)
+        if next_concept_id is None:
+            return None
+
+        mastery = await self.get_or_create_mastery(student_id, next_concept_id)
+        if not mastery.is_unlocked:
+            mastery.is_unlocked = True
+            mastery.unlocked_at = datetime.now(timezone.utc)
+            return next_concept_id
+
+        return None
+
+    @staticmethod
+    def _next_concept_in_chapter(concept_id: str) -> str | None:
+        """개념이 속한 챕터에서 다음 개념 ID (인덱스 로드 후 호출, 마지막 개념이면 None)."""
+        # 이 개념이 속한 챕터 찾기 (개념 → 단원 역인덱스)
+        chapters = chapter_concept_index.chapters_for_concept(concept_id)
+        if not chapters or not chapters[0].concept_ids:
             return None
+        concept_ids = chapters[0].concept_ids
 
         # 현재 개념의 인덱스 찾기
         try:
-            idx = chapter.concept_ids.index(concept_id)
+            idx = concept_ids.index(concept_id)
         except ValueError:
             return None
 
         # 마지막 개념이면 해금할 다음 개념 없음
-        if idx >= len(chapter.concept_ids) - 1:
+        if idx >= len(concept_ids) - 1:
             return None
 
-        next_concept_id = chapter.concept_ids[idx + 1]
-        mastery = await self.get_or_create_mastery(student_id, next_concept_id)
-        if not mastery.is_unlocked:
-            mastery.is_unlocked = True
-            mastery.unlocked_at = datetime.now(timezone.utc)
-            return next_concept_id
-
-        return None
+        return concept_ids[idx + 1]
 
     async def ensure_first_concept_unlocked(self, student_id: str, chapter_id: str) -> str | None:
         """해금된 챕터의 첫 번째 개념이 해금되어 있는지 확인/보장.
@@ -12,6 +12,7 @@ from app.models.chapter import Chapter
 from app.models.user import User
 from app.services.mastery_service import MasteryService
 from app.services.chapter_service import ChapterService
+from app.services.chapter_concept_index import chapter_concept_index
 
 
 class PlacementService:
@@ -88,9 +89,12 @@ class PlacementService:
         return placement_result
 
     async def _find_chapter_by_concept(self, concept_id: str) -> Chapter | None:
-        """개념 ID로 해당 단원 찾기."""
-        stmt = select(Chapter).where(Chapter.concept_ids.contains([concept_id]))
-        return await self.db.scalar(stmt)
+        """개념 ID로 해당 단원 찾기 (개념 → 단원 역인덱스)."""
+        await chapter_concept_index.ensure_loaded(self.db)
+        chapters = chapter_concept_index.chapters_for_concept(concept_id)
+        if not chapters:
+            return None
+        return await self.db.get(Chapter, chapters[0].chapter_id)
 
     async def _determine_placement(
         self, chapter_scores: dict[str, dict], overall_score: int
@@ -0,0 +1,281 @@
+"""테스트 완료 후처리 작업 큐.
+
+complete_test 응답(점수/XP/업적)을 먼저 반환하고, 숙련도·단원 진행률·미션 갱신은
+프로세스 내 큐에서 순차 처리한다.
+- 작업 상태는 post_completion_jobs 테이블에 영속 (시도 ID 단위 멱등성 키)
+- 단계별 완료 기록은 단계 처리와 같은 트랜잭션에 커밋: 재시도 시 이미 반영된 단계는 건너뜀
+- 실패 시 지수 백오프로 재시도, 최대 횟수 초과 시 failed
+- 앱 시작 시 recover()로 재시작 전 끝나지 않은 작업을 다시 큐에 넣음
+- 진행 상태는 GET /tests/attempts/{attempt_id}/post-completion 으로 조회 (워커 무관)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import SessionFactory
+from app.models.answer_log import AnswerLog
+from app.models.post_completion_job import PostCompletionJob
+from app.models.question import Question
+from app.models.test_attempt import TestAttempt
+from app.services.chapter_concept_index import chapter_concept_index
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.5
+# 완료/실패 작업 상태 보관 시간 (초)
+JOB_RETENTION_SECONDS = 3600
+
+
+async def _update_mastery(db: AsyncSession, job: dict) -> None:
+    from app.services.mastery_service import MasteryService
+
+    await MasteryService(db).update_mastery_from_attempt(job["student_id"], job["attempt_id"])
+
+
+async def _update_chapters(db: AsyncSession, job: dict) -> None:
+    """이번 시도에서 다룬 개념이 속한 단원의 진행률 갱신."""
+    from app.services.chapter_service import ChapterService
+
+    concepts_stmt = (
+        select(Question.concept_id)
+        .join(AnswerLog, AnswerLog.question_id == Question.id)
+        .where(
+            AnswerLog.attempt_id == job["attempt_id"],
+            Question.concept_id.isnot(None),
+        )
+        .distinct()
+    )
+    concept_ids = set((await db.scalars(concepts_stmt)).all())
+    if not concept_ids:
+        return
+
+    # 개념 → 단원 역인덱스로 영향받는 단원만 갱신
+    await chapter_concept_index.ensure_loaded(db)
+    chapters = chapter_concept_index.chapters_for_concepts(
+        concept_ids, grade=job.get("grade"), active_only=True
+    )
+
+    chapter_service = ChapterService(db)
+    for chapter in chapters:
+        await chapter_service.update_chapter_progress(job["student_id"], chapter.chapter_id)
+
+
+def _mission_step(action_type: str) -> Callable[[AsyncSession, dict], Awaitable[None]]:
+    async def _step(db: AsyncSession, job: dict) -> None:
+        from app.services.mission_service import MissionService
+
+        count = job["mission_counts"].get(action_type, 0)
+        if count:
+            await MissionService(db).update_mission_progress(job["student_id"], action_type, count)
+
+    return _step
+
+
+# (단계 이름, 처리 함수) - 각 단계는 자체 세션에서 커밋까지 완료
+STEPS: list[tuple[str, Callable[[AsyncSession, dict], Awaitable[None]]]] = [
+    ("mastery", _update_mastery),
+    ("chapter_progress", _update_chapters),
+    ("mission_complete_tests", _mission_step("complete_tests")),
+    ("mission_solve_questions", _mission_step("solve_questions")),
+    ("mission_perfect_score", _mission_step("perfect_score")),
+]
+
+
+class PostCompletionQueue:
+    """시도 완료 후처리 큐 (상태는 post_completion_jobs 테이블에 영속)."""
+
+    def __init__(
+        self,
+        eager: bool = False,
+        max_retries: int = MAX_RETRIES,
+        backoff_seconds: float = RETRY_BACKOFF_SECONDS,
+    ):
+        # eager: 큐를 거치지 않고 등록 시점에 바로 실행 (테스트 환경)
+        self.eager = eager
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._jobs: dict[str, dict] = {}
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+    @staticmethod
+    def job_key(attempt_id: str) -> str:
+        """시도 단위 멱등성 키."""
+        return f"post-completion:{attempt_id}"
+
+    def get(self, attempt_id: str) -> dict | None:
+        """이 프로세스가 처리 중이거나 처리한 작업 상태 조회."""
+        return self._jobs.get(self.job_key(attempt_id))
+
+    def clear(self) -> None:
+        """작업 기록 초기화."""
+        self._jobs.clear()
+
+    async def enqueue(
+        self,
+        attempt: TestAttempt,
+        grade: str | None,
+        session_factory: SessionFactory,
+    ) -> dict:
+        """완료된 시도의 후처리 등록. 이미 등록(진행/완료)된 시도는 기존 작업 반환."""
+        key = self.job_key(attempt.id)
+        existing = self._jobs.get(key)
+        if existing and existing["status"] != "failed":
+            return existing
+
+        async with session_factory() as db:
+            row = await db.get(PostCompletionJob, attempt.id)
+            if row is None:
+                row = PostCompletionJob(
+                    attempt_id=attempt.id,
+                    student_id=attempt.student_id,
+                    grade=grade,
+                    mission_counts={
+                        "complete_tests": 1,
+                        "solve_questions": attempt.total_count,
+                        "perfect_score": 1 if attempt.score >= 100 else 0,
+                    },
+                    steps_completed=[],
+                )
+                db.add(row)
+            elif row.status == "completed":
+                # 재시작 전 또는 다른 워커에서 이미 완료
+                job = self._jobs[key] = _job_from_row(row)
+                return job
+            # 새 작업 또는 실패 작업 재시도 (완료된 단계는 유지)
+            row.status = "pending"
+            row.tries = 0
+            row.error = None
+            row.finished_at = None
+            await db.commit()
+            job = _job_from_row(row)
+
+        self._jobs[key] = job
+        self._prune()
+        await self._schedule(job, session_factory)
+        return job
+
+    async def recover(self, session_factory: SessionFactory) -> int:
+        """재시작 전 끝나지 않은(pending/running) 작업을 다시 큐에 넣는다 (앱 시작 시 호출)."""
+        async with session_factory() as db:
+            rows = (await db.scalars(
+                select(PostCompletionJob)
+                .where(PostCompletionJob.status.in_(("pending", "running")))
+            )).all()
+
+        for row in rows:
+            job = _job_from_row(row)
+            job["status"] = "pending"
+            self._jobs[job["key"]] = job
+            await self._schedule(job, session_factory)
+        if rows:
+            logger.info("Recovered %d post-completion jobs", len(rows))
+        return len(rows)
+
+    async def drain(self) -> None:
+        """대기 중인 작업이 모두 끝날 때까지 대기."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _schedule(self, job: dict, session_factory: SessionFactory) -> None:
+        if self.eager:
+            await self._run(job, session_factory)
+        else:
+            self._ensure_worker()
+            self._queue.put_nowait((job, session_factory))
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._work())
+
+    async def _work(self) -> None:
+        while True:
+            job, session_factory = await self._queue.get()
+            try:
+                await self._run(job, session_factory)
+            except Exception:
+                logger.exception("Post-completion job crashed: %s", job["key"])
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: dict, session_factory: SessionFactory) -> None:
+        job["status"] = "running"
+        while True:
+            job["tries"] += 1
+            try:
+                for name, step in STEPS:
+                    if name in job["steps_completed"]:
+                        continue
+                    async with session_factory() as db:
+                        # 완료 표시를 단계의 커밋에 함께 실어, 재시작 후 재처리 시 이중 반영 방지
+                        await db.execute(
+                            update(PostCompletionJob)
+                            .where(PostCompletionJob.attempt_id == job["attempt_id"])
+                            .values(
+                                status="running",
+                                steps_completed=[*job["steps_completed"], name],
+                            )
+                        )
+                        await step(db, job)
+                        await db.commit()
+                    job["steps_completed"].append(name)
+                job["status"] = "completed"
+                job["error"] = None
+                break
+            except Exception as exc:
+                logger.exception("Post-completion step failed: %s (try %d)", job["key"], job["tries"])
+                job["error"] = str(exc)
+                if job["tries"] >= self.max_retries:
+                    job["status"] = "failed"
+                    break
+                await asyncio.sleep(self.backoff_seconds * 2 ** (job["tries"] - 1))
+        job["finished_at"] = datetime.now(timezone.utc)
+
+        async with session_factory() as db:
+            await db.execute(
+                update(PostCompletionJob)
+                .where(PostCompletionJob.attempt_id == job["attempt_id"])
+                .values(
+                    status=job["status"], tries=job["tries"], error=job["error"],
+                    finished_at=job["finished_at"],
+                )
+            )
+            await db.commit()
+
+    def _prune(self) -> None:
+        """보관 시간이 지난 완료/실패 작업 기록을 메모리에서 제거 (DB 행은 유지)."""
+        cutoff = time.time() - JOB_RETENTION_SECONDS
+        expired = [
+            key for key, job in self._jobs.items()
+            if job["finished_at"] is not None and job["finished_at"].timestamp() < cutoff
+        ]
+        for key in expired:
+            del self._jobs[key]
+
+
+def _job_from_row(row: PostCompletionJob) -> dict:
+    return {
+        "key": PostCompletionQueue.job_key(row.attempt_id),
+        "attempt_id": row.attempt_id,
+        "student_id": row.student_id,
+        "grade": row.grade,
+        "mission_counts": dict(row.mission_counts or {}),
+        "status": row.status,
+        "steps_completed": list(row.steps_completed or []),
+        "tries": row.tries or 0,
+        "error": row.error,
+        "finished_at": row.finished_at,
+    }
+
+
+# 프로세스 전역 큐 (테스트 환경에서는 즉시 실행)
+post_completion_queue = PostCompletionQueue(eager=os.environ.get("TESTING") == "1")
@@ -0,0 +1,237 @@
+"""문제 풀 인메모리 인덱스.
+
+적응형 다음 문제 선택 시 (개념, 난이도)별 활성 문제 ID를 DB 조회 없이 찾기 위한 프로세스 단위 인덱스.
+- 개념별로 최초 사용 시 한 번만 DB에서 로드 (이후 TTL 경과 시 재로드)
+- Question INSERT/UPDATE/DELETE ORM 이벤트로 활성/비활성 변경을 세션에 모아 두었다가 커밋 시 반영
+  (롤백되면 폐기)
+- 인덱스는 후보 ID만 제공하므로, 최종 선택된 문제는 호출 측에서 DB로 재확인한다
+- 출제 선택(종합/약점 시험, 빠른 연습, 일일 테스트)은 문제당 메타데이터 튜플(QuestionMeta)만
+  사용하고, 본문/해설/보기 등 전체 행은 최종 선택된 ID에 대해서만 조회한다
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from app.core import commit_hooks
+from app.models.question import Question
+
+# 다른 워커 프로세스의 변경을 반영하기 위한 개념별 재로드 주기 (초)
+INDEX_TTL_SECONDS = 300
+# 테스트별 난이도 뷰 캐시 최대 개수 (LRU)
+MAX_TEST_VIEWS = 1024
+
+# 커밋 시 반영할 변경 보관 키: {question_id: on_question_changed 인자 | None(삭제)}
+_PENDING_KEY = "question_pool_index_changes"
+
+
+class QuestionMeta(NamedTuple):
+    """출제 선택용 문제 메타데이터 (본문 제외)."""
+
+    id: str
+    concept_id: str
+    difficulty: int
+    category: str
+    question_type: str
+
+
+class QuestionPoolIndex:
+    """개념 → 난이도 → 활성 문제 ID 집합 인덱스."""
+
+    def __init__(self, ttl_seconds: float = INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        # {concept_id: {difficulty: {question_id, ...}}}
+        self._pools: dict[str, dict[int, set[str]]] = {}
+        # {question_id: QuestionMeta}
+        self._meta: dict[str, QuestionMeta] = {}
+        # {concept_id: 로드 시각}
+        self._loaded_at: dict[str, float] = {}
+        # 테스트별 난이도 뷰 캐시 (LRU)
+        # {(test_key, 개념, 카테고리): (개념별 버전, {difficulty: [question_id, ...]})}
+        self._test_views: OrderedDict[tuple, tuple[tuple[int, ...], dict[int, list[str]]]] = OrderedDict()
+        # {concept_id: 버전} - 개념 풀이 바뀔 때마다 증가 (해당 개념을 포함한 뷰만 무효화)
+        self._concept_versions: dict[str, int] = {}
+        self._version = 0
+
+    def clear(self) -> None:
+        """인덱스 전체 초기화."""
+        self._pools.clear()
+        self._meta.clear()
+        self._loaded_at.clear()
+        self._test_views.clear()
+        self._concept_versions.clear()
+
+    def is_loaded(self, concept_id: str) -> bool:
+        """개념 풀이 로드되어 있고 TTL 이내인지 여부."""
+        loaded_at = self._loaded_at.get(concept_id)
+        if loaded_at is None:
+            return False
+        return time.monotonic() - loaded_at < self.ttl_seconds
+
+    async def ensure_loaded(self, db: AsyncSession, concept_ids: Iterable[str]) -> None:
+        """아직 로드되지 않은 개념 풀을 한 번의 쿼리로 로드."""
+        missing = [cid for cid in dict.fromkeys(concept_ids) if not self.is_loaded(cid)]
+        if not missing:
+            return
+
+        stmt = select(
+            Question.id, Question.concept_id, Question.difficulty, Question.category,
+            Question.question_type,
+        ).where(
+            Question.concept_id.in_(missing),
+            Question.is_active == True,  # noqa: E712
+        )
+        rows = (await db.execute(stmt)).all()
+
+        for cid in missing:
+            self._drop_concept(cid)
+            self._pools[cid] = {}
+        for qid, cid, difficulty, category, question_type in rows:
+            self._add(qid, cid, difficulty, category, _enum_value(question_type))
+
+        now = time.monotonic()
+        for cid in missing:
+            self._loaded_at[cid] = now
+            self._touch(cid)
+
+    def get_pool(self, concept_ids: list[str], difficulty: int, test_key: str | None = None,
+                 category: str | None = None) -> list[str]:
+        """여러 개념에 걸친 특정 난이도의 활성 문제 ID 목록 (O(1) 조회).
+
+        test_key를 주면 테스트 단위 난이도 뷰를 캐시하여 재사용한다.
+        category를 주면 해당 카테고리 문제만 포함한다.
+        """
+        view = self._get_test_view(concept_ids, test_key, category)
+        return view.get(difficulty, [])
+
+    def get_questions(self, concept_ids: Iterable[str]) -> list[QuestionMeta]:
+        """여러 개념의 활성 문제 메타데이터 (ensure_loaded 이후 호출)."""
+        questions = []
+        for cid in dict.fromkeys(concept_ids):
+            for ids in self._pools.get(cid, {}).values():
+                questions.extend(self._meta[qid] for qid in ids)
+        return questions
+
+    def discard(self, question_id: str) -> None:
+        """문제 ID를 인덱스에서 제거 (비활성/삭제 확인 시)."""
+        self._remove(question_id)
+
+    def on_question_changed(self, question_id: str, concept_id: str | None, difficulty: int | None,
+                            category: str | None, is_active: bool | None,
+                            question_type: str | None = None) -> None:
+        """문제 활성/비활성/난이도 변경을 인덱스에 반영."""
+        self._remove(question_id)
+        if (
+            is_active is not False
+            and concept_id
+            and difficulty is not None
+            and concept_id in self._pools
+        ):
+            self._add(question_id, concept_id, difficulty, category, question_type)
+
+    def _get_test_view(self, concept_ids: list[str], test_key: str | None,
+                       category: str | None = None) -> dict[int, list[str]]:
+        key = (test_key, tuple(concept_ids), category) if test_key else None
+        if key is not None:
+            versions = tuple(self._concept_versions.get(cid, 0) for cid in concept_ids)
+            cached = self._test_views.get(key)
+            if cached and cached[0] == versions:
+                self._test_views.move_to_end(key)
+                return cached[1]
+
+        view: dict[int, list[str]] = {}
+        for cid in concept_ids:
+            for difficulty, ids in self._pools.get(cid, {}).items():
+                if category is not None:
+                    ids = [qid for qid in ids if self._meta[qid].category == category]
+                view.setdefault(difficulty, []).extend(ids)
+
+        if key is not None:
+            self._test_views[key] = (versions, view)
+            self._test_views.move_to_end(key)
+            while len(self._test_views) > MAX_TEST_VIEWS:
+                self._test_views.popitem(last=False)
+        return view
+
+    def _touch(self, concept_id: str) -> None:
+        # 전역 카운터에서 발급해 개념을 다시 로드해도 이전 버전과 겹치지 않게 한다
+        self._version += 1
+        self._concept_versions[concept_id] = self._version
+
+    def _add(self, question_id: str, concept_id: str, difficulty: int, category: str | None,
+             question_type: str | None) -> None:
+        self._pools.setdefault(concept_id, {}).setdefault(difficulty, set()).add(question_id)
+        self._touch(concept_id)
+        self._meta[question_id] = QuestionMeta(
+            question_id, concept_id, difficulty, category or "", question_type or ""
+        )
+
+    def _remove(self, question_id: str) -> bool:
+        meta = self._meta.pop(question_id, None)
+        if not meta:
+            return False
+        bucket = self._pools.get(meta.concept_id, {}).get(meta.difficulty)
+        if bucket is not None:
+            bucket.discard(question_id)
+        self._touch(meta.concept_id)
+        return True
+
+    def _drop_concept(self, concept_id: str) -> None:
+        for ids in self._pools.pop(concept_id, {}).values():
+            for qid in ids:
+                self._meta.pop(qid, None)
+        self._loaded_at.pop(concept_id, None)
+        self._touch(concept_id)
+
+
+# 프로세스 전역 인덱스
+question_pool_index = QuestionPoolIndex()
+
+
+def _enum_value(value) -> str | None:
+    return value.value if hasattr(value, "value") else value
+
+
+def stage_question_changed(session: Session | None, question_id: str, concept_id: str | None,
+                           difficulty: int | None, category: str | None, is_active: bool | None,
+                           question_type: str | None = None) -> None:
+    """문제 변경을 세션 커밋 시 인덱스에 반영하도록 보관 (Core INSERT 등 ORM 이벤트 밖의 변경용)."""
+    commit_hooks.stage(
+        session, _PENDING_KEY, question_id,
+        (concept_id, difficulty, category, is_active, question_type),
+    )
+
+
+def _apply(changes: dict[str, tuple | None]) -> None:
+    for question_id, change in changes.items():
+        if change is None:
+            question_pool_index.discard(question_id)
+        else:
+            question_pool_index.on_question_changed(question_id, *change)
+
+
+commit_hooks.register(_PENDING_KEY, _apply)
+
+
+@event.listens_for(Question, "after_insert")
+@event.listens_for(Question, "after_update")
+def _sync_question_index(mapper, connection, target: Question) -> None:
+    stage_question_changed(
+        object_session(target),
+        target.id,
+        target.concept_id,
+        target.difficulty,
+        _enum_value(target.category),
+        target.is_active,
+        _enum_value(target.question_type),
+    )
+
+
+@event.listens_for(Question, "after_delete")
+def _remove_question_from_index(mapper, connection, target: Question) -> None:
+    commit_hooks.stage(object_session(target), _PENDING_KEY, target.id, None)
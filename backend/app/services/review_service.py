@@ -40,9 +40,57 @@ class ReviewService:
         - 기존(복습 중): stage=1로 리셋, wrong_count += 1
         - 기존(졸업): 졸업 취소, stage=1로 리셋
         """
-        now = datetime.now(timezone.utc)
         review = await self._get(student_id, question_id)
+        self._apply_wrong(review, student_id, question_id, datetime.now(timezone.utc))
+        await self.db.flush()
+
+    async def register_correct(self, student_id: str, question_id: str) -> None:
+        """복습 대상 문제를 맞힌 경우 stage 승급.
 
+        - 복습 대상 아니면 무시 (한 번도 틀리지 않은 문제)
+        - 이미 졸업이면 무시
+        - stage 5에서 맞추면 졸업
+        """
+        review = await self._get(student_id, question_id)
+        self._apply_correct(review, datetime.now(timezone.utc))
+        await self.db.flush()
+
+    async def register_results(
+        self, student_id: str, results: list[tuple[str, bool]]
+    ) -> None:
+        """여러 채점 결과를 순서대로 반영 (기존 복습 기록은 한 번에 조회).
+
+        Args:
+            results: [(question_id, is_correct), ...] 제출 순서
+        """
+        if not results:
+            return
+
+        question_ids = list({qid for qid, _ in results})
+        stmt = select(WrongAnswerReview).where(
+            WrongAnswerReview.student_id == student_id,
+            WrongAnswerReview.question_id.in_(question_ids),
+        )
+        reviews = {r.question_id: r for r in (await self.db.scalars(stmt)).all()}
+
+        now = datetime.now(timezone.utc)
+        for question_id, is_correct in results:
+            review = reviews.get(question_id)
+            if is_correct:
+                self._apply_correct(review, now)
+            else:
+                reviews[question_id] = self._apply_wrong(review, student_id, question_id, now)
+
+        await self.db.flush()
+
+    def _apply_wrong(
+        self,
+        review: WrongAnswerReview | None,
+        student_id: str,
+        question_id: str,
+        now: datetime,
+    ) -> WrongAnswerReview:
+        """오답 반영 (신규 등록 또는 stage 1로 리셋)."""
         if review:
             review.wrong_count += 1
             review.review_stage = 1
@@ -62,21 +110,13 @@ class ReviewService:
                 last_wrong_at=now,
             )
             self.db.add(review)
+        return review
 
-        await self.db.flush()
-
-    async def register_correct(self, student_id: str, question_id: str) -> None:
-        """복습 대상 문제를 맞힌 경우 stage 승급.
-
-        - 복습 대상 아니면 무시 (한 번도 틀리지 않은 문제)
-        - 이미 졸업이면 무시
-        - stage 5에서 맞추면 졸업
-        """
-        review = await self._get(student_id, question_id)
+    def _apply_correct(self, review: WrongAnswerReview | None, now: datetime) -> None:
+        """정답 반영 (복습 중인 문제만 stage 승급/졸업)."""
         if not review or review.is_graduated:
             return
 
-        now = datetime.now(timezone.utc)
         review.correct_streak += 1
         review.last_reviewed_at = now
 
@@ -90,8 +130,6 @@ class ReviewService:
             days = REVIEW_INTERVALS[review.review_stage]
             review.next_review_date = self._future_date_str(days)
 
-        await self.db.flush()
-
     async def get_due_question_ids(
         self, student_id: str, limit: int = 3
     ) -> list[str]:
@@ -1,9 +1,10 @@
 """통계 서비스."""
 
+import time
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
 
-from sqlalchemy import select, func
+from sqlalchemy import case, select, func
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,11 +17,24 @@ from app.models.test_attempt import TestAttempt
 from app.models.answer_log import AnswerLog
 from app.models.concept import Concept
 from app.schemas.common import Grade, UserRole
+from app.services.daily_stats_service import DailyStatsService
 
 # KST (한국 표준시, UTC+9)
 KST = timezone(timedelta(hours=9))
 
 
+# 개념별 통계 스냅샷 유지 시간 (초) - 강사 리포트는 약간의 지연 허용
+CONCEPT_STATS_TTL_SECONDS = 60
+
+# {(teacher_id, grade, class_id): (생성 시각, 결과)}
+_concept_stats_snapshots: dict[tuple, tuple[float, list[dict]]] = {}
+
+
+def clear_concept_stats_cache() -> None:
+    """개념별 통계 스냅샷 초기화."""
+    _concept_stats_snapshots.clear()
+
+
 def _kst_today():
     """오늘 날짜 (KST 기준)."""
     return datetime.now(KST).date()
@@ -86,6 +100,28 @@ class StatsService:
 
         return sorted(weak, key=lambda x: x["accuracy_rate"])
 
+    async def _get_daily_series(
+        self, student_ids: list[str], days: int = 7, today=None
+    ) -> list[tuple]:
+        """최근 N일 일별 집계 [(date, totals), ...] (일별 롤업 테이블 단일 범위 조회)."""
+        today = today or _kst_today()
+        start_day = today - timedelta(days=days - 1)
+        totals = await DailyStatsService(self.db).get_daily_totals(
+            student_ids, start_day, today
+        )
+        empty = {
+            "active_students": 0,
+            "tests_completed": 0,
+            "questions_answered": 0,
+            "correct_count": 0,
+            "time_spent_seconds": 0,
+        }
+        series = []
+        for i in range(days):
+            day = start_day + timedelta(days=i)
+            series.append((day, totals.get(day.isoformat(), empty)))
+        return series
+
     async def get_student_stats(self, student_id: str) -> dict | None:
         """학생 통계 조회."""
         if not self.db:
@@ -271,27 +307,14 @@ class StatsService:
 
         # 일별 활동 (최근 7일, KST 기준)
         daily_activity = []
-        for i in range(7):
-            day = today - timedelta(days=6 - i)
-            day_start, day_end = _kst_day_utc_range(day)
-            day_attempts_stmt = select(TestAttempt).where(
-                TestAttempt.student_id == student_id,
-                TestAttempt.completed_at.isnot(None),
-                TestAttempt.started_at >= day_start,
-                TestAttempt.started_at < day_end,
-            )
-            day_attempts = list((await self.db.scalars(day_attempts_stmt)).all())
-
-            tests_completed = len(day_attempts)
-            questions_answered = sum(a.total_count for a in day_attempts)
-            correct = sum(a.correct_count for a in day_attempts)
-            day_accuracy = self.calculate_accuracy_rate(correct, questions_answered)
-
+        for day, totals in await self._get_daily_series([student_id], 7, today):
             daily_activity.append({
                 "date": day.isoformat(),
-                "tests_completed": tests_completed,
-                "questions_answered": questions_answered,
-                "accuracy_rate": day_accuracy,
+                "tests_completed": totals["tests_completed"],
+                "questions_answered": totals["questions_answered"],
+                "accuracy_rate": self.calculate_accuracy_rate(
+                    totals["correct_count"], totals["questions_answered"]
+                ),
             })
 
         # 오답 복습 현황
@@ -404,16 +427,10 @@ class StatsService:
         week_tests = len([a for a in week_attempts if a.completed_at])
 
         # 7일간 정답률 트렌드
-        accuracy_trend = []
-        for i in range(7):
-            day = today - timedelta(days=6 - i)
-            day_attempts = [
-                a for a in week_attempts
-                if a.completed_at and _to_kst_date(a.started_at) == day
-            ]
-            day_questions = sum(a.total_count for a in day_attempts)
-            day_correct = sum(a.correct_count for a in day_attempts)
-            accuracy_trend.append(self.calculate_accuracy_rate(day_correct, day_questions))
+        accuracy_trend = [
+            self.calculate_accuracy_rate(totals["correct_count"], totals["questions_answered"])
+            for _, totals in await self._get_daily_series(student_ids, 7, today)
+        ]
 
         # 알림 생성
         alerts = []
@@ -484,34 +501,38 @@ class StatsService:
         count_stmt = select(func.count()).select_from(students_stmt.subquery())
         total = await self.db.scalar(count_stmt) or 0
 
-        # 페이지네이션
-        students_stmt = students_stmt.order_by(User.name)
-        students_stmt = students_stmt.offset((page - 1) * page_size).limit(page_size)
-        students = list((await self.db.scalars(students_stmt)).all())
+        # 페이지네이션 (학생 목록 먼저)
+        page_stmt = (
+            students_stmt
+            .order_by(User.name)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        students = list((await self.db.scalars(page_stmt)).all())
+
+        # 완료 시도 집계: 페이지 학생만 GROUP BY 한 번
+        attempt_stats: dict[str, tuple[int, int, int]] = {}
+        if students:
+            stats_stmt = (
+                select(
+                    TestAttempt.student_id,
+                    func.count(TestAttempt.id),
+                    func.sum(TestAttempt.correct_count),
+                    func.sum(TestAttempt.total_count),
+                )
+                .where(
+                    TestAttempt.student_id.in_([s.id for s in students]),
+                    TestAttempt.completed_at.isnot(None),
+                )
+                .group_by(TestAttempt.student_id)
+            )
+            for student_id, tests_completed, correct, total_q in await self.db.execute(stats_stmt):
+                attempt_stats[student_id] = (tests_completed, correct or 0, total_q or 0)
 
         result = []
         for student in students:
-            # 완료된 시도 수
-            attempts_stmt = select(func.count()).where(
-                TestAttempt.student_id == student.id,
-                TestAttempt.completed_at.isnot(None),
-            )
-            tests_completed = await self.db.scalar(attempts_stmt) or 0
-
-            # 정답률
-            stats_stmt = select(
-                func.sum(TestAttempt.correct_count),
-                func.sum(TestAttempt.total_count),
-            ).where(
-                TestAttempt.student_id == student.id,
-                TestAttempt.completed_at.isnot(None),
-            )
-            stats = (await self.db.execute(stats_stmt)).first()
-            correct = stats[0] or 0
-            total_q = stats[1] or 0
-            accuracy = self.calculate_accuracy_rate(correct, total_q)
-
             class_ = class_map.get(student.class_id)
+            tests_completed, correct, total_q = attempt_stats.get(student.id, (0, 0, 0))
 
             result.append({
                 "user_id": student.id,
@@ -520,7 +541,7 @@ class StatsService:
                 "class_name": class_.name if class_ else "",
                 "level": student.level,
                 "total_xp": student.total_xp,
-                "accuracy_rate": accuracy,
+                "accuracy_rate": self.calculate_accuracy_rate(correct, total_q),
                 "tests_completed": tests_completed,
                 "current_streak": student.current_streak,
                 "last_activity_at": student.last_activity_date,
@@ -585,31 +606,8 @@ class StatsService:
                     "completed_at": attempt.completed_at,
                 })
 
-        # 일별 활동 (최근 7일, KST 기준)
-        today = _kst_today()
-        daily_activity = []
-        for i in range(7):
-            day = today - timedelta(days=6 - i)
-            day_start, day_end = _kst_day_utc_range(day)
-            day_attempts_stmt = select(TestAttempt).where(
-                TestAttempt.student_id == student_id,
-                TestAttempt.completed_at.isnot(None),
-                TestAttempt.started_at >= day_start,
-                TestAttempt.started_at < day_end,
-            )
-            day_attempts = list((await self.db.scalars(day_attempts_stmt)).all())
-
-            tests_completed = len(day_attempts)
-            questions_answered = sum(a.total_count for a in day_attempts)
-            correct = sum(a.correct_count for a in day_attempts)
-            accuracy = self.calculate_accuracy_rate(correct, questions_answered)
-
-            daily_activity.append({
-                "date": day.isoformat(),
-                "tests_completed": tests_completed,
-                "questions_answered": questions_answered,
-                "accuracy_rate": accuracy,
-            })
+        # 일별 활동 (최근 7일, KST 기준) - 기본 통계에서 이미 계산됨
+        daily_activity = base_stats["daily_activity"]
 
         # 단원별 진행률 조회
         chapter_progress_list = []
@@ -795,28 +793,14 @@ class StatsService:
 
         # 일별 통계 (최근 7일, KST 기준)
         daily_stats = []
-        for i in range(7):
-            day = today - timedelta(days=6 - i)
-            day_start, day_end = _kst_day_utc_range(day)
-            day_attempts_stmt = select(TestAttempt).where(
-                TestAttempt.student_id.in_(student_ids),
-                TestAttempt.completed_at.isnot(None),
-                TestAttempt.started_at >= day_start,
-                TestAttempt.started_at < day_end,
-            )
-            day_attempts = list((await self.db.scalars(day_attempts_stmt)).all())
-
-            active = len(set(a.student_id for a in day_attempts))
-            tests = len(day_attempts)
-            questions = sum(a.total_count for a in day_attempts)
-            correct = sum(a.correct_count for a in day_attempts)
-            accuracy = self.calculate_accuracy_rate(correct, questions)
-
+        for day, totals in await self._get_daily_series(student_ids, 7, today):
             daily_stats.append({
                 "date": day.isoformat(),
-                "active_students": active,
-                "tests_completed": tests,
-                "average_accuracy": accuracy,
+                "active_students": totals["active_students"],
+                "tests_completed": totals["tests_completed"],
+                "average_accuracy": self.calculate_accuracy_rate(
+                    totals["correct_count"], totals["questions_answered"]
+                ),
             })
 
         return {
@@ -840,12 +824,20 @@ class StatsService:
         grade: Grade | None = None,
         class_id: str | None = None,
     ) -> list[dict]:
-        """개념별 통계 조회."""
+        """개념별 통계 조회.
+
+        결과는 (강사, 학년, 반) 단위로 CONCEPT_STATS_TTL_SECONDS 동안 스냅샷으로 재사용한다.
+        """
         if not self.db:
             raise ValueError("Database session required")
 
         from app.models.question import Question
 
+        cache_key = (teacher_id, grade, class_id)
+        cached = _concept_stats_snapshots.get(cache_key)
+        if cached and time.monotonic() - cached[0] < CONCEPT_STATS_TTL_SECONDS:
+            return [dict(item) for item in cached[1]]
+
         # 담당 반 조회
         classes_stmt = select(Class).where(Class.teacher_id == teacher_id)
         if class_id:
@@ -862,71 +854,56 @@ class StatsService:
             User.role == UserRole.STUDENT,
             User.is_active == True,  # noqa: E712
         )
-        students = list((await self.db.scalars(students_stmt)).all())
-        student_ids = [s.id for s in students]
+        student_ids = list((await self.db.scalars(
+            students_stmt.with_only_columns(User.id)
+        )).all())
 
         if not student_ids:
             return []
 
-        # 개념 조회
-        concepts_stmt = select(Concept)
+        # 개념별 답안 집계 (GROUP BY 한 번, 담당 학생 답안만)
+        stmt = (
+            select(
+                Concept.id,
+                Concept.name,
+                Concept.grade,
+                func.count(AnswerLog.id).label("total"),
+                func.sum(case((AnswerLog.is_correct == True, 1), else_=0)).label("correct"),  # noqa: E712
+                func.count(func.distinct(TestAttempt.student_id)).label("students"),
+                func.sum(AnswerLog.time_spent_seconds).label("total_time"),
+            )
+            .select_from(AnswerLog)
+            .join(TestAttempt, AnswerLog.attempt_id == TestAttempt.id)
+            .join(Question, AnswerLog.question_id == Question.id)
+            .join(Concept, Question.concept_id == Concept.id)
+            .where(TestAttempt.student_id.in_(student_ids))
+            .group_by(Concept.id, Concept.name, Concept.grade)
+            .order_by(Concept.id)
+        )
         if grade:
-            concepts_stmt = concepts_stmt.where(Concept.grade == grade)
-        concepts = list((await self.db.scalars(concepts_stmt)).all())
+            stmt = stmt.where(Concept.grade == grade)
 
         result = []
-        for concept in concepts:
-            # 해당 개념의 문제 ID 조회
-            question_ids_stmt = select(Question.id).where(
-                Question.concept_id == concept.id
-            )
-            question_ids = list((await self.db.scalars(question_ids_stmt)).all())
-
-            if not question_ids:
-                continue
-
-            # 해당 문제들의 답안 로그 조회 (담당 학생들만)
-            logs_stmt = select(AnswerLog).where(
-                AnswerLog.question_id.in_(question_ids),
-            ).join(TestAttempt).where(
-                TestAttempt.student_id.in_(student_ids),
-            )
-            logs = list((await self.db.scalars(logs_stmt)).all())
-
-            if not logs:
-                continue
-
-            total_questions = len(logs)
-            correct_count = sum(1 for log in logs if log.is_correct)
-            accuracy_rate = self.calculate_accuracy_rate(correct_count, total_questions)
-
-            # 풀이한 학생 수
-            attempt_ids = [log.attempt_id for log in logs]
-            if attempt_ids:
-                student_count_stmt = select(func.count(func.distinct(TestAttempt.student_id))).where(
-                    TestAttempt.id.in_(attempt_ids)
-                )
-                student_count = await self.db.scalar(student_count_stmt) or 0
-            else:
-                student_count = 0
-
-            # 평균 풀이 시간
-            total_time = sum(log.time_spent_seconds for log in logs)
-            avg_time = total_time / len(logs) if logs else 0
+        for row in await self.db.execute(stmt):
+            total_questions = row.total or 0
+            correct_count = row.correct or 0
+            avg_time = (row.total_time or 0) / total_questions if total_questions else 0
 
             result.append({
-                "concept_id": concept.id,
-                "concept_name": concept.name,
-                "grade": concept.grade,
+                "concept_id": row.id,
+                "concept_name": row.name,
+                "grade": row.grade,
                 "total_questions": total_questions,
                 "correct_count": correct_count,
-                "accuracy_rate": accuracy_rate,
-                "student_count": student_count,
+                "accuracy_rate": self.calculate_accuracy_rate(correct_count, total_questions),
+                "student_count": row.students or 0,
                 "average_time_seconds": round(avg_time, 1),
                 "difficulty_distribution": {"easy": 0, "medium": 0, "hard": 0},
             })
 
-        return sorted(result, key=lambda x: x["accuracy_rate"])
+        result.sort(key=lambda x: x["accuracy_rate"])
+        _concept_stats_snapshots[cache_key] = (time.monotonic(), result)
+        return [dict(item) for item in result]
 
     # ===========================
     # 일일 할당량 (Daily Quota)
@@ -1030,50 +1007,19 @@ class StatsService:
 
     async def get_learning_trend(self, user_id: str, days: int = 7) -> list[dict]:
         """최근 N일간의 학습 추이 (일별 문제 풀이 수, 정답률)."""
-        today = _kst_today()
         trend_data = []
-        
-        # 1. AnswerLog 기반으로 일별 통계 집계
-        # (성능 최적화를 위해 DailyTestRecord를 쓰는게 좋지만, 실시간성을 위해 직접 집계 예시)
-        # 혹은 DailyTestRecord가 잘 업데이트 되고 있다면 그것을 사용.
-        # 여기서는 DailyTestRecord를 사용한다고 가정 (이미 존재한다고 함)
-        
-        from app.models.daily_test_record import DailyTestRecord
-        
-        start_date = today - timedelta(days=days-1)
-        
-        query = (
-            select(
-                DailyTestRecord.date,
-                func.sum(DailyTestRecord.total_count).label("total_solved"),
-                func.sum(DailyTestRecord.correct_count).label("total_correct")
-            )
-            .where(
-                DailyTestRecord.student_id == user_id,
-                DailyTestRecord.date >= start_date
-            )
-            .group_by(DailyTestRecord.date)
-            .order_by(DailyTestRecord.date.asc())
-        )
-        
-        result = await self.db.execute(query)
-        rows = result.all()
-        stats_map = {row.date: {"total": row.total_solved, "correct": row.total_correct} for row in rows}
-        
-        for i in range(days):
-            date = start_date + timedelta(days=i)
-            data = stats_map.get(date, {"total": 0, "correct": 0})
-            
+        for day, totals in await self._get_daily_series([user_id], days):
+            solved = totals["questions_answered"]
             accuracy = 0
-            if data["total"] > 0:
-                accuracy = round((data["correct"] / data["total"]) * 100)
-                
+            if solved > 0:
+                accuracy = round((totals["correct_count"] / solved) * 100)
+
             trend_data.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "solved": data["total"],
+                "date": day.strftime("%Y-%m-%d"),
+                "solved": solved,
                 "accuracy": accuracy
             })
-            
+
         return trend_data
 
     async def get_weak_concepts_radar(self, user_id: str, limit: int = 6) -> list[dict]:
@@ -6,8 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
 from app.models.class_ import Class
 from app.schemas.common import Grade, UserRole
-from app.schemas.auth import UserCreate, UserResponse, UserUpdate
-from app.core.security import get_password_hash
+from app.schemas.auth import RegisterRequest, UserCreate, UserResponse, UserUpdate
+from app.core.security import password_hasher
 
 
 class StudentService:
@@ -67,7 +67,7 @@ class StudentService:
         class_id: str,
     ) -> User:
         """학생 생성."""
-        hashed_password = get_password_hash(password)
+        hashed_password = await password_hasher.hash(password)
         student = User(
             login_id=login_id,
             hashed_password=hashed_password,
@@ -81,6 +81,60 @@ class StudentService:
         await self.db.refresh(student)
         return student
 
+    async def create_students_bulk(
+        self,
+        requests: list[RegisterRequest],
+    ) -> tuple[list[User], list[dict]]:
+        """학생 일괄 생성.
+
+        아이디 중복은 한 번의 조회로 확인하고, 비밀번호는 해싱 풀에서 병렬로
+        해싱한 뒤 한 트랜잭션으로 저장한다.
+
+        Returns:
+            (생성된 학생 목록, 실패 목록 [{"login_id", "code", "message"}])
+        """
+        login_ids = [req.login_id for req in requests]
+        existing = set((await self.db.scalars(
+            select(User.login_id).where(User.login_id.in_(login_ids))
+        )).all())
+
+        valid: list[RegisterRequest] = []
+        failed: list[dict] = []
+        seen: set[str] = set()
+        for req in requests:
+            if req.login_id in existing or req.login_id in seen:
+                failed.append({
+                    "login_id": req.login_id,
+                    "code": "LOGIN_ID_ALREADY_EXISTS",
+                    "message": "이미 사용 중인 아이디입니다.",
+                })
+                continue
+            seen.add(req.login_id)
+            valid.append(req)
+
+        hashed_passwords = await password_hasher.hash_many([req.password for req in valid])
+        students = [
+            User(
+                login_id=req.login_id,
+                hashed_password=hashed_password,
+                name=req.name,
+                role=UserRole.STUDENT,
+                grade=req.grade,
+                class_id=req.class_id,
+            )
+            for req, hashed_password in zip(valid, hashed_passwords)
+        ]
+        if students:
+            self.db.add_all(students)
+            await self.db.commit()
+            # 서버 기본값(created_at 등)을 한 번의 조회로 다시 읽음
+            (await self.db.scalars(
+                select(User)
+                .where(User.id.in_([student.id for student in students]))
+                .execution_options(populate_existing=True)
+            )).all()
+        return students, failed
+
     async def update_student(
         self,
         student_id: str,
@@ -128,7 +182,7 @@ class StudentService:
         if not student:
             return None
 
-        student.hashed_password = get_password_hash(new_password)
+        student.hashed_password = await password_hasher.hash(new_password)
         await self.db.commit()
         await self.db.refresh(student)
         return student
@@ -3,13 +3,37 @@
 Generates unlimited computation questions by randomizing numbers
 in predefined templates. Zero AI cost.
 """
+import hashlib
 import logging
 import random
+from collections.abc import Callable
 
-from app.templates import TEMPLATE_REGISTRY
+from app.templates import TEMPLATE_REGISTRY, rng, seeded
 
 logger = logging.getLogger(__name__)
 
+# Consecutive duplicate draws after which a template counts as exhausted
+MAX_TEMPLATE_MISSES = 20
+
+# Map grade names to concept prefixes
+GRADE_CONCEPT_PREFIX = {
+    "elementary_3": "concept-e3-",
+    "elementary_4": "concept-e4-",
+    "elementary_5": "concept-e5-",
+    "elementary_6": "concept-e6-",
+    "middle_1": "concept-m1-",
+    "middle_2": "concept-m2-",
+    "middle_3": "concept-m3-",
+    "high_1": "concept-h1-",
+    "high_2": "concept-h2-",
+}
+
+
+def variant_seed(*parts: object) -> int:
+    """Stable seed from arbitrary parts, e.g. variant_seed(student_id, date, concept_id)."""
+    key = "|".join(str(p) for p in parts)
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
 
 class TemplateGenerator:
     """Generate computation question variants from registered templates."""
@@ -22,6 +46,44 @@ class TemplateGenerator:
         """Check if templates exist for a concept."""
         return concept_id in TEMPLATE_REGISTRY
 
+    def difficulties(self, concept_id: str) -> list[int]:
+        """Return the distinct template difficulties registered for a concept."""
+        return sorted({d for d, _ in TEMPLATE_REGISTRY.get(concept_id, [])})
+
+    def concepts_for_grade(
+        self,
+        grade: str,
+        available_concept_ids: list[str] | None = None,
+    ) -> list[str]:
+        """Return templated concept_ids for a grade.
+
+        Args:
+            grade: grade prefix (e.g., "elementary_3")
+            available_concept_ids: limit to these concepts (student's unlocked)
+        """
+        prefix = GRADE_CONCEPT_PREFIX.get(grade, "")
+        if not prefix:
+            return []
+
+        templated = [cid for cid in TEMPLATE_REGISTRY if cid.startswith(prefix)]
+        if available_concept_ids is not None:
+            available_set = set(available_concept_ids)
+            templated = [cid for cid in templated if cid in available_set]
+        return templated
+
+    def _candidates(self, concept_id: str, difficulty: int | None) -> list[tuple[int, Callable]]:
+        """Templates for a concept, filtered by difficulty (closest as fallback)."""
+        templates = TEMPLATE_REGISTRY.get(concept_id)
+        if not templates:
+            return []
+        if difficulty is None:
+            return templates
+        exact = [(d, fn) for d, fn in templates if d == difficulty]
+        if exact:
+            return exact
+        closest = min(abs(d - difficulty) for d, _ in templates)
+        return [(d, fn) for d, fn in templates if abs(d - difficulty) == closest]
+
     def generate(
         self,
         concept_id: str,
@@ -40,19 +102,10 @@ class TemplateGenerator:
         Returns:
             Question dict ready for DB insertion, or None if no template found.
         """
-        templates = TEMPLATE_REGISTRY.get(concept_id)
-        if not templates:
+        candidates = self._candidates(concept_id, difficulty)
+        if not candidates:
             return None
 
-        # Filter by difficulty if specified
-        if difficulty is not None:
-            candidates = [(d, fn) for d, fn in templates if d == difficulty]
-            if not candidates:
-                # Fallback: closest difficulty
-                candidates = sorted(templates, key=lambda t: abs(t[0] - difficulty))
-        else:
-            candidates = templates
-
         exclude = exclude_ids or set()
 
         for _ in range(max_attempts):
@@ -71,29 +124,50 @@ class TemplateGenerator:
         count: int,
         difficulty: int | None = None,
         exclude_ids: set[str] | None = None,
+        seed: int | str | None = None,
     ) -> list[dict]:
-        """Generate N unique question variants for a concept.
+        """Generate N distinct question variants for a concept in one pass.
+
+        Draws from the concept's templates round-robin with rejection
+        sampling: a draw whose ID was already seen or excluded is discarded,
+        and a template is dropped after MAX_TEMPLATE_MISSES consecutive misses.
+        The result never contains duplicates or excluded IDs. Limitation: the
+        miss cutoff is a heuristic, so a template with unused variants left
+        can still be dropped early and the batch may come back shorter than
+        count.
 
         Args:
             concept_id: target concept
             count: number of questions to generate
             difficulty: exact difficulty (None = mixed)
             exclude_ids: question IDs to avoid
+            seed: makes the batch reproducible (see variant_seed)
 
         Returns:
             List of question dicts (may be fewer than count if templates limited).
         """
-        if not self.has_templates(concept_id):
+        templates = self._candidates(concept_id, difficulty)
+        if not templates or count <= 0:
             return []
 
-        exclude = set(exclude_ids) if exclude_ids else set()
+        seen = set(exclude_ids) if exclude_ids else set()
         results = []
-
-        for _ in range(count):
-            q = self.generate(concept_id, difficulty, exclude)
-            if q:
-                results.append(q)
-                exclude.add(q["id"])
+        with seeded(seed):
+            active = [[fn, 0] for _, fn in templates]
+            rng.shuffle(active)
+            while active and len(results) < count:
+                for slot in list(active):
+                    if len(results) >= count:
+                        break
+                    question = slot[0]()
+                    if question["id"] in seen:
+                        slot[1] += 1
+                        if slot[1] >= MAX_TEMPLATE_MISSES:
+                            active.remove(slot)
+                        continue
+                    slot[1] = 0
+                    seen.add(question["id"])
+                    results.append(question)
 
         return results
 
@@ -103,6 +177,7 @@ class TemplateGenerator:
         count: int,
         available_concept_ids: list[str] | None = None,
         exclude_ids: set[str] | None = None,
+        seed: int | str | None = None,
     ) -> list[dict]:
         """Generate questions across all concepts for a grade.
 
@@ -113,38 +188,12 @@ class TemplateGenerator:
             count: total questions to generate
             available_concept_ids: limit to these concepts (student's unlocked)
             exclude_ids: question IDs to avoid
+            seed: makes concept order and variants reproducible
 
         Returns:
             List of question dicts.
         """
-        # Map grade names to concept prefixes
-        grade_prefix_map = {
-            "elementary_3": "concept-e3-",
-            "elementary_4": "concept-e4-",
-            "elementary_5": "concept-e5-",
-            "elementary_6": "concept-e6-",
-            "middle_1": "concept-m1-",
-            "middle_2": "concept-m2-",
-            "middle_3": "concept-m3-",
-            "high_1": "concept-h1-",
-            "high_2": "concept-h2-",
-        }
-
-        prefix = grade_prefix_map.get(grade, "")
-        if not prefix:
-            return []
-
-        # Get concepts with templates for this grade
-        templated = [
-            cid for cid in TEMPLATE_REGISTRY
-            if cid.startswith(prefix)
-        ]
-
-        # Filter by available concepts if provided
-        if available_concept_ids is not None:
-            available_set = set(available_concept_ids)
-            templated = [cid for cid in templated if cid in available_set]
-
+        templated = self.concepts_for_grade(grade, available_concept_ids)
         if not templated:
             return []
 
@@ -155,16 +204,19 @@ class TemplateGenerator:
         per_concept = max(1, count // len(templated))
         remainder = count - per_concept * len(templated)
 
-        random.shuffle(templated)
+        with seeded(seed):
+            rng.shuffle(templated)
         for i, cid in enumerate(templated):
             n = per_concept + (1 if i < remainder else 0)
-            batch = self.generate_batch(cid, n, exclude_ids=exclude)
+            concept_seed = variant_seed(seed, cid) if seed is not None else None
+            batch = self.generate_batch(cid, n, exclude_ids=exclude, seed=concept_seed)
             results.extend(batch)
             for q in batch:
                 exclude.add(q["id"])
 
         # Trim to requested count
         if len(results) > count:
-            results = random.sample(results, count)
+            with seeded(seed):
+                results = rng.sample(results, count)
 
         return results
@@ -0,0 +1,251 @@
+"""템플릿 연산 문제 변형 선생성 풀.
+
+일일 테스트 시작 시 템플릿 변형을 만들고 한 건씩 존재 여부를 확인해 저장하던 작업을
+(개념, 난이도)별로 미리 만들어 둔 변형 ID를 꺼내 쓰는 방식으로 바꾼다.
+- 버퍼에는 DB에 새로 저장된(처음 출제되는) 변형 ID만 보관
+- 저장은 INSERT ... ON CONFLICT DO NOTHING 일괄 실행, RETURNING으로 새로 저장된 ID만 확인
+- 버퍼가 부족하면 요청 세션으로 부족분만 즉시 생성 (버퍼에는 넣지 않아 롤백 시에도 안전)
+- 꺼낸 뒤 버퍼가 LOW_WATERMARK 미만이면 별도 세션으로 백그라운드 보충 (커밋 후 버퍼 반영)
+"""
+
+import asyncio
+import logging
+import os
+import random
+from collections import deque
+from collections.abc import Iterable
+
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import SessionFactory, session_factory_for
+from app.models.question import Question
+from app.services.question_pool_index import stage_question_changed
+from app.services.template_generator import TemplateGenerator, variant_seed
+
+logger = logging.getLogger(__name__)
+
+# (개념, 난이도)별 버퍼 목표 수량 / 보충 시작 기준
+BUFFER_TARGET = 20
+LOW_WATERMARK = 5
+# 저장 컬럼 (템플릿 dict 키 중 Question 컬럼)
+_COLUMNS = (
+    "id", "concept_id", "category", "part", "question_type", "difficulty",
+    "content", "options", "correct_answer", "explanation", "points", "blank_config",
+)
+
+PoolKey = tuple[str, int]
+
+
+def _insert_ignore(db: AsyncSession):
+    """DB 방언별 INSERT ... ON CONFLICT DO NOTHING 생성기."""
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    return dialect.insert(Question)
+
+
+async def insert_variants(db: AsyncSession, variants: list[dict]) -> list[str]:
+    """템플릿 변형 일괄 저장. 새로 저장된 ID만 입력 순서대로 반환 (기존 ID는 건너뜀)."""
+    rows = {}
+    for v in variants:
+        rows.setdefault(v["id"], {
+            **{col: v.get(col) for col in _COLUMNS},
+            "explanation": v.get("explanation", ""),
+            "points": v.get("points", 10),
+            "is_active": True,
+        })
+    if not rows:
+        return []
+
+    stmt = (
+        _insert_ignore(db)
+        .values(list(rows.values()))
+        .on_conflict_do_nothing(index_elements=["id"])
+        .returning(Question.id)
+    )
+    inserted = set((await db.execute(stmt)).scalars().all())
+
+    # Core INSERT는 ORM 이벤트가 없으므로 커밋 시 문제 풀 인덱스에 반영되도록 직접 보관
+    for qid in inserted:
+        row = rows[qid]
+        stage_question_changed(
+            db.sync_session, qid, row["concept_id"], row["difficulty"], row["category"], True,
+            row["question_type"],
+        )
+    return [qid for qid in rows if qid in inserted]
+
+
+class TemplateVariantPool:
+    """(개념, 난이도) → 미출제 템플릿 변형 ID 버퍼."""
+
+    def __init__(self, background_refill: bool = True):
+        self.background_refill = background_refill
+        self._buffers: dict[PoolKey, deque[str]] = {}
+        self._refilling: set[PoolKey] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._generator = TemplateGenerator()
+        self._stats = {"claimed_from_buffer": 0, "generated_inline": 0, "refilled": 0}
+
+    def clear(self) -> None:
+        """버퍼 초기화."""
+        self._buffers.clear()
+        self._refilling.clear()
+        for key in self._stats:
+            self._stats[key] = 0
+
+    def metrics(self) -> dict:
+        """풀 지표."""
+        return {
+            **self._stats,
+            "buffered": sum(len(ids) for ids in self._buffers.values()),
+            "keys": len(self._buffers),
+        }
+
+    def buffered(self, concept_id: str, difficulty: int) -> int:
+        """버퍼에 남은 변형 수."""
+        return len(self._buffers.get((concept_id, difficulty), ()))
+
+    def discard(self, question_id: str) -> None:
+        """삭제/비활성화된 문제를 버퍼에서 제거."""
+        for ids in self._buffers.values():
+            if question_id in ids:
+                ids.remove(question_id)
+                return
+
+    async def claim(
+        self,
+        db: AsyncSession,
+        grade: str,
+        count: int,
+        available_concept_ids: list[str] | None = None,
+        exclude_ids: set[str] | None = None,
+        seed: int | str | None = None,
+    ) -> list[str]:
+        """학년의 템플릿 개념에 고르게 나눠 미출제 변형 ID를 꺼낸다.
+
+        버퍼가 모자란 만큼은 요청 세션으로 즉시 생성·저장한다 (seed: 학생/날짜별 재현용).
+        """
+        concepts = self._generator.concepts_for_grade(grade, available_concept_ids)
+        if not concepts or count <= 0:
+            return []
+
+        random.shuffle(concepts)
+        quotas = [count // len(concepts) + (1 if i < count % len(concepts) else 0)
+                  for i in range(len(concepts))]
+        exclude = set(exclude_ids or ())
+        claimed: list[str] = []
+        shortfall: dict[PoolKey, int] = {}
+        touched: list[PoolKey] = []
+
+        for concept_id, quota in zip(concepts, quotas):
+            keys = [(concept_id, d) for d in self._generator.difficulties(concept_id)]
+            random.shuffle(keys)
+            for i in range(quota):
+                key = keys[i % len(keys)]
+                touched.append(key)
+                qid = self._pop(key, exclude)
+                if qid:
+                    claimed.append(qid)
+                    exclude.add(qid)
+                    self._stats["claimed_from_buffer"] += 1
+                else:
+                    shortfall[key] = shortfall.get(key, 0) + 1
+
+        if shortfall:
+            inline = await self._generate(db, shortfall, exclude, seed)
+            claimed.extend(inline)
+            self._stats["generated_inline"] += len(inline)
+
+        self._schedule_refill(db, touched)
+        return claimed
+
+    async def refill(self, session_factory: SessionFactory, keys: Iterable[PoolKey]) -> int:
+        """버퍼를 BUFFER_TARGET까지 보충 (별도 세션에서 저장·커밋 후 버퍼 반영)."""
+        wanted = {
+            key: BUFFER_TARGET - self.buffered(*key)
+            for key in dict.fromkeys(keys)
+            if self.buffered(*key) < BUFFER_TARGET
+        }
+        if not wanted:
+            return 0
+
+        async with session_factory() as db:
+            variants = {key: self._variants(key, n, set()) for key, n in wanted.items()}
+            inserted = set(await insert_variants(
+                db, [v for batch in variants.values() for v in batch]
+            ))
+            await db.commit()
+
+        added = 0
+        for key, batch in variants.items():
+            fresh = [qid for qid in dict.fromkeys(v["id"] for v in batch) if qid in inserted]
+            self._buffers.setdefault(key, deque()).extend(fresh)
+            added += len(fresh)
+        self._stats["refilled"] += added
+        return added
+
+    def _pop(self, key: PoolKey, exclude: set[str]) -> str | None:
+        ids = self._buffers.get(key)
+        while ids:
+            qid = ids.popleft()
+            if qid not in exclude:
+                return qid
+        return None
+
+    def _variants(self, key: PoolKey, count: int, exclude: set[str], seed: int | str | None = None) -> list[dict]:
+        concept_id, difficulty = key
+        return self._generator.generate_batch(
+            concept_id, count, difficulty=difficulty, exclude_ids=exclude,
+            seed=variant_seed(seed, concept_id, difficulty) if seed is not None else None,
+        )
+
+    async def _generate(
+        self, db: AsyncSession, shortfall: dict[PoolKey, int], exclude: set[str], seed: int | str | None,
+    ) -> list[str]:
+        """부족분 즉시 생성. 새 변형이 모자라면 이미 저장된 변형으로 채운다."""
+        variants: list[dict] = []
+        for key, n in shortfall.items():
+            batch = self._variants(key, n, exclude, seed)
+            variants.extend(batch)
+            exclude.update(v["id"] for v in batch)
+
+        fresh = await insert_variants(db, variants)
+        fresh_set = set(fresh)
+        # 템플릿 숫자 범위가 좁아 새 변형을 못 만든 경우 기존 변형 재사용
+        return fresh + [qid for qid in dict.fromkeys(v["id"] for v in variants) if qid not in fresh_set]
+
+    def _schedule_refill(self, db: AsyncSession, keys: list[PoolKey]) -> None:
+        low = [
+            key for key in dict.fromkeys(keys)
+            if self.buffered(*key) < LOW_WATERMARK and key not in self._refilling
+        ]
+        if not low or not self.background_refill:
+            return
+
+        self._refilling.update(low)
+        task = asyncio.create_task(self._refill_task(session_factory_for(db), low))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refill_task(self, session_factory: SessionFactory, keys: list[PoolKey]) -> None:
+        try:
+            await self.refill(session_factory, keys)
+        except Exception:
+            logger.exception("Template variant refill failed")
+        finally:
+            self._refilling.difference_update(keys)
+
+
+# 프로세스 전역 풀 (테스트 환경에서는 백그라운드 보충 비활성)
+template_variant_pool = TemplateVariantPool(background_refill=os.environ.get("TESTING") != "1")
+
+
+@event.listens_for(Question, "after_update")
+def _discard_inactive_variant(mapper, connection, target: Question) -> None:
+    if target.is_active is False:
+        template_variant_pool.discard(target.id)
+
+
+@event.listens_for(Question, "after_delete")
+def _discard_deleted_variant(mapper, connection, target: Question) -> None:
+    template_variant_pool.discard(target.id)
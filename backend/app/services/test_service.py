@@ -3,9 +3,11 @@
 import random
 from datetime import datetime, timezone
 
-from sqlalchemy import select, func
+from sqlalchemy import event, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import object_session
 
+from app.core import commit_hooks
 from app.models.test import Test
 from app.models.test_attempt import TestAttempt
 from app.models.answer_log import AnswerLog
@@ -13,9 +15,14 @@ from app.models.question import Question
 from app.models.chapter import Chapter
 from app.models.chapter_progress import ChapterProgress
 from app.models.concept import Concept
-from app.models.concept_mastery import ConceptMastery
 from app.schemas.common import Grade, QuestionType
 from app.services.blank_service import BlankService
+from app.services.question_pool_index import QuestionMeta, question_pool_index
+from app.services.unlock_frontier import unlock_frontier
+
+# 테스트 카탈로그 버전: Test 행이 바뀌면 증가 (학생별 목록 캐시 키에 포함)
+_catalog_version = 0
+_CATALOG_PENDING_KEY = "test_catalog_changed"
 
 
 def shuffle_question_options(options: list[dict], correct_answer: str) -> tuple[list[dict], str]:
@@ -72,55 +79,10 @@ class TestService:
         self.db = db
 
     async def _get_student_available_concept_ids(self, student_id: str, grade: Grade) -> list[str]:
-        """학생이 해금한 개념 ID만 반환 (ChapterProgress.is_unlocked + ConceptMastery.is_unlocked 기반)."""
-        from app.models.chapter_progress import ChapterProgress
-
-        # 1. 해금된 챕터의 개념 ID 목록 수집
-        unlocked_ch_stmt = (
-            select(Chapter)
-            .join(ChapterProgress, Chapter.id == ChapterProgress.chapter_id)
-            .where(
-                ChapterProgress.student_id == student_id,
-                ChapterProgress.is_unlocked == True,  # noqa: E712
-                Chapter.grade == grade,
-            )
+        """학생이 해금한 개념 ID만 반환 (해금 현황 캐시 경유)."""
+        return await unlock_frontier.available_concept_ids(
+            self.db, student_id, grade, fallback_to_grade=True
         )
-        unlocked_chapters = list((await self.db.scalars(unlocked_ch_stmt)).all())
-        chapter_concept_ids = set()
-        for ch in unlocked_chapters:
-            chapter_concept_ids.update(ch.concept_ids or [])
-
-        if not chapter_concept_ids:
-            # 폴백: 해금된 챕터가 없으면 첫 챕터 첫 개념 자동 해금
-            from app.services.mastery_service import MasteryService
-            first_chapter_stmt = (
-                select(Chapter)
-                .where(Chapter.grade == grade, Chapter.semester == 1, Chapter.chapter_number == 1)
-            )
-            first_chapter = await self.db.scalar(first_chapter_stmt)
-            if first_chapter and first_chapter.concept_ids:
-                mastery_service = MasteryService(self.db)
-                first_concept_id = first_chapter.concept_ids[0]
-                await mastery_service.ensure_first_concept_unlocked(student_id, first_chapter.id)
-                await self.db.flush()
-                return [first_concept_id]
-
-            # 최종 폴백: 챕터 데이터가 없는 학년 → 전체 개념
-            fallback_stmt = select(Concept.id).where(Concept.grade == grade)
-            return list((await self.db.scalars(fallback_stmt)).all())
-
-        # 2. 해금된 개념 중 해금된 챕터에 속한 것만 반환
-        stmt = (
-            select(ConceptMastery.concept_id)
-            .join(Concept, ConceptMastery.concept_id == Concept.id)
-            .where(
-                ConceptMastery.student_id == student_id,
-                ConceptMastery.is_unlocked == True,  # noqa: E712
-                Concept.grade == grade,
-                ConceptMastery.concept_id.in_(chapter_concept_ids),
-            )
-        )
-        return list((await self.db.scalars(stmt)).all())
 
     async def generate_comprehensive_test(
         self,
@@ -161,11 +123,9 @@ class TestService:
         if not available_concept_ids:
             return None
 
-        # 해당 개념의 문제 조회 (난이도 분포 고려)
-        stmt = select(Question).where(
-            Question.concept_id.in_(available_concept_ids)
-        )
-        all_questions = list((await self.db.scalars(stmt)).all())
+        # 해당 개념의 활성 문제 메타데이터 (난이도 분포 고려, 본문 미조회)
+        await question_pool_index.ensure_loaded(self.db, available_concept_ids)
+        all_questions = question_pool_index.get_questions(available_concept_ids)
 
         if len(all_questions) < 10:
             return None
@@ -192,7 +152,8 @@ class TestService:
 
         # 부족하면 나머지에서 랜덤 선택
         if len(selected) < target_count:
-            remaining = [q for q in all_questions if q not in selected]
+            selected_ids = {q.id for q in selected}
+            remaining = [q for q in all_questions if q.id not in selected_ids]
             selected.extend(random.sample(remaining, min(target_count - len(selected), len(remaining))))
 
         random.shuffle(selected)
@@ -271,18 +232,15 @@ class TestService:
 
         weak_concept_ids = [m.concept_id for m in weak_masteries]
 
-        # 약점 개념의 문제 조회
-        q_stmt = select(Question).where(
-            Question.concept_id.in_(weak_concept_ids),
-            Question.is_active == True,  # noqa: E712
-        )
-        all_questions = list((await self.db.scalars(q_stmt)).all())
+        # 약점 개념의 활성 문제 메타데이터
+        await question_pool_index.ensure_loaded(self.db, weak_concept_ids)
+        all_questions = question_pool_index.get_questions(weak_concept_ids)
 
         if not all_questions:
             return None
 
         # 개념별 문제 분류 (약한 순서 유지)
-        concept_questions: dict[str, list] = {cid: [] for cid in weak_concept_ids}
+        concept_questions: dict[str, list[QuestionMeta]] = {cid: [] for cid in weak_concept_ids}
         for q in all_questions:
             if q.concept_id in concept_questions:
                 concept_questions[q.concept_id].append(q)
@@ -361,95 +319,45 @@ class TestService:
         page: int = 1,
         page_size: int = 10,
     ) -> tuple[list[dict], int]:
-        """풀 수 있는 테스트 목록 조회."""
-        stmt = select(Test).where(Test.is_active == True)  # noqa: E712
-
-        if grade:
-            stmt = stmt.where(Test.grade == grade)
+        """풀 수 있는 테스트 목록 조회.
 
+        카탈로그는 필터링에 필요한 컬럼만 조회하고, Test 행 전체는 현재 페이지 분량만 로드한다.
+        해금 필터를 거친 목록(자동 생성 종합시험 포함)은 해금 현황 또는 테스트 카탈로그가
+        바뀔 때까지 재사용한다.
+        """
         # 해금된 챕터의 concept_ids로 테스트 필터링
         available_concept_ids: list[str] = []
         if grade:
             available_concept_ids = await self._get_student_available_concept_ids(student_id, grade)
 
-        # 페이지네이션 전에 전체 목록을 가져와서 concept 필터링
-        stmt = stmt.order_by(Test.created_at.desc())
-        all_tests = list((await self.db.scalars(stmt)).all())
-
-        # 테스트의 concept_ids가 해금된 concept에 포함되는 것만 필터링
+        # 목록 항목: DB 테스트는 ID, 자동 생성 종합시험은 dict
         if available_concept_ids and grade:
-            from app.services.chapter_service import ChapterService
-            chapter_service = ChapterService(self.db)
+            entries = await unlock_frontier.memoize(
+                self.db, student_id, grade, ("available_tests", _catalog_version),
+                lambda: self._get_eligible_entries(student_id, grade, available_concept_ids),
+            )
+        else:
+            stmt = select(Test.id).where(Test.is_active == True)  # noqa: E712
+            if grade:
+                stmt = stmt.where(Test.grade == grade)
+            stmt = stmt.order_by(Test.created_at.desc())
+            entries = list((await self.db.scalars(stmt)).all())
+
+        total = len(entries)
 
-            # 학기/학년 완료 상태 조회
-            semester_status = await chapter_service.get_semester_completion_status(student_id, grade)
-            grade_status = await chapter_service.get_grade_completion_status(student_id, grade)
-
-            filtered_tests = []
-            for t in all_tests:
-                # 일일 테스트는 별도 API(/daily-tests)로 관리 → available 목록에서 제외
-                if t.id.startswith("daily-"):
-                    continue
-                # 진단 평가는 항상 표시
-                if getattr(t, "is_placement", False):
-                    filtered_tests.append(t)
-                    continue
-                if not t.concept_ids:
-                    filtered_tests.append(t)
-                    continue
-
-                # 테스트 유형별 필터링
-                test_type = getattr(t, "test_type", "concept")
-
-                if test_type == "semester_final":
-                    # 학기 종합시험: 해당 학기 100% 완료 시에만 표시
-                    semester = getattr(t, "semester", None)
-                    if semester and semester_status.get(semester, {}).get("is_completed"):
-                        filtered_tests.append(t)
-                elif test_type == "grade_final":
-                    # 학년 종합시험: 학년 전체 100% 완료 시에만 표시
-                    if grade_status.get("is_completed"):
-                        filtered_tests.append(t)
-                elif test_type == "cumulative":
-                    # 누적 종합시험: 해금된 개념만 포함 (동적 필터링)
-                    # 해금된 개념 중 하나라도 있으면 표시
-                    if any(cid in available_concept_ids for cid in t.concept_ids):
-                        filtered_tests.append(t)
-                else:
-                    # 일반 개념/연산 테스트: 테스트의 모든 concept_ids가 해금되어야 표시
-                    if t.concept_ids and all(cid in available_concept_ids for cid in t.concept_ids):
-                        filtered_tests.append(t)
-            all_tests = filtered_tests
-
-            # 자동 생성 종합시험 추가
-            auto_tests = []
-
-            # 1. 누적 종합시험 (항상 표시)
-            cumulative = await self.generate_comprehensive_test(student_id, grade, "cumulative")
-            if cumulative:
-                auto_tests.append(cumulative)
-
-            # 2. 학기 기말시험 (학기 완료 시 표시)
-            for sem, status in semester_status.items():
-                if status.get("is_completed"):
-                    sem_final = await self.generate_comprehensive_test(student_id, grade, "semester_final", sem)
-                    if sem_final:
-                        auto_tests.append(sem_final)
-
-            # 3. 학년 기말시험 (학년 완료 시 표시)
-            if grade_status.get("is_completed"):
-                grade_final = await self.generate_comprehensive_test(student_id, grade, "grade_final")
-                if grade_final:
-                    auto_tests.append(grade_final)
-
-            # 자동 생성 테스트를 앞에 추가
-            all_tests = auto_tests + all_tests
-
-        total = len(all_tests)
-
-        # 페이지네이션
+        # 페이지네이션 후 해당 페이지의 테스트 행만 로드
         start = (page - 1) * page_size
-        tests = all_tests[start:start + page_size]
+        page_entries = entries[start:start + page_size]
+        page_ids = [e for e in page_entries if isinstance(e, str)]
+        test_map = {}
+        if page_ids:
+            rows = await self.db.scalars(select(Test).where(Test.id.in_(page_ids)))
+            test_map = {t.id: t for t in rows.all()}
+        tests = [
+            test_map.get(e) if isinstance(e, str) else e
+            for e in page_entries
+            if not isinstance(e, str) or e in test_map
+        ]
 
         # 한 번의 쿼리로 모든 테스트의 시도 통계 조회
         test_ids = [t.id if hasattr(t, 'id') else t['id'] for t in tests]
@@ -505,6 +413,89 @@ class TestService:
 
         return result, total
 
+    async def _get_completion_status(self, student_id: str, grade: Grade) -> tuple[dict, dict]:
+        """(학기별 완료 상태, 학년 완료 상태)."""
+        from app.services.chapter_service import ChapterService
+        chapter_service = ChapterService(self.db)
+
+        semester_status = await chapter_service.get_semester_completion_status(student_id, grade)
+        grade_status = await chapter_service.get_grade_completion_status(student_id, grade)
+        return semester_status, grade_status
+
+    async def _get_eligible_entries(
+        self, student_id: str, grade: Grade, available_concept_ids: list[str]
+    ) -> list[str | dict]:
+        """해금 현황으로 거른 테스트 ID 목록 (앞에 자동 생성 종합시험 dict)."""
+        # 일일 테스트는 별도 API(/daily-tests)로 관리 → available 목록에서 제외
+        stmt = (
+            select(Test.id, Test.test_type, Test.semester, Test.is_placement, Test.concept_ids)
+            .where(
+                Test.is_active == True,  # noqa: E712
+                Test.grade == grade,
+                Test.id.not_like("daily-%"),
+            )
+            .order_by(Test.created_at.desc())
+        )
+        catalog = (await self.db.execute(stmt)).all()
+
+        semester_status, grade_status = await self._get_completion_status(student_id, grade)
+        available = frozenset(available_concept_ids)
+        entries: list[str | dict] = [
+            row.id for row in catalog
+            if self._is_test_eligible(row, available, semester_status, grade_status)
+        ]
+
+        # 자동 생성 종합시험을 앞에 추가
+        auto_tests = await self._generate_auto_comprehensive_tests(
+            student_id, grade, semester_status, grade_status
+        )
+        return auto_tests + entries
+
+    @staticmethod
+    def _is_test_eligible(row, available: frozenset[str], semester_status: dict, grade_status: dict) -> bool:
+        """테스트 유형별 노출 여부."""
+        # 진단 평가는 항상 표시
+        if row.is_placement or not row.concept_ids:
+            return True
+
+        if row.test_type == "semester_final":
+            # 학기 종합시험: 해당 학기 100% 완료 시에만 표시
+            return bool(row.semester and semester_status.get(row.semester, {}).get("is_completed"))
+        if row.test_type == "grade_final":
+            # 학년 종합시험: 학년 전체 100% 완료 시에만 표시
+            return bool(grade_status.get("is_completed"))
+        if row.test_type == "cumulative":
+            # 누적 종합시험: 해금된 개념 중 하나라도 있으면 표시
+            return any(cid in available for cid in row.concept_ids)
+        # 일반 개념/연산 테스트: 테스트의 모든 concept_ids가 해금되어야 표시
+        return all(cid in available for cid in row.concept_ids)
+
+    async def _generate_auto_comprehensive_tests(
+        self, student_id: str, grade: Grade, semester_status: dict, grade_status: dict
+    ) -> list[dict]:
+        """목록용 자동 생성 종합시험 (누적 / 완료 학기 기말 / 학년 종합)."""
+        auto_tests = []
+
+        # 1. 누적 종합시험 (항상 표시)
+        cumulative = await self.generate_comprehensive_test(student_id, grade, "cumulative")
+        if cumulative:
+            auto_tests.append(cumulative)
+
+        # 2. 학기 기말시험 (학기 완료 시 표시)
+        for sem, status in semester_status.items():
+            if status.get("is_completed"):
+                sem_final = await self.generate_comprehensive_test(student_id, grade, "semester_final", sem)
+                if sem_final:
+                    auto_tests.append(sem_final)
+
+        # 3. 학년 기말시험 (학년 완료 시 표시)
+        if grade_status.get("is_completed"):
+            grade_final = await self.generate_comprehensive_test(student_id, grade, "grade_final")
+            if grade_final:
+                auto_tests.append(grade_final)
+
+        return auto_tests
+
     async def get_test_by_id(self, test_id: str, student_id: str | None = None) -> Test | dict | None:
         """테스트 조회 (auto-generated 테스트 포함)."""
         # 자동 생성 테스트 처리
@@ -843,3 +834,22 @@ class TestService:
         await self.db.refresh(attempt)
 
         return attempt
+
+
+def _bump_catalog_version(_changes: dict | None = None) -> None:
+    global _catalog_version
+    _catalog_version += 1
+
+
+# 트랜잭션 중 이전 카탈로그로 만든 목록이 남지 않도록 커밋/롤백 시 한 번 더 증가
+commit_hooks.register(
+    _CATALOG_PENDING_KEY, _bump_catalog_version, on_rollback=_bump_catalog_version
+)
+
+
+@event.listens_for(Test, "after_insert")
+@event.listens_for(Test, "after_update")
+@event.listens_for(Test, "after_delete")
+def _on_test_changed(mapper, connection, target) -> None:
+    _bump_catalog_version()
+    commit_hooks.stage(object_session(target), _CATALOG_PENDING_KEY, None)
@@ -0,0 +1,116 @@
+"""검증된 액세스 토큰 캐시 + 토큰 폐기 목록.
+
+get_current_user는 요청마다 JWT 서명을 검증하므로, 한 번 검증한 토큰은
+sha256(토큰) 키로 만료 시각까지 메모리에 보관해 이후 요청은 딕셔너리 조회로 끝낸다.
+- 폐기 목록: 로그아웃/리프레시로 폐기된 토큰 해시 (토큰 만료 시각까지 보관)
+- 사용자별 폐기 시각: revoke_all_user_tokens 이전에 발급된 액세스 토큰 거부
+- 프로세스 로컬 상태이므로, 다른 워커의 리프레시 토큰 폐기는 DB 조회로 확인한다
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.schemas.auth import UserResponse
+
+MAX_ENTRIES = 4096
+
+
+def token_hash(token: str) -> str:
+    """토큰 캐시 키."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenCache:
+    """LRU 검증 토큰 캐시와 폐기 목록."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        # {토큰 해시: (사용자, 만료 ts)}
+        self._verified: OrderedDict[str, tuple[UserResponse, float]] = OrderedDict()
+        # {토큰 해시: 만료 ts}
+        self._revoked: dict[str, float] = {}
+        # {사용자 ID: 폐기 ts} — 이 시각 이전에 발급된 토큰 거부
+        self._user_revoked_at: dict[str, float] = {}
+        self._stats = {"hits": 0, "misses": 0, "rejected": 0}
+
+    def clear(self) -> None:
+        """전체 초기화."""
+        self._verified.clear()
+        self._revoked.clear()
+        self._user_revoked_at.clear()
+        for key in self._stats:
+            self._stats[key] = 0
+
+    def metrics(self) -> dict:
+        """캐시 지표."""
+        return {
+            **self._stats,
+            "entries": len(self._verified),
+            "revoked": len(self._revoked),
+        }
+
+    def get(self, token: str) -> UserResponse | None:
+        """검증된 토큰의 사용자 반환. 미등록/만료면 None."""
+        key = token_hash(token)
+        entry = self._verified.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        user, expires_at = entry
+        if expires_at <= time.time():
+            del self._verified[key]
+            self._stats["misses"] += 1
+            return None
+        self._verified.move_to_end(key)
+        self._stats["hits"] += 1
+        return user
+
+    def put(self, token: str, user: UserResponse, payload: dict) -> None:
+        """검증을 마친 토큰 등록 (payload의 exp까지 유효)."""
+        expires_at = float(payload.get("exp") or 0)
+        if expires_at <= time.time():
+            return
+        self._verified[token_hash(token)] = (user, expires_at)
+        while len(self._verified) > self.max_entries:
+            self._verified.popitem(last=False)
+
+    def is_revoked(self, token: str, payload: dict) -> bool:
+        """폐기된 토큰 여부 (토큰 자체 폐기 또는 사용자 전체 폐기 이전 발급)."""
+        revoked = token_hash(token) in self._revoked
+        if not revoked:
+            revoked_at = self._user_revoked_at.get(payload.get("sub", ""))
+            # iat가 없는 토큰은 발급 시각을 알 수 없으므로 함께 폐기
+            revoked = revoked_at is not None and float(payload.get("iat") or 0) < revoked_at
+        if revoked:
+            self._stats["rejected"] += 1
+        return revoked
+
+    def revoke(self, token: str, expires_at: float | None) -> None:
+        """토큰 폐기 (만료 시각까지 보관)."""
+        self._prune()
+        key = token_hash(token)
+        self._verified.pop(key, None)
+        self._revoked[key] = float(expires_at) if expires_at else time.time() + 24 * 3600
+
+    def revoke_user(self, user_id: str) -> None:
+        """사용자의 기존 발급 토큰 전체 폐기."""
+        self._prune()
+        self._user_revoked_at[user_id] = time.time()
+        for key, (user, _) in list(self._verified.items()):
+            if user.id == user_id:
+                del self._verified[key]
+
+    def _prune(self) -> None:
+        now = time.time()
+        for key in [key for key, expires_at in self._revoked.items() if expires_at <= now]:
+            del self._revoked[key]
+        # 액세스 토큰 수명이 지난 사용자 폐기 시각은 불필요 (리프레시 토큰은 DB에서 폐기 확인)
+        horizon = now - settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        for user_id in [uid for uid, at in self._user_revoked_at.items() if at <= horizon]:
+            del self._user_revoked_at[user_id]
+
+
+# 프로세스 전역 토큰 캐시
+token_cache = TokenCache()
@@ -0,0 +1,249 @@
+"""학생별 해금 현황(단원/개념) 캐시.
+
+TestService와 DailyTestService가 요청마다 (해금 단원 → 단원 개념) + (해금 숙련도 → 개념)
+조인을 반복하던 것을 (학생, 학년)별 결과 캐시로 대체한다.
+- 단원의 개념 목록은 개념 → 단원 역인덱스(chapter_concept_index)에서 조회
+- 무효화는 해금 경로에서만: ConceptMastery/ChapterProgress의 is_unlocked 변경·삭제 ORM 이벤트
+  (unlock_next_concept_in_chapter, auto_unlock_next_concepts, _auto_unlock_next_chapters,
+  진단 평가 배치, 강사 단원 잠금/해제 모두 이 경로), 단원 편집 시 전체 초기화
+- 해금 현황에서 파생된 값(자동 종합시험, 학기/학년 완료 상태)은 memoize로 같은 항목에 보관
+  (단원 완료 여부 변경도 무효화 대상)
+- flush 시점과 커밋/롤백 시점에 한 번 더 무효화 (커밋 전 다른 요청이 읽은 값이 남지 않도록)
+- 원시 SQL로 삭제하는 경로(관리자 학습 데이터 초기화)는 invalidate를 직접 호출
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, NamedTuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import object_session
+
+from app.core import commit_hooks
+from app.models.chapter import Chapter
+from app.models.chapter_progress import ChapterProgress
+from app.models.concept import Concept
+from app.models.concept_mastery import ConceptMastery
+from app.services.chapter_concept_index import chapter_concept_index
+
+# 다른 워커 프로세스의 해금을 반영하기 위한 재조회 주기 (초)
+FRONTIER_TTL_SECONDS = 300
+MAX_STUDENTS = 4096
+# 커밋/롤백 시 다시 무효화할 학생 ID 보관 키 (None: 전체)
+_PENDING_KEY = "unlock_frontier_students"
+
+
+class Frontier(NamedTuple):
+    chapter_ids: frozenset[str]
+    # 해금 단원에 속한 개념 (해금 여부 무관)
+    chapter_concept_ids: frozenset[str]
+    # 해금 단원에 속하면서 해금된 개념 (조회 순서 유지)
+    concept_ids: tuple[str, ...]
+
+
+class _Entry:
+    __slots__ = ("frontier", "loaded_at", "derived")
+
+    def __init__(self, frontier: Frontier):
+        self.frontier = frontier
+        self.loaded_at = time.monotonic()
+        # {키: 해금 현황에서 파생된 값}
+        self.derived: dict[Hashable, Any] = {}
+
+
+def _grade_value(grade) -> str | None:
+    return grade.value if hasattr(grade, "value") else grade
+
+
+class UnlockFrontier:
+    """(학생, 학년) → 해금 단원/개념 캐시."""
+
+    def __init__(self, ttl_seconds: float = FRONTIER_TTL_SECONDS, max_students: int = MAX_STUDENTS):
+        self.ttl_seconds = ttl_seconds
+        self.max_students = max_students
+        # {학생 ID: {학년: _Entry}}
+        self._entries: OrderedDict[str, dict[str | None, _Entry]] = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "derived_hits": 0}
+
+    def clear(self) -> None:
+        """전체 초기화."""
+        self._entries.clear()
+        for key in self._stats:
+            self._stats[key] = 0
+
+    def metrics(self) -> dict:
+        """캐시 지표."""
+        return {**self._stats, "students": len(self._entries)}
+
+    def invalidate_all(self) -> None:
+        """전 학생 무효화 (단원 구성 변경 시)."""
+        if self._entries:
+            self._entries.clear()
+            self._stats["invalidations"] += 1
+
+    def invalidate(self, student_id: str) -> None:
+        """학생의 해금 현황 무효화 (전 학년)."""
+        if self._entries.pop(student_id, None) is not None:
+            self._stats["invalidations"] += 1
+
+    async def get(self, db: AsyncSession, student_id: str, grade) -> Frontier:
+        """학생의 학년별 해금 현황 (캐시 미스 시 2회 조회)."""
+        return (await self._entry(db, student_id, grade)).frontier
+
+    async def memoize(
+        self,
+        db: AsyncSession,
+        student_id: str,
+        grade,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """해금 현황에서 파생된 값을 해금 현황이 바뀔 때까지 보관.
+
+        factory 실행 중 해금 현황이 무효화되면(폴백 해금 등) 결과를 보관하지 않는다.
+        """
+        entry = await self._entry(db, student_id, grade)
+        if key in entry.derived:
+            self._stats["derived_hits"] += 1
+            return entry.derived[key]
+
+        value = await factory()
+        if self._entries.get(student_id, {}).get(_grade_value(grade)) is entry:
+            entry.derived[key] = value
+        return value
+
+    async def _entry(self, db: AsyncSession, student_id: str, grade) -> _Entry:
+        grade = _grade_value(grade)
+        entry = self._entries.get(student_id, {}).get(grade)
+        if entry is not None and time.monotonic() - entry.loaded_at < self.ttl_seconds:
+            self._entries.move_to_end(student_id)
+            self._stats["hits"] += 1
+            return entry
+
+        self._stats["misses"] += 1
+        entry = _Entry(await self._load(db, student_id, grade))
+        self._entries.setdefault(student_id, {})[grade] = entry
+        self._entries.move_to_end(student_id)
+        while len(self._entries) > self.max_students:
+            self._entries.popitem(last=False)
+        return entry
+
+    async def available_concept_ids(
+        self, db: AsyncSession, student_id: str, grade, fallback_to_grade: bool = False
+    ) -> list[str]:
+        """학생이 해금한 개념 ID (해금 단원에 속한 것만).
+
+        해금된 단원이 없으면 1학기 1단원 첫 개념을 해금해 반환하고,
+        단원 데이터가 없는 학년이면 fallback_to_grade일 때 학년 전체 개념을 반환한다.
+        """
+        frontier = await self.get(db, student_id, grade)
+        if frontier.chapter_concept_ids:
+            return list(frontier.concept_ids)
+
+        from app.services.mastery_service import MasteryService
+
+        first_chapter_stmt = (
+            select(Chapter)
+            .where(Chapter.grade == grade, Chapter.semester == 1, Chapter.chapter_number == 1)
+        )
+        first_chapter = await db.scalar(first_chapter_stmt)
+        if first_chapter and first_chapter.concept_ids:
+            await MasteryService(db).ensure_first_concept_unlocked(student_id, first_chapter.id)
+            await db.flush()
+            return [first_chapter.concept_ids[0]]
+
+        if not fallback_to_grade:
+            return []
+        fallback_stmt = select(Concept.id).where(Concept.grade == grade)
+        return list((await db.scalars(fallback_stmt)).all())
+
+    async def _load(self, db: AsyncSession, student_id: str, grade: str | None) -> Frontier:
+        await chapter_concept_index.ensure_loaded(db)
+        progress_stmt = select(ChapterProgress.chapter_id).where(
+            ChapterProgress.student_id == student_id,
+            ChapterProgress.is_unlocked == True,  # noqa: E712
+        )
+        chapter_ids = set()
+        chapter_concept_ids: set[str] = set()
+        for chapter_id in (await db.scalars(progress_stmt)).all():
+            info = chapter_concept_index.get(chapter_id)
+            if info is None or info.grade != grade:
+                continue
+            chapter_ids.add(chapter_id)
+            chapter_concept_ids.update(info.concept_ids)
+
+        concept_ids: list[str] = []
+        if chapter_concept_ids:
+            stmt = (
+                select(ConceptMastery.concept_id)
+                .join(Concept, ConceptMastery.concept_id == Concept.id)
+                .where(
+                    ConceptMastery.student_id == student_id,
+                    ConceptMastery.is_unlocked == True,  # noqa: E712
+                    Concept.grade == grade,
+                    ConceptMastery.concept_id.in_(chapter_concept_ids),
+                )
+            )
+            concept_ids = list((await db.scalars(stmt)).all())
+
+        return Frontier(frozenset(chapter_ids), frozenset(chapter_concept_ids), tuple(concept_ids))
+
+
+# 프로세스 전역 해금 현황 캐시
+unlock_frontier = UnlockFrontier()
+
+
+def _invalidate_pending(student_ids: dict) -> None:
+    if None in student_ids:
+        unlock_frontier.invalidate_all()
+        return
+    for student_id in student_ids:
+        unlock_frontier.invalidate(student_id)
+
+
+# 트랜잭션 중 재계산된 해금 현황이 남지 않도록 커밋/롤백 모두에서 다시 무효화
+commit_hooks.register(_PENDING_KEY, _invalidate_pending, on_rollback=_invalidate_pending)
+
+
+def _invalidate(target) -> None:
+    unlock_frontier.invalidate(target.student_id)
+    commit_hooks.stage(object_session(target), _PENDING_KEY, target.student_id)
+
+
+@event.listens_for(ConceptMastery, "after_insert")
+@event.listens_for(ChapterProgress, "after_insert")
+def _on_unlock_row_inserted(mapper, connection, target) -> None:
+    if target.is_unlocked:
+        _invalidate(target)
+
+
+@event.listens_for(ConceptMastery, "after_update")
+def _on_mastery_updated(mapper, connection, target) -> None:
+    # 숙련도 갱신 등 해금 여부가 바뀌지 않은 UPDATE는 무시
+    if inspect(target).attrs.is_unlocked.history.has_changes():
+        _invalidate(target)
+
+
+@event.listens_for(ChapterProgress, "after_update")
+def _on_chapter_progress_updated(mapper, connection, target) -> None:
+    # 단원 완료 여부는 학기/학년 완료 상태(파생 값)에 반영
+    attrs = inspect(target).attrs
+    if attrs.is_unlocked.history.has_changes() or attrs.is_completed.history.has_changes():
+        _invalidate(target)
+
+
+@event.listens_for(ConceptMastery, "after_delete")
+@event.listens_for(ChapterProgress, "after_delete")
+def _on_unlock_row_deleted(mapper, connection, target) -> None:
+    _invalidate(target)
+
+
+@event.listens_for(Chapter, "after_insert")
+@event.listens_for(Chapter, "after_update")
+@event.listens_for(Chapter, "after_delete")
+def _on_chapter_changed(mapper, connection, target) -> None:
+    unlock_frontier.invalidate_all()
+    # 단원 역인덱스는 커밋 시 갱신되므로 그 사이 재계산된 해금 현황도 커밋 시 다시 무효화
+    commit_hooks.stage(object_session(target), _PENDING_KEY, None)
@@ -6,6 +6,9 @@ the same question structure.
 """
 import hashlib
 import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Callable
 
 # Unicode superscript mapping for math expressions
@@ -17,6 +20,37 @@ def sup(n) -> str:
     """Convert a number or simple expression to Unicode superscript."""
     return str(n).translate(_SUP_MAP)
 
+# RNG installed by seeded() for the current thread/task (None = global random)
+_seeded_rng: ContextVar[random.Random | None] = ContextVar("template_rng", default=None)
+
+
+class _TemplateRandom:
+    """Random source for templates: the seeded() RNG if active, else the global random."""
+
+    def __getattr__(self, name: str):
+        return getattr(_seeded_rng.get() or random, name)
+
+
+rng = _TemplateRandom()
+
+
+@contextmanager
+def seeded(seed: int | str | None) -> Iterator[None]:
+    """Make templates draw from a private random.Random(seed) inside the block.
+
+    The global random state is never touched, and the RNG is scoped to the
+    current context, so concurrent callers do not share it.
+    """
+    if seed is None:
+        yield
+        return
+    token = _seeded_rng.set(random.Random(seed))
+    try:
+        yield
+    finally:
+        _seeded_rng.reset(token)
+
+
 # concept_id -> [(difficulty, generator_function), ...]
 TEMPLATE_REGISTRY: dict[str, list[tuple[int, Callable]]] = {}
 
@@ -67,7 +101,7 @@ def build_mc(
             wrong_strs.append(fs)
 
     all_options = [answer_str] + wrong_strs
-    random.shuffle(all_options)
+    rng.shuffle(all_options)
 
     labels = ["A", "B", "C", "D"]
     correct_label = labels[all_options.index(answer_str)]
@@ -12,9 +12,8 @@
 - concept-e3-div2-01: (두 자리)÷(한 자리) 나머지
 - concept-e3-div2-02: 나머지 활용 문제
 """
-import random
 
-from . import register, build_mc, build_fb
+from . import register, build_mc, build_fb, rng
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -50,8 +49,8 @@ def _addition_explanation(a: int, b: int) -> str:
 @register("concept-e3-add-sub-01", difficulty=3)
 def e3_add_lv3():
     while True:
-        a = random.randint(100, 499)
-        b = random.randint(100, 499)
+        a = rng.randint(100, 499)
+        b = rng.randint(100, 499)
         if _has_carry(a, b):
             break
     ans = a + b
@@ -67,8 +66,8 @@ def e3_add_lv3():
 @register("concept-e3-add-sub-01", difficulty=5)
 def e3_add_lv5():
     while True:
-        a = random.randint(200, 799)
-        b = random.randint(200, 799)
+        a = rng.randint(200, 799)
+        b = rng.randint(200, 799)
         if _has_carry(a, b) and a + b < 1600:
             break
     ans = a + b
@@ -84,8 +83,8 @@ def e3_add_lv5():
 @register("concept-e3-add-sub-01", difficulty=7)
 def e3_add_lv7():
     while True:
-        a = random.randint(300, 999)
-        b = random.randint(300, 999)
+        a = rng.randint(300, 999)
+        b = rng.randint(300, 999)
         # 두 자리 이상에서 받아올림
         if (a % 10 + b % 10 >= 10) and (a // 10 % 10 + b // 10 % 10 >= 9):
             break
@@ -110,8 +109,8 @@ def _has_borrow(a: int, b: int) -> bool:
 @register("concept-e3-add-sub-02", difficulty=3)
 def e3_sub_lv3():
     while True:
-        a = random.randint(300, 700)
-        b = random.randint(100, a - 50)
+        a = rng.randint(300, 700)
+        b = rng.randint(100, a - 50)
         if _has_borrow(a, b) and a - b > 50:
             break
     ans = a - b
@@ -127,8 +126,8 @@ def e3_sub_lv3():
 @register("concept-e3-add-sub-02", difficulty=5)
 def e3_sub_lv5():
     while True:
-        a = random.randint(400, 999)
-        b = random.randint(200, a - 100)
+        a = rng.randint(400, 999)
+        b = rng.randint(200, a - 100)
         if _has_borrow(a, b):
             break
     ans = a - b
@@ -145,10 +144,10 @@ def e3_sub_lv5():
 def e3_sub_lv7():
     """십의 자리가 0인 수에서 빼기 (예: 803 - 467)."""
     while True:
-        h = random.randint(3, 9)
-        a = h * 100 + random.choice([0, 1, 2, 3]) * 1  # X0Y 형태
-        a = h * 100 + random.randint(0, 9)  # 십의 자리 0~1
-        b = random.randint(100, a - 100)
+        h = rng.randint(3, 9)
+        a = h * 100 + rng.choice([0, 1, 2, 3]) * 1  # X0Y 형태
+        a = h * 100 + rng.randint(0, 9)  # 십의 자리 0~1
+        b = rng.randint(100, a - 100)
         if _has_borrow(a, b) and a // 10 % 10 <= 1:
             break
     ans = a - b
@@ -167,8 +166,8 @@ def e3_sub_lv7():
 
 @register("concept-e3-mul1-01", difficulty=3)
 def e3_mul1_lv3():
-    a = random.randint(11, 49)
-    b = random.randint(2, 5)
+    a = rng.randint(11, 49)
+    b = rng.randint(2, 5)
     ans = a * b
     tens, ones = a // 10, a % 10
     return build_mc(
@@ -183,8 +182,8 @@ def e3_mul1_lv3():
 
 @register("concept-e3-mul1-01", difficulty=5)
 def e3_mul1_lv5():
-    a = random.randint(12, 50)
-    b = random.randint(4, 9)
+    a = rng.randint(12, 50)
+    b = rng.randint(4, 9)
     ans = a * b
     tens, ones = a // 10, a % 10
     return build_mc(
@@ -199,8 +198,8 @@ def e3_mul1_lv5():
 
 @register("concept-e3-mul1-01", difficulty=7)
 def e3_mul1_lv7():
-    a = random.randint(30, 99)
-    b = random.randint(6, 9)
+    a = rng.randint(30, 99)
+    b = rng.randint(6, 9)
     ans = a * b
     tens, ones = a // 10, a % 10
     return build_mc(
@@ -220,8 +219,8 @@ def e3_mul1_lv7():
 @register("concept-e3-mul1-02", difficulty=4)
 def e3_mul1_carry_lv4():
     while True:
-        a = random.randint(13, 59)
-        b = random.randint(3, 7)
+        a = rng.randint(13, 59)
+        b = rng.randint(3, 7)
         if (a % 10) * b >= 10:  # 올림 발생
             break
     ans = a * b
@@ -239,8 +238,8 @@ def e3_mul1_carry_lv4():
 @register("concept-e3-mul1-02", difficulty=6)
 def e3_mul1_carry_lv6():
     while True:
-        a = random.randint(25, 89)
-        b = random.randint(5, 9)
+        a = rng.randint(25, 89)
+        b = rng.randint(5, 9)
         if (a % 10) * b >= 10:
             break
     ans = a * b
@@ -261,8 +260,8 @@ def e3_mul1_carry_lv6():
 
 @register("concept-e3-div1-01", difficulty=3)
 def e3_div1_lv3():
-    b = random.randint(2, 9)
-    ans = random.randint(2, 9)
+    b = rng.randint(2, 9)
+    ans = rng.randint(2, 9)
     a = b * ans
     return build_mc(
         content=f"{a} / {b} = ?",
@@ -275,8 +274,8 @@ def e3_div1_lv3():
 
 @register("concept-e3-div1-01", difficulty=5)
 def e3_div1_lv5():
-    b = random.randint(6, 9)
-    ans = random.randint(5, 9)
+    b = rng.randint(6, 9)
+    ans = rng.randint(5, 9)
     a = b * ans
     return build_mc(
         content=f"{a} / {b} = ?",
@@ -294,8 +293,8 @@ def e3_div1_lv5():
 @register("concept-e3-div1-02", difficulty=3)
 def e3_div_rel_lv3():
     """□ × b = c 형태."""
-    b = random.randint(3, 9)
-    ans = random.randint(3, 9)
+    b = rng.randint(3, 9)
+    ans = rng.randint(3, 9)
     c = b * ans
     return build_mc(
         content=f"□ x {b} = {c}일 때, □에 들어갈 수는?",
@@ -309,8 +308,8 @@ def e3_div_rel_lv3():
 @register("concept-e3-div1-02", difficulty=5)
 def e3_div_rel_lv5():
     """□ ÷ b = c 형태 (□ 구하기)."""
-    b = random.randint(3, 9)
-    c = random.randint(3, 9)
+    b = rng.randint(3, 9)
+    c = rng.randint(3, 9)
     ans = b * c
     return build_mc(
         content=f"□ / {b} = {c}일 때, □에 들어갈 수는?",
@@ -324,10 +323,10 @@ def e3_div_rel_lv5():
 @register("concept-e3-div1-02", difficulty=7)
 def e3_div_rel_lv7():
     """a ÷ b = □, □ × c = △ 형태."""
-    b = random.randint(3, 9)
-    mid = random.randint(3, 9)
+    b = rng.randint(3, 9)
+    mid = rng.randint(3, 9)
     a = b * mid
-    c = random.randint(2, 6)
+    c = rng.randint(2, 6)
     ans = mid * c
     return build_mc(
         content=f"{a} / {b} = □, □ x {c} = △일 때, △은?",
@@ -344,8 +343,8 @@ def e3_div_rel_lv7():
 
 @register("concept-e3-mul2-01", difficulty=4)
 def e3_mul2_lv4():
-    a = random.randint(101, 350)
-    b = random.randint(2, 5)
+    a = rng.randint(101, 350)
+    b = rng.randint(2, 5)
     ans = a * b
     h, t, o = a // 100, a // 10 % 10, a % 10
     return build_mc(
@@ -360,8 +359,8 @@ def e3_mul2_lv4():
 
 @register("concept-e3-mul2-01", difficulty=6)
 def e3_mul2_lv6():
-    a = random.randint(200, 500)
-    b = random.randint(5, 9)
+    a = rng.randint(200, 500)
+    b = rng.randint(5, 9)
     ans = a * b
     h, t, o = a // 100, a // 10 % 10, a % 10
     return build_mc(
@@ -377,10 +376,10 @@ def e3_mul2_lv6():
 @register("concept-e3-mul2-01", difficulty=8)
 def e3_mul2_lv8():
     """가운데 0이 있는 곱셈 (407 × 5 등)."""
-    h = random.randint(2, 9)
-    o = random.randint(1, 9)
+    h = rng.randint(2, 9)
+    o = rng.randint(1, 9)
     a = h * 100 + o  # X0Y
-    b = random.randint(3, 9)
+    b = rng.randint(3, 9)
     ans = a * b
     return build_mc(
         content=f"{a} x {b} = ?",
@@ -398,8 +397,8 @@ def e3_mul2_lv8():
 
 @register("concept-e3-mul2-02", difficulty=5)
 def e3_mul2x2_lv5():
-    a = random.randint(11, 35)
-    b = random.randint(11, 25)
+    a = rng.randint(11, 35)
+    b = rng.randint(11, 25)
     ans = a * b
     return build_mc(
         content=f"{a} x {b} = ?",
@@ -414,8 +413,8 @@ def e3_mul2x2_lv5():
 
 @register("concept-e3-mul2-02", difficulty=7)
 def e3_mul2x2_lv7():
-    a = random.randint(20, 60)
-    b = random.randint(15, 40)
+    a = rng.randint(20, 60)
+    b = rng.randint(15, 40)
     ans = a * b
     return build_mc(
         content=f"{a} x {b} = ?",
@@ -434,9 +433,9 @@ def e3_mul2x2_lv7():
 
 @register("concept-e3-div2-01", difficulty=3)
 def e3_div2_lv3():
-    b = random.randint(3, 9)
-    quotient = random.randint(3, 9)
-    remainder = random.randint(1, b - 1)
+    b = rng.randint(3, 9)
+    quotient = rng.randint(3, 9)
+    remainder = rng.randint(1, b - 1)
     a = b * quotient + remainder
     return build_mc(
         content=f"{a} / {b}의 나머지는?",
@@ -449,9 +448,9 @@ def e3_div2_lv3():
 
 @register("concept-e3-div2-01", difficulty=5)
 def e3_div2_lv5():
-    b = random.randint(3, 9)
-    quotient = random.randint(5, 15)
-    remainder = random.randint(1, b - 1)
+    b = rng.randint(3, 9)
+    quotient = rng.randint(5, 15)
+    remainder = rng.randint(1, b - 1)
     a = b * quotient + remainder
     return build_mc(
         content=f"{a} / {b}의 몫과 나머지를 구하면? (몫 ... 나머지)",
@@ -473,15 +472,15 @@ def e3_div2_lv5():
 @register("concept-e3-div2-02", difficulty=5)
 def e3_div2_word_lv5():
     """N명을 M명씩 배정하면 몇 묶음 필요? (올림)."""
-    per_group = random.randint(3, 8)
-    total = random.randint(per_group + 1, per_group * 10)
+    per_group = rng.randint(3, 8)
+    total = rng.randint(per_group + 1, per_group * 10)
     # 나머지가 있도록
     while total % per_group == 0:
         total += 1
     quotient = total // per_group
     ans = quotient + 1  # 올림
-    items = random.choice(["학생", "사과", "구슬", "색연필", "사탕"])
-    containers = random.choice(["묶음", "봉지", "상자", "그룹", "팀"])
+    items = rng.choice(["학생", "사과", "구슬", "색연필", "사탕"])
+    containers = rng.choice(["묶음", "봉지", "상자", "그룹", "팀"])
     return build_mc(
         content=f"{items} {total}개를 {per_group}개씩 {containers}에 담으면 "
                 f"{containers}은 최소 몇 개 필요한가요?",
@@ -497,11 +496,11 @@ def e3_div2_word_lv5():
 @register("concept-e3-div2-02", difficulty=7)
 def e3_div2_word_lv7():
     """어떤 수에 a를 곱했더니 b. 어떤 수를 c로 나누면?"""
-    c = random.randint(2, 6)
-    some = random.randint(2, 9) * c  # c로 나누어떨어지게
-    a = random.randint(2, 9)
+    c = rng.randint(2, 6)
+    some = rng.randint(2, 9) * c  # c로 나누어떨어지게
+    a = rng.randint(2, 9)
     while a == 1:
-        a = random.randint(2, 9)
+        a = rng.randint(2, 9)
     b = some * a
     ans = some // c
     return build_mc(
@@ -522,8 +521,8 @@ def e3_div2_word_lv7():
 @register("concept-e3-add-sub-01", difficulty=4)
 def e3_add_fb_lv4():
     while True:
-        a = random.randint(100, 599)
-        b = random.randint(100, 599)
+        a = rng.randint(100, 599)
+        b = rng.randint(100, 599)
         if _has_carry(a, b):
             break
     ans = a + b
@@ -538,8 +537,8 @@ def e3_add_fb_lv4():
 @register("concept-e3-add-sub-02", difficulty=4)
 def e3_sub_fb_lv4():
     while True:
-        a = random.randint(300, 900)
-        b = random.randint(100, a - 100)
+        a = rng.randint(300, 900)
+        b = rng.randint(100, a - 100)
         if _has_borrow(a, b):
             break
     ans = a - b
@@ -553,8 +552,8 @@ def e3_sub_fb_lv4():
 
 @register("concept-e3-mul1-01", difficulty=4)
 def e3_mul1_fb_lv4():
-    a = random.randint(11, 50)
-    b = random.randint(2, 9)
+    a = rng.randint(11, 50)
+    b = rng.randint(2, 9)
     ans = a * b
     return build_fb(
         content=f"{a} x {b} = [answer]",
@@ -566,8 +565,8 @@ def e3_mul1_fb_lv4():
 
 @register("concept-e3-div1-01", difficulty=4)
 def e3_div1_fb_lv4():
-    b = random.randint(2, 9)
-    ans = random.randint(2, 9)
+    b = rng.randint(2, 9)
+    ans = rng.randint(2, 9)
     a = b * ans
     return build_fb(
         content=f"{a} / {b} = [answer]",
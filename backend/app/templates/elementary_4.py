@@ -8,9 +8,8 @@
 - concept-e4-dec-op-02: 소수 덧셈/뺄셈
 """
 import math
-import random
 
-from . import register, build_mc, build_fb
+from . import register, build_mc, build_fb, rng
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -20,8 +19,8 @@ from . import register, build_mc, build_fb
 
 @register("concept-e4-mul-div-01", difficulty=4)
 def e4_mul_3x2_lv4():
-    a = random.randint(100, 300)
-    b = random.randint(11, 30)
+    a = rng.randint(100, 300)
+    b = rng.randint(11, 30)
     ans = a * b
     return build_mc(
         content=f"{a} x {b} = ?",
@@ -36,8 +35,8 @@ def e4_mul_3x2_lv4():
 
 @register("concept-e4-mul-div-01", difficulty=6)
 def e4_mul_3x2_lv6():
-    a = random.randint(200, 600)
-    b = random.randint(20, 60)
+    a = rng.randint(200, 600)
+    b = rng.randint(20, 60)
     ans = a * b
     return build_mc(
         content=f"{a} x {b} = ?",
@@ -52,8 +51,8 @@ def e4_mul_3x2_lv6():
 
 @register("concept-e4-mul-div-01", difficulty=8)
 def e4_mul_3x2_lv8():
-    a = random.randint(300, 999)
-    b = random.randint(40, 99)
+    a = rng.randint(300, 999)
+    b = rng.randint(40, 99)
     ans = a * b
     return build_mc(
         content=f"{a} x {b} = ?",
@@ -74,8 +73,8 @@ def e4_mul_3x2_lv8():
 @register("concept-e4-mul-div-02", difficulty=4)
 def e4_div_3by2_lv4():
     """나누어 떨어지는 나눗셈."""
-    b = random.randint(11, 30)
-    quotient = random.randint(5, 15)
+    b = rng.randint(11, 30)
+    quotient = rng.randint(5, 15)
     a = b * quotient
     return build_mc(
         content=f"{a} ÷ {b} = ?",
@@ -89,9 +88,9 @@ def e4_div_3by2_lv4():
 @register("concept-e4-mul-div-02", difficulty=6)
 def e4_div_3by2_lv6():
     """나머지 있는 나눗셈."""
-    b = random.randint(15, 40)
-    quotient = random.randint(10, 20)
-    remainder = random.randint(1, b - 1)
+    b = rng.randint(15, 40)
+    quotient = rng.randint(10, 20)
+    remainder = rng.randint(1, b - 1)
     a = b * quotient + remainder
     return build_mc(
         content=f"{a} ÷ {b}의 몫과 나머지를 구하면? (몫 ... 나머지)",
@@ -109,9 +108,9 @@ def e4_div_3by2_lv6():
 @register("concept-e4-mul-div-02", difficulty=8)
 def e4_div_3by2_lv8():
     """큰 수의 나눗셈."""
-    b = random.randint(20, 50)
-    quotient = random.randint(15, 30)
-    remainder = random.randint(0, b - 1)
+    b = rng.randint(20, 50)
+    quotient = rng.randint(15, 30)
+    remainder = rng.randint(0, b - 1)
     a = b * quotient + remainder
     return build_mc(
         content=f"{a} ÷ {b}의 몫은?",
@@ -130,9 +129,9 @@ def e4_div_3by2_lv8():
 @register("concept-e4-frac-op-01", difficulty=3)
 def e4_frac_same_add_lv3():
     """분모가 같은 진분수 덧셈."""
-    denom = random.randint(4, 12)
-    num1 = random.randint(1, denom - 2)
-    num2 = random.randint(1, denom - num1 - 1)
+    denom = rng.randint(4, 12)
+    num1 = rng.randint(1, denom - 2)
+    num2 = rng.randint(1, denom - num1 - 1)
     ans_num = num1 + num2
     gcd = math.gcd(ans_num, denom)
     ans_num_reduced = ans_num // gcd
@@ -154,9 +153,9 @@ def e4_frac_same_add_lv3():
 @register("concept-e4-frac-op-01", difficulty=5)
 def e4_frac_same_sub_lv5():
     """분모가 같은 진분수 뺄셈."""
-    denom = random.randint(5, 15)
-    num1 = random.randint(3, denom - 1)
-    num2 = random.randint(1, num1 - 1)
+    denom = rng.randint(5, 15)
+    num1 = rng.randint(3, denom - 1)
+    num2 = rng.randint(1, num1 - 1)
     ans_num = num1 - num2
     gcd = math.gcd(ans_num, denom)
     ans_num_reduced = ans_num // gcd
@@ -178,9 +177,9 @@ def e4_frac_same_sub_lv5():
 @register("concept-e4-frac-op-01", difficulty=7)
 def e4_frac_same_mix_lv7():
     """분모가 같은 분수 덧셈 (결과가 가분수)."""
-    denom = random.randint(5, 10)
-    num1 = random.randint(denom // 2, denom - 1)
-    num2 = random.randint(denom // 2, denom - 1)
+    denom = rng.randint(5, 10)
+    num1 = rng.randint(denom // 2, denom - 1)
+    num2 = rng.randint(denom // 2, denom - 1)
     ans_num = num1 + num2
     whole = ans_num // denom
     remainder = ans_num % denom
@@ -212,9 +211,9 @@ def e4_frac_same_mix_lv7():
 @register("concept-e4-frac-op-02", difficulty=5)
 def e4_mixed_sub_lv5():
     """자연수 - 진분수 (받아내림)."""
-    whole = random.randint(3, 9)
-    denom = random.randint(4, 8)
-    num = random.randint(1, denom - 1)
+    whole = rng.randint(3, 9)
+    denom = rng.randint(4, 8)
+    num = rng.randint(1, denom - 1)
     # 결과: (whole - 1) + (denom - num)/denom
     ans_whole = whole - 1
     ans_num = denom - num
@@ -239,11 +238,11 @@ def e4_mixed_sub_lv5():
 @register("concept-e4-frac-op-02", difficulty=7)
 def e4_mixed_add_lv7():
     """대분수 + 대분수."""
-    denom = random.randint(4, 8)
-    whole1 = random.randint(1, 5)
-    whole2 = random.randint(1, 5)
-    num1 = random.randint(1, denom - 1)
-    num2 = random.randint(1, denom - 1)
+    denom = rng.randint(4, 8)
+    whole1 = rng.randint(1, 5)
+    whole2 = rng.randint(1, 5)
+    num1 = rng.randint(1, denom - 1)
+    num2 = rng.randint(1, denom - 1)
     # 결과 계산
     total_num = num1 + num2
     carry = total_num // denom
@@ -273,11 +272,11 @@ def e4_mixed_add_lv7():
 @register("concept-e4-frac-op-02", difficulty=8)
 def e4_mixed_sub_lv8():
     """대분수 - 대분수 (받아내림)."""
-    denom = random.randint(5, 10)
-    whole1 = random.randint(4, 9)
-    whole2 = random.randint(1, whole1 - 2)
-    num1 = random.randint(1, denom - 2)
-    num2 = random.randint(num1 + 1, denom - 1)  # 받아내림 발생
+    denom = rng.randint(5, 10)
+    whole1 = rng.randint(4, 9)
+    whole2 = rng.randint(1, whole1 - 2)
+    num1 = rng.randint(1, denom - 2)
+    num2 = rng.randint(num1 + 1, denom - 1)  # 받아내림 발생
     # 받아내림 계산
     ans_whole = whole1 - whole2 - 1
     ans_num = denom + num1 - num2
@@ -307,8 +306,8 @@ def e4_mixed_sub_lv8():
 @register("concept-e4-dec-op-02", difficulty=4)
 def e4_dec_add_lv4():
     """소수 한 자리 덧셈."""
-    a = round(random.uniform(1.0, 9.9), 1)
-    b = round(random.uniform(1.0, 9.9), 1)
+    a = round(rng.uniform(1.0, 9.9), 1)
+    b = round(rng.uniform(1.0, 9.9), 1)
     ans = round(a + b, 1)
     return build_mc(
         content=f"{a} + {b} = ?",
@@ -327,8 +326,8 @@ def e4_dec_add_lv4():
 @register("concept-e4-dec-op-02", difficulty=6)
 def e4_dec_add_lv6():
     """소수 두 자리 덧셈."""
-    a = round(random.uniform(0.5, 9.99), 2)
-    b = round(random.uniform(0.5, 9.99), 2)
+    a = round(rng.uniform(0.5, 9.99), 2)
+    b = round(rng.uniform(0.5, 9.99), 2)
     ans = round(a + b, 2)
     return build_mc(
         content=f"{a} + {b} = ?",
@@ -347,8 +346,8 @@ def e4_dec_add_lv6():
 @register("concept-e4-dec-op-02", difficulty=7)
 def e4_dec_sub_lv7():
     """소수 뺄셈 (받아내림 포함)."""
-    a = round(random.uniform(5.0, 19.99), 2)
-    b = round(random.uniform(1.0, a - 1.0), 2)
+    a = round(rng.uniform(5.0, 19.99), 2)
+    b = round(rng.uniform(1.0, a - 1.0), 2)
     ans = round(a - b, 2)
     return build_mc(
         content=f"{a} - {b} = ?",
@@ -371,8 +370,8 @@ def e4_dec_sub_lv7():
 
 @register("concept-e4-mul-div-01", difficulty=5)
 def e4_mul_fb_lv5():
-    a = random.randint(150, 400)
-    b = random.randint(15, 40)
+    a = rng.randint(150, 400)
+    b = rng.randint(15, 40)
     ans = a * b
     return build_fb(
         content=f"{a} x {b} = [answer]",
@@ -384,8 +383,8 @@ def e4_mul_fb_lv5():
 
 @register("concept-e4-mul-div-02", difficulty=5)
 def e4_div_fb_lv5():
-    b = random.randint(12, 30)
-    quotient = random.randint(10, 25)
+    b = rng.randint(12, 30)
+    quotient = rng.randint(10, 25)
     a = b * quotient
     return build_fb(
         content=f"{a} ÷ {b} = [answer]",
@@ -397,8 +396,8 @@ def e4_div_fb_lv5():
 
 @register("concept-e4-dec-op-02", difficulty=5)
 def e4_dec_fb_lv5():
-    a = round(random.uniform(1.5, 9.9), 2)
-    b = round(random.uniform(0.5, 5.0), 2)
+    a = round(rng.uniform(1.5, 9.9), 2)
+    b = round(rng.uniform(0.5, 5.0), 2)
     ans = round(a + b, 2)
     return build_fb(
         content=f"{a} + {b} = [answer]",
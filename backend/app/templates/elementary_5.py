@@ -10,9 +10,8 @@
 - concept-e5-dec-mul-02: 소수 x 소수
 """
 import math
-import random
 
-from . import register, build_mc, build_fb
+from . import register, build_mc, build_fb, rng
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -23,9 +22,9 @@ from . import register, build_mc, build_fb
 @register("concept-e5-mixed-calc-01", difficulty=4)
 def e5_mixed_calc_lv4():
     """덧셈 + 곱셈 (곱셈 먼저)."""
-    a = random.randint(2, 10)
-    b = random.randint(2, 9)
-    c = random.randint(2, 9)
+    a = rng.randint(2, 10)
+    b = rng.randint(2, 9)
+    c = rng.randint(2, 9)
     ans = a + b * c
     wrong1 = (a + b) * c  # 순서 바꾼 오답
     return build_mc(
@@ -41,10 +40,10 @@ def e5_mixed_calc_lv4():
 @register("concept-e5-mixed-calc-01", difficulty=6)
 def e5_mixed_calc_lv6():
     """뺄셈 + 나눗셈."""
-    c = random.randint(2, 9)
-    b = random.randint(2, 9)
+    c = rng.randint(2, 9)
+    b = rng.randint(2, 9)
     bc = b * c
-    a = random.randint(bc + 5, bc + 20)
+    a = rng.randint(bc + 5, bc + 20)
     ans = a - bc // c
     return build_mc(
         content=f"{a} - {bc} / {c} = ?",
@@ -64,10 +63,10 @@ def e5_mixed_calc_lv6():
 @register("concept-e5-mixed-calc-01", difficulty=8)
 def e5_mixed_calc_lv8():
     """곱셈 + 나눗셈 + 덧셈."""
-    a = random.randint(3, 8)
-    b = random.randint(2, 5)
-    c = random.randint(2, 6)
-    d = random.randint(2, 9)
+    a = rng.randint(3, 8)
+    b = rng.randint(2, 5)
+    c = rng.randint(2, 6)
+    d = rng.randint(2, 9)
     cd = c * d
     ans = a * b + cd // d
     return build_mc(
@@ -93,9 +92,9 @@ def e5_mixed_calc_lv8():
 @register("concept-e5-mixed-calc-02", difficulty=5)
 def e5_paren_calc_lv5():
     """(a - b) x c."""
-    a = random.randint(10, 30)
-    b = random.randint(2, a - 2)
-    c = random.randint(2, 9)
+    a = rng.randint(10, 30)
+    b = rng.randint(2, a - 2)
+    c = rng.randint(2, 9)
     ans = (a - b) * c
     return build_mc(
         content=f"({a} - {b}) x {c} = ?",
@@ -115,10 +114,10 @@ def e5_paren_calc_lv5():
 @register("concept-e5-mixed-calc-02", difficulty=7)
 def e5_paren_calc_lv7():
     """(a + b) x c + d."""
-    a = random.randint(3, 12)
-    b = random.randint(2, 10)
-    c = random.randint(2, 7)
-    d = random.randint(5, 15)
+    a = rng.randint(3, 12)
+    b = rng.randint(2, 10)
+    c = rng.randint(2, 7)
+    d = rng.randint(5, 15)
     ans = (a + b) * c + d
     return build_mc(
         content=f"({a} + {b}) x {c} + {d} = ?",
@@ -139,11 +138,11 @@ def e5_paren_calc_lv7():
 @register("concept-e5-mixed-calc-02", difficulty=9)
 def e5_paren_calc_lv9():
     """a x (b + c) - d."""
-    a = random.randint(3, 9)
-    b = random.randint(2, 8)
-    c = random.randint(2, 8)
+    a = rng.randint(3, 9)
+    b = rng.randint(2, 8)
+    c = rng.randint(2, 8)
     prod = a * (b + c)
-    d = random.randint(5, prod - 5)
+    d = rng.randint(5, prod - 5)
     ans = prod - d
     return build_mc(
         content=f"{a} x ({b} + {c}) - {d} = ?",
@@ -169,11 +168,11 @@ def e5_paren_calc_lv9():
 @register("concept-e5-divisor-02", difficulty=4)
 def e5_gcd_lv4():
     """작은 수의 최대공약수."""
-    gcd_val = random.randint(2, 6)
-    a_mul = random.randint(2, 8)
-    b_mul = random.randint(2, 8)
+    gcd_val = rng.randint(2, 6)
+    a_mul = rng.randint(2, 8)
+    b_mul = rng.randint(2, 8)
     while math.gcd(a_mul, b_mul) != 1:
-        b_mul = random.randint(2, 8)
+        b_mul = rng.randint(2, 8)
     a = gcd_val * a_mul
     b = gcd_val * b_mul
     return build_mc(
@@ -194,11 +193,11 @@ def e5_gcd_lv4():
 @register("concept-e5-divisor-02", difficulty=6)
 def e5_lcm_lv6():
     """최소공배수."""
-    gcd_val = random.randint(2, 6)
-    a_mul = random.randint(2, 8)
-    b_mul = random.randint(2, 8)
+    gcd_val = rng.randint(2, 6)
+    a_mul = rng.randint(2, 8)
+    b_mul = rng.randint(2, 8)
     while math.gcd(a_mul, b_mul) != 1:
-        b_mul = random.randint(2, 8)
+        b_mul = rng.randint(2, 8)
     a = gcd_val * a_mul
     b = gcd_val * b_mul
     lcm_val = (a * b) // gcd_val
@@ -220,12 +219,12 @@ def e5_lcm_lv6():
 @register("concept-e5-divisor-02", difficulty=8)
 def e5_gcd_three_lv8():
     """세 수의 최대공약수."""
-    gcd_val = random.randint(2, 5)
-    a_mul = random.randint(2, 6)
-    b_mul = random.randint(2, 6)
-    c_mul = random.randint(2, 6)
+    gcd_val = rng.randint(2, 5)
+    a_mul = rng.randint(2, 6)
+    b_mul = rng.randint(2, 6)
+    c_mul = rng.randint(2, 6)
     while math.gcd(math.gcd(a_mul, b_mul), c_mul) != 1:
-        c_mul = random.randint(2, 6)
+        c_mul = rng.randint(2, 6)
     a = gcd_val * a_mul
     b = gcd_val * b_mul
     c = gcd_val * c_mul
@@ -251,12 +250,12 @@ def e5_gcd_three_lv8():
 @register("concept-e5-frac-add-01", difficulty=5)
 def e5_frac_diff_add_lv5():
     """분모가 다른 진분수 덧셈."""
-    denom1 = random.randint(3, 8)
-    denom2 = random.randint(3, 8)
+    denom1 = rng.randint(3, 8)
+    denom2 = rng.randint(3, 8)
     while denom1 == denom2:
-        denom2 = random.randint(3, 8)
-    num1 = random.randint(1, denom1 - 1)
-    num2 = random.randint(1, denom2 - 1)
+        denom2 = rng.randint(3, 8)
+    num1 = rng.randint(1, denom1 - 1)
+    num2 = rng.randint(1, denom2 - 1)
     lcm = (denom1 * denom2) // math.gcd(denom1, denom2)
     new_num1 = num1 * (lcm // denom1)
     new_num2 = num2 * (lcm // denom2)
@@ -282,13 +281,13 @@ def e5_frac_diff_add_lv5():
 @register("concept-e5-frac-add-01", difficulty=7)
 def e5_frac_diff_sub_lv7():
     """분모가 다른 진분수 뺄셈."""
-    denom1 = random.randint(4, 10)
-    denom2 = random.randint(3, 9)
+    denom1 = rng.randint(4, 10)
+    denom2 = rng.randint(3, 9)
     while denom1 == denom2:
-        denom2 = random.randint(3, 9)
+        denom2 = rng.randint(3, 9)
     lcm = (denom1 * denom2) // math.gcd(denom1, denom2)
-    new_num1 = random.randint(lcm // 2, lcm - 1)
-    new_num2 = random.randint(1, new_num1 - 1)
+    new_num1 = rng.randint(lcm // 2, lcm - 1)
+    new_num2 = rng.randint(1, new_num1 - 1)
     num1 = new_num1 // (lcm // denom1)
     num2 = new_num2 // (lcm // denom2)
     # 정확한 계산
@@ -351,10 +350,10 @@ def e5_frac_diff_mix_lv9():
 @register("concept-e5-frac-mul-02", difficulty=5)
 def e5_frac_mul_lv5():
     """진분수 x 진분수."""
-    denom1 = random.randint(3, 8)
-    denom2 = random.randint(3, 8)
-    num1 = random.randint(1, denom1 - 1)
-    num2 = random.randint(1, denom2 - 1)
+    denom1 = rng.randint(3, 8)
+    denom2 = rng.randint(3, 8)
+    num1 = rng.randint(1, denom1 - 1)
+    num2 = rng.randint(1, denom2 - 1)
     ans_num = num1 * num2
     ans_denom = denom1 * denom2
     gcd = math.gcd(ans_num, ans_denom)
@@ -378,12 +377,12 @@ def e5_frac_mul_lv5():
 def e5_frac_mul_cancel_lv7():
     """약분 후 곱하기."""
     # 2/3 x 3/4 = 1/2 형태
-    a = random.randint(2, 6)
-    b = random.randint(a + 1, 9)
+    a = rng.randint(2, 6)
+    b = rng.randint(a + 1, 9)
     c = a  # 약분 가능하게
-    d = random.randint(2, 8)
+    d = rng.randint(2, 8)
     while d == b:
-        d = random.randint(2, 8)
+        d = rng.randint(2, 8)
     ans_num = a * c
     ans_denom = b * d
     gcd = math.gcd(ans_num, ans_denom)
@@ -406,11 +405,11 @@ def e5_frac_mul_cancel_lv7():
 @register("concept-e5-frac-mul-02", difficulty=8)
 def e5_frac_mul_mixed_lv8():
     """대분수 x 진분수."""
-    whole = random.randint(1, 4)
-    num1 = random.randint(1, 5)
-    denom1 = random.randint(num1 + 1, 8)
-    num2 = random.randint(1, 6)
-    denom2 = random.randint(num2 + 1, 8)
+    whole = rng.randint(1, 4)
+    num1 = rng.randint(1, 5)
+    denom1 = rng.randint(num1 + 1, 8)
+    num2 = rng.randint(1, 6)
+    denom2 = rng.randint(num2 + 1, 8)
     # 가분수로 변환
     improper_num = whole * denom1 + num1
     ans_num = improper_num * num2
@@ -449,8 +448,8 @@ def e5_frac_mul_mixed_lv8():
 @register("concept-e5-dec-mul-01", difficulty=4)
 def e5_dec_mul_nat_lv4():
     """소수 한 자리 x 한 자리 수."""
-    a = round(random.uniform(1.1, 9.9), 1)
-    b = random.randint(2, 9)
+    a = round(rng.uniform(1.1, 9.9), 1)
+    b = rng.randint(2, 9)
     ans = round(a * b, 1)
     return build_mc(
         content=f"{a} x {b} = ?",
@@ -469,8 +468,8 @@ def e5_dec_mul_nat_lv4():
 @register("concept-e5-dec-mul-01", difficulty=6)
 def e5_dec_mul_nat_lv6():
     """소수 두 자리 x 한 자리 수."""
-    a = round(random.uniform(1.01, 9.99), 2)
-    b = random.randint(3, 9)
+    a = round(rng.uniform(1.01, 9.99), 2)
+    b = rng.randint(3, 9)
     ans = round(a * b, 2)
     return build_mc(
         content=f"{a} x {b} = ?",
@@ -489,8 +488,8 @@ def e5_dec_mul_nat_lv6():
 @register("concept-e5-dec-mul-01", difficulty=7)
 def e5_dec_mul_nat_lv7():
     """소수 x 두 자리 수."""
-    a = round(random.uniform(2.5, 9.9), 1)
-    b = random.randint(10, 25)
+    a = round(rng.uniform(2.5, 9.9), 1)
+    b = rng.randint(10, 25)
     ans = round(a * b, 1)
     return build_mc(
         content=f"{a} x {b} = ?",
@@ -514,8 +513,8 @@ def e5_dec_mul_nat_lv7():
 @register("concept-e5-dec-mul-02", difficulty=6)
 def e5_dec_mul_dec_lv6():
     """소수 한 자리 x 소수 한 자리."""
-    a = round(random.uniform(0.2, 0.9), 1)
-    b = round(random.uniform(0.2, 0.9), 1)
+    a = round(rng.uniform(0.2, 0.9), 1)
+    b = round(rng.uniform(0.2, 0.9), 1)
     ans = round(a * b, 2)
     return build_mc(
         content=f"{a} x {b} = ?",
@@ -534,8 +533,8 @@ def e5_dec_mul_dec_lv6():
 @register("concept-e5-dec-mul-02", difficulty=8)
 def e5_dec_mul_dec_lv8():
     """소수 두 자리 x 소수 한 자리."""
-    a = round(random.uniform(1.01, 9.99), 2)
-    b = round(random.uniform(0.2, 0.9), 1)
+    a = round(rng.uniform(1.01, 9.99), 2)
+    b = round(rng.uniform(0.2, 0.9), 1)
     ans = round(a * b, 3)
     # 소수점 셋째 자리 반올림
     ans = round(ans, 2)
@@ -556,8 +555,8 @@ def e5_dec_mul_dec_lv8():
 @register("concept-e5-dec-mul-02", difficulty=9)
 def e5_dec_mul_dec_lv9():
     """소수 두 자리 x 소수 두 자리."""
-    a = round(random.uniform(1.1, 5.9), 1)
-    b = round(random.uniform(1.1, 5.9), 1)
+    a = round(rng.uniform(1.1, 5.9), 1)
+    b = round(rng.uniform(1.1, 5.9), 1)
     ans = round(a * b, 2)
     return build_mc(
         content=f"{a} x {b} = ? (소수 둘째 자리까지)",
@@ -580,9 +579,9 @@ def e5_dec_mul_dec_lv9():
 
 @register("concept-e5-mixed-calc-01", difficulty=5)
 def e5_mixed_fb_lv5():
-    a = random.randint(5, 15)
-    b = random.randint(2, 8)
-    c = random.randint(2, 9)
+    a = rng.randint(5, 15)
+    b = rng.randint(2, 8)
+    c = rng.randint(2, 9)
     ans = a + b * c
     return build_fb(
         content=f"{a} + {b} x {c} = [answer]",
@@ -594,11 +593,11 @@ def e5_mixed_fb_lv5():
 
 @register("concept-e5-divisor-02", difficulty=5)
 def e5_gcd_fb_lv5():
-    gcd_val = random.randint(3, 8)
-    a_mul = random.randint(3, 9)
-    b_mul = random.randint(3, 9)
+    gcd_val = rng.randint(3, 8)
+    a_mul = rng.randint(3, 9)
+    b_mul = rng.randint(3, 9)
     while math.gcd(a_mul, b_mul) != 1:
-        b_mul = random.randint(3, 9)
+        b_mul = rng.randint(3, 9)
     a = gcd_val * a_mul
     b = gcd_val * b_mul
     return build_fb(
@@ -611,8 +610,8 @@ def e5_gcd_fb_lv5():
 
 @register("concept-e5-dec-mul-02", difficulty=7)
 def e5_dec_mul_fb_lv7():
-    a = round(random.uniform(1.1, 9.9), 1)
-    b = round(random.uniform(0.2, 0.9), 1)
+    a = round(rng.uniform(1.1, 9.9), 1)
+    b = round(rng.uniform(0.2, 0.9), 1)
     ans = round(a * b, 2)
     return build_fb(
         content=f"{a} x {b} = [answer]",
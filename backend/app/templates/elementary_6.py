@@ -7,9 +7,8 @@
 - concept-e6-dec-div2: 소수 ÷ 소수
 """
 import math
-import random
 
-from . import register, build_mc, build_fb
+from . import register, build_mc, build_fb, rng
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -20,9 +19,9 @@ from . import register, build_mc, build_fb
 @register("concept-e6-frac-div1", difficulty=4)
 def e6_frac_div_nat_lv4():
     """진분수 ÷ 자연수."""
-    denom = random.randint(4, 12)
-    num = random.randint(2, denom - 1)
-    divisor = random.randint(2, 5)
+    denom = rng.randint(4, 12)
+    num = rng.randint(2, denom - 1)
+    divisor = rng.randint(2, 5)
     # 결과: num/denom ÷ divisor = num/(denom × divisor)
     ans_num = num
     ans_denom = denom * divisor
@@ -47,9 +46,9 @@ def e6_frac_div_nat_lv4():
 @register("concept-e6-frac-div1", difficulty=6)
 def e6_frac_div_nat_lv6():
     """가분수 ÷ 자연수."""
-    denom = random.randint(3, 8)
-    num = random.randint(denom + 1, denom * 3)
-    divisor = random.randint(2, 6)
+    denom = rng.randint(3, 8)
+    num = rng.randint(denom + 1, denom * 3)
+    divisor = rng.randint(2, 6)
     ans_num = num
     ans_denom = denom * divisor
     gcd = math.gcd(ans_num, ans_denom)
@@ -81,10 +80,10 @@ def e6_frac_div_nat_lv6():
 @register("concept-e6-frac-div1", difficulty=8)
 def e6_frac_div_nat_lv8():
     """대분수 ÷ 자연수."""
-    whole = random.randint(2, 6)
-    num = random.randint(1, 7)
-    denom = random.randint(num + 1, 10)
-    divisor = random.randint(2, 5)
+    whole = rng.randint(2, 6)
+    num = rng.randint(1, 7)
+    denom = rng.randint(num + 1, 10)
+    divisor = rng.randint(2, 5)
     # 가분수로 변환
     improper_num = whole * denom + num
     ans_num = improper_num
@@ -123,10 +122,10 @@ def e6_frac_div_nat_lv8():
 @register("concept-e6-frac-div2", difficulty=5)
 def e6_frac_div_frac_lv5():
     """진분수 ÷ 진분수."""
-    denom1 = random.randint(3, 8)
-    num1 = random.randint(2, denom1 - 1)
-    denom2 = random.randint(3, 8)
-    num2 = random.randint(2, denom2 - 1)
+    denom1 = rng.randint(3, 8)
+    num1 = rng.randint(2, denom1 - 1)
+    denom2 = rng.randint(3, 8)
+    num2 = rng.randint(2, denom2 - 1)
     # 결과: (num1/denom1) ÷ (num2/denom2) = (num1 × denom2) / (denom1 × num2)
     ans_num = num1 * denom2
     ans_denom = denom1 * num2
@@ -159,10 +158,10 @@ def e6_frac_div_frac_lv5():
 @register("concept-e6-frac-div2", difficulty=7)
 def e6_frac_div_frac_lv7():
     """가분수 ÷ 진분수."""
-    denom1 = random.randint(3, 7)
-    num1 = random.randint(denom1 + 1, denom1 * 2)
-    denom2 = random.randint(3, 7)
-    num2 = random.randint(1, denom2 - 1)
+    denom1 = rng.randint(3, 7)
+    num1 = rng.randint(denom1 + 1, denom1 * 2)
+    denom2 = rng.randint(3, 7)
+    num2 = rng.randint(1, denom2 - 1)
     ans_num = num1 * denom2
     ans_denom = denom1 * num2
     gcd = math.gcd(ans_num, ans_denom)
@@ -194,12 +193,12 @@ def e6_frac_div_frac_lv7():
 @register("concept-e6-frac-div2", difficulty=9)
 def e6_frac_div_frac_lv9():
     """대분수 ÷ 대분수."""
-    whole1 = random.randint(1, 4)
-    num1 = random.randint(1, 5)
-    denom1 = random.randint(num1 + 1, 8)
-    whole2 = random.randint(1, 3)
-    num2 = random.randint(1, 5)
-    denom2 = random.randint(num2 + 1, 8)
+    whole1 = rng.randint(1, 4)
+    num1 = rng.randint(1, 5)
+    denom1 = rng.randint(num1 + 1, 8)
+    whole2 = rng.randint(1, 3)
+    num2 = rng.randint(1, 5)
+    denom2 = rng.randint(num2 + 1, 8)
     # 가분수로 변환
     improper_num1 = whole1 * denom1 + num1
     improper_num2 = whole2 * denom2 + num2
@@ -241,8 +240,8 @@ def e6_frac_div_frac_lv9():
 @register("concept-e6-dec-div1", difficulty=4)
 def e6_dec_div_nat_lv4():
     """소수 한 자리 ÷ 한 자리 수 (나누어떨어짐)."""
-    divisor = random.randint(2, 9)
-    quotient = round(random.uniform(1.1, 9.9), 1)
+    divisor = rng.randint(2, 9)
+    quotient = round(rng.uniform(1.1, 9.9), 1)
     dividend = round(quotient * divisor, 1)
     ans = quotient
     return build_mc(
@@ -262,8 +261,8 @@ def e6_dec_div_nat_lv4():
 @register("concept-e6-dec-div1", difficulty=6)
 def e6_dec_div_nat_lv6():
     """소수 두 자리 ÷ 한 자리 수."""
-    divisor = random.randint(2, 9)
-    quotient = round(random.uniform(1.1, 9.99), 2)
+    divisor = rng.randint(2, 9)
+    quotient = round(rng.uniform(1.1, 9.99), 2)
     dividend = round(quotient * divisor, 2)
     ans = round(dividend / divisor, 2)
     return build_mc(
@@ -283,8 +282,8 @@ def e6_dec_div_nat_lv6():
 @register("concept-e6-dec-div1", difficulty=8)
 def e6_dec_div_nat_lv8():
     """자연수 ÷ 자연수 = 소수 (몫을 소수로)."""
-    divisor = random.randint(4, 8)
-    whole = random.randint(5, 30)
+    divisor = rng.randint(4, 8)
+    whole = rng.randint(5, 30)
     dividend = whole
     ans = round(dividend / divisor, 2)
     return build_mc(
@@ -309,8 +308,8 @@ def e6_dec_div_nat_lv8():
 @register("concept-e6-dec-div2", difficulty=6)
 def e6_dec_div_dec_lv6():
     """소수 한 자리 ÷ 소수 한 자리."""
-    divisor = round(random.uniform(0.2, 0.9), 1)
-    quotient = random.randint(2, 9)
+    divisor = round(rng.uniform(0.2, 0.9), 1)
+    quotient = rng.randint(2, 9)
     dividend = round(divisor * quotient, 1)
     ans = quotient
     return build_mc(
@@ -331,8 +330,8 @@ def e6_dec_div_dec_lv6():
 @register("concept-e6-dec-div2", difficulty=8)
 def e6_dec_div_dec_lv8():
     """소수 ÷ 소수 (결과가 소수)."""
-    divisor = round(random.uniform(0.5, 2.0), 1)
-    dividend = round(random.uniform(3.0, 15.0), 1)
+    divisor = round(rng.uniform(0.5, 2.0), 1)
+    dividend = round(rng.uniform(3.0, 15.0), 1)
     ans = round(dividend / divisor, 1)
     return build_mc(
         content=f"{dividend} ÷ {divisor} = ? (소수 첫째 자리까지)",
@@ -351,8 +350,8 @@ def e6_dec_div_dec_lv8():
 @register("concept-e6-dec-div2", difficulty=9)
 def e6_dec_div_dec_lv9():
     """복잡한 소수 나눗셈."""
-    divisor = round(random.uniform(1.2, 3.5), 1)
-    dividend = round(random.uniform(8.0, 25.0), 1)
+    divisor = round(rng.uniform(1.2, 3.5), 1)
+    dividend = round(rng.uniform(8.0, 25.0), 1)
     ans = round(dividend / divisor, 2)
     return build_mc(
         content=f"{dividend} ÷ {divisor} = ? (소수 둘째 자리까지)",
@@ -375,9 +374,9 @@ def e6_dec_div_dec_lv9():
 
 @register("concept-e6-frac-div1", difficulty=5)
 def e6_frac_div_nat_fb_lv5():
-    denom = random.randint(4, 10)
-    num = random.randint(2, denom - 1)
-    divisor = random.randint(2, 5)
+    denom = rng.randint(4, 10)
+    num = rng.randint(2, denom - 1)
+    divisor = rng.randint(2, 5)
     ans_num = num
     ans_denom = denom * divisor
     gcd = math.gcd(ans_num, ans_denom)
@@ -394,10 +393,10 @@ def e6_frac_div_nat_fb_lv5():
 
 @register("concept-e6-frac-div2", difficulty=6)
 def e6_frac_div_frac_fb_lv6():
-    denom1 = random.randint(3, 8)
-    num1 = random.randint(2, denom1 - 1)
-    denom2 = random.randint(3, 8)
-    num2 = random.randint(2, denom2 - 1)
+    denom1 = rng.randint(3, 8)
+    num1 = rng.randint(2, denom1 - 1)
+    denom2 = rng.randint(3, 8)
+    num2 = rng.randint(2, denom2 - 1)
     ans_num = num1 * denom2
     ans_denom = denom1 * num2
     gcd = math.gcd(ans_num, ans_denom)
@@ -421,8 +420,8 @@ def e6_frac_div_frac_fb_lv6():
 
 @register("concept-e6-dec-div2", difficulty=7)
 def e6_dec_div_dec_fb_lv7():
-    divisor = round(random.uniform(0.5, 2.5), 1)
-    dividend = round(random.uniform(5.0, 20.0), 1)
+    divisor = round(rng.uniform(0.5, 2.5), 1)
+    dividend = round(rng.uniform(5.0, 20.0), 1)
     ans = round(dividend / divisor, 1)
     return build_fb(
         content=f"{dividend} ÷ {divisor} = [answer] (소수 첫째 자리까지)",
@@ -5,10 +5,9 @@
 - concept-h1-equation-01: 이차방정식 (인수분해, 근의 공식)
 - concept-h1-equation-02: 이차부등식 (해의 범위)
 """
-import random
 import math
 
-from . import register, build_mc, build_fb
+from . import register, build_mc, build_fb, rng
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -18,8 +17,8 @@ from . import register, build_mc, build_fb
 @register("concept-h1-polynomial-01", difficulty=3)
 def h1_poly_add_lv3():
     """(ax²+bx+c)+(dx²+ex+f) 형태."""
-    a, b, c = random.randint(1, 5), random.randint(-5, 5), random.randint(-5, 5)
-    d, e, f = random.randint(1, 5), random.randint(-5, 5), random.randint(-5, 5)
+    a, b, c = rng.randint(1, 5), rng.randint(-5, 5), rng.randint(-5, 5)
+    d, e, f = rng.randint(1, 5), rng.randint(-5, 5), rng.randint(-5, 5)
 
     ans_a = a + d
     ans_b = b + e
@@ -67,11 +66,11 @@ def h1_poly_add_lv3():
 @register("concept-h1-polynomial-01", difficulty=5)
 def h1_poly_mul_binomial_lv5():
     """(x+a)(x+b) 전개."""
-    a = random.randint(-8, 8)
-    b = random.randint(-8, 8)
+    a = rng.randint(-8, 8)
+    b = rng.randint(-8, 8)
     while a == 0 or b == 0:
-        a = random.randint(-8, 8)
-        b = random.randint(-8, 8)
+        a = rng.randint(-8, 8)
+        b = rng.randint(-8, 8)
 
     # (x+a)(x+b) = x² + (a+b)x + ab
     coef_x = a + b
@@ -118,9 +117,9 @@ def h1_poly_mul_binomial_lv5():
 @register("concept-h1-polynomial-01", difficulty=7)
 def h1_poly_cube_lv7():
     """(x+a)³ 전개."""
-    a = random.randint(-3, 3)
+    a = rng.randint(-3, 3)
     while a == 0:
-        a = random.randint(-3, 3)
+        a = rng.randint(-3, 3)
 
     # (x+a)³ = x³ + 3ax² + 3a²x + a³
     coef_x2 = 3 * a
@@ -172,10 +171,10 @@ def h1_poly_cube_lv7():
 def h1_quad_factor_lv3():
     """x² + bx + c = 0을 인수분해로 풀기 (근이 정수)."""
     # 근 p, q를 먼저 선택 (정수)
-    p = random.randint(-8, 8)
-    q = random.randint(-8, 8)
+    p = rng.randint(-8, 8)
+    q = rng.randint(-8, 8)
     while p == q:
-        q = random.randint(-8, 8)
+        q = rng.randint(-8, 8)
 
     # (x-p)(x-q) = x² - (p+q)x + pq
     b = -(p + q)
@@ -218,9 +217,9 @@ def h1_quad_factor_lv3():
 @register("concept-h1-equation-01", difficulty=5)
 def h1_quad_discriminant_lv5():
     """판별식 D=b²-4ac 계산."""
-    a = random.randint(1, 5)
-    b = random.randint(-10, 10)
-    c = random.randint(-10, 10)
+    a = rng.randint(1, 5)
+    b = rng.randint(-10, 10)
+    c = rng.randint(-10, 10)
 
     D = b * b - 4 * a * c
 
@@ -266,13 +265,13 @@ def h1_quad_formula_lv7():
     """근의 공식 사용 (근이 무리수)."""
     # Pick D that is not a perfect square
     a = 1  # Keep a=1 for simplicity
-    b = random.randint(-6, 6)
+    b = rng.randint(-6, 6)
     while b == 0:
-        b = random.randint(-6, 6)
+        b = rng.randint(-6, 6)
 
     # Pick c such that D > 0 and not a perfect square
     for _ in range(100):
-        c = random.randint(-10, 10)
+        c = rng.randint(-10, 10)
         D = b * b - 4 * a * c
         if D > 0 and int(math.sqrt(D))**2 != D:
             break
@@ -329,8 +328,8 @@ def h1_quad_formula_lv7():
 def h1_quad_ineq_lv4():
     """x² + bx + c < 0 해의 범위 (근이 정수, a>0)."""
     # Pick two integer roots p < q
-    p = random.randint(-8, -1)
-    q = random.randint(1, 8)
+    p = rng.randint(-8, -1)
+    q = rng.randint(1, 8)
 
     # (x-p)(x-q) = x² - (p+q)x + pq
     b = -(p + q)
@@ -373,8 +372,8 @@ def h1_quad_ineq_lv4():
 @register("concept-h1-equation-02", difficulty=6)
 def h1_quad_ineq_geq_lv6():
     """x² + bx + c ≥ 0 해의 범위."""
-    p = random.randint(-6, -1)
-    q = random.randint(1, 6)
+    p = rng.randint(-6, -1)
+    q = rng.randint(1, 6)
 
     b = -(p + q)
     c = p * q
@@ -415,8 +414,8 @@ def h1_quad_ineq_geq_lv6():
 @register("concept-h1-equation-02", difficulty=8)
 def h1_quad_ineq_negative_a_lv8():
     """-x² + bx + c > 0 (a<0인 경우)."""
-    p = random.randint(-5, -1)
-    q = random.randint(1, 5)
+    p = rng.randint(-5, -1)
+    q = rng.randint(1, 5)
 
     # -(x-p)(x-q) = -x² + (p+q)x - pq
     b = p + q
@@ -463,11 +462,11 @@ def h1_quad_ineq_negative_a_lv8():
 @register("concept-h1-polynomial-01", difficulty=4)
 def h1_poly_fb_lv4():
     """(x+a)(x+b) 전개 fill-in-blank."""
-    a = random.randint(-5, 5)
-    b = random.randint(-5, 5)
+    a = rng.randint(-5, 5)
+    b = rng.randint(-5, 5)
     while a == 0 or b == 0:
-        a = random.randint(-5, 5)
-        b = random.randint(-5, 5)
+        a = rng.randint(-5, 5)
+        b = rng.randint(-5, 5)
 
     coef_x = a + b
     const = a * b
@@ -488,10 +487,10 @@ def h1_poly_fb_lv4():
 @register("concept-h1-equation-01", difficulty=4)
 def h1_quad_fb_lv4():
     """이차방정식 해 구하기 (fill-in-blank)."""
-    p = random.randint(-6, 6)
-    q = random.randint(-6, 6)
+    p = rng.randint(-6, 6)
+    q = rng.randint(-6, 6)
     while p == q:
-        q = random.randint(-6, 6)
+        q = rng.randint(-6, 6)
 
     b = -(p + q)
     c = p * q
@@ -5,10 +5,9 @@
 - concept-h2-line: 직선의 방정식 (기울기, 절편, 평행/수직)
 - concept-h2-circle: 원의 방정식 (중심, 반지름)
 """
-import random
 import math
 
-from . import register, build_mc, build_fb
+from . import register, build_mc, build_fb, rng
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -20,15 +19,15 @@ def h2_distance_lv3():
     """두 점 사이의 거리 (피타고라스 정수쌍 사용)."""
     # Use Pythagorean triples for clean answers: (3,4,5), (5,12,13), (8,15,17)
     triples = [(3, 4, 5), (5, 12, 13), (8, 15, 17), (6, 8, 10)]
-    dx, dy, dist = random.choice(triples)
+    dx, dy, dist = rng.choice(triples)
 
     # Random starting point
-    x1 = random.randint(-5, 5)
-    y1 = random.randint(-5, 5)
+    x1 = rng.randint(-5, 5)
+    y1 = rng.randint(-5, 5)
 
     # Apply dx, dy with random signs
-    dx = dx * random.choice([-1, 1])
-    dy = dy * random.choice([-1, 1])
+    dx = dx * rng.choice([-1, 1])
+    dy = dy * rng.choice([-1, 1])
 
     x2 = x1 + dx
     y2 = y1 + dy
@@ -54,10 +53,10 @@ def h2_distance_lv3():
 @register("concept-h2-plane-coord", difficulty=5)
 def h2_midpoint_lv5():
     """두 점의 중점 좌표."""
-    x1 = random.randint(-8, 8)
-    y1 = random.randint(-8, 8)
-    x2 = random.randint(-8, 8)
-    y2 = random.randint(-8, 8)
+    x1 = rng.randint(-8, 8)
+    y1 = rng.randint(-8, 8)
+    x2 = rng.randint(-8, 8)
+    y2 = rng.randint(-8, 8)
 
     mid_x = (x1 + x2) / 2
     mid_y = (y1 + y2) / 2
@@ -88,11 +87,11 @@ def h2_midpoint_lv5():
 def h2_distance_formula_lv7():
     """원점으로부터의 거리."""
     # Pick point such that distance is simple
-    x = random.randint(-10, 10)
-    y = random.randint(-10, 10)
+    x = rng.randint(-10, 10)
+    y = rng.randint(-10, 10)
     while x == 0 and y == 0:
-        x = random.randint(-10, 10)
-        y = random.randint(-10, 10)
+        x = rng.randint(-10, 10)
+        y = rng.randint(-10, 10)
 
     dist_sq = x*x + y*y
     # Check if perfect square
@@ -126,12 +125,12 @@ def h2_distance_formula_lv7():
 @register("concept-h2-line", difficulty=3)
 def h2_line_slope_lv3():
     """기울기와 한 점이 주어졌을 때 직선의 방정식."""
-    m = random.randint(-5, 5)
+    m = rng.randint(-5, 5)
     while m == 0:
-        m = random.randint(-5, 5)
+        m = rng.randint(-5, 5)
 
-    x0 = random.randint(-5, 5)
-    y0 = random.randint(-5, 5)
+    x0 = rng.randint(-5, 5)
+    y0 = rng.randint(-5, 5)
 
     # y - y0 = m(x - x0) → y = mx - mx0 + y0
     b = y0 - m * x0
@@ -173,14 +172,14 @@ def h2_line_slope_lv3():
 @register("concept-h2-line", difficulty=5)
 def h2_line_two_points_lv5():
     """두 점을 지나는 직선의 기울기."""
-    x1 = random.randint(-5, 5)
-    y1 = random.randint(-5, 5)
-    x2 = random.randint(-5, 5)
-    y2 = random.randint(-5, 5)
+    x1 = rng.randint(-5, 5)
+    y1 = rng.randint(-5, 5)
+    x2 = rng.randint(-5, 5)
+    y2 = rng.randint(-5, 5)
 
     # Ensure different x-coordinates
     while x1 == x2:
-        x2 = random.randint(-5, 5)
+        x2 = rng.randint(-5, 5)
 
     # m = (y2 - y1) / (x2 - x1)
     dy = y2 - y1
@@ -218,14 +217,14 @@ def h2_line_two_points_lv5():
 @register("concept-h2-line", difficulty=7)
 def h2_line_parallel_lv7():
     """평행한 두 직선 (기울기 같음)."""
-    m = random.randint(-5, 5)
+    m = rng.randint(-5, 5)
     while m == 0:
-        m = random.randint(-5, 5)
+        m = rng.randint(-5, 5)
 
-    b1 = random.randint(-8, 8)
-    b2 = random.randint(-8, 8)
+    b1 = rng.randint(-8, 8)
+    b2 = rng.randint(-8, 8)
     while b1 == b2:
-        b2 = random.randint(-8, 8)
+        b2 = rng.randint(-8, 8)
 
     def fmt_line(slope, intercept):
         if slope == 1:
@@ -245,7 +244,7 @@ def h2_line_parallel_lv7():
     line1 = fmt_line(m, b1)
 
     # Ask for parallel line through a specific point
-    x0 = random.randint(-5, 5)
+    x0 = rng.randint(-5, 5)
     y0 = m * x0 + b2  # This ensures the new line passes through (x0, y0) with slope m
 
     answer_str = fmt_line(m, b2)
@@ -270,11 +269,11 @@ def h2_line_parallel_lv7():
 def h2_line_perpendicular_lv8():
     """수직인 두 직선 (기울기의 곱이 -1)."""
     # Pick m1 such that m2 = -1/m1 is also simple
-    m1_num = random.randint(-4, 4)
+    m1_num = rng.randint(-4, 4)
     while m1_num == 0:
-        m1_num = random.randint(-4, 4)
+        m1_num = rng.randint(-4, 4)
 
-    m1_den = random.randint(1, 3)
+    m1_den = rng.randint(1, 3)
 
     # m2 = -m1_den / m1_num
     m2_num = -m1_den
@@ -324,9 +323,9 @@ def h2_line_perpendicular_lv8():
 @register("concept-h2-circle", difficulty=3)
 def h2_circle_standard_lv3():
     """중심과 반지름이 주어졌을 때 원의 방정식."""
-    h = random.randint(-5, 5)
-    k = random.randint(-5, 5)
-    r = random.randint(1, 8)
+    h = rng.randint(-5, 5)
+    k = rng.randint(-5, 5)
+    r = rng.randint(1, 8)
 
     # (x-h)² + (y-k)² = r²
     def fmt_circle(cx, cy, radius):
@@ -373,9 +372,9 @@ def h2_circle_standard_lv3():
 @register("concept-h2-circle", difficulty=5)
 def h2_circle_center_lv5():
     """원의 방정식에서 중심 좌표 구하기."""
-    h = random.randint(-8, 8)
-    k = random.randint(-8, 8)
-    r = random.randint(1, 10)
+    h = rng.randint(-8, 8)
+    k = rng.randint(-8, 8)
+    r = rng.randint(1, 10)
 
     def fmt_circle(cx, cy, radius):
         parts = []
@@ -423,9 +422,9 @@ def h2_circle_center_lv5():
 @register("concept-h2-circle", difficulty=7)
 def h2_circle_radius_lv7():
     """원의 방정식에서 반지름 구하기."""
-    h = random.randint(-5, 5)
-    k = random.randint(-5, 5)
-    r = random.randint(2, 10)
+    h = rng.randint(-5, 5)
+    k = rng.randint(-5, 5)
+    r = rng.randint(2, 10)
 
     def fmt_circle(cx, cy, radius):
         parts = []
@@ -477,9 +476,9 @@ def h2_circle_expand_lv8():
     # Expand to x² + y² + Dx + Ey + F = 0
     # where D = -2h, E = -2k, F = h² + k² - r²
 
-    h = random.randint(-4, 4)
-    k = random.randint(-4, 4)
-    r = random.randint(2, 6)
+    h = rng.randint(-4, 4)
+    k = rng.randint(-4, 4)
+    r = rng.randint(2, 6)
 
     D = -2 * h
     E = -2 * k
@@ -541,13 +540,13 @@ def h2_circle_expand_lv8():
 def h2_distance_fb_lv4():
     """두 점 사이 거리 fill-in-blank."""
     triples = [(3, 4, 5), (5, 12, 13), (8, 15, 17), (6, 8, 10)]
-    dx, dy, dist = random.choice(triples)
+    dx, dy, dist = rng.choice(triples)
 
-    x1 = random.randint(-5, 5)
-    y1 = random.randint(-5, 5)
+    x1 = rng.randint(-5, 5)
+    y1 = rng.randint(-5, 5)
 
-    dx = dx * random.choice([-1, 1])
-    dy = dy * random.choice([-1, 1])
+    dx = dx * rng.choice([-1, 1])
+    dy = dy * rng.choice([-1, 1])
 
     x2 = x1 + dx
     y2 = y1 + dy
@@ -565,13 +564,13 @@ def h2_distance_fb_lv4():
 @register("concept-h2-line", difficulty=4)
 def h2_slope_fb_lv4():
     """두 점을 지나는 직선의 기울기 fill-in-blank."""
-    x1 = random.randint(-5, 5)
-    y1 = random.randint(-5, 5)
-    x2 = random.randint(-5, 5)
-    y2 = random.randint(-5, 5)
+    x1 = rng.randint(-5, 5)
+    y1 = rng.randint(-5, 5)
+    x2 = rng.randint(-5, 5)
+    y2 = rng.randint(-5, 5)
 
     while x1 == x2:
-        x2 = random.randint(-5, 5)
+        x2 = rng.randint(-5, 5)
 
     dy = y2 - y1
     dx = x2 - x1
@@ -604,9 +603,9 @@ def h2_slope_fb_lv4():
 @register("concept-h2-circle", difficulty=4)
 def h2_circle_fb_lv4():
     """원의 반지름 구하기 fill-in-blank."""
-    h = random.randint(-5, 5)
-    k = random.randint(-5, 5)
-    r = random.randint(2, 8)
+    h = rng.randint(-5, 5)
+    k = rng.randint(-5, 5)
+    r = rng.randint(2, 8)
 
     def fmt_circle(cx, cy, radius):
         parts = []
@@ -9,10 +9,9 @@
 - concept-m1-expr-03: 식의 값 (대입)
 - concept-m1-eq-02: 일차방정식 풀이
 """
-import random
 import math
 
-from . import register, build_mc, build_fb
+from . import register, build_mc, build_fb, rng
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -51,7 +50,7 @@ def _factorization_str(factors: dict[int, int]) -> str:
 def m1_prime_factor_lv3():
     """작은 수의 소인수분해."""
     candidates = [12, 18, 20, 24, 30, 36, 40, 45, 48, 50, 54, 60]
-    n = random.choice(candidates)
+    n = rng.choice(candidates)
     factors = _prime_factorize(n)
     ans = _factorization_str(factors)
 
@@ -84,7 +83,7 @@ def m1_prime_factor_lv3():
 def m1_prime_factor_lv5():
     """중간 크기의 소인수분해."""
     candidates = [72, 84, 90, 96, 100, 108, 120, 144, 150, 180]
-    n = random.choice(candidates)
+    n = rng.choice(candidates)
     factors = _prime_factorize(n)
     ans = _factorization_str(factors)
 
@@ -115,7 +114,7 @@ def m1_prime_factor_lv5():
 def m1_prime_factor_lv7():
     """큰 수의 소인수분해."""
     candidates = [200, 216, 240, 250, 288, 300, 360, 400, 432, 500]
-    n = random.choice(candidates)
+    n = rng.choice(candidates)
     factors = _prime_factorize(n)
     ans = _factorization_str(factors)
 
@@ -151,7 +150,7 @@ def m1_prime_factor_lv7():
 def m1_gcd_lv3():
     """작은 수의 최대공약수."""
     pairs = [(12, 18), (20, 30), (24, 36), (15, 25), (18, 24), (14, 21)]
-    a, b = random.choice(pairs)
+    a, b = rng.choice(pairs)
     ans = math.gcd(a, b)
 
     return build_mc(
@@ -168,7 +167,7 @@ def m1_gcd_lv3():
 def m1_lcm_lv5():
     """중간 크기의 최소공배수."""
     pairs = [(12, 18), (15, 20), (24, 36), (30, 45), (16, 24)]
-    a, b = random.choice(pairs)
+    a, b = rng.choice(pairs)
     ans = (a * b) // math.gcd(a, b)
 
     return build_mc(
@@ -185,7 +184,7 @@ def m1_lcm_lv5():
 def m1_gcd_lcm_lv7():
     """세 수의 최대공약수."""
     triples = [(12, 18, 24), (20, 30, 40), (15, 25, 35), (16, 24, 32)]
-    a, b, c = random.choice(triples)
+    a, b, c = rng.choice(triples)
     ans = math.gcd(math.gcd(a, b), c)
 
     return build_mc(
@@ -206,7 +205,7 @@ def m1_gcd_lcm_lv7():
 @register("concept-m1-int-02", difficulty=3)
 def m1_abs_lv3():
     """기본 절댓값 계산."""
-    a = random.randint(-15, -1)
+    a = rng.randint(-15, -1)
     ans = abs(a)
 
     return build_mc(
@@ -222,8 +221,8 @@ def m1_abs_lv3():
 @register("concept-m1-int-02", difficulty=5)
 def m1_abs_add_lv5():
     """절댓값의 덧셈."""
-    a = random.randint(-12, -3)
-    b = random.randint(1, 12)
+    a = rng.randint(-12, -3)
+    b = rng.randint(1, 12)
     ans = abs(a) + abs(b)
 
     return build_mc(
@@ -239,8 +238,8 @@ def m1_abs_add_lv5():
 @register("concept-m1-int-02", difficulty=7)
 def m1_abs_expr_lv7():
     """절댓값 혼합 계산."""
-    a = random.randint(-10, -2)
-    b = random.randint(2, 10)
+    a = rng.randint(-10, -2)
+    b = rng.randint(2, 10)
     ans = abs(a) - abs(b) if abs(a) > abs(b) else abs(b) - abs(a)
     sign = "-" if abs(a) > abs(b) else "+"
 
@@ -261,8 +260,8 @@ def m1_abs_expr_lv7():
 @register("concept-m1-int-03", difficulty=3)
 def m1_int_add_lv3():
     """정수 덧셈 기본."""
-    a = random.randint(-15, -5)
-    b = random.randint(3, 15)
+    a = rng.randint(-15, -5)
+    b = rng.randint(3, 15)
     ans = a + b
 
     return build_mc(
@@ -278,9 +277,9 @@ def m1_int_add_lv3():
 @register("concept-m1-int-03", difficulty=5)
 def m1_int_mixed_lv5():
     """정수 덧셈과 뺄셈 혼합."""
-    a = random.randint(-10, -2)
-    b = random.randint(5, 12)
-    c = random.randint(-8, -2)
+    a = rng.randint(-10, -2)
+    b = rng.randint(5, 12)
+    c = rng.randint(-8, -2)
     ans = a + b - c
 
     return build_mc(
@@ -296,9 +295,9 @@ def m1_int_mixed_lv5():
 @register("concept-m1-int-03", difficulty=7)
 def m1_int_mult_lv7():
     """정수의 곱셈과 거듭제곱."""
-    a = random.choice([-3, -2, 2, 3])
-    exp = random.randint(2, 3)
-    b = random.randint(2, 5)
+    a = rng.choice([-3, -2, 2, 3])
+    exp = rng.randint(2, 3)
+    b = rng.randint(2, 5)
     result = (a ** exp) * b
     ans = result
 
@@ -323,8 +322,8 @@ def m1_int_mult_lv7():
 @register("concept-m1-expr-02", difficulty=3)
 def m1_like_terms_lv3():
     """기본 동류항 정리."""
-    a = random.randint(2, 7)
-    b = random.randint(1, 5)
+    a = rng.randint(2, 7)
+    b = rng.randint(1, 5)
     ans_coef = a + b
 
     return build_mc(
@@ -340,10 +339,10 @@ def m1_like_terms_lv3():
 @register("concept-m1-expr-02", difficulty=5)
 def m1_like_terms_lv5():
     """동류항 정리와 상수항."""
-    a = random.randint(2, 6)
-    b = random.randint(-5, -1)
-    c = random.randint(1, 4)
-    d = random.randint(3, 9)
+    a = rng.randint(2, 6)
+    b = rng.randint(-5, -1)
+    c = rng.randint(1, 4)
+    d = rng.randint(3, 9)
     ans_coef = a + c
     ans_const = b + d
     ans_str = f"{ans_coef}x" + (f"+{ans_const}" if ans_const > 0 else str(ans_const))
@@ -369,10 +368,10 @@ def m1_like_terms_lv5():
 @register("concept-m1-expr-02", difficulty=7)
 def m1_like_terms_complex_lv7():
     """복잡한 동류항 정리."""
-    a = random.randint(3, 7)
-    b = random.randint(-6, -2)
-    c = random.randint(-4, -1)
-    d = random.randint(5, 10)
+    a = rng.randint(3, 7)
+    b = rng.randint(-6, -2)
+    c = rng.randint(-4, -1)
+    d = rng.randint(5, 10)
     ans_coef = a + b
     ans_const = c + d
 
@@ -405,9 +404,9 @@ def m1_like_terms_complex_lv7():
 @register("concept-m1-expr-03", difficulty=3)
 def m1_substitution_lv3():
     """일차식에 값 대입."""
-    a = random.randint(2, 7)
-    b = random.randint(1, 10)
-    x_val = random.randint(1, 5)
+    a = rng.randint(2, 7)
+    b = rng.randint(1, 10)
+    x_val = rng.randint(1, 5)
     ans = a * x_val + b
 
     return build_mc(
@@ -423,9 +422,9 @@ def m1_substitution_lv3():
 @register("concept-m1-expr-03", difficulty=5)
 def m1_substitution_lv5():
     """일차식에 음수 대입."""
-    a = random.randint(2, 6)
-    b = random.randint(-8, -2)
-    x_val = random.randint(-5, -1)
+    a = rng.randint(2, 6)
+    b = rng.randint(-8, -2)
+    x_val = rng.randint(-5, -1)
     ans = a * x_val + b
 
     b_str = str(b) if b < 0 else f"+{b}"
@@ -443,10 +442,10 @@ def m1_substitution_lv5():
 @register("concept-m1-expr-03", difficulty=7)
 def m1_substitution_complex_lv7():
     """이차식에 값 대입."""
-    a = random.randint(1, 3)
-    b = random.randint(-5, -1)
-    c = random.randint(2, 8)
-    x_val = random.randint(2, 4)
+    a = rng.randint(1, 3)
+    b = rng.randint(-5, -1)
+    c = rng.randint(2, 8)
+    x_val = rng.randint(2, 4)
     ans = a * (x_val ** 2) + b * x_val + c
 
     b_str = str(b) + "x" if b < 0 else f"+{b}x"
@@ -469,8 +468,8 @@ def m1_substitution_complex_lv7():
 @register("concept-m1-eq-02", difficulty=3)
 def m1_linear_eq_lv3():
     """기본 일차방정식 (x + a = b 형태)."""
-    ans = random.randint(1, 15)
-    a = random.randint(3, 12)
+    ans = rng.randint(1, 15)
+    a = rng.randint(3, 12)
     b = ans + a
 
     return build_mc(
@@ -486,9 +485,9 @@ def m1_linear_eq_lv3():
 @register("concept-m1-eq-02", difficulty=5)
 def m1_linear_eq_lv5():
     """일차방정식 (ax + b = c 형태)."""
-    ans = random.randint(2, 10)
-    a = random.randint(2, 6)
-    b = random.randint(1, 8)
+    ans = rng.randint(2, 10)
+    a = rng.randint(2, 6)
+    b = rng.randint(1, 8)
     c = a * ans + b
 
     return build_mc(
@@ -504,10 +503,10 @@ def m1_linear_eq_lv5():
 @register("concept-m1-eq-02", difficulty=7)
 def m1_linear_eq_complex_lv7():
     """복잡한 일차방정식 (ax + b = cx + d 형태)."""
-    ans = random.randint(2, 12)
-    a = random.randint(3, 7)
-    c = random.randint(1, a - 1)
-    b = random.randint(1, 10)
+    ans = rng.randint(2, 12)
+    a = rng.randint(3, 7)
+    c = rng.randint(1, a - 1)
+    b = rng.randint(1, 10)
     d = (a - c) * ans + b
 
     return build_mc(
@@ -526,9 +525,9 @@ def m1_linear_eq_complex_lv7():
 
 @register("concept-m1-int-03", difficulty=4)
 def m1_int_fb_lv4():
-    a = random.randint(-8, -2)
-    b = random.randint(5, 12)
-    c = random.randint(-6, -1)
+    a = rng.randint(-8, -2)
+    b = rng.randint(5, 12)
+    c = rng.randint(-6, -1)
     ans = a + b - c
 
     return build_fb(
@@ -543,7 +542,7 @@ def m1_int_fb_lv4():
 @register("concept-m1-prime-03", difficulty=4)
 def m1_gcd_fb_lv4():
     pairs = [(24, 36), (30, 45), (18, 27), (20, 35)]
-    a, b = random.choice(pairs)
+    a, b = rng.choice(pairs)
     ans = math.gcd(a, b)
 
     return build_fb(
@@ -557,9 +556,9 @@ def m1_gcd_fb_lv4():
 
 @register("concept-m1-eq-02", difficulty=4)
 def m1_linear_eq_fb_lv4():
-    ans = random.randint(3, 12)
-    a = random.randint(2, 5)
-    b = random.randint(2, 9)
+    ans = rng.randint(3, 12)
+    a = rng.randint(2, 5)
+    b = rng.randint(2, 9)
     c = a * ans + b
 
     return build_fb(
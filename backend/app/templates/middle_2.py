@@ -6,9 +6,8 @@
 - concept-m2-ineq-02: 복잡한 일차부등식
 - concept-m2-simul-01: 연립방정식
 """
-import random
 
-from . import register, build_mc, build_fb, sup
+from . import register, build_mc, build_fb, sup, rng
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -18,9 +17,9 @@ from . import register, build_mc, build_fb, sup
 @register("concept-m2-expr-01", difficulty=3)
 def m2_exponent_mult_lv3():
     """거듭제곱의 곱셈 (aᵐ × aⁿ = aᵐ⁺ⁿ)."""
-    var = random.choice(["a", "x", "y"])
-    m = random.randint(2, 5)
-    n = random.randint(2, 4)
+    var = rng.choice(["a", "x", "y"])
+    m = rng.randint(2, 5)
+    n = rng.randint(2, 4)
     ans_exp = m + n
 
     return build_mc(
@@ -41,9 +40,9 @@ def m2_exponent_mult_lv3():
 @register("concept-m2-expr-01", difficulty=5)
 def m2_exponent_power_lv5():
     """거듭제곱의 거듭제곱 ((aᵐ)ⁿ = aᵐⁿ)."""
-    var = random.choice(["a", "b", "x"])
-    m = random.randint(2, 4)
-    n = random.randint(2, 3)
+    var = rng.choice(["a", "b", "x"])
+    m = rng.randint(2, 4)
+    n = rng.randint(2, 3)
     ans_exp = m * n
 
     return build_mc(
@@ -64,9 +63,9 @@ def m2_exponent_power_lv5():
 @register("concept-m2-expr-01", difficulty=7)
 def m2_exponent_div_lv7():
     """거듭제곱의 나눗셈 (aᵐ / aⁿ = aᵐ⁻ⁿ)."""
-    var = random.choice(["a", "x", "y"])
-    m = random.randint(5, 9)
-    n = random.randint(2, m - 1)
+    var = rng.choice(["a", "x", "y"])
+    m = rng.randint(5, 9)
+    n = rng.randint(2, m - 1)
     ans_exp = m - n
 
     return build_mc(
@@ -89,7 +88,7 @@ def m2_exponent_mixed_lv8():
     """혼합 지수법칙 ((ab)ⁿ = aⁿ × bⁿ)."""
     var1 = "a"
     var2 = "b"
-    n = random.randint(2, 4)
+    n = rng.randint(2, 4)
     sn = sup(n)
 
     return build_mc(
@@ -114,8 +113,8 @@ def m2_exponent_mixed_lv8():
 @register("concept-m2-ineq-01", difficulty=3)
 def m2_ineq_basic_lv3():
     """기본 일차부등식 (x + a < b)."""
-    ans = random.randint(1, 12)
-    a = random.randint(2, 8)
+    ans = rng.randint(1, 12)
+    a = rng.randint(2, 8)
     b = ans + a
 
     return build_mc(
@@ -136,8 +135,8 @@ def m2_ineq_basic_lv3():
 @register("concept-m2-ineq-01", difficulty=5)
 def m2_ineq_negative_lv5():
     """음수로 나누기 (부등호 방향 바뀜)."""
-    ans = random.randint(1, 10)
-    a = random.randint(-5, -2)
+    ans = rng.randint(1, 10)
+    a = rng.randint(-5, -2)
     b = a * ans
 
     return build_mc(
@@ -158,9 +157,9 @@ def m2_ineq_negative_lv5():
 @register("concept-m2-ineq-01", difficulty=7)
 def m2_ineq_coefficient_lv7():
     """계수가 있는 일차부등식 (ax + b ≤ c)."""
-    ans = random.randint(3, 15)
-    a = random.randint(2, 5)
-    b = random.randint(-6, -1)
+    ans = rng.randint(3, 15)
+    a = rng.randint(2, 5)
+    b = rng.randint(-6, -1)
     c = a * ans + b
 
     b_str = str(b) if b < 0 else f"+{b}"
@@ -187,10 +186,10 @@ def m2_ineq_coefficient_lv7():
 @register("concept-m2-ineq-02", difficulty=5)
 def m2_ineq_both_sides_lv5():
     """양변에 x가 있는 부등식 (ax + b > cx + d)."""
-    ans = random.randint(2, 10)
-    a = random.randint(3, 6)
-    c = random.randint(1, a - 1)
-    b = random.randint(1, 8)
+    ans = rng.randint(2, 10)
+    a = rng.randint(3, 6)
+    c = rng.randint(1, a - 1)
+    b = rng.randint(1, 8)
     d = (a - c) * ans + b
 
     return build_mc(
@@ -211,9 +210,9 @@ def m2_ineq_both_sides_lv5():
 @register("concept-m2-ineq-02", difficulty=7)
 def m2_ineq_distribute_lv7():
     """괄호가 있는 부등식 (-a(x - b) < c)."""
-    ans = random.randint(3, 12)
-    a = random.randint(2, 4)
-    b = random.randint(1, 6)
+    ans = rng.randint(3, 12)
+    a = rng.randint(2, 4)
+    b = rng.randint(1, 6)
     # -a(x - b) < c → -ax + ab < c → -ax < c - ab → x > (ab - c) / a
     c = a * b - a * ans
 
@@ -235,9 +234,9 @@ def m2_ineq_distribute_lv7():
 @register("concept-m2-ineq-02", difficulty=8)
 def m2_ineq_fraction_lv8():
     """분수 계수 부등식."""
-    ans = random.randint(4, 16)
+    ans = rng.randint(4, 16)
     # (x + a) / 2 ≥ b → x + a ≥ 2b → x ≥ 2b - a
-    a = random.randint(2, 8)
+    a = rng.randint(2, 8)
     b = (ans + a) // 2
 
     return build_mc(
@@ -262,8 +261,8 @@ def m2_ineq_fraction_lv8():
 @register("concept-m2-simul-01", difficulty=5)
 def m2_simul_basic_lv5():
     """기본 연립방정식 (x + y = a, x - y = b)."""
-    x_ans = random.randint(3, 10)
-    y_ans = random.randint(1, 8)
+    x_ans = rng.randint(3, 10)
+    y_ans = rng.randint(1, 8)
     a = x_ans + y_ans
     b = x_ans - y_ans
 
@@ -286,12 +285,12 @@ def m2_simul_basic_lv5():
 @register("concept-m2-simul-01", difficulty=7)
 def m2_simul_coefficient_lv7():
     """계수가 있는 연립방정식 (ax + by = c, dx + ey = f)."""
-    x_ans = random.randint(2, 7)
-    y_ans = random.randint(1, 6)
-    a = random.randint(2, 4)
-    b = random.randint(1, 3)
-    d = random.randint(1, 3)
-    e = random.randint(2, 4)
+    x_ans = rng.randint(2, 7)
+    y_ans = rng.randint(1, 6)
+    a = rng.randint(2, 4)
+    b = rng.randint(1, 3)
+    d = rng.randint(1, 3)
+    e = rng.randint(2, 4)
     c = a * x_ans + b * y_ans
     f = d * x_ans + e * y_ans
 
@@ -313,8 +312,8 @@ def m2_simul_coefficient_lv7():
 @register("concept-m2-simul-01", difficulty=8)
 def m2_simul_negative_lv8():
     """음수 해를 갖는 연립방정식."""
-    x_ans = random.randint(-6, -1)
-    y_ans = random.randint(3, 9)
+    x_ans = rng.randint(-6, -1)
+    y_ans = rng.randint(3, 9)
     a = 2
     b = 3
     c = a * x_ans + b * y_ans
@@ -343,9 +342,9 @@ def m2_simul_negative_lv8():
 
 @register("concept-m2-expr-01", difficulty=4)
 def m2_exponent_fb_lv4():
-    var = random.choice(["a", "x", "y"])
-    m = random.randint(3, 6)
-    n = random.randint(2, 4)
+    var = rng.choice(["a", "x", "y"])
+    m = rng.randint(3, 6)
+    n = rng.randint(2, 4)
     ans_exp = m + n
 
     return build_fb(
@@ -359,8 +358,8 @@ def m2_exponent_fb_lv4():
 
 @register("concept-m2-ineq-01", difficulty=4)
 def m2_ineq_fb_lv4():
-    ans = random.randint(2, 15)
-    a = random.randint(-4, -2)
+    ans = rng.randint(2, 15)
+    a = rng.randint(-4, -2)
     b = a * ans
 
     return build_fb(
@@ -374,8 +373,8 @@ def m2_ineq_fb_lv4():
 
 @register("concept-m2-simul-01", difficulty=6)
 def m2_simul_fb_lv6():
-    x_ans = random.randint(2, 9)
-    y_ans = random.randint(1, 7)
+    x_ans = rng.randint(2, 9)
+    y_ans = rng.randint(1, 7)
     a = x_ans + y_ans
     b = x_ans - y_ans
 
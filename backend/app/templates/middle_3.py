@@ -6,10 +6,9 @@
 - concept-m3-factor-01: 인수분해 (곱셈 공식)
 - concept-m3-factor-02: 인수분해 (일반)
 """
-import random
 import math
 
-from . import register, build_mc, build_fb
+from . import register, build_mc, build_fb, rng
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -19,7 +18,7 @@ from . import register, build_mc, build_fb
 @register("concept-m3-sqrt-01", difficulty=3)
 def m3_sqrt_basic_lv3():
     """기본 제곱근 (완전제곱수)."""
-    n = random.choice([4, 9, 16, 25, 36, 49, 64, 81, 100])
+    n = rng.choice([4, 9, 16, 25, 36, 49, 64, 81, 100])
     ans = int(math.sqrt(n))
 
     return build_mc(
@@ -40,7 +39,7 @@ def m3_sqrt_basic_lv3():
 @register("concept-m3-sqrt-01", difficulty=5)
 def m3_sqrt_two_roots_lv5():
     """제곱근의 개수."""
-    n = random.choice([9, 16, 25, 36, 49, 64])
+    n = rng.choice([9, 16, 25, 36, 49, 64])
     ans = int(math.sqrt(n))
 
     return build_mc(
@@ -61,7 +60,7 @@ def m3_sqrt_two_roots_lv5():
 @register("concept-m3-sqrt-01", difficulty=7)
 def m3_sqrt_negative_lv7():
     """음수의 절댓값과 제곱근."""
-    a = random.randint(-9, -2)
+    a = rng.randint(-9, -2)
     ans = abs(a)
 
     return build_mc(
@@ -99,8 +98,8 @@ def _simplify_sqrt(n: int) -> tuple[int, int]:
 def m3_radical_simplify_lv3():
     """제곱근 간단히 하기."""
     bases = [2, 3, 5]
-    base = random.choice(bases)
-    k = random.choice([4, 9, 16, 25])
+    base = rng.choice(bases)
+    k = rng.choice([4, 9, 16, 25])
     n = k * base
     coef = int(math.sqrt(k))
 
@@ -122,9 +121,9 @@ def m3_radical_simplify_lv3():
 @register("concept-m3-sqrt-03", difficulty=5)
 def m3_radical_mult_lv5():
     """제곱근의 곱셈."""
-    a_coef = random.randint(2, 5)
-    b_coef = random.randint(2, 5)
-    base = random.choice([2, 3, 5, 6])
+    a_coef = rng.randint(2, 5)
+    b_coef = rng.randint(2, 5)
+    base = rng.choice([2, 3, 5, 6])
     product = a_coef * b_coef
 
     return build_mc(
@@ -147,7 +146,7 @@ def m3_radical_complex_lv7():
     """복잡한 무리수 곱셈."""
     # √a × √b = √(ab), 완전제곱수가 되도록
     pairs = [(2, 8), (3, 12), (5, 20), (6, 24), (2, 18)]
-    a, b = random.choice(pairs)
+    a, b = rng.choice(pairs)
     product = a * b
     ans = int(math.sqrt(product))
 
@@ -169,9 +168,9 @@ def m3_radical_complex_lv7():
 @register("concept-m3-sqrt-03", difficulty=8)
 def m3_radical_add_lv8():
     """제곱근의 덧셈 (동류항)."""
-    base = random.choice([2, 3, 5])
-    a = random.randint(2, 5)
-    b = random.randint(1, 4)
+    base = rng.choice([2, 3, 5])
+    a = rng.randint(2, 5)
+    b = rng.randint(1, 4)
     ans_coef = a + b
 
     return build_mc(
@@ -196,7 +195,7 @@ def m3_radical_add_lv8():
 @register("concept-m3-factor-01", difficulty=3)
 def m3_expand_square_lv3():
     """완전제곱식 전개 (x+a)²."""
-    a = random.randint(2, 7)
+    a = rng.randint(2, 7)
     # (x + a)² = x² + 2ax + a²
     coef = 2 * a
     const = a ** 2
@@ -219,8 +218,8 @@ def m3_expand_square_lv3():
 @register("concept-m3-factor-01", difficulty=5)
 def m3_expand_diff_lv5():
     """곱셈 공식 (a+b)(a-b)."""
-    a = random.randint(2, 8)
-    b = random.randint(2, 6)
+    a = rng.randint(2, 8)
+    b = rng.randint(2, 6)
     # (x+a)(x-a) = x² - a²
     const = a ** 2
 
@@ -242,8 +241,8 @@ def m3_expand_diff_lv5():
 @register("concept-m3-factor-01", difficulty=7)
 def m3_expand_general_lv7():
     """일반 전개 (x+a)(x+b)."""
-    a = random.randint(2, 6)
-    b = random.randint(2, 6)
+    a = rng.randint(2, 6)
+    b = rng.randint(2, 6)
     # (x+a)(x+b) = x² + (a+b)x + ab
     coef = a + b
     const = a * b
@@ -266,8 +265,8 @@ def m3_expand_general_lv7():
 @register("concept-m3-factor-01", difficulty=8)
 def m3_expand_negative_lv8():
     """음수 포함 전개 (x+a)(x-b)."""
-    a = random.randint(3, 8)
-    b = random.randint(2, 6)
+    a = rng.randint(3, 8)
+    b = rng.randint(2, 6)
     # (x+a)(x-b) = x² + (a-b)x - ab
     coef = a - b
     const = -(a * b)
@@ -297,7 +296,7 @@ def m3_expand_negative_lv8():
 @register("concept-m3-factor-02", difficulty=3)
 def m3_factor_perfect_square_lv3():
     """완전제곱식 인수분해."""
-    a = random.randint(2, 6)
+    a = rng.randint(2, 6)
     # x² + 2ax + a² = (x + a)²
     coef = 2 * a
     const = a ** 2
@@ -320,7 +319,7 @@ def m3_factor_perfect_square_lv3():
 @register("concept-m3-factor-02", difficulty=5)
 def m3_factor_difference_lv5():
     """제곱의 차 인수분해."""
-    a = random.randint(3, 9)
+    a = rng.randint(3, 9)
     # x² - a² = (x+a)(x-a)
     const = a ** 2
 
@@ -342,8 +341,8 @@ def m3_factor_difference_lv5():
 @register("concept-m3-factor-02", difficulty=7)
 def m3_factor_general_lv7():
     """일반 인수분해 x² + (a+b)x + ab."""
-    a = random.randint(2, 6)
-    b = random.randint(2, 5)
+    a = rng.randint(2, 6)
+    b = rng.randint(2, 5)
     # x² + (a+b)x + ab = (x+a)(x+b)
     coef = a + b
     const = a * b
@@ -367,8 +366,8 @@ def m3_factor_general_lv7():
 @register("concept-m3-factor-02", difficulty=8)
 def m3_factor_negative_lv8():
     """음수 상수항 인수분해 x² + (a-b)x - ab."""
-    a = random.randint(4, 8)
-    b = random.randint(2, a - 1)
+    a = rng.randint(4, 8)
+    b = rng.randint(2, a - 1)
     # x² + (a-b)x - ab = (x+a)(x-b)
     coef = a - b
     const = -(a * b)
@@ -397,7 +396,7 @@ def m3_factor_negative_lv8():
 
 @register("concept-m3-sqrt-01", difficulty=4)
 def m3_sqrt_fb_lv4():
-    n = random.choice([16, 25, 36, 49, 64, 81, 100])
+    n = rng.choice([16, 25, 36, 49, 64, 81, 100])
     ans = int(math.sqrt(n))
 
     return build_fb(
@@ -412,8 +411,8 @@ def m3_sqrt_fb_lv4():
 @register("concept-m3-sqrt-03", difficulty=5)
 def m3_radical_fb_lv5():
     bases = [2, 3, 5]
-    base = random.choice(bases)
-    k = random.choice([4, 9, 16])
+    base = rng.choice(bases)
+    k = rng.choice([4, 9, 16])
     n = k * base
     coef = int(math.sqrt(k))
 
@@ -428,7 +427,7 @@ def m3_radical_fb_lv5():
 
 @register("concept-m3-factor-02", difficulty=6)
 def m3_factor_fb_lv6():
-    a = random.randint(2, 6)
+    a = rng.randint(2, 6)
     coef = 2 * a
     const = a ** 2
 
@@ -0,0 +1,416 @@
+"""핵심 API 흐름 쿼리 수 / 지연 시간 예산 점검.
+
+tests/api와 같은 방식(인메모리 SQLite + get_db 오버라이드 + ASGITransport)으로 앱을 띄우고,
+app/seeds의 개념/문제/테스트에 학생·응시 기록·답안 로그를 대량으로 채운 뒤
+핵심 흐름을 반복 실행해 요청별 SQL 실행 수와 지연 시간을 측정합니다.
+- 흐름: 테스트 시작 / 답안 제출 / 적응형 다음 문제 / 테스트 완료 /
+  대시보드 / 학생 통계 목록 / 개념별 통계 / 랭킹
+- 예산(scripts/query_budgets.json): 흐름별 max_statements, p95_ms
+- 예산 초과 시 종료 코드 1, 결과는 JSON 리포트로 저장 (커밋 간 추이 비교용)
+- 테스트 완료는 TESTING 환경의 즉시 실행 후처리(숙련도/단원/미션)까지 포함해 측정
+
+사용법:
+    python scripts/benchmark_query_budget.py
+    python scripts/benchmark_query_budget.py --students 5000 --output query-report.json
+    python scripts/benchmark_query_budget.py --record-budgets   # 현재 측정값으로 예산 갱신
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_DIR))
+
+# 앱 import 전에 테스트 환경 설정 (tests/conftest.py와 동일)
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key")
+os.environ["TESTING"] = "1"
+# 앱 전역 계측 미들웨어는 끄고 이 스크립트의 계측기로만 측정
+os.environ["QUERY_PROFILING"] = "false"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.core.database import Base, get_db  # noqa: E402
+from app.core.query_profiler import QueryProfiler  # noqa: E402
+from app.core.security import get_password_hash  # noqa: E402
+from app.main import app, limiter  # noqa: E402
+from app.models import AnswerLog, Class, Concept, Question, Test, TestAttempt, User  # noqa: E402
+from app.seeds import get_all_grade_seed_data  # noqa: E402
+from app.services.auth_service import AuthService  # noqa: E402
+
+DEFAULT_BUDGETS = Path(__file__).resolve().parent / "query_budgets.json"
+API = "/api/v1"
+# 측정 대상 학년 (흐름용 학생/테스트)
+FLOW_GRADE = "middle_1"
+ADAPTIVE_TEST_ID = "bench-adaptive-middle_1"
+# 예산 기록 시 지연 시간 여유 배수 / 최소 예산 (쿼리 수는 측정값 그대로)
+LATENCY_HEADROOM = 2.0
+LATENCY_FLOOR_MS = 50
+INSERT_CHUNK = 2000
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """최근접 순위 백분위수."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def _bulk_insert(db: AsyncSession, model, rows: list[dict]) -> None:
+    for i in range(0, len(rows), INSERT_CHUNK):
+        await db.execute(insert(model), rows[i:i + INSERT_CHUNK])
+
+
+async def seed(db: AsyncSession, args: argparse.Namespace) -> dict:
+    """시드 데이터 + 대량 학생/응시 기록 생성. 흐름에 쓸 사용자/테스트 반환."""
+    rng = random.Random(args.seed)
+    data = get_all_grade_seed_data()
+    now = datetime.now(timezone.utc)
+
+    await _bulk_insert(db, Concept, [
+        {
+            "id": c["id"], "name": c["name"], "grade": c["grade"],
+            "category": c["category"], "part": c["part"],
+            "description": c.get("description", ""), "parent_id": c.get("parent_id"),
+        }
+        for c in data["concepts"]
+    ])
+    await _bulk_insert(db, Question, [
+        {
+            "id": q["id"], "concept_id": q["concept_id"], "category": q["category"],
+            "part": q["part"], "question_type": q["question_type"],
+            "difficulty": q["difficulty"], "content": q["content"],
+            "options": q.get("options"), "correct_answer": q["correct_answer"],
+            "explanation": q.get("explanation", ""), "points": q.get("points", 10),
+            "blank_config": q.get("blank_config"), "is_active": True,
+        }
+        for q in data["questions"]
+    ])
+    questions = {q["id"]: q for q in data["questions"]}
+
+    tests = [
+        {
+            "id": t["id"], "title": t["title"], "description": t.get("description", ""),
+            "grade": t["grade"], "concept_ids": t["concept_ids"], "question_ids": t["question_ids"],
+            "question_count": t.get("question_count", len(t["question_ids"])),
+            "time_limit_minutes": t.get("time_limit_minutes"),
+            "is_adaptive": t.get("is_adaptive", False),
+            "adaptive_pool_config": t.get("adaptive_pool_config"),
+            "use_question_pool": t.get("use_question_pool", False),
+            "questions_per_attempt": t.get("questions_per_attempt"),
+            "shuffle_options": t.get("shuffle_options", True),
+            "is_active": t.get("is_active", True),
+        }
+        for t in data["tests"]
+    ]
+    # 시드에는 적응형 테스트가 없으므로 흐름 학년 객관식 문제로 하나 구성
+    adaptive_pool = [
+        q["id"] for q in data["questions"]
+        if q["id"].startswith("m1-") and q["question_type"] == "multiple_choice"
+    ]
+    tests.append({
+        "id": ADAPTIVE_TEST_ID, "title": "적응형 벤치마크", "description": "",
+        "grade": FLOW_GRADE, "concept_ids": sorted({questions[qid]["concept_id"] for qid in adaptive_pool}),
+        "question_ids": adaptive_pool, "question_count": 10, "time_limit_minutes": None,
+        "is_adaptive": True, "adaptive_pool_config": None, "use_question_pool": False,
+        "questions_per_attempt": None, "shuffle_options": False, "is_active": True,
+    })
+    await _bulk_insert(db, Test, tests)
+
+    # 시드 테스트 중 일부는 문제 목록에 시드에 없는 문제 ID를 포함하므로 실제 문제만 사용
+    tests_by_grade: dict[str, list[tuple[dict, list[str]]]] = {}
+    for t in tests:
+        existing = [qid for qid in t["question_ids"] if qid in questions]
+        if not t["is_adaptive"] and existing:
+            tests_by_grade.setdefault(t["grade"], []).append((t, existing))
+    grades = sorted(tests_by_grade)
+
+    hashed = get_password_hash("password123")
+    teachers = [
+        {"id": f"bench-teacher-{i}", "login_id": f"bteacher{i:03d}", "name": f"강사{i}",
+         "role": "teacher", "grade": None, "class_id": None, "hashed_password": hashed, "is_active": True}
+        for i in range(args.classes)
+    ]
+    classes = [
+        {"id": f"bench-class-{i}", "name": f"벤치반{i}", "teacher_id": f"bench-teacher-{i}"}
+        for i in range(args.classes)
+    ]
+    students = []
+    for i in range(args.students):
+        # 흐름 학생을 확보하기 위해 앞쪽 학생은 흐름 학년으로 배정
+        grade = FLOW_GRADE if i < args.repeat else grades[i % len(grades)]
+        students.append({
+            "id": f"bench-student-{i}", "login_id": f"bstudent{i:05d}", "name": f"학생{i}",
+            "role": "student", "grade": grade, "class_id": f"bench-class-{i % args.classes}",
+            "hashed_password": hashed, "is_active": True,
+            "level": rng.randint(1, 20), "total_xp": rng.randint(0, 20000),
+            "current_streak": rng.randint(0, 30), "max_streak": 30,
+            "last_activity_date": now - timedelta(days=rng.randint(0, 13)),
+        })
+    await _bulk_insert(db, User, teachers)
+    await _bulk_insert(db, Class, classes)
+    await _bulk_insert(db, User, students)
+
+    attempts, logs = [], []
+    for student in students:
+        for n in range(args.attempts_per_student):
+            test, existing = rng.choice(tests_by_grade[student["grade"]])
+            attempt_id = f"bench-attempt-{student['id']}-{n}"
+            completed_at = now - timedelta(days=rng.randint(0, 13), minutes=rng.randint(0, 600))
+            answered = existing[:args.answers_per_attempt]
+            correct = 0
+            for qid in answered:
+                is_correct = rng.random() < 0.7
+                correct += is_correct
+                q = questions[qid]
+                logs.append({
+                    "attempt_id": attempt_id, "question_id": qid,
+                    "selected_answer": q["correct_answer"] if is_correct else "?",
+                    "is_correct": is_correct, "time_spent_seconds": rng.randint(5, 120),
+                    "points_earned": 10 if is_correct else 0,
+                    "question_difficulty": q["difficulty"], "question_category": q["category"],
+                    "created_at": completed_at,
+                })
+            attempts.append({
+                "id": attempt_id, "test_id": test["id"], "student_id": student["id"],
+                "started_at": completed_at - timedelta(minutes=10), "completed_at": completed_at,
+                "score": correct * 10, "max_score": len(answered) * 10,
+                "correct_count": correct, "total_count": len(answered), "xp_earned": correct * 10,
+            })
+    await _bulk_insert(db, TestAttempt, attempts)
+    await _bulk_insert(db, AnswerLog, logs)
+    await db.commit()
+
+    return {
+        "flow_students": students[:args.repeat],
+        "flow_test": max(tests_by_grade[FLOW_GRADE], key=lambda item: len(item[1]))[0]["id"],
+        "teacher": teachers[0],
+        "volumes": {
+            "concepts": len(data["concepts"]),
+            "questions": len(data["questions"]),
+            "tests": len(tests),
+            "classes": len(classes),
+            "students": len(students),
+            "attempts": len(attempts),
+            "answer_logs": len(logs),
+        },
+    }
+
+
+class FlowRecorder:
+    """흐름별 요청 측정값 수집."""
+
+    def __init__(self, client: AsyncClient, profiler: QueryProfiler):
+        self.client = client
+        self.profiler = profiler
+        self.samples: dict[str, list[tuple[int, float]]] = {}
+
+    async def request(self, flow: str, method: str, url: str, token: str, **kwargs) -> dict:
+        headers = {"Authorization": f"Bearer {token}"}
+        with self.profiler.track() as stats:
+            started = time.perf_counter()
+            response = await self.client.request(method, f"{API}{url}", headers=headers, **kwargs)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        if response.status_code >= 400:
+            raise RuntimeError(f"{flow}: {method} {url} -> {response.status_code} {response.text[:300]}")
+        self.samples.setdefault(flow, []).append((stats.count, elapsed_ms))
+        return response.json()["data"]
+
+    def summary(self) -> dict:
+        flows = {}
+        for flow, samples in self.samples.items():
+            counts = [count for count, _ in samples]
+            latencies = [ms for _, ms in samples]
+            flows[flow] = {
+                "requests": len(samples),
+                "statements": {
+                    "min": min(counts),
+                    "max": max(counts),
+                    "avg": round(sum(counts) / len(counts), 1),
+                },
+                "latency_ms": {
+                    "p50": round(percentile(latencies, 50), 1),
+                    "p95": round(percentile(latencies, 95), 1),
+                    "max": round(max(latencies), 1),
+                },
+            }
+        return flows
+
+
+async def run_flows(recorder: FlowRecorder, ids: dict) -> None:
+    # 로그인 응답과 같은 형식의 토큰 (bcrypt 검증 비용은 측정 대상이 아님)
+    auth = AuthService()
+    teacher_token = auth.create_access_token_for_user(SimpleNamespace(**ids["teacher"]))
+
+    for student in ids["flow_students"]:
+        token = auth.create_access_token_for_user(SimpleNamespace(**student))
+
+        started = await recorder.request("start_test", "POST", f"/tests/{ids['flow_test']}/start", token)
+        attempt_id = started["attempt_id"]
+        for question in started["test"]["questions"][:3]:
+            await recorder.request(
+                "submit_answer", "POST", f"/tests/attempts/{attempt_id}/submit", token,
+                json={"question_id": question["id"], "selected_answer": "1", "time_spent_seconds": 20},
+            )
+        await recorder.request("complete_test", "POST", f"/tests/attempts/{attempt_id}/complete", token)
+
+        adaptive = await recorder.request("start_adaptive_test", "POST", f"/tests/{ADAPTIVE_TEST_ID}/start", token)
+        adaptive_id = adaptive["attempt_id"]
+        question_id = adaptive["test"]["questions"][0]["id"]
+        submitted = set()
+        for _ in range(3):
+            await recorder.request(
+                "submit_answer", "POST", f"/tests/attempts/{adaptive_id}/submit", token,
+                json={"question_id": question_id, "selected_answer": "1", "time_spent_seconds": 20},
+            )
+            submitted.add(question_id)
+            next_question = await recorder.request("next_question", "POST", f"/tests/attempts/{adaptive_id}/next", token)
+            # 다음 문제 선택은 커밋되지 않아 이미 제출한 문제가 다시 나올 수 있음
+            if not next_question.get("question") or next_question["question"]["id"] in submitted:
+                break
+            question_id = next_question["question"]["id"]
+
+        await recorder.request("ranking", "GET", "/stats/ranking", token)
+        await recorder.request("dashboard", "GET", "/stats/dashboard", teacher_token)
+        await recorder.request("students_summary", "GET", "/stats/students", teacher_token)
+        await recorder.request("concept_stats", "GET", "/stats/concepts", teacher_token)
+
+
+def check_budgets(flows: dict, budgets: dict) -> list[dict]:
+    """예산 초과 목록. 예산이 없는 흐름은 건너뛴다."""
+    violations = []
+    for flow, result in flows.items():
+        budget = budgets.get(flow)
+        if not budget:
+            continue
+        measured = {"max_statements": result["statements"]["max"], "p95_ms": result["latency_ms"]["p95"]}
+        for metric, actual in measured.items():
+            limit = budget.get(metric)
+            if limit is not None and actual > limit:
+                violations.append({"flow": flow, "metric": metric, "budget": limit, "actual": actual})
+    return violations
+
+
+def record_budgets(flows: dict) -> dict:
+    return {
+        flow: {
+            "max_statements": result["statements"]["max"],
+            "p95_ms": max(LATENCY_FLOOR_MS, math.ceil(result["latency_ms"]["p95"] * LATENCY_HEADROOM)),
+        }
+        for flow, result in sorted(flows.items())
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    started = time.perf_counter()
+    async with session_factory() as db:
+        ids = await seed(db, args)
+    seed_sec = time.perf_counter() - started
+
+    app.dependency_overrides[get_db] = override_get_db
+    limiter.enabled = False
+    profiler = QueryProfiler()
+    profiler.install(engine)
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            recorder = FlowRecorder(client, profiler)
+            await run_flows(recorder, ids)
+    finally:
+        profiler.uninstall()
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "volumes": ids["volumes"],
+        "seed_seconds": round(seed_sec, 1),
+        "flows": recorder.summary(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=2000, help="학생 수 (기본 2000)")
+    parser.add_argument("--classes", type=int, default=40, help="반(강사) 수 (기본 40)")
+    parser.add_argument("--attempts-per-student", type=int, default=5, help="학생별 완료 응시 수 (기본 5)")
+    parser.add_argument("--answers-per-attempt", type=int, default=10, help="응시별 답안 로그 수 (기본 10)")
+    parser.add_argument("--repeat", type=int, default=20, help="흐름 반복 횟수 (학생별 1회, 기본 20)")
+    parser.add_argument("--seed", type=int, default=2026, help="데이터 생성 시드")
+    parser.add_argument("--budgets", type=Path, default=DEFAULT_BUDGETS, help="예산 파일")
+    parser.add_argument("--output", type=Path, help="JSON 리포트 경로 (없으면 표준 출력)")
+    parser.add_argument("--record-budgets", action="store_true", help="현재 측정값으로 예산 파일 갱신")
+    args = parser.parse_args()
+    args.repeat = min(args.repeat, args.students)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    report = asyncio.run(run(args))
+
+    if args.record_budgets:
+        args.budgets.write_text(json.dumps(record_budgets(report["flows"]), indent=2) + "\n", encoding="utf-8")
+        print(f"[INFO] 예산 기록: {args.budgets}", file=sys.stderr)
+    budgets = json.loads(args.budgets.read_text(encoding="utf-8")) if args.budgets.exists() else {}
+    report["budgets"] = budgets
+    report["violations"] = check_budgets(report["flows"], budgets)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    print(f"{'flow':<22} {'stmts max':>9} {'p50 ms':>8} {'p95 ms':>8}", file=sys.stderr)
+    for flow, result in report["flows"].items():
+        print(
+            f"{flow:<22} {result['statements']['max']:>9} "
+            f"{result['latency_ms']['p50']:>8.1f} {result['latency_ms']['p95']:>8.1f}",
+            file=sys.stderr,
+        )
+    for v in report["violations"]:
+        print(f"[FAIL] {v['flow']} {v['metric']}: {v['actual']} > {v['budget']}", file=sys.stderr)
+    if report["violations"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""템플릿 변형 일괄 생성 벤치마크.
+
+TEMPLATE_REGISTRY의 모든 (개념, 난이도)에 대해 N개 변형을 만들어
+기존 방식(generate 반복 + exclude 재시도)과 generate_batch(비복원 추출)를 비교합니다.
+- 서로 다른 변형 수 / 중복 수 / 소요 시간
+- 변형 공간이 N보다 작은 템플릿은 generate_batch가 중복 없이 조기 종료
+
+사용법:
+    python scripts/benchmark_template_generator.py
+    python scripts/benchmark_template_generator.py --count 50 --seed 2026-10-18
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.template_generator import TemplateGenerator, variant_seed  # noqa: E402
+from app.templates import TEMPLATE_REGISTRY  # noqa: E402
+
+
+def legacy_batch(generator: TemplateGenerator, concept_id: str, count: int, difficulty: int) -> list[dict]:
+    """기존 generate_batch 동작: 한 건씩 generate (최대 50회 재시도, 실패 시 중복 반환)."""
+    exclude: set[str] = set()
+    results = []
+    for _ in range(count):
+        q = generator.generate(concept_id, difficulty, exclude)
+        if q:
+            results.append(q)
+            exclude.add(q["id"])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=30, help="(개념, 난이도)별 생성 수 (기본 30)")
+    parser.add_argument("--seed", default="benchmark", help="generate_batch 시드")
+    args = parser.parse_args()
+
+    generator = TemplateGenerator()
+    totals = {"legacy": [0, 0, 0.0], "batch": [0, 0, 0.0]}  # [distinct, duplicates, seconds]
+    short_keys = []
+
+    print(f"{'concept':<28} {'diff':>4} {'legacy uniq/dup':>16} {'ms':>8} {'batch uniq':>11} {'ms':>8}")
+    for concept_id in TEMPLATE_REGISTRY:
+        for difficulty in generator.difficulties(concept_id):
+            started = time.perf_counter()
+            legacy = legacy_batch(generator, concept_id, args.count, difficulty)
+            legacy_sec = time.perf_counter() - started
+
+            started = time.perf_counter()
+            batch = generator.generate_batch(
+                concept_id, args.count, difficulty=difficulty,
+                seed=variant_seed(args.seed, concept_id, difficulty),
+            )
+            batch_sec = time.perf_counter() - started
+
+            legacy_uniq = len({q["id"] for q in legacy})
+            batch_uniq = len({q["id"] for q in batch})
+            assert batch_uniq == len(batch), f"duplicate variant in batch: {concept_id}"
+
+            totals["legacy"][0] += legacy_uniq
+            totals["legacy"][1] += len(legacy) - legacy_uniq
+            totals["legacy"][2] += legacy_sec
+            totals["batch"][0] += batch_uniq
+            totals["batch"][2] += batch_sec
+            if batch_uniq < args.count:
+                short_keys.append((concept_id, difficulty, batch_uniq))
+
+            print(
+                f"{concept_id:<28} {difficulty:>4} "
+                f"{legacy_uniq:>9}/{len(legacy) - legacy_uniq:<6} {legacy_sec * 1000:>8.1f} "
+                f"{batch_uniq:>11} {batch_sec * 1000:>8.1f}"
+            )
+
+    print()
+    for name, (uniq, dup, sec) in totals.items():
+        print(f"[{name:>6}] distinct={uniq} duplicates={dup} time={sec * 1000:.0f}ms")
+    print(f"[INFO] 변형 공간이 {args.count}개 미만인 (개념, 난이도): {len(short_keys)}")
+    for concept_id, difficulty, uniq in short_keys:
+        print(f"  {concept_id} (난이도 {difficulty}): {uniq}개")
+
+
+if __name__ == "__main__":
+    main()
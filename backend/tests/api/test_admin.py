@@ -327,6 +327,56 @@ class TestResetStudent:
         assert "학생 데이터가 초기화되었습니다" in data["message"]
         assert data["data"]["student_id"] == "student-001"
 
+    async def test_reset_student_clears_daily_stats(self, client: AsyncClient) -> None:
+        """초기화 후 학생 학습 추이(일별 집계)에 삭제된 활동이 남지 않는다."""
+        from datetime import datetime, timezone
+
+        from app.models.test_attempt import TestAttempt
+        from tests.conftest import TestingSessionLocal
+
+        # 완료된 시도 → 일별 집계 행 생성 (ORM 이벤트)
+        async with TestingSessionLocal() as session:
+            session.add(TestAttempt(
+                test_id="test-001",
+                student_id="student-001",
+                score=20,
+                max_score=30,
+                correct_count=2,
+                total_count=3,
+                completed_at=datetime.now(timezone.utc),
+            ))
+            await session.commit()
+
+        student_login = await client.post(
+            "/api/v1/auth/login",
+            json={"login_id": "student01", "password": "password123"},
+        )
+        student_headers = {"Authorization": f"Bearer {student_login.json()['data']['access_token']}"}
+        trend = await client.get("/api/v1/stats/me/trend", headers=student_headers)
+        assert sum(day["solved"] for day in trend.json()["data"]) == 3
+
+        master_login = await client.post(
+            "/api/v1/auth/login",
+            json={"login_id": "master01", "password": "password123"},
+        )
+        await client.put(
+            "/api/v1/admin/users/teacher-001",
+            json={"role": "admin"},
+            headers={"Authorization": f"Bearer {master_login.json()['data']['access_token']}"},
+        )
+        admin_login = await client.post(
+            "/api/v1/auth/login",
+            json={"login_id": "teacher01", "password": "password123"},
+        )
+        response = await client.post(
+            "/api/v1/admin/reset-student/student-001",
+            headers={"Authorization": f"Bearer {admin_login.json()['data']['access_token']}"},
+        )
+        assert response.status_code == 200
+
+        trend = await client.get("/api/v1/stats/me/trend", headers=student_headers)
+        assert sum(day["solved"] for day in trend.json()["data"]) == 0
+
     async def test_reset_student_not_student_role(self, client: AsyncClient) -> None:
         """학생이 아닌 계정 초기화 시도."""
         # teacher를 admin으로 승격
@@ -751,3 +801,49 @@ class TestUpdateChapters:
         """인증 없이 업데이트 시도."""
         response = await client.post("/api/v1/admin/update-chapters")
         assert response.status_code == 401
+
+
+class TestRuntimeMetrics:
+    """런타임 지표 조회 테스트."""
+
+    async def test_metrics_report_queries_per_route(self, client: AsyncClient) -> None:
+        """계측 활성화 시 응답 헤더와 라우트별 쿼리 지표 제공."""
+        from app.core.query_profiler import query_profiler
+        from tests.conftest import test_engine
+
+        query_profiler.install(test_engine)
+        try:
+            login_response = await client.post(
+                "/api/v1/auth/login",
+                json={"login_id": "master01", "password": "password123"},
+                headers={"Origin": "http://localhost:5173"},
+            )
+            assert int(login_response.headers["x-db-query-count"]) > 0
+            assert "x-db-time-ms" in login_response.headers
+            exposed = login_response.headers["access-control-expose-headers"].lower()
+            assert "x-db-query-count" in exposed and "x-db-time-ms" in exposed
+            headers = {"Authorization": f"Bearer {login_response.json()['data']['access_token']}"}
+
+            response = await client.get("/api/v1/admin/metrics", headers=headers)
+        finally:
+            query_profiler.uninstall()
+            query_profiler.reset()
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["query_profiling"] is True
+        login_metrics = data["routes"]["POST /api/v1/auth/login"]
+        assert login_metrics["requests"] == 1
+        assert login_metrics["max_statements"] > 0
+        assert "password_hasher" in data
+        assert "token_cache" in data
+
+    async def test_metrics_forbidden_for_student(self, client: AsyncClient) -> None:
+        login_response = await client.post(
+            "/api/v1/auth/login",
+            json={"login_id": "student01", "password": "password123"},
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['data']['access_token']}"}
+
+        response = await client.get("/api/v1/admin/metrics", headers=headers)
+        assert response.status_code == 403
@@ -79,6 +79,21 @@ class TestTokenRefresh:
         assert "access_token" in data["data"]
         assert "refresh_token" in data["data"]
 
+    async def test_refresh_token_rotated_token_rejected(self, client: AsyncClient) -> None:
+        """갱신에 사용된 refresh token은 재사용 불가."""
+        await client.post(
+            "/api/v1/auth/login",
+            json={"login_id": "student01", "password": "password123"},
+        )
+        old_refresh_token = client.cookies.get("refresh_token")
+
+        assert (await client.post("/api/v1/auth/refresh")).status_code == 200
+
+        client.cookies.clear()
+        client.cookies.set("refresh_token", old_refresh_token, path="/api/v1/auth")
+        response = await client.post("/api/v1/auth/refresh")
+        assert response.status_code == 401
+
     async def test_refresh_token_invalid(self, client: AsyncClient) -> None:
         """유효하지 않은 refresh token."""
         response = await client.post(
@@ -121,6 +136,20 @@ class TestLogout:
         assert response.status_code == 200
         assert response.json()["data"]["message"] == "로그아웃 성공"
 
+    async def test_logout_revokes_access_token_immediately(self, client: AsyncClient) -> None:
+        """로그아웃 직후 같은 액세스 토큰은 캐시에 있어도 거부."""
+        login_response = await client.post(
+            "/api/v1/auth/login",
+            json={"login_id": "student01", "password": "password123"},
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['data']['access_token']}"}
+
+        assert (await client.get("/api/v1/auth/me", headers=headers)).status_code == 200
+        assert (await client.post("/api/v1/auth/logout", headers=headers)).status_code == 200
+
+        response = await client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == 401
+
     async def test_logout_without_auth(self, client: AsyncClient) -> None:
         """인증 없이 로그아웃 시도."""
         response = await client.post(
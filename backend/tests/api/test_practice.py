@@ -0,0 +1,109 @@
+"""빠른 연습 API 통합 테스트."""
+
+from httpx import AsyncClient
+
+from app.models.question import Question
+from app.models.test import Test
+from app.models.test_attempt import TestAttempt
+from tests.conftest import TestingSessionLocal
+
+
+async def _login_student(client: AsyncClient) -> dict:
+    login = await client.post(
+        "/api/v1/auth/login",
+        json={"login_id": "student01", "password": "password123"},
+    )
+    token = login.json()["data"]["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestStartPractice:
+    """빠른 연습 시작 테스트."""
+
+    async def test_start_practice_picks_active_question(self, client: AsyncClient) -> None:
+        """시작 난이도에 맞는 활성 문제로 적응형 시도를 만든다."""
+        headers = await _login_student(client)
+
+        response = await client.post(
+            "/api/v1/practice/start",
+            json={"grade": "middle_1", "category": "concept", "count": 5, "starting_difficulty": 6},
+            headers=headers,
+        )
+
+        assert response.status_code == 201
+        attempt_id = response.json()["data"]["attempt_id"]
+        async with TestingSessionLocal() as session:
+            attempt = await session.get(TestAttempt, attempt_id)
+            question = await session.get(Question, attempt.adaptive_question_ids[0])
+            assert question.is_active
+            assert question.category == "concept"
+            assert attempt.max_score == question.points
+
+        # 공유 풀 테스트의 기본 문항 수가 아니라 세션 문항 수를 보고
+        detail = await client.get(f"/api/v1/tests/attempts/{attempt_id}", headers=headers)
+        assert detail.status_code == 200
+        assert detail.json()["data"]["test"]["question_count"] == 5
+
+    async def test_practice_sessions_share_pool_test(self, client: AsyncClient) -> None:
+        """연습 세션은 (학년, 카테고리)별 풀 테스트를 공유하고 다른 카테고리 문제는 출제하지 않는다."""
+        async with TestingSessionLocal() as session:
+            session.add(Question(
+                id="question-calc-001",
+                concept_id="concept-001",
+                category="computation",
+                part="calc",
+                question_type="short_answer",
+                difficulty=5,
+                content="2 + 3 = ?",
+                correct_answer="5",
+                explanation="",
+                points=10,
+            ))
+            await session.commit()
+        headers = await _login_student(client)
+
+        attempt_ids = []
+        for _ in range(2):
+            response = await client.post(
+                "/api/v1/practice/start",
+                json={"grade": "middle_1", "category": "concept", "count": 5, "starting_difficulty": 5},
+                headers=headers,
+            )
+            assert response.status_code == 201
+            attempt_ids.append(response.json()["data"]["attempt_id"])
+
+        async with TestingSessionLocal() as session:
+            attempts = [await session.get(TestAttempt, aid) for aid in attempt_ids]
+            assert attempts[0].test_id == attempts[1].test_id == "practice-middle_1-concept"
+            for attempt in attempts:
+                assert attempt.adaptive_question_ids[0] != "question-calc-001"
+            test = await session.get(Test, "practice-middle_1-concept")
+            assert test.question_ids == []
+            assert test.adaptive_pool_config == {"category": "concept"}
+
+    async def test_start_practice_no_questions(self, client: AsyncClient) -> None:
+        """해당 카테고리 문제가 없으면 404, 풀 테스트도 만들지 않는다."""
+        headers = await _login_student(client)
+
+        response = await client.post(
+            "/api/v1/practice/start",
+            json={"grade": "middle_1", "category": "fill_in_blank", "count": 5},
+            headers=headers,
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"]["code"] == "NO_QUESTIONS"
+        async with TestingSessionLocal() as session:
+            assert await session.get(Test, "practice-middle_1-fill_in_blank") is None
+
+    async def test_start_practice_invalid_category(self, client: AsyncClient) -> None:
+        """지원하지 않는 카테고리는 422."""
+        headers = await _login_student(client)
+
+        response = await client.post(
+            "/api/v1/practice/start",
+            json={"grade": "middle_1", "category": "application", "count": 5},
+            headers=headers,
+        )
+
+        assert response.status_code == 422
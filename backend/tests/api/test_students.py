@@ -230,6 +230,40 @@ async def test_create_student_duplicate_login_id(client: AsyncClient):
     assert resp.status_code == 400
 
 
+@pytest.mark.asyncio
+async def test_create_students_bulk(client: AsyncClient):
+    """학생 일괄 생성: 생성 목록과 중복 아이디 실패 목록 반환, 생성된 계정으로 로그인 가능."""
+    login_resp = await client.post(
+        "/api/v1/auth/login",
+        json={"login_id": "master01", "password": "password123"}
+    )
+    token = login_resp.json()["data"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    students = [
+        {
+            "login_id": login_id,
+            "password": "newpass123",
+            "name": f"일괄 학생 {login_id}",
+            "role": "student",
+            "grade": "middle_1",
+            "class_id": "class-001",
+        }
+        for login_id in ("bulkstudent01", "student01", "bulkstudent02")
+    ]
+    resp = await client.post("/api/v1/students/bulk", headers=headers, json={"students": students})
+    assert resp.status_code == 201
+    data = resp.json()["data"]
+    assert [s["login_id"] for s in data["created"]] == ["bulkstudent01", "bulkstudent02"]
+    assert [f["login_id"] for f in data["failed"]] == ["student01"]
+
+    login_resp = await client.post(
+        "/api/v1/auth/login",
+        json={"login_id": "bulkstudent02", "password": "newpass123"}
+    )
+    assert login_resp.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_create_student_forbidden_for_student(client: AsyncClient):
     """학생은 학생 생성 불가 (403)."""
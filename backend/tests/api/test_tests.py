@@ -304,6 +304,84 @@ class TestSubmitAnswer:
         assert response.json()["detail"]["error"]["code"] == "ALREADY_SUBMITTED"
 
 
+class TestSubmitAnswersBatch:
+    """답안 일괄 제출 테스트."""
+
+    async def test_submit_batch_preserves_order_and_combo(self, client: AsyncClient) -> None:
+        """제출 순서대로 채점되고 콤보/점수가 누적된다."""
+        login_response = await client.post(
+            "/api/v1/auth/login",
+            json={"login_id": "student01", "password": "password123"},
+        )
+        access_token = login_response.json()["data"]["access_token"]
+
+        start_response = await client.post(
+            "/api/v1/tests/test-001/start",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        attempt_id = start_response.json()["data"]["attempt_id"]
+        question_ids = [q["id"] for q in start_response.json()["data"]["test"]["questions"]]
+
+        response = await client.post(
+            f"/api/v1/tests/attempts/{attempt_id}/submit-batch",
+            json={
+                "answers": [
+                    {"question_id": question_ids[0], "selected_answer": "B", "time_spent_seconds": 10},
+                    {"question_id": question_ids[1], "selected_answer": "B", "time_spent_seconds": 12},
+                ]
+            },
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["graded_count"] == 2
+        assert [item["status"] for item in data["results"]] == ["graded", "graded"]
+        assert [item["result"]["combo_count"] for item in data["results"]] == [1, 2]
+        assert data["questions_remaining"] == len(question_ids) - 2
+        assert data["current_score"] == data["results"][-1]["result"]["current_score"]
+
+    async def test_submit_batch_is_idempotent(self, client: AsyncClient) -> None:
+        """같은 버퍼를 다시 보내면 이미 제출된 문제는 건너뛴다."""
+        login_response = await client.post(
+            "/api/v1/auth/login",
+            json={"login_id": "student01", "password": "password123"},
+        )
+        access_token = login_response.json()["data"]["access_token"]
+
+        start_response = await client.post(
+            "/api/v1/tests/test-001/start",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        attempt_id = start_response.json()["data"]["attempt_id"]
+        question_id = start_response.json()["data"]["test"]["questions"][0]["id"]
+
+        payload = {
+            "answers": [
+                {"question_id": question_id, "selected_answer": "A", "time_spent_seconds": 5},
+                {"question_id": "question-없음", "selected_answer": "A", "time_spent_seconds": 5},
+            ]
+        }
+        first = await client.post(
+            f"/api/v1/tests/attempts/{attempt_id}/submit-batch",
+            json=payload,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert [item["status"] for item in first.json()["data"]["results"]] == ["graded", "not_found"]
+        assert first.json()["data"]["results"][0]["result"]["is_correct"] is False
+        remaining = first.json()["data"]["questions_remaining"]
+
+        second = await client.post(
+            f"/api/v1/tests/attempts/{attempt_id}/submit-batch",
+            json=payload,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert second.status_code == 200
+        assert second.json()["data"]["graded_count"] == 0
+        assert second.json()["data"]["results"][0]["status"] == "already_submitted"
+        assert second.json()["data"]["questions_remaining"] == remaining
+
+
 class TestCompleteTest:
     """테스트 완료 테스트."""
 
@@ -336,6 +414,37 @@ class TestCompleteTest:
         assert "xp_earned" in data["data"]
         assert "level_up" in data["data"]
 
+    async def test_post_completion_status(self, client: AsyncClient) -> None:
+        """완료 후처리 상태 조회 (테스트 환경은 즉시 실행)."""
+        login_response = await client.post(
+            "/api/v1/auth/login",
+            json={"login_id": "student01", "password": "password123"},
+        )
+        access_token = login_response.json()["data"]["access_token"]
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        start_response = await client.post("/api/v1/tests/test-001/start", headers=headers)
+        attempt_id = start_response.json()["data"]["attempt_id"]
+
+        before = await client.get(
+            f"/api/v1/tests/attempts/{attempt_id}/post-completion", headers=headers
+        )
+        assert before.json()["data"]["status"] == "pending"
+
+        complete = await client.post(
+            f"/api/v1/tests/attempts/{attempt_id}/complete", headers=headers
+        )
+        assert complete.json()["data"]["post_completion_status"] == "completed"
+        assert any(a["id"] == "first_test" for a in complete.json()["data"]["achievements_earned"])
+
+        response = await client.get(
+            f"/api/v1/tests/attempts/{attempt_id}/post-completion", headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["status"] == "completed"
+        assert "mastery" in data["steps_completed"]
+
     async def test_complete_test_already_completed(self, client: AsyncClient) -> None:
         """이미 완료된 테스트 재완료 시도."""
         login_response = await client.post(
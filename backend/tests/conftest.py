@@ -30,7 +30,16 @@ from app.models import (
     DailyTestRecord,
     Chapter,
 )
+from app.services.ai_response_cache import ai_response_cache
 from app.services.auth_service import AuthService
+from app.services.chapter_concept_index import chapter_concept_index
+from app.services.leaderboard_index import leaderboard_index
+from app.services.post_completion_queue import post_completion_queue
+from app.services.question_pool_index import question_pool_index
+from app.services.stats_service import clear_concept_stats_cache
+from app.services.template_variant_pool import template_variant_pool
+from app.services.token_cache import token_cache
+from app.services.unlock_frontier import unlock_frontier
 
 # 테스트 환경에서 Rate Limiter 비활성화
 limiter.enabled = False
@@ -48,6 +57,19 @@ TestingSessionLocal = async_sessionmaker(
 )
 
 
+def _reset_in_process_caches():
+    """프로세스 전역 인덱스/캐시 초기화 (테스트마다 DB를 새로 만들므로)."""
+    question_pool_index.clear()
+    leaderboard_index.clear()
+    chapter_concept_index.clear()
+    ai_response_cache.clear()
+    post_completion_queue.clear()
+    clear_concept_stats_cache()
+    token_cache.clear()
+    template_variant_pool.clear()
+    unlock_frontier.clear()
+
+
 async def override_get_db():
     """테스트용 DB 세션."""
     async with TestingSessionLocal() as session:
@@ -57,6 +79,7 @@ async def override_get_db():
 @pytest.fixture(scope="function")
 async def db_session():
     """각 테스트마다 새로운 DB 세션 제공."""
+    _reset_in_process_caches()
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -70,6 +93,7 @@ async def db_session():
 @pytest.fixture(scope="function")
 async def client():
     """테스트 클라이언트."""
+    _reset_in_process_caches()
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
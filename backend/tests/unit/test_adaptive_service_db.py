@@ -850,3 +850,137 @@ async def test_peek_next_difficulty_returns_none_for_non_adaptive(db_session):
 
     # Then: None 반환 (비적응형 테스트)
     assert next_difficulty is None
+
+
+@pytest.mark.asyncio
+async def test_submit_answer_records_recent_window(db_session):
+    """GradingService.submit_answer: 적응형 시도의 최근 답안 윈도우 갱신 (최대 2개, 최신순)."""
+    from app.services.grading_service import GradingService
+
+    # Given: 적응형 시도와 난이도 5, 6, 7 문제
+    student = User(
+        id="student-013",
+        login_id="student13",
+        name="학생 13",
+        role="student",
+        hashed_password="hashed",
+        is_active=True,
+        level=1,
+        total_xp=0,
+        current_streak=0,
+        max_streak=0,
+    )
+    db_session.add(student)
+
+    concept = Concept(
+        id="concept-013",
+        name="개념 13",
+        grade="middle_1",
+        category="concept",
+        part="algebra",
+    )
+    db_session.add(concept)
+
+    questions = []
+    for diff in [5, 6, 7]:
+        question = Question(
+            id=f"q-013-{diff}",
+            concept_id="concept-013",
+            category="concept",
+            part="algebra",
+            question_type="multiple_choice",
+            difficulty=diff,
+            content=f"난이도 {diff} 문제",
+            options=[],
+            correct_answer="A",
+            explanation="설명",
+            points=10,
+        )
+        db_session.add(question)
+        questions.append(question)
+
+    test = Test(
+        id="test-013",
+        title="적응형 테스트",
+        description="설명",
+        grade="middle_1",
+        concept_ids=["concept-013"],
+        question_ids=[],
+        question_count=5,
+        time_limit_minutes=10,
+        is_active=True,
+        is_adaptive=True,
+    )
+    db_session.add(test)
+
+    attempt = TestAttempt(
+        id="attempt-013",
+        test_id="test-013",
+        student_id="student-013",
+        score=0,
+        max_score=30,
+        total_count=5,
+        current_difficulty=5,
+        adaptive_question_ids=["q-013-5", "q-013-6", "q-013-7"],
+        adaptive_recent_results=[],
+        is_adaptive=True,
+    )
+    db_session.add(attempt)
+    await db_session.commit()
+
+    # When: 정답, 오답, 정답 순서로 제출
+    grading = GradingService(db_session)
+    for question, answer in zip(questions, ["A", "B", "A"]):
+        await grading.submit_answer(
+            attempt=attempt,
+            question=question,
+            selected_answer=answer,
+            time_spent_seconds=10,
+            current_combo=0,
+        )
+
+    # Then: 최근 2개만 최신순으로 유지
+    assert attempt.adaptive_recent_results == [
+        {"question_id": "q-013-7", "is_correct": True, "difficulty": 7},
+        {"question_id": "q-013-6", "is_correct": False, "difficulty": 6},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_peek_next_difficulty_uses_window_without_log_scan(db_session):
+    """peek_next_difficulty: 윈도우가 있으면 AnswerLog를 조회하지 않음."""
+    from sqlalchemy import event
+
+    # Given: 윈도우에 난이도 6 연속 오답 2회 (AnswerLog 없음)
+    attempt = TestAttempt(
+        id="attempt-014",
+        test_id="test-014",
+        student_id="student-014",
+        score=0,
+        max_score=10,
+        total_count=5,
+        current_difficulty=6,
+        adaptive_question_ids=["q-1", "q-2", "q-3"],
+        adaptive_recent_results=[
+            {"question_id": "q-2", "is_correct": False, "difficulty": 6},
+            {"question_id": "q-1", "is_correct": False, "difficulty": 6},
+        ],
+        is_adaptive=True,
+    )
+
+    statements: list[str] = []
+    sync_engine = db_session.bind.sync_engine
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", _count)
+    try:
+        service = AdaptiveService(db_session)
+        next_difficulty = await service.peek_next_difficulty(attempt)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _count)
+
+    # Then: 6 - 2 = 4, DB 조회 없음
+    assert next_difficulty == 4
+    assert statements == []
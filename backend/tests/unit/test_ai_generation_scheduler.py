@@ -0,0 +1,88 @@
+"""GenerationScheduler / TokenBucket 단위 테스트."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.ai_generation_scheduler import GenerationScheduler, TokenBucket
+
+
+def _job(delay: float, contents: list[str], log: list[str] | None = None):
+    async def _run():
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append("cancelled")
+            raise
+        return [{"content": c} for c in contents]
+    return _run
+
+
+def _unlimited() -> TokenBucket:
+    return TokenBucket(rate_per_second=1000, capacity=100)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_takes_slowest_call_not_sum():
+    """요청이 병렬 실행되어 전체 시간이 가장 느린 요청 수준이다."""
+    jobs = [_job(0.1, [f"q{i}"]) for i in range(5)]
+
+    started = time.perf_counter()
+    result = await GenerationScheduler(rate_limiter=_unlimited()).run(jobs)
+    elapsed = time.perf_counter() - started
+
+    assert sorted(q["content"] for q in result) == [f"q{i}" for i in range(5)]
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_dedupes_on_arrival_and_stops_early():
+    """도착 순서대로 중복을 거르고, 목표 수량을 채우면 남은 요청을 취소한다."""
+    seen = {"dup"}
+    log: list[str] = []
+
+    def _accept(q: dict) -> bool:
+        if q["content"] in seen:
+            return False
+        seen.add(q["content"])
+        return True
+
+    jobs = [
+        _job(0.01, ["dup", "a", "b"]),
+        _job(0.02, ["b", "c", "d"]),
+        _job(5.0, ["late"], log),
+    ]
+    result = await GenerationScheduler(rate_limiter=_unlimited()).run(
+        jobs, accept=_accept, limit=3
+    )
+
+    assert [q["content"] for q in result] == ["a", "b", "c"]
+    assert log == ["cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_failed_or_timed_out_job_is_skipped():
+    """실패하거나 시간 초과된 요청은 결과 없이 건너뛴다."""
+    async def _boom():
+        raise RuntimeError("boom")
+
+    jobs = [_boom, _job(5.0, ["slow"]), _job(0.01, ["ok"])]
+    result = await GenerationScheduler(rate_limiter=_unlimited(), timeout=0.05).run(jobs)
+
+    assert [q["content"] for q in result] == ["ok"]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    """버스트 이후에는 초당 rate개로 제한된다."""
+    bucket = TokenBucket(rate_per_second=50, capacity=2)
+
+    started = time.perf_counter()
+    for _ in range(5):
+        await bucket.acquire()
+    elapsed = time.perf_counter() - started
+
+    # 버스트 2개 + 추가 3개는 각 1/50초 간격
+    assert elapsed >= 0.05
@@ -0,0 +1,83 @@
+"""AI 응답 캐시 단위 테스트 (Gemini 호출은 가짜 클라이언트로 대체)."""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.ai_response_cache import AIResponseCache
+from app.models.question import Question
+from app.services import ai_service as ai_service_module
+from app.services.ai_response_cache import ai_response_cache, make_cache_key, normalize_answer
+from app.services.ai_service import AIService
+
+
+class _FakeGemini:
+    def __init__(self, text: str):
+        self.text = text
+        self.calls = 0
+
+    async def generate_content(self, contents, config=None, timeout=None, model=None):
+        self.calls += 1
+        return SimpleNamespace(text=self.text)
+
+
+@pytest.fixture
+def fake_gemini(monkeypatch):
+    fake = _FakeGemini('{"is_correct": true, "confidence": 0.9, "reason": "동치"}')
+    monkeypatch.setattr(ai_service_module, "get_gemini_client", lambda: fake)
+    return fake
+
+
+def test_normalized_answers_share_key():
+    assert normalize_answer(" 3 / 4 ") == normalize_answer("３/４") == "3/4"
+    assert normalize_answer("−2") == "-2"
+    key = make_cache_key("grade", "문제", "0.75", "", "3 / 4")
+    assert key == make_cache_key("grade", "문제", "0.75", "", "3/4")
+    assert key != make_cache_key("grade", "문제", "0.7", "", "3/4")
+
+
+@pytest.mark.asyncio
+async def test_repeat_answer_served_from_cache(db_session, fake_gemini):
+    """같은 오답은 메모리/DB 캐시에서 응답하고, 문제 정답이 바뀌면 무효화된다."""
+    db_session.add(Question(
+        id="q-cache", concept_id="concept-001", category="computation", part="calc",
+        question_type="fill_in_blank", difficulty=3, content="x²+5x+6을 인수분해하면?",
+        correct_answer="(x+2)(x+3)", explanation="", points=10,
+    ))
+    await db_session.commit()
+
+    service = AIService()
+    kwargs = dict(
+        question_content="x²+5x+6을 인수분해하면?", correct_answer="(x+2)(x+3)",
+        accept_formats=None, question_id="q-cache", db=db_session,
+    )
+    first = await service.grade_fill_blank(student_answer="(x+3)(x+2)", **kwargs)
+    await db_session.commit()
+    second = await service.grade_fill_blank(student_answer=" (x + 3)(x + 2) ", **kwargs)
+
+    assert first == second
+    assert fake_gemini.calls == 1
+    assert ai_response_cache.metrics()["memory_hits"] == 1
+
+    # 프로세스 재시작(메모리 캐시 비움) 후에도 DB 캐시 적중
+    ai_response_cache.clear()
+    assert await service.grade_fill_blank(student_answer="(x+3)(x+2)", **kwargs) == first
+    assert fake_gemini.calls == 1
+    assert ai_response_cache.metrics()["db_hits"] == 1
+
+    # 허용 표기가 다르면 별도 판정
+    await service.grade_fill_blank(
+        student_answer="(x+3)(x+2)", **{**kwargs, "accept_formats": ["x²+5x+6"]}
+    )
+    assert fake_gemini.calls == 2
+
+    # 정답 수정 → 해당 문제 캐시 삭제
+    question = await db_session.get(Question, "q-cache")
+    question.correct_answer = "(x+3)(x+2)"
+    await db_session.commit()
+    remaining = await db_session.scalar(
+        select(func.count(AIResponseCache.id)).where(AIResponseCache.question_id == "q-cache")
+    )
+    assert remaining == 0
+    assert ai_response_cache.metrics()["entries"] == 0
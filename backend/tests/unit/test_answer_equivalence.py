@@ -0,0 +1,87 @@
+"""답안 동치 판정 단위 테스트."""
+
+import pytest
+
+from app.services.ai_service import AIService
+from app.services.answer_equivalence import answers_equivalent, compare_answers
+
+
+@pytest.mark.parametrize("student, correct", [
+    ("0.75", "3/4"),
+    ("6/8", "3/4"),
+    ("-3.0", "-3"),
+    ("−2", "-2"),
+    ("5 cm", "5cm"),
+    ("5", "5cm"),
+    ("5", "5cm²"),
+    ("5 cm^2", "5cm²"),
+    ("12", "12m²"),
+    ("3.5", "3.5km²"),
+    ("27", "27cm³"),
+    ("8 m³", "8m^3"),
+    ("2 1/3", "2(1/3)"),
+    ("7/3", "2(1/3)"),
+    ("√12", "2√3"),
+    ("3^2*2^3", "2³×3²"),
+    ("2×2×2×3×3", "2³×3²"),
+    ("5x+6+x^2", "x²+5x+6"),
+    ("-3b+5a", "5a-3b"),
+    ("-3, -2", "-3,-2"),
+    ("3, -2", "-2, 3"),
+    ("0.5, 3", "3, 1/2"),
+    ("(1, -2)", "(1,-2)"),
+])
+def test_equivalent_notations(student, correct):
+    assert compare_answers(student, correct) is True
+
+
+@pytest.mark.parametrize("student, correct", [
+    ("2", "2m"),
+    ("1.5m", "1.5"),
+])
+def test_missing_unit_is_accepted(student, correct):
+    """단위는 한쪽에만 있어도 생략으로 보고 값만 비교한다."""
+    assert compare_answers(student, correct) is True
+
+
+@pytest.mark.parametrize("student, correct", [
+    ("0.7", "3/4"),
+    ("6cm²", "5cm²"),
+    ("x²+5x+7", "x²+5x+6"),
+    ("B", "A"),
+])
+def test_same_form_different_value(student, correct):
+    assert compare_answers(student, correct) is False
+
+
+@pytest.mark.parametrize("student, correct", [
+    ("72", "2³×3²"),             # 소인수분해 문제에 값만 입력
+    ("(x+2)(x+3)", "x²+5x+6"),   # 괄호 식은 해석하지 않음
+    ("2a+3a", "5a"),             # 동류항 미정리
+    ("50mm", "5cm"),             # 단위 환산 안 함
+    ("5cm", "5cm²"),             # 길이와 넓이 단위
+    ("-2,-4", "-3,-2"),          # 목록은 불일치도 호출자가 판정
+    ("-2", "-3,-2"),             # 해의 일부만 입력
+    ("(-2, 1)", "(1, -2)"),      # 좌표 순서가 다름
+    ("소수", "서로소"),
+])
+def test_undecidable_is_left_to_caller(student, correct):
+    assert compare_answers(student, correct) is None
+    assert answers_equivalent(student, correct) is False
+
+
+@pytest.mark.asyncio
+async def test_grade_fill_blank_decides_locally_without_ai():
+    """로컬에서 판정 가능한 답은 AI 클라이언트 없이 결과를 돌려준다."""
+    service = AIService()
+
+    equal = await service.grade_fill_blank("3/4를 소수로?", "0.75", "3/4", None)
+    assert equal == {"is_correct": True, "confidence": 1.0, "reason": "수학적으로 동치"}
+
+    # 값이 달라 보여도 로컬에서 오답 확정하지 않음 (대소문자/근삿값 등은 AI가 판단) → AI 미설정 시 None
+    assert await service.grade_fill_blank("3/4를 소수로?", "0.75", "0.7", None) is None
+    assert await service.grade_fill_blank("1/3을 소수로?", "1/3", "0.333", None) is None
+    assert await service.grade_fill_blank("문자식", "2x", "2X", None) is None
+
+    # 판정 불가 + AI 미설정 → None
+    assert await service.grade_fill_blank("소인수분해", "2³×3²", "72", None) is None
@@ -0,0 +1,113 @@
+"""ChapterConceptIndex 단위 테스트."""
+
+import pytest
+from sqlalchemy import event
+
+from app.models.chapter import Chapter
+from app.models.concept import Concept
+from app.services.chapter_concept_index import ChapterConceptIndex, chapter_concept_index
+from app.services.mastery_service import MasteryService
+
+
+def _chapter(cid: str, concept_ids: list[str], number: int = 1, is_active: bool = True) -> Chapter:
+    return Chapter(
+        id=cid, name=f"단원 {cid}", grade="middle_1", semester=1,
+        chapter_number=number, concept_ids=concept_ids, is_active=is_active,
+    )
+
+
+class TestChapterConceptIndexPure:
+    """DB 없이 역인덱스 동작 확인."""
+
+    def _loaded(self) -> ChapterConceptIndex:
+        index = ChapterConceptIndex()
+        index._loaded_at = float("inf")  # 로드된 것으로 간주
+        return index
+
+    def test_reverse_lookup_with_filters(self):
+        index = self._loaded()
+        index.on_chapter_changed("ch1", "middle_1", True, ["c1", "c2"])
+        index.on_chapter_changed("ch2", "middle_2", True, ["c2", "c3"])
+        index.on_chapter_changed("ch3", "middle_1", False, ["c3"])
+
+        assert [c.chapter_id for c in index.chapters_for_concept("c2")] == ["ch1", "ch2"]
+        assert [c.chapter_id for c in index.chapters_for_concept("c2", grade="middle_2")] == ["ch2"]
+        assert [
+            c.chapter_id for c in index.chapters_for_concepts(["c1", "c3"], active_only=True)
+        ] == ["ch1", "ch2"]
+        assert index.chapters_for_concept("unknown") == []
+
+    def test_edit_moves_concepts(self):
+        index = self._loaded()
+        index.on_chapter_changed("ch1", "middle_1", True, ["c1", "c2"])
+
+        index.on_chapter_changed("ch1", "middle_1", True, ["c2", "c3"])
+        assert index.chapters_for_concept("c1") == []
+        assert index.get("ch1").concept_ids == ("c2", "c3")
+
+        index.discard("ch1")
+        assert index.chapters_for_concept("c2") == []
+        assert index.get("ch1") is None
+
+    def test_changes_ignored_until_loaded(self):
+        index = ChapterConceptIndex()
+        index.on_chapter_changed("ch1", "middle_1", True, ["c1"])
+        assert index.get("ch1") is None
+
+
+@pytest.mark.asyncio
+async def test_index_loads_once_and_tracks_chapter_edits(db_session):
+    """단원 로드는 한 번만 일어나고, 이후 concept_ids 편집은 ORM 이벤트로 반영된다."""
+    for i in range(1, 4):
+        db_session.add(Concept(
+            id=f"concept-{i}", name=f"개념 {i}", grade="middle_1",
+            category="concept", part="calc",
+        ))
+    db_session.add(_chapter("chapter-a", ["concept-1", "concept-2"]))
+    await db_session.commit()
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, *args):
+        if "FROM chapters" in statement:
+            statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        service = MasteryService(db_session)
+        assert await service.unlock_next_concept_in_chapter("student-1", "concept-1") == "concept-2"
+        await db_session.commit()
+        assert await service.unlock_next_concept_in_chapter("student-1", "concept-2") is None
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    # 단원 조회는 인덱스 로드 1회뿐
+    assert len(statements) == 1
+
+    # 단원 편집 → 인덱스 즉시 반영
+    chapter = await db_session.get(Chapter, "chapter-a")
+    chapter.concept_ids = ["concept-1", "concept-2", "concept-3"]
+    await db_session.commit()
+    assert chapter_concept_index.get("chapter-a").concept_ids == (
+        "concept-1", "concept-2", "concept-3",
+    )
+    assert await service.unlock_next_concept_in_chapter("student-1", "concept-2") == "concept-3"
+
+
+@pytest.mark.asyncio
+async def test_index_ignores_rolled_back_chapter_edits(db_session):
+    """롤백된 단원 편집/추가는 인덱스에 반영되지 않는다."""
+    db_session.add(_chapter("chapter-a", ["concept-1"]))
+    await db_session.commit()
+    await chapter_concept_index.ensure_loaded(db_session)
+
+    chapter = await db_session.get(Chapter, "chapter-a")
+    chapter.concept_ids = ["concept-1", "concept-2"]
+    db_session.add(_chapter("chapter-b", ["concept-2"], number=2))
+    await db_session.flush()
+    await db_session.rollback()
+
+    assert chapter_concept_index.get("chapter-a").concept_ids == ("concept-1",)
+    assert chapter_concept_index.get("chapter-b") is None
+    assert chapter_concept_index.chapters_for_concept("concept-2") == []
@@ -0,0 +1,84 @@
+"""commit_hooks 단위 테스트."""
+
+import pytest
+
+from app.core import commit_hooks
+from app.models.user import User
+from app.services.leaderboard_index import leaderboard_index
+
+KEY = "test_commit_hooks"
+
+
+@pytest.fixture
+def applied():
+    calls: list[dict] = []
+    commit_hooks.register(KEY, calls.append)
+    return calls
+
+
+def _student(uid: str, xp: int) -> User:
+    return User(
+        id=uid, login_id=uid, name=uid, role="student",
+        grade="middle_1", hashed_password="x", is_active=True,
+        level=1, total_xp=xp, current_streak=0, max_streak=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_staged_changes_apply_once_on_commit(db_session, applied):
+    """같은 식별자의 변경은 마지막 값만 커밋 후 한 번 반영된다."""
+    await db_session.begin()
+    commit_hooks.stage(db_session.sync_session, KEY, "a", 1)
+    commit_hooks.stage(db_session.sync_session, KEY, "a", 2)
+    assert applied == []
+
+    await db_session.commit()
+    assert applied == [{"a": 2}]
+    assert not db_session.sync_session.info.get(commit_hooks._STAGED_KEY)
+
+
+@pytest.mark.asyncio
+async def test_savepoint_changes_follow_outer_transaction(db_session, applied):
+    """세이브포인트 롤백분은 버리고, RELEASE된 변경은 바깥 커밋 때 반영한다."""
+    await db_session.begin()
+    commit_hooks.stage(db_session.sync_session, KEY, "outer", 1)
+
+    nested = await db_session.begin_nested()
+    commit_hooks.stage(db_session.sync_session, KEY, "rolled_back", 1)
+    await nested.rollback()
+
+    async with db_session.begin_nested():
+        commit_hooks.stage(db_session.sync_session, KEY, "released", 1)
+    assert applied == []
+
+    await db_session.commit()
+    assert applied == [{"outer": 1, "released": 1}]
+
+
+@pytest.mark.asyncio
+async def test_released_savepoint_discarded_with_outer_rollback(db_session, applied):
+    """RELEASE된 세이브포인트 변경도 바깥 트랜잭션이 롤백되면 버린다."""
+    await db_session.begin()
+    async with db_session.begin_nested():
+        commit_hooks.stage(db_session.sync_session, KEY, "released", 1)
+    await db_session.rollback()
+
+    assert applied == []
+    assert not db_session.sync_session.info.get(commit_hooks._STAGED_KEY)
+
+
+@pytest.mark.asyncio
+async def test_index_ignores_changes_in_rolled_back_savepoint(db_session):
+    """세이브포인트 안에서 flush된 XP 변경은 롤백되면 인덱스에 남지 않는다."""
+    db_session.add(_student("s1", 100))
+    await db_session.commit()
+    await leaderboard_index.ensure_loaded(db_session)
+
+    user = await db_session.get(User, "s1")
+    nested = await db_session.begin_nested()
+    user.total_xp = 999
+    await db_session.flush()
+    await nested.rollback()
+    await db_session.commit()
+
+    assert leaderboard_index.get("s1").total_xp == 100
@@ -1293,3 +1293,43 @@ async def test_build_category_filter_for_fill_in_blank(db_session):
     assert len(result_ids) == 1
     assert "q-fb-1" in result_ids
     assert "q-mc-1" not in result_ids
+
+
+@pytest.mark.asyncio
+async def test_get_category_candidates_matches_category_filter(db_session):
+    """문제 풀 인덱스 기반 후보가 _build_category_filter와 같은 조건을 따른다."""
+    # Given: 정상 빈칸, 부적절 패턴 빈칸, 객관식 문제
+    db_session.add(Concept(
+        id="concept-fb-002",
+        name="빈칸 개념",
+        grade="middle_1",
+        category=QuestionCategory.CONCEPT,
+        part=ProblemPart.CALC,
+    ))
+    for qid, question_type, content in [
+        ("q-fb-ok", QuestionType.FILL_IN_BLANK, "빈칸을 채우세요: 2 + 2 = __"),
+        ("q-fb-bad", QuestionType.FILL_IN_BLANK, "옳은 것을 고르시오: __"),
+        ("q-mc-2", QuestionType.MULTIPLE_CHOICE, "2 + 2 는?"),
+    ]:
+        db_session.add(Question(
+            id=qid,
+            concept_id="concept-fb-002",
+            category=QuestionCategory.CONCEPT,
+            part=ProblemPart.CALC,
+            question_type=question_type,
+            difficulty=5,
+            content=content,
+            correct_answer="4",
+            explanation="설명",
+            is_active=True,
+        ))
+    await db_session.commit()
+
+    # When: 카테고리별 후보 조회
+    service = DailyTestService(db_session)
+    fill_in_blank = await service._get_category_candidates(["concept-fb-002"], "fill_in_blank")
+    concept = await service._get_category_candidates(["concept-fb-002"], "concept")
+
+    # Then: 빈칸은 부적절 패턴 제외, 개념은 빈칸 유형 제외
+    assert [q.id for q in fill_in_blank] == ["q-fb-ok"]
+    assert [q.id for q in concept] == ["q-mc-2"]
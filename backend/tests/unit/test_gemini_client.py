@@ -0,0 +1,72 @@
+"""GeminiClient 단위 테스트 (SDK 비동기 API를 가짜 객체로 대체)."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.gemini_client import GeminiClient
+
+
+class _FakeModels:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.cancelled = 0
+
+    async def generate_content(self, model, contents, config=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return SimpleNamespace(text=f"ok:{contents}")
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+
+
+def _client(delay: float, **kwargs) -> tuple[GeminiClient, _FakeModels]:
+    models = _FakeModels(delay)
+    fake_sdk = SimpleNamespace(aio=SimpleNamespace(models=models))
+    return GeminiClient(fake_sdk, **kwargs), models
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    """동시 호출 수가 max_concurrency를 넘지 않는다."""
+    client, models = _client(0.02, max_concurrency=2, timeout_seconds=5)
+
+    responses = await asyncio.gather(*(client.generate_content(f"p{i}") for i in range(6)))
+
+    assert [r.text for r in responses] == [f"ok:p{i}" for i in range(6)]
+    assert models.peak == 2
+    metrics = client.metrics()
+    assert metrics["calls"] == 6
+    assert metrics["succeeded"] == 6
+    assert metrics["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_call_without_blocking_loop():
+    """마감 시간 초과 시 진행 중인 요청이 취소되고, 그동안 이벤트 루프는 멈추지 않는다."""
+    client, models = _client(5.0, timeout_seconds=5)
+    ticks = 0
+
+    async def _ticker():
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.gather(client.generate_content("slow", timeout=0.05), _ticker())
+
+    assert ticks == 5
+    assert models.cancelled == 1
+    assert models.active == 0
+    metrics = client.metrics()
+    assert metrics["timed_out"] == 1
+    assert metrics["succeeded"] == 0
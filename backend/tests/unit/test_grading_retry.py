@@ -224,3 +224,61 @@ def test_get_hint_for_retry():
     hint3 = service.get_hint_for_retry(question, 3)
     assert hint3["level"] == 3
     assert hint3["type"] == "extended"
+
+
+@pytest.mark.asyncio
+async def test_submit_answers_batch_applies_retry_queue(db_session):
+    """submit_answers_batch가 일일 테스트 재도전 큐를 순서대로 갱신하고 한 번만 커밋한다."""
+    # Given
+    db_session.add(User(
+        id="student-retry-4",
+        login_id="student_retry_4",
+        name="재도전 학생 4",
+        role="student",
+        hashed_password="hashed"
+    ))
+    for qid in ("q-batch-1", "q-batch-2"):
+        db_session.add(Question(
+            id=qid,
+            concept_id="c-001",
+            category=QuestionCategory.CONCEPT,
+            part=ProblemPart.CALC,
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            difficulty=1,
+            content="문제",
+            correct_answer="A",
+            points=10
+        ))
+    attempt = TestAttempt(
+        id="attempt-retry-4",
+        test_id="daily-test-4",
+        student_id="student-retry-4",
+        score=0,
+        max_score=20,
+        total_count=2,
+        retry_queue=[],
+        retry_counts={},
+        current_question_index=0
+    )
+    db_session.add(attempt)
+    await db_session.commit()
+
+    # When
+    service = GradingService(db_session)
+    outcomes = await service.submit_answers_batch(
+        attempt=attempt,
+        answers=[
+            {"question_id": "q-batch-1", "selected_answer": "B", "time_spent_seconds": 5},
+            {"question_id": "q-batch-2", "selected_answer": "A", "time_spent_seconds": 5},
+            {"question_id": "q-batch-1", "selected_answer": "A", "time_spent_seconds": 5},
+        ],
+        is_daily_test=True,
+    )
+
+    # Then
+    assert [o["status"] for o in outcomes] == ["graded", "graded", "already_submitted"]
+    assert outcomes[0]["result"]["retry_scheduled"] is True
+    assert outcomes[1]["result"]["combo_count"] == 1
+    assert outcomes[1]["result"]["questions_remaining"] == 0
+    assert attempt.retry_queue == ["q-batch-1"]
+    assert attempt.correct_count == 1
@@ -59,6 +59,43 @@ class TestGradeAnswer:
         assert result["is_correct"] is True
         assert result["points_earned"] == 10
 
+    @pytest.mark.parametrize("selected, correct", [
+        ("0.75", "3/4"),
+        ("2 1/3", "2(1/3)"),
+        ("5 cm", "5"),
+        ("2^3*3^2", "2³×3²"),
+    ])
+    def test_equivalent_notation_is_correct(self, grading_service, selected, correct):
+        """Mathematically equivalent notations are graded correct locally."""
+        result = grading_service.grade_answer(
+            question_id=1,
+            selected_answer=selected,
+            correct_answer=correct,
+            points=10
+        )
+        assert result["is_correct"] is True
+
+    def test_different_form_is_not_equivalent(self, grading_service):
+        """A value in a different form (72 for a factorization) stays wrong."""
+        result = grading_service.grade_answer(
+            question_id=1,
+            selected_answer="72",
+            correct_answer="2³×3²",
+            points=10
+        )
+        assert result["is_correct"] is False
+
+    def test_multiple_choice_skips_equivalence(self, grading_service):
+        """Multiple-choice answers compare only the option label."""
+        result = grading_service.grade_answer(
+            question_id=1,
+            selected_answer="0.75",
+            correct_answer="3/4",
+            points=10,
+            question_type="multiple_choice",
+        )
+        assert result["is_correct"] is False
+
     def test_dict_correct_answer_routes_to_fill_in_blank(self, grading_service):
         """Dict correct_answer routes to fill-in-blank grading."""
         result = grading_service.grade_answer(
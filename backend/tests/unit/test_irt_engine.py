@@ -0,0 +1,134 @@
+"""IRTEngine 단위 테스트."""
+
+import pytest
+
+from app.models.concept import Concept
+from app.models.question import Question
+from app.models.test import Test
+from app.models.test_attempt import TestAttempt
+from app.services.adaptive_service import AdaptiveService
+from app.services.irt_engine import IRTEngine, theta_to_difficulty
+
+
+class TestIRTEngine:
+    """능력 추정 순수 로직."""
+
+    @pytest.fixture
+    def engine(self):
+        return IRTEngine({"engine": "irt", "se_threshold": 0.7, "min_questions": 3})
+
+    def test_is_enabled(self):
+        assert IRTEngine.is_enabled({"engine": "irt"})
+        assert not IRTEngine.is_enabled({"engine": "step"})
+        assert not IRTEngine.is_enabled(None)
+
+    def test_initial_state_centered_on_initial_difficulty(self, engine):
+        state = engine.initial_state(6)
+        assert theta_to_difficulty(state["theta"]) == 6
+        assert state["answered"] == 0
+        assert state["se"] == pytest.approx(1.0, abs=0.05)
+
+    def test_correct_answer_raises_theta(self, engine):
+        state = engine.initial_state(5)
+        after = engine.update(state, 5, True)
+        assert after["theta"] > state["theta"]
+        assert after["se"] < state["se"]
+        assert after["answered"] == 1
+
+    def test_wrong_answer_lowers_theta(self, engine):
+        state = engine.initial_state(5)
+        after = engine.update(state, 5, False)
+        assert after["theta"] < state["theta"]
+
+    def test_flip_to_correct_matches_direct_correct(self, engine):
+        state = engine.initial_state(5)
+        flipped = engine.flip_to_correct(engine.update(state, 7, False), 7)
+        direct = engine.update(state, 7, True)
+        assert flipped["theta"] == pytest.approx(direct["theta"], abs=1e-3)
+        assert flipped["answered"] == direct["answered"]
+
+    def test_best_difficulty_maximizes_information(self, engine):
+        state = engine.initial_state(8)
+        assert engine.best_difficulty(state, [2, 5, 8, 10]) == 8
+        assert engine.best_difficulty(state, [2, 5]) == 5
+        assert engine.best_difficulty(state, []) is None
+
+    def test_should_stop_after_precise_estimate(self, engine):
+        state = engine.initial_state(5)
+        assert not engine.should_stop(state)
+        for diff, correct in [(5, True), (6, True), (7, False), (6, True), (6, False), (6, True)]:
+            state = engine.update(state, diff, correct)
+        assert state["se"] <= 0.7
+        assert engine.should_stop(state)
+
+
+@pytest.mark.asyncio
+async def test_select_next_question_irt_engine(db_session):
+    """IRT 엔진 테스트: 추정 능력 근처 난이도 선택, 정밀도 충족 시 조기 종료."""
+    db_session.add(Concept(
+        id="concept-irt", name="개념", grade="middle_1", category="concept", part="algebra",
+    ))
+    for diff in range(1, 11):
+        for n in range(3):
+            db_session.add(Question(
+                id=f"q-irt-{diff}-{n}",
+                concept_id="concept-irt",
+                category="concept",
+                part="algebra",
+                question_type="multiple_choice",
+                difficulty=diff,
+                content="문제",
+                options=[],
+                correct_answer="A",
+                explanation="",
+                points=10,
+            ))
+    test = Test(
+        id="test-irt",
+        title="IRT",
+        grade="middle_1",
+        concept_ids=["concept-irt"],
+        question_ids=[],
+        question_count=20,
+        is_adaptive=True,
+        adaptive_pool_config={"engine": "irt", "se_threshold": 0.7, "min_questions": 3},
+    )
+    db_session.add(test)
+    await db_session.commit()
+
+    service = AdaptiveService(db_session)
+    attempt = TestAttempt(
+        id="attempt-irt",
+        test_id="test-irt",
+        student_id="student-irt",
+        score=0,
+        max_score=10,
+        total_count=20,
+        is_adaptive=True,
+        current_difficulty=5,
+        adaptive_question_ids=["q-irt-5-0"],
+        adaptive_recent_results=[],
+        ability_state=service.initial_engine_state(test, 5),
+    )
+    attempt.test = test
+
+    # 정답 → 능력 상승 → 더 어려운 문제
+    AdaptiveService.record_result(attempt, "q-irt-5-0", True, 5)
+    question, target = await service.select_next_question(attempt)
+    assert question is not None
+    assert target > 5
+    assert question.difficulty == target
+
+    # 충분히 많은 응답 후 조기 종료
+    for diff, correct in [(6, True), (7, False), (6, True), (6, False), (6, True)]:
+        AdaptiveService.record_result(attempt, f"q-irt-{diff}-1", correct, diff)
+    assert await service.peek_next_difficulty(attempt) is None
+    question, _ = await service.select_next_question(attempt)
+    assert question is None
+
+
+def test_default_engine_has_no_ability_state():
+    """adaptive_pool_config가 없으면 기존 단계 규칙 엔진 (상태 없음)."""
+    service = AdaptiveService(db=None)
+    test = Test(id="t", title="t", grade="middle_1", concept_ids=[], question_ids=[], question_count=1)
+    assert service.initial_engine_state(test, 5) is None
@@ -0,0 +1,109 @@
+"""LeaderboardIndex / RankingService 단위 테스트."""
+
+import pytest
+
+from app.models.user import User
+from app.services.gamification_service import GamificationService
+from app.services.leaderboard_index import LeaderboardIndex, leaderboard_index
+from app.services.ranking_service import RankingService
+
+
+def _student(uid: str, xp: int, grade: str = "middle_1") -> User:
+    return User(
+        id=uid, login_id=uid, name=f"학생{uid}", role="student",
+        grade=grade, hashed_password="x", is_active=True,
+        level=1, total_xp=xp, current_streak=0, max_streak=0,
+    )
+
+
+class TestLeaderboardIndexPure:
+    """DB 없이 정렬 배열 동작 확인."""
+
+    def _loaded(self) -> LeaderboardIndex:
+        index = LeaderboardIndex()
+        index._loaded_at = float("inf")  # 로드된 것으로 간주
+        return index
+
+    def test_rank_ties_share_rank(self):
+        index = self._loaded()
+        for uid, xp in (("a", 100), ("b", 100), ("c", 50)):
+            index.on_user_changed(uid, "student", uid, 1, xp, "middle_1")
+
+        assert index.rank_for_xp(100) == 1
+        assert index.rank_for_xp(50) == 3
+        assert [e.user_id for e in index.top(2)] == ["a", "b"]
+
+    def test_xp_change_repositions_entry(self):
+        index = self._loaded()
+        index.on_user_changed("a", "student", "a", 1, 10, "middle_1")
+        index.on_user_changed("b", "student", "b", 1, 20, "middle_2")
+
+        index.on_user_changed("a", "student", "a", 1, 30, "middle_1")
+        assert [e.user_id for e in index.top(5)] == ["a", "b"]
+        assert index.rank_for_xp(20, "middle_2") == 1
+        assert index.rank_for_xp(20, "middle_1") == 2
+
+        index.on_user_changed("a", "teacher", "a", 1, 30, "middle_1")
+        assert [e.user_id for e in index.top(5)] == ["b"]
+        assert index.top(5, "middle_1") == []
+
+    def test_changes_ignored_until_loaded(self):
+        index = LeaderboardIndex()
+        index.on_user_changed("a", "student", "a", 1, 10, "middle_1")
+        assert index.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_ranking_service_reads_index_and_tracks_xp(db_session):
+    """상위 랭킹/내 순위가 인덱스에서 제공되고 XP 변경이 즉시 반영된다."""
+    for uid, xp, grade in (("s1", 300, "middle_1"), ("s2", 200, "middle_1"), ("s3", 250, "middle_2")):
+        db_session.add(_student(uid, xp, grade))
+    await db_session.commit()
+
+    service = RankingService(db_session)
+    top = await service.get_top_users(limit=10)
+    assert [item["user_id"] for item in top] == ["s1", "s3", "s2"]
+    assert (await service.get_user_rank("s2"))["rank"] == 3
+    assert (await service.get_user_rank("s2", grade="middle_1"))["rank"] == 2
+
+    # 게이미피케이션으로 XP 획득 → 인덱스 즉시 갱신
+    user = await db_session.get(User, "s2")
+    await GamificationService(db_session).update_user_gamification(
+        user=user, xp_earned=200, today="2026-10-18",
+    )
+    assert leaderboard_index.get("s2").total_xp == user.total_xp
+    assert (await service.get_user_rank("s2"))["rank"] == 1
+    assert (await service.get_top_users(limit=1))[0]["user_id"] == "s2"
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_changes_not_applied(db_session):
+    """롤백된 XP 변경·신규 학생은 인덱스에 반영되지 않는다."""
+    db_session.add(_student("s1", 100))
+    await db_session.commit()
+    await leaderboard_index.ensure_loaded(db_session)
+
+    user = await db_session.get(User, "s1")
+    user.total_xp = 999
+    db_session.add(_student("s2", 500))
+    await db_session.flush()
+    await db_session.rollback()
+
+    assert leaderboard_index.get("s1").total_xp == 100
+    assert leaderboard_index.get("s2") is None
+    assert [e.user_id for e in leaderboard_index.top(5)] == ["s1"]
+
+
+@pytest.mark.asyncio
+async def test_reconcile_reloads_from_db(db_session):
+    """재동기화 주기가 지나면 DB 기준으로 다시 로드한다."""
+    db_session.add(_student("s1", 100))
+    await db_session.commit()
+
+    await leaderboard_index.ensure_loaded(db_session)
+    leaderboard_index._entries.clear()
+    leaderboard_index._buckets.clear()  # 다른 워커에서 놓친 변경을 흉내
+
+    leaderboard_index._loaded_at -= leaderboard_index.reconcile_seconds + 1
+    await leaderboard_index.ensure_loaded(db_session)
+    assert leaderboard_index.get("s1").total_xp == 100
@@ -706,3 +706,68 @@ async def test_update_mastery_from_attempt_unlocks_next_in_chapter(db_session):
     )
     mastery = await db_session.scalar(stmt)
     assert mastery.is_mastered is True
+
+
+@pytest.mark.asyncio
+async def test_update_mastery_from_attempt_batches_concepts(db_session):
+    """여러 개념 응시 결과를 일괄 조회/저장하고, 마스터 달성 시 단원 내 다음 개념을 해금한다."""
+    from app.core.query_profiler import QueryProfiler
+
+    # Given: 개념 6개 단원, 앞 5개 개념 응시 (c1만 정답, 기존 89% → 마스터 달성)
+    db_session.add(User(
+        id="student-104", login_id="student104", name="학생 104", role="student",
+        hashed_password="hashed", is_active=True, level=1, total_xp=0,
+        current_streak=0, max_streak=0,
+    ))
+    concept_ids = [f"concept-104-{i}" for i in range(1, 7)]
+    for cid in concept_ids:
+        db_session.add(Concept(id=cid, name=cid, grade="middle_1", category="concept", part="calc"))
+    db_session.add(Chapter(
+        id="chapter-104", name="1. 단원", grade="middle_1", semester=1, chapter_number=1,
+        concept_ids=concept_ids,
+    ))
+    db_session.add(ConceptMastery(
+        student_id="student-104", concept_id="concept-104-1", is_unlocked=True,
+        total_attempts=10, correct_count=9, average_score=95.0, mastery_percentage=89,
+    ))
+    db_session.add(TestAttempt(
+        id="attempt-104", test_id="test-104", student_id="student-104",
+        score=50, max_score=50, completed_at=datetime.now(timezone.utc),
+    ))
+    for i, cid in enumerate(concept_ids[:5], start=1):
+        db_session.add(Question(
+            id=f"question-104-{i}", concept_id=cid, category="concept", part="calc",
+            question_type="multiple_choice", difficulty=6, content="문제", options=[],
+            correct_answer="A", explanation="", points=10,
+        ))
+        db_session.add(AnswerLog(
+            attempt_id="attempt-104", question_id=f"question-104-{i}", selected_answer="A",
+            is_correct=i == 1, time_spent_seconds=30, points_earned=10 if i == 1 else 0,
+        ))
+    await db_session.commit()
+
+    # When: 숙련도 업데이트 (개념 수와 무관한 쿼리 수)
+    profiler = QueryProfiler()
+    profiler.install(db_session.bind)
+    try:
+        with profiler.track() as stats:
+            result = await MasteryService(db_session).update_mastery_from_attempt(
+                "student-104", "attempt-104"
+            )
+    finally:
+        profiler.uninstall()
+
+    # Then
+    assert set(result) == set(concept_ids[:5])
+    assert stats.count <= 7
+    masteries = {
+        m.concept_id: m
+        for m in (await db_session.scalars(
+            select(ConceptMastery).where(ConceptMastery.student_id == "student-104")
+        )).all()
+    }
+    assert masteries["concept-104-1"].is_mastered is True
+    assert masteries["concept-104-2"].is_unlocked is True
+    assert masteries["concept-104-2"].total_attempts == 1
+    assert masteries["concept-104-3"].is_unlocked is False
+    assert "concept-104-6" not in masteries
@@ -0,0 +1,68 @@
+"""PasswordHasher 단위 테스트."""
+
+import asyncio
+
+import pytest
+
+from app.core.security import PasswordHasher, verify_password
+
+
+@pytest.fixture
+def hasher():
+    pool = PasswordHasher(max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_roundtrip(hasher):
+    hashed = await hasher.hash("password123")
+
+    assert hashed != "password123"
+    assert await hasher.verify("password123", hashed) is True
+    assert await hasher.verify("wrong-password", hashed) is False
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_event_loop(hasher):
+    """해싱 중에도 이벤트 루프의 다른 작업이 진행된다."""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    task = asyncio.create_task(ticker())
+    try:
+        await hasher.hash_many(["password123"] * 4)
+    finally:
+        task.cancel()
+
+    assert ticks > 1
+
+
+@pytest.mark.asyncio
+async def test_hash_many_keeps_order_and_tracks_queue(hasher):
+    passwords = [f"password-{i}" for i in range(6)]
+    hashes = await hasher.hash_many(passwords)
+
+    assert all(verify_password(p, h) for p, h in zip(passwords, hashes))
+    metrics = hasher.metrics()
+    assert metrics["submitted"] == metrics["completed"] == 6
+    assert metrics["queued"] == metrics["running"] == 0
+    # 워커 2개에 6건 동시 제출 → 대기열이 생김
+    assert metrics["max_queue_depth"] >= 3
+    assert metrics["max_workers"] == 2
+
+    hasher.reset_metrics()
+    assert hasher.metrics()["submitted"] == 0
+
+
+def test_hash_many_sync(hasher):
+    hashes = hasher.hash_many_sync(["a-password", "b-password"])
+
+    assert verify_password("a-password", hashes[0])
+    assert verify_password("b-password", hashes[1])
+    assert hashes[0] != hashes[1]
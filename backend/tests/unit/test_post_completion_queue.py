@@ -0,0 +1,143 @@
+"""PostCompletionQueue 단위 테스트."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.database import session_factory_for
+from app.models.post_completion_job import PostCompletionJob
+from app.models.test_attempt import TestAttempt
+from app.models.user import User
+from app.services import post_completion_queue as pcq
+from app.services.post_completion_queue import PostCompletionQueue
+
+
+async def _seed(db_session) -> TestAttempt:
+    db_session.add(User(
+        id="s1", login_id="s1", name="학생1", role="student",
+        grade="middle_1", hashed_password="x", is_active=True,
+        level=1, total_xp=0, current_streak=0, max_streak=0,
+    ))
+    attempt = TestAttempt(
+        id="att1", test_id="t1", student_id="s1",
+        score=100, max_score=100, correct_count=10, total_count=10,
+        xp_earned=50, combo_max=0, completed_at=datetime.now(timezone.utc),
+    )
+    db_session.add(attempt)
+    await db_session.commit()
+    return attempt
+
+
+@pytest.mark.asyncio
+async def test_queue_runs_steps_in_background(db_session):
+    """등록 즉시 pending을 반환하고, 워커가 모든 단계를 처리한다."""
+    attempt = await _seed(db_session)
+    queue = PostCompletionQueue()
+
+    job = await queue.enqueue(attempt, grade="middle_1", session_factory=session_factory_for(db_session))
+    assert job["status"] == "pending"
+
+    await queue.drain()
+    assert job["status"] == "completed"
+    assert job["steps_completed"] == [name for name, _ in pcq.STEPS]
+
+    # 같은 시도 재등록은 기존 작업 반환
+    again = await queue.enqueue(attempt, grade="middle_1", session_factory=session_factory_for(db_session))
+    assert again is job
+
+
+@pytest.mark.asyncio
+async def test_failed_step_is_retried_without_repeating_done_steps(db_session, monkeypatch):
+    """실패한 단계만 재시도하고 이미 완료된 단계는 다시 실행하지 않는다."""
+    attempt = await _seed(db_session)
+    calls = {"first": 0, "flaky": 0}
+
+    async def _first(db, job):
+        calls["first"] += 1
+
+    async def _flaky(db, job):
+        calls["flaky"] += 1
+        if calls["flaky"] < 2:
+            raise RuntimeError("일시적 오류")
+
+    monkeypatch.setattr(pcq, "STEPS", [("first", _first), ("flaky", _flaky)])
+    queue = PostCompletionQueue(eager=True, backoff_seconds=0)
+
+    job = await queue.enqueue(attempt, grade=None, session_factory=session_factory_for(db_session))
+
+    assert job["status"] == "completed"
+    assert job["tries"] == 2
+    assert calls == {"first": 1, "flaky": 2}
+
+
+@pytest.mark.asyncio
+async def test_job_fails_after_max_retries(db_session, monkeypatch):
+    """최대 재시도 초과 시 failed로 기록하고, 재등록하면 다시 시도한다."""
+    attempt = await _seed(db_session)
+
+    async def _broken(db, job):
+        raise RuntimeError("영구 오류")
+
+    monkeypatch.setattr(pcq, "STEPS", [("broken", _broken)])
+    queue = PostCompletionQueue(eager=True, max_retries=2, backoff_seconds=0)
+
+    job = await queue.enqueue(attempt, grade=None, session_factory=session_factory_for(db_session))
+    assert job["status"] == "failed"
+    assert job["error"] == "영구 오류"
+
+    retry = await queue.enqueue(attempt, grade=None, session_factory=session_factory_for(db_session))
+    assert retry is not job
+    assert queue.get("att1") is retry
+
+
+@pytest.mark.asyncio
+async def test_job_state_is_persisted(db_session, monkeypatch):
+    """작업 상태와 완료 단계가 post_completion_jobs 행에 기록된다."""
+    attempt = await _seed(db_session)
+
+    async def _noop(db, job):
+        pass
+
+    monkeypatch.setattr(pcq, "STEPS", [("a", _noop), ("b", _noop)])
+    queue = PostCompletionQueue(eager=True)
+    await queue.enqueue(attempt, grade="middle_1", session_factory=session_factory_for(db_session))
+
+    row = await db_session.get(PostCompletionJob, "att1", populate_existing=True)
+    assert row.status == "completed"
+    assert row.steps_completed == ["a", "b"]
+    assert row.tries == 1
+    assert row.mission_counts["perfect_score"] == 1
+
+    # 새 프로세스(메모리 기록 없음)에서 재등록해도 다시 실행하지 않음
+    fresh = PostCompletionQueue(eager=True)
+    job = await fresh.enqueue(attempt, grade="middle_1", session_factory=session_factory_for(db_session))
+    assert job["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_recover_resumes_unfinished_jobs(db_session, monkeypatch):
+    """재시작 시 끝나지 않은 작업을 다시 처리하되, 완료 기록된 단계는 건너뛴다."""
+    await _seed(db_session)
+    db_session.add(PostCompletionJob(
+        attempt_id="att1", student_id="s1", grade="middle_1", status="running",
+        mission_counts={"complete_tests": 1}, steps_completed=["a"], tries=1,
+    ))
+    await db_session.commit()
+    calls: list[str] = []
+
+    async def _a(db, job):
+        calls.append("a")
+
+    async def _b(db, job):
+        calls.append("b")
+
+    monkeypatch.setattr(pcq, "STEPS", [("a", _a), ("b", _b)])
+    queue = PostCompletionQueue(eager=True)
+
+    assert await queue.recover(session_factory_for(db_session)) == 1
+    assert calls == ["b"]
+    assert queue.get("att1")["status"] == "completed"
+
+    row = await db_session.get(PostCompletionJob, "att1", populate_existing=True)
+    assert row.status == "completed"
+    assert row.steps_completed == ["a", "b"]
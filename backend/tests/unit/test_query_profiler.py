@@ -0,0 +1,63 @@
+"""QueryProfiler 단위 테스트."""
+
+import pytest
+from fastapi.routing import APIRoute
+from sqlalchemy import select
+
+from app.core.query_profiler import SLOWEST_KEPT, QueryProfiler, QueryStats, _route_template
+from app.models.user import User
+
+
+@pytest.fixture
+def profiler(db_session):
+    profiler = QueryProfiler(slow_query_ms=10_000)
+    profiler.install(db_session.bind)
+    yield profiler
+    profiler.uninstall()
+
+
+@pytest.mark.asyncio
+async def test_track_counts_statements_in_scope(db_session, profiler):
+    await db_session.execute(select(User))  # 구간 밖 쿼리는 집계 안 됨
+
+    with profiler.track() as stats:
+        await db_session.execute(select(User))
+        await db_session.execute(select(User.id).where(User.login_id == "nobody"))
+
+    assert stats.count == 2
+    assert stats.total_ms > 0
+    assert len(stats.slowest) == 2
+    assert all(statement.startswith("SELECT users.") for _, statement in stats.slowest)
+
+
+def test_record_route_aggregates_and_keeps_slowest():
+    profiler = QueryProfiler()
+    light = QueryStats()
+    light.record(1.0, "SELECT 1")
+    heavy = QueryStats()
+    for i in range(SLOWEST_KEPT + 3):
+        heavy.record(float(i), f"SELECT {i}")
+
+    profiler.record_route("GET /light", light)
+    profiler.record_route("GET /heavy", heavy)
+    profiler.record_route("GET /heavy", light)
+
+    metrics = profiler.metrics()
+    assert list(metrics) == ["GET /heavy", "GET /light"]
+    heavy_metrics = metrics["GET /heavy"]
+    assert heavy_metrics["requests"] == 2
+    assert heavy_metrics["max_statements"] == SLOWEST_KEPT + 3
+    assert heavy_metrics["avg_statements"] == (SLOWEST_KEPT + 4) / 2
+    assert len(heavy_metrics["slowest"]) == SLOWEST_KEPT
+    assert heavy_metrics["slowest"][0]["statement"] == f"SELECT {SLOWEST_KEPT + 2}"
+
+    profiler.reset()
+    assert profiler.metrics() == {}
+
+
+@pytest.mark.parametrize("route_path", ["/tests/{test_id}", "/api/v1/tests/{test_id}"])
+def test_route_template_includes_router_prefix(route_path):
+    """라우트 경로에 prefix가 없어도 요청 경로에서 복원한다."""
+    route = APIRoute(route_path, lambda test_id: None)
+    scope = {"route": route, "path": "/api/v1/tests/t1", "path_params": {"test_id": "t1"}}
+    assert _route_template(scope) == "/api/v1/tests/{test_id}"
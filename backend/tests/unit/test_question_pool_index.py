@@ -0,0 +1,222 @@
+"""QuestionPoolIndex 단위 테스트."""
+
+import pytest
+from sqlalchemy import event
+
+from app.models.concept import Concept
+from app.models.question import Question
+from app.models.test import Test
+from app.services.adaptive_service import AdaptiveService
+from app.services.question_pool_index import QuestionPoolIndex, question_pool_index
+
+
+def _question(qid: str, difficulty: int, concept_id: str = "concept-001", is_active: bool = True) -> Question:
+    return Question(
+        id=qid,
+        concept_id=concept_id,
+        category="concept",
+        part="algebra",
+        question_type="multiple_choice",
+        difficulty=difficulty,
+        content=f"문제 {qid}",
+        options=[],
+        correct_answer="A",
+        explanation="",
+        points=10,
+        is_active=is_active,
+    )
+
+
+async def _seed(db_session, questions: list[Question]) -> Test:
+    db_session.add(Concept(
+        id="concept-001", name="일차방정식", grade="middle_1", category="concept", part="algebra",
+    ))
+    for q in questions:
+        db_session.add(q)
+    test = Test(
+        id="test-001",
+        title="적응형",
+        grade="middle_1",
+        concept_ids=["concept-001"],
+        question_ids=[],
+        question_count=5,
+        is_adaptive=True,
+    )
+    db_session.add(test)
+    await db_session.commit()
+    return test
+
+
+class TestQuestionPoolIndexPure:
+    """DB 없이 인덱스 자료구조 동작 확인."""
+
+    def test_change_events_ignored_for_unloaded_concept(self):
+        index = QuestionPoolIndex()
+        index.on_question_changed("q-1", "c-1", 5, "concept", True)
+        assert index.get_pool(["c-1"], 5) == []
+
+    def test_deactivation_removes_from_pool(self):
+        index = QuestionPoolIndex()
+        index._pools["c-1"] = {}
+        index.on_question_changed("q-1", "c-1", 5, "concept", True)
+        assert index.get_pool(["c-1"], 5, test_key="t") == ["q-1"]
+
+        index.on_question_changed("q-1", "c-1", 5, "concept", False)
+        assert index.get_pool(["c-1"], 5, test_key="t") == []
+
+    def test_difficulty_change_moves_bucket(self):
+        index = QuestionPoolIndex()
+        index._pools["c-1"] = {}
+        index.on_question_changed("q-1", "c-1", 5, "concept", True)
+        index.on_question_changed("q-1", "c-1", 7, "concept", True)
+        assert index.get_pool(["c-1"], 5) == []
+        assert index.get_pool(["c-1"], 7) == ["q-1"]
+
+
+@pytest.mark.asyncio
+async def test_ensure_loaded_reads_active_questions_once(db_session):
+    """개념 풀은 최초 한 번만 로드되고 비활성 문제는 제외."""
+    await _seed(db_session, [
+        _question("q-001", 5),
+        _question("q-002", 5),
+        _question("q-003", 7, is_active=False),
+    ])
+
+    statements: list[str] = []
+    sync_engine = db_session.bind.sync_engine
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", _count)
+    try:
+        await question_pool_index.ensure_loaded(db_session, ["concept-001"])
+        await question_pool_index.ensure_loaded(db_session, ["concept-001"])
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _count)
+
+    assert len(statements) == 1
+    assert sorted(question_pool_index.get_pool(["concept-001"], 5)) == ["q-001", "q-002"]
+    assert question_pool_index.get_pool(["concept-001"], 7) == []
+
+
+@pytest.mark.asyncio
+async def test_index_tracks_orm_activation_changes(db_session):
+    """문제 추가/비활성화가 ORM 이벤트로 인덱스에 반영."""
+    await _seed(db_session, [_question("q-001", 5)])
+    await question_pool_index.ensure_loaded(db_session, ["concept-001"])
+
+    db_session.add(_question("q-002", 5))
+    await db_session.commit()
+    assert sorted(question_pool_index.get_pool(["concept-001"], 5)) == ["q-001", "q-002"]
+
+    q1 = await db_session.get(Question, "q-001")
+    q1.is_active = False
+    await db_session.commit()
+    assert question_pool_index.get_pool(["concept-001"], 5) == ["q-002"]
+
+
+@pytest.mark.asyncio
+async def test_index_ignores_rolled_back_changes(db_session):
+    """롤백된 문제 추가/비활성화는 인덱스에 반영되지 않는다."""
+    await _seed(db_session, [_question("q-001", 5)])
+    await question_pool_index.ensure_loaded(db_session, ["concept-001"])
+
+    db_session.add(_question("q-002", 5))
+    q1 = await db_session.get(Question, "q-001")
+    q1.is_active = False
+    await db_session.flush()
+    await db_session.rollback()
+
+    assert question_pool_index.get_pool(["concept-001"], 5) == ["q-001"]
+
+
+@pytest.mark.asyncio
+async def test_select_closest_question_skips_stale_index_entry(db_session):
+    """인덱스에 남은 삭제된 문제는 건너뛰고 인덱스에서 제거."""
+    test = await _seed(db_session, [_question("q-001", 6)])
+    await question_pool_index.ensure_loaded(db_session, ["concept-001"])
+    # 목표 난이도의 유일한 후보가 삭제된 문제 → 반드시 먼저 선택됨
+    question_pool_index.on_question_changed("q-ghost", "concept-001", 5, "concept", True)
+
+    service = AdaptiveService(db_session)
+    question = await service._select_closest_question(test, 5, exclude_ids=[])
+    assert question is not None
+    assert question.id == "q-001"
+
+    assert question_pool_index.get_pool(["concept-001"], 5) == []
+    assert question_pool_index.get_pool(["concept-001"], 6) == ["q-001"]
+
+
+@pytest.mark.asyncio
+async def test_select_closest_question_expands_spread(db_session):
+    """목표 난이도에 문제가 없으면 가장 가까운 난이도에서 선택."""
+    test = await _seed(db_session, [_question("q-001", 2), _question("q-002", 9)])
+
+    service = AdaptiveService(db_session)
+    question = await service._select_closest_question(test, 8, exclude_ids=[])
+    assert question.id == "q-002"
+
+    question = await service._select_closest_question(test, 8, exclude_ids=["q-002"])
+    assert question.id == "q-001"
+
+    assert await service._select_closest_question(test, 8, exclude_ids=["q-001", "q-002"]) is None
+
+
+@pytest.mark.asyncio
+async def test_get_questions_returns_metadata_only(db_session):
+    """출제 선택용 메타데이터는 본문 없이 유형/카테고리를 담고 변경 이벤트를 따른다."""
+    await _seed(db_session, [_question("q-001", 5), _question("q-002", 8)])
+    await question_pool_index.ensure_loaded(db_session, ["concept-001"])
+
+    metas = sorted(question_pool_index.get_questions(["concept-001"]))
+    assert [(m.id, m.difficulty, m.category, m.question_type) for m in metas] == [
+        ("q-001", 5, "concept", "multiple_choice"),
+        ("q-002", 8, "concept", "multiple_choice"),
+    ]
+
+    q2 = await db_session.get(Question, "q-002")
+    q2.question_type = "fill_in_blank"
+    await db_session.commit()
+    metas = {m.id: m for m in question_pool_index.get_questions(["concept-001"])}
+    assert metas["q-002"].question_type == "fill_in_blank"
+
+
+def test_get_pool_filters_category_per_view():
+    """category를 주면 같은 테스트 키라도 카테고리별 뷰를 따로 만든다."""
+    index = QuestionPoolIndex()
+    index._pools["c-1"] = {}
+    index.on_question_changed("q-1", "c-1", 5, "concept", True)
+    index.on_question_changed("q-2", "c-1", 5, "computation", True)
+
+    assert index.get_pool(["c-1"], 5, test_key="t", category="computation") == ["q-2"]
+    assert sorted(index.get_pool(["c-1"], 5, test_key="t")) == ["q-1", "q-2"]
+
+
+def test_test_views_invalidate_per_concept():
+    """다른 개념의 문제 변경은 캐시된 뷰를 버리지 않고, 같은 개념의 변경만 뷰를 다시 만든다."""
+    index = QuestionPoolIndex()
+    index._pools["c-1"] = {}
+    index._pools["c-2"] = {}
+    index.on_question_changed("q-1", "c-1", 5, "concept", True)
+
+    view = index._get_test_view(["c-1"], "t")
+    index.on_question_changed("q-2", "c-2", 5, "concept", True)
+    assert index._get_test_view(["c-1"], "t") is view
+
+    index.on_question_changed("q-3", "c-1", 5, "concept", True)
+    assert sorted(index.get_pool(["c-1"], 5, test_key="t")) == ["q-1", "q-3"]
+
+
+def test_test_views_are_bounded(monkeypatch):
+    """테스트별 뷰 캐시는 LRU로 최대 개수를 넘지 않는다."""
+    from app.services import question_pool_index as module
+
+    monkeypatch.setattr(module, "MAX_TEST_VIEWS", 2)
+    index = QuestionPoolIndex()
+    index._pools["c-1"] = {}
+    index.on_question_changed("q-1", "c-1", 5, "concept", True)
+
+    for key in ("a", "b", "a", "c"):
+        index.get_pool(["c-1"], 5, test_key=key)
+    assert list(index._test_views) == [("a", ("c-1",), None), ("c", ("c-1",), None)]
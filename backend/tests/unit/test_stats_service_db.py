@@ -497,6 +497,76 @@ class TestGetClassStats:
             assert day_stat["average_accuracy"] == 80.0
 
 
+class TestGetStudentsSummary:
+    """Tests for get_students_summary method."""
+
+    async def _add_students(self, db_session, count: int) -> None:
+        for i in range(count):
+            db_session.add(User(
+                id=f"sum-s{i}", login_id=f"sum-s{i}", name=f"요약학생{i:02d}", role="student",
+                grade="middle_1", class_id="c1",
+                hashed_password="x", is_active=True,
+                level=1, total_xp=0, current_streak=0, max_streak=0,
+            ))
+            db_session.add(TestAttempt(
+                id=f"sum-att{i}", test_id="t1", student_id=f"sum-s{i}",
+                score=70, max_score=100, correct_count=7, total_count=10,
+                xp_earned=10, completed_at=datetime.now(timezone.utc),
+            ))
+        await db_session.commit()
+
+    async def _count_queries(self, db_session, coro_factory):
+        from sqlalchemy import event
+
+        statements: list[str] = []
+        sync_engine = db_session.bind.sync_engine
+
+        def _count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(sync_engine, "before_cursor_execute", _count)
+        try:
+            result = await coro_factory()
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _count)
+        return result, len(statements)
+
+    async def test_summary_aggregates_per_student(
+        self, db_session, stats_service, base_stats_data
+    ):
+        """Per-student tests_completed/accuracy come from the grouped aggregate."""
+        await self._add_students(db_session, 2)
+
+        items, total = await stats_service.get_students_summary(teacher_id="t1")
+
+        assert total == 3
+        by_id = {item["user_id"]: item for item in items}
+        assert by_id["sum-s0"]["tests_completed"] == 1
+        assert by_id["sum-s0"]["accuracy_rate"] == 70.0
+        assert by_id["sum-s0"]["class_name"] == "1반"
+        assert by_id["s1"]["tests_completed"] == 0
+        assert by_id["s1"]["accuracy_rate"] == 0.0
+
+    async def test_summary_query_count_independent_of_page_size(
+        self, db_session, stats_service, base_stats_data
+    ):
+        """Query count stays constant as the page grows (no per-student queries)."""
+        await self._add_students(db_session, 30)
+
+        small, small_queries = await self._count_queries(
+            db_session, lambda: stats_service.get_students_summary(teacher_id="t1", page_size=5)
+        )
+        large, large_queries = await self._count_queries(
+            db_session, lambda: stats_service.get_students_summary(teacher_id="t1", page_size=30)
+        )
+
+        assert len(small[0]) == 5
+        assert len(large[0]) == 30
+        assert large_queries == small_queries
+        # 반 + 강사(selectin) + 개수 + 페이지 학생 + 학생 반(selectin) + 페이지 학생 집계
+        assert large_queries <= 6
+
+
 class TestGetConceptStats:
     """Tests for get_concept_stats method."""
 
@@ -656,6 +726,46 @@ class TestGetConceptStats:
         assert result == []
 
 
+    async def test_get_concept_stats_single_grouped_query_and_snapshot(
+        self, db_session, stats_service, base_stats_data
+    ):
+        """Aggregation is one grouped query; a repeat call is served from the snapshot."""
+        from sqlalchemy import event
+
+        now = datetime.now(timezone.utc)
+        db_session.add(TestAttempt(
+            id="att1", test_id="t1", student_id="s1",
+            score=10, max_score=10, correct_count=1, total_count=1,
+            xp_earned=5, started_at=now, completed_at=now,
+        ))
+        db_session.add(AnswerLog(
+            attempt_id="att1", question_id="q1",
+            selected_answer="A", is_correct=True,
+            points_earned=10, time_spent_seconds=12,
+        ))
+        await db_session.commit()
+
+        statements: list[str] = []
+        sync_engine = db_session.bind.sync_engine
+
+        def _count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(sync_engine, "before_cursor_execute", _count)
+        try:
+            first = await stats_service.get_concept_stats("t1")
+            first_count = len(statements)
+            second = await stats_service.get_concept_stats("t1")
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _count)
+
+        grouped = [stmt for stmt in statements if "GROUP BY" in stmt]
+        assert len(grouped) == 1
+        assert len(statements) == first_count  # 스냅샷 재사용
+        assert first == second
+        assert first[0]["average_time_seconds"] == 12.0
+
+
 class TestGetStudentQuotaProgress:
     """Tests for get_student_quota_progress method."""
 
@@ -913,3 +1023,122 @@ class TestGetClassQuotaProgress:
 
         result = await stats_service.get_class_quota_progress("c2")
         assert result == []
+
+
+class TestDailyStatsRollup:
+    """Tests for the student_daily_stats rollup maintained on attempt completion."""
+
+    async def test_completion_updates_rollup(
+        self, db_session, stats_service, base_stats_data
+    ):
+        """Completing an attempt adds tests/questions/correct/time to the KST day row."""
+        from app.models.student_daily_stat import StudentDailyStat
+        from app.services.daily_stats_service import kst_date_str
+
+        now = datetime.now(timezone.utc)
+        attempt = TestAttempt(
+            id="att-roll", test_id="t1", student_id="s1",
+            score=0, max_score=100, correct_count=0, total_count=10,
+            xp_earned=0, started_at=now - timedelta(minutes=5),
+        )
+        db_session.add(attempt)
+        db_session.add(AnswerLog(
+            attempt_id="att-roll", question_id="q1",
+            selected_answer="A", is_correct=True,
+            points_earned=10, time_spent_seconds=25,
+        ))
+        await db_session.commit()
+        assert (await db_session.scalars(select(StudentDailyStat))).all() == []
+
+        attempt.correct_count = 7
+        attempt.completed_at = now
+        await db_session.commit()
+
+        # 완료 후 정답 정정은 변경분만 반영
+        attempt.correct_count = 8
+        await db_session.commit()
+
+        row = await db_session.scalar(select(StudentDailyStat))
+        assert row.date == kst_date_str(now - timedelta(minutes=5))
+        assert row.tests_completed == 1
+        assert row.questions_answered == 10
+        assert row.correct_count == 8
+        assert row.time_spent_seconds == 25
+
+        await db_session.delete(attempt)
+        await db_session.commit()
+        await db_session.refresh(row)
+        assert row.tests_completed == 0
+        assert row.time_spent_seconds == 0
+
+    async def test_same_day_completions_upsert_one_row(
+        self, db_session, stats_service, base_stats_data
+    ):
+        """Same-day completions accumulate into one row through a single upsert each."""
+        from sqlalchemy import event
+
+        from app.models.student_daily_stat import StudentDailyStat
+
+        now = datetime.now(timezone.utc)
+        statements: list[str] = []
+        sync_engine = db_session.bind.sync_engine
+
+        def _count(conn, cursor, statement, *args):
+            if "student_daily_stats" in statement:
+                statements.append(statement)
+
+        event.listen(sync_engine, "before_cursor_execute", _count)
+        try:
+            for i in range(2):
+                db_session.add(TestAttempt(
+                    id=f"att-same{i}", test_id="t1", student_id="s1",
+                    score=50, max_score=100, correct_count=i + 1, total_count=5,
+                    xp_earned=0, started_at=now, completed_at=now,
+                ))
+                await db_session.commit()
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _count)
+
+        assert len(statements) == 2
+        assert all("ON CONFLICT" in statement for statement in statements)
+        rows = (await db_session.scalars(select(StudentDailyStat))).all()
+        assert len(rows) == 1
+        assert rows[0].tests_completed == 2
+        assert rows[0].questions_answered == 10
+        assert rows[0].correct_count == 3
+
+    async def test_daily_activity_reads_rollup_in_one_query(
+        self, db_session, stats_service, base_stats_data
+    ):
+        """Daily series for 7 days is served by a single range query."""
+        from sqlalchemy import event
+
+        base_date = datetime.now(timezone.utc).date()
+        for i in range(3):
+            day_start, _ = _kst_day_utc_range(base_date - timedelta(days=i))
+            db_session.add(TestAttempt(
+                id=f"att{i}", test_id="t1", student_id="s1",
+                score=50, max_score=100, correct_count=5, total_count=10,
+                xp_earned=20, started_at=day_start + timedelta(hours=1),
+                completed_at=day_start + timedelta(hours=2),
+            ))
+        await db_session.commit()
+
+        statements: list[str] = []
+        sync_engine = db_session.bind.sync_engine
+
+        def _count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(sync_engine, "before_cursor_execute", _count)
+        try:
+            series = await stats_service._get_daily_series(["s1"], 7)
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _count)
+
+        assert len(statements) == 1
+        assert len(series) == 7
+        assert sum(totals["tests_completed"] for _, totals in series) == 3
+
+        trend = await stats_service.get_learning_trend("s1", days=7)
+        assert sum(d["solved"] for d in trend) == 30
@@ -7,7 +7,8 @@ from app.models.answer_log import AnswerLog
 from app.models.class_ import Class
 from app.models.test_attempt import TestAttempt
 from app.models.user import User
-from app.schemas.auth import UserUpdate
+from app.core.security import verify_password
+from app.schemas.auth import RegisterRequest, UserUpdate
 from app.schemas.common import Grade, UserRole
 from app.services.student_service import StudentService
 
@@ -716,3 +717,44 @@ async def test_reset_test_history_not_found(db_session):
 
     # Then: False 반환
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_create_students_bulk(db_session):
+    """create_students_bulk: 중복 아이디는 실패 처리, 나머지는 병렬 해싱 후 일괄 생성."""
+    # Given: 이미 존재하는 학생 1명
+    db_session.add(User(
+        id="student-existing",
+        login_id="existing01",
+        name="기존 학생",
+        role=UserRole.STUDENT,
+        grade=Grade.MIDDLE_1,
+        hashed_password="hashed",
+    ))
+    await db_session.commit()
+
+    def _request(login_id: str, password: str) -> RegisterRequest:
+        return RegisterRequest(
+            login_id=login_id, password=password, name=f"학생 {login_id}",
+            role=UserRole.STUDENT, grade=Grade.MIDDLE_1,
+        )
+
+    requests = [
+        _request("bulk01", "password01"),
+        _request("existing01", "password02"),
+        _request("bulk02", "password03"),
+        _request("bulk01", "password04"),  # 요청 내 중복
+    ]
+
+    # When
+    service = StudentService(db_session)
+    students, failed = await service.create_students_bulk(requests)
+
+    # Then
+    assert [s.login_id for s in students] == ["bulk01", "bulk02"]
+    assert all(s.role == UserRole.STUDENT for s in students)
+    assert all(s.created_at is not None for s in students)
+    assert verify_password("password01", students[0].hashed_password)
+    assert verify_password("password03", students[1].hashed_password)
+    assert [f["login_id"] for f in failed] == ["existing01", "bulk01"]
+    assert {f["code"] for f in failed} == {"LOGIN_ID_ALREADY_EXISTS"}
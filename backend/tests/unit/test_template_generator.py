@@ -0,0 +1,52 @@
+"""TemplateGenerator 단위 테스트."""
+
+import random
+
+from app.services.template_generator import TemplateGenerator, variant_seed
+from app.templates import TEMPLATE_REGISTRY
+
+CONCEPT_ID = "concept-m1-prime-02"
+
+
+def _ids(batch: list[dict]) -> list[str]:
+    return [q["id"] for q in batch]
+
+
+def test_generate_batch_is_reproducible_per_seed():
+    generator = TemplateGenerator()
+    seed = variant_seed("student-1", "2026-10-18")
+
+    first = generator.generate_batch(CONCEPT_ID, 8, seed=seed)
+    second = generator.generate_batch(CONCEPT_ID, 8, seed=seed)
+
+    assert _ids(first) == _ids(second)
+    assert variant_seed("student-1", "2026-10-18") != variant_seed("student-2", "2026-10-18")
+
+
+def test_seeded_generation_leaves_global_random_untouched():
+    """시드 생성은 전역 random 상태를 바꾸지 않는다."""
+    state = random.getstate()
+    TemplateGenerator().generate_for_grade("middle_1", 10, seed=variant_seed("s1"))
+    assert random.getstate() == state
+
+
+def test_generate_batch_never_returns_duplicates_or_excluded():
+    """변형 공간보다 많이 요청해도 중복/제외 ID 없이 가능한 만큼만 반환."""
+    generator = TemplateGenerator()
+    excluded = set(_ids(generator.generate_batch(CONCEPT_ID, 3, seed=1)))
+
+    batch = generator.generate_batch(CONCEPT_ID, 1000, exclude_ids=excluded, seed=2)
+
+    ids = _ids(batch)
+    assert 0 < len(ids) < 1000
+    assert len(ids) == len(set(ids))
+    assert not set(ids) & excluded
+
+
+def test_generate_batch_respects_difficulty_for_every_template():
+    generator = TemplateGenerator()
+    for concept_id in TEMPLATE_REGISTRY:
+        for difficulty in generator.difficulties(concept_id):
+            batch = generator.generate_batch(concept_id, 2, difficulty=difficulty, seed=0)
+            assert batch, f"{concept_id} ({difficulty})"
+            assert {q["difficulty"] for q in batch} == {difficulty}
@@ -0,0 +1,108 @@
+"""TemplateVariantPool 단위 테스트."""
+
+import pytest
+from sqlalchemy import event, func, select
+
+from app.core.database import session_factory_for
+from app.models.concept import Concept
+from app.models.question import Question
+from app.services.question_pool_index import question_pool_index
+from app.services.template_generator import TemplateGenerator
+from app.services.template_variant_pool import (
+    BUFFER_TARGET,
+    TemplateVariantPool,
+    insert_variants,
+)
+
+CONCEPT_ID = "concept-m1-prime-02"
+
+
+async def _add_concept(db_session) -> None:
+    db_session.add(Concept(
+        id=CONCEPT_ID, name="소인수분해", grade="middle_1",
+        category="computation", part="calc",
+    ))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_insert_variants_skips_existing_ids(db_session):
+    """기존 ID는 ON CONFLICT DO NOTHING으로 건너뛰고 새 ID만 반환."""
+    await _add_concept(db_session)
+    await question_pool_index.ensure_loaded(db_session, [CONCEPT_ID])
+    generator = TemplateGenerator()
+    first = generator.generate_batch(CONCEPT_ID, 3, difficulty=3)
+
+    assert await insert_variants(db_session, first) == [v["id"] for v in first]
+
+    second = first[:2] + generator.generate_batch(
+        CONCEPT_ID, 1, difficulty=3, exclude_ids={v["id"] for v in first},
+    )
+    assert await insert_variants(db_session, second) == [second[2]["id"]]
+
+    total = await db_session.scalar(select(func.count()).select_from(Question))
+    assert total == 4
+    # Core INSERT도 커밋 시 문제 풀 인덱스에 반영
+    assert question_pool_index.get_pool([CONCEPT_ID], 3) == []
+    await db_session.commit()
+    assert len(question_pool_index.get_pool([CONCEPT_ID], 3)) == 4
+
+
+@pytest.mark.asyncio
+async def test_claim_generates_inline_then_serves_from_buffer(db_session):
+    """버퍼가 비면 즉시 생성, 보충 후에는 DB 작업 없이 버퍼에서 꺼냄."""
+    await _add_concept(db_session)
+    pool = TemplateVariantPool(background_refill=False)
+
+    inline_ids = await pool.claim(db_session, "middle_1", 3, available_concept_ids=[CONCEPT_ID])
+    await db_session.commit()
+    assert len(set(inline_ids)) == 3
+    stored = (await db_session.scalars(
+        select(Question.id).where(Question.id.in_(inline_ids))
+    )).all()
+    assert set(stored) == set(inline_ids)
+
+    difficulties = TemplateGenerator().difficulties(CONCEPT_ID)
+    added = await pool.refill(
+        session_factory_for(db_session), [(CONCEPT_ID, d) for d in difficulties],
+    )
+    assert added > 0
+    assert pool.buffered(CONCEPT_ID, difficulties[0]) <= BUFFER_TARGET
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        claimed = await pool.claim(
+            db_session, "middle_1", 3,
+            available_concept_ids=[CONCEPT_ID], exclude_ids=set(inline_ids),
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(claimed) == 3
+    assert not set(claimed) & set(inline_ids)
+    assert statements == []
+    assert pool.metrics()["claimed_from_buffer"] == 3
+
+
+@pytest.mark.asyncio
+async def test_discard_removes_deactivated_variant(db_session):
+    """비활성화된 변형은 버퍼에서 제거."""
+    from app.services.template_variant_pool import template_variant_pool
+
+    await _add_concept(db_session)
+    await template_variant_pool.refill(session_factory_for(db_session), [(CONCEPT_ID, 3)])
+    buffered = template_variant_pool.buffered(CONCEPT_ID, 3)
+    assert buffered > 0
+
+    qid = template_variant_pool._buffers[(CONCEPT_ID, 3)][0]
+    question = await db_session.get(Question, qid)
+    question.is_active = False
+    await db_session.commit()
+
+    assert template_variant_pool.buffered(CONCEPT_ID, 3) == buffered - 1
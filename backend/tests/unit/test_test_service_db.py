@@ -720,3 +720,64 @@ class TestGetAvailableTestsFiltering:
         # Placement test should appear
         test_ids = [r["test"].id if hasattr(r["test"], "id") else r["test"]["id"] for r in results]
         assert "placement1" in test_ids
+
+    @pytest.mark.asyncio
+    async def test_paginates_and_memoizes_auto_tests_until_unlock(self, db_session):
+        """페이지 분량만 반환하고, 필터링된 목록은 해금 현황/카탈로그가 바뀔 때까지 재사용한다."""
+        from app.services.mastery_service import MasteryService
+        from app.services.unlock_frontier import unlock_frontier
+
+        db_session.add(User(
+            id="s4", login_id="s4", name="학생4", role="student", grade="middle_1",
+            hashed_password="x", is_active=True, level=1, total_xp=0,
+            current_streak=0, max_streak=0
+        ))
+        for cid in ("c1", "c2"):
+            db_session.add(Concept(id=cid, name=cid, grade="middle_1", category="concept", part="algebra"))
+            for i in range(12):
+                db_session.add(Question(
+                    id=f"{cid}-q{i}", concept_id=cid, category="concept", part="algebra",
+                    question_type="multiple_choice", difficulty=i % 10 + 1, content="문제",
+                    options=[{"id": "1", "label": "A", "text": "1"}], correct_answer="A", points=10,
+                ))
+        db_session.add(Chapter(
+            id="ch1", name="1. 단원", grade="middle_1", semester=1,
+            chapter_number=1, concept_ids=["c1", "c2"]
+        ))
+        db_session.add(ChapterProgress(student_id="s4", chapter_id="ch1", is_unlocked=True))
+        db_session.add(ConceptMastery(student_id="s4", concept_id="c1", is_unlocked=True))
+        for i, concept_ids in enumerate([["c1"], ["c1"], ["c1"], ["c2"]]):
+            db_session.add(Test(
+                id=f"t{i}", title=f"테스트{i}", grade="middle_1", concept_ids=concept_ids,
+                question_ids=[f"{concept_ids[0]}-q0"], question_count=1, is_active=True,
+            ))
+        await db_session.commit()
+
+        service = TestService(db_session)
+        results, total = await service.get_available_tests("s4", "middle_1", page=1, page_size=2)
+        assert total == 4  # 누적 종합시험 + t0~t2 (t3는 c2 미해금)
+        assert len(results) == 2
+        cumulative = results[0]["test"]
+        assert cumulative["id"].startswith("auto-cumulative-")
+
+        _, total = await service.get_available_tests("s4", "middle_1", page=2, page_size=2)
+        assert total == 4
+        results, _ = await service.get_available_tests("s4", "middle_1", page=1, page_size=2)
+        assert results[0]["test"]["question_ids"] == cumulative["question_ids"]
+        assert unlock_frontier.metrics()["derived_hits"] == 2
+
+        # 테스트 추가 → 카탈로그 버전이 바뀌어 목록 재계산
+        db_session.add(Test(
+            id="t4", title="테스트4", grade="middle_1", concept_ids=["c1"],
+            question_ids=["c1-q1"], question_count=1, is_active=True,
+        ))
+        await db_session.commit()
+        _, total = await service.get_available_tests("s4", "middle_1", page=1, page_size=2)
+        assert total == 5
+
+        # 다음 개념 해금 → t3 노출, 누적 종합시험 재생성
+        await MasteryService(db_session).unlock_next_concept_in_chapter("s4", "c1")
+        await db_session.commit()
+        results, total = await service.get_available_tests("s4", "middle_1", page=1, page_size=10)
+        assert total == 6
+        assert set(results[0]["test"]["concept_ids"]) == {"c1", "c2"}
@@ -0,0 +1,68 @@
+"""TokenCache 단위 테스트."""
+
+import time
+from datetime import datetime, timezone
+
+from app.schemas.auth import UserResponse
+from app.services.token_cache import TokenCache
+
+
+def _user(user_id: str = "student-1") -> UserResponse:
+    now = datetime.now(timezone.utc)
+    return UserResponse(
+        id=user_id, login_id="student01", name="학생", role="student",
+        created_at=now, updated_at=now,
+    )
+
+
+def _payload(user_id: str = "student-1", ttl: float = 600, iat: float | None = None) -> dict:
+    now = time.time()
+    return {"sub": user_id, "exp": now + ttl, "iat": now if iat is None else iat}
+
+
+def test_verified_token_hit_until_expiry():
+    cache = TokenCache()
+    cache.put("token-a", _user(), _payload())
+    cache.put("token-expired", _user(), _payload(ttl=-1))
+
+    assert cache.get("token-a").id == "student-1"
+    assert cache.get("token-expired") is None
+    assert cache.get("unknown") is None
+    assert cache.metrics()["hits"] == 1
+    assert cache.metrics()["misses"] == 2
+
+
+def test_lru_bound():
+    cache = TokenCache(max_entries=2)
+    for name in ("t1", "t2", "t3"):
+        cache.put(name, _user(), _payload())
+
+    assert cache.get("t1") is None
+    assert cache.get("t3") is not None
+    assert cache.metrics()["entries"] == 2
+
+
+def test_revoke_token_evicts_and_rejects():
+    cache = TokenCache()
+    payload = _payload()
+    cache.put("token-a", _user(), payload)
+
+    cache.revoke("token-a", payload["exp"])
+
+    assert cache.get("token-a") is None
+    assert cache.is_revoked("token-a", payload) is True
+    assert cache.is_revoked("token-b", _payload()) is False
+
+
+def test_revoke_user_rejects_only_earlier_tokens():
+    cache = TokenCache()
+    old_payload = _payload(iat=time.time() - 5)
+    cache.put("old-token", _user(), old_payload)
+    cache.put("other-user", _user("student-2"), _payload("student-2", iat=time.time() - 5))
+
+    cache.revoke_user("student-1")
+
+    assert cache.get("old-token") is None
+    assert cache.is_revoked("old-token", old_payload) is True
+    assert cache.is_revoked("new-token", _payload(iat=time.time() + 1)) is False
+    assert cache.get("other-user") is not None
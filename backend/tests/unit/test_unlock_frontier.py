@@ -0,0 +1,141 @@
+"""UnlockFrontier 단위 테스트."""
+
+import pytest
+from sqlalchemy import select
+
+from app.core.query_profiler import QueryProfiler
+from app.models.chapter import Chapter
+from app.models.chapter_progress import ChapterProgress
+from app.models.concept import Concept
+from app.models.concept_mastery import ConceptMastery
+from app.models.user import User
+from app.services.chapter_service import ChapterService
+from app.services.daily_test_service import DailyTestService
+from app.services.mastery_service import MasteryService
+from app.services.test_service import TestService
+from app.services.unlock_frontier import unlock_frontier
+
+
+async def _setup(db) -> None:
+    """학생 1명, 단원 2개(ch1 해금, ch2 잠김), ch1 첫 개념만 해금."""
+    db.add(User(
+        id="s1", login_id="s1", name="학생", role="student", grade="middle_1",
+        hashed_password="x", is_active=True, level=1, total_xp=0,
+        current_streak=0, max_streak=0,
+    ))
+    for i in range(1, 5):
+        db.add(Concept(id=f"c{i}", name=f"개념{i}", grade="middle_1", category="concept", part="algebra"))
+    db.add(Chapter(id="ch1", name="1. 단원", grade="middle_1", semester=1, chapter_number=1,
+                   concept_ids=["c1", "c2"]))
+    db.add(Chapter(id="ch2", name="2. 단원", grade="middle_1", semester=1, chapter_number=2,
+                   concept_ids=["c3", "c4"]))
+    db.add(ChapterProgress(student_id="s1", chapter_id="ch1", is_unlocked=True))
+    db.add(ConceptMastery(student_id="s1", concept_id="c1", is_unlocked=True))
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_frontier_is_shared_and_cached(db_session):
+    """두 서비스가 같은 캐시를 읽고, 두 번째 조회부터는 쿼리가 없다."""
+    await _setup(db_session)
+
+    profiler = QueryProfiler()
+    profiler.install(db_session.bind)
+    try:
+        with profiler.track() as first:
+            assert await TestService(db_session)._get_student_available_concept_ids("s1", "middle_1") == ["c1"]
+        with profiler.track() as second:
+            assert await DailyTestService(db_session)._get_student_available_concept_ids("s1", "middle_1") == ["c1"]
+    finally:
+        profiler.uninstall()
+
+    assert first.count > 0
+    assert second.count == 0
+    frontier = await unlock_frontier.get(db_session, "s1", "middle_1")
+    assert frontier.chapter_ids == {"ch1"}
+    assert frontier.chapter_concept_ids == {"c1", "c2"}
+    assert unlock_frontier.metrics()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concept_unlock_invalidates(db_session):
+    """단원 내 다음 개념 해금 시 캐시가 무효화된다."""
+    await _setup(db_session)
+    assert await unlock_frontier.available_concept_ids(db_session, "s1", "middle_1") == ["c1"]
+
+    assert await MasteryService(db_session).unlock_next_concept_in_chapter("s1", "c1") == "c2"
+    await db_session.commit()
+
+    assert sorted(await unlock_frontier.available_concept_ids(db_session, "s1", "middle_1")) == ["c1", "c2"]
+
+
+@pytest.mark.asyncio
+async def test_mastery_update_without_unlock_keeps_cache(db_session):
+    """해금 여부가 바뀌지 않는 숙련도 갱신은 캐시를 유지한다."""
+    await _setup(db_session)
+    await unlock_frontier.get(db_session, "s1", "middle_1")
+
+    mastery = await db_session.scalar(select(ConceptMastery).where(ConceptMastery.concept_id == "c1"))
+    mastery.mastery_percentage = 80
+    await db_session.commit()
+
+    assert unlock_frontier.metrics()["invalidations"] == 0
+    await unlock_frontier.get(db_session, "s1", "middle_1")
+    assert unlock_frontier.metrics()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_chapter_unlock_invalidates_and_commit_rechecks(db_session):
+    """단원 해금은 flush 시점에 무효화되고, 커밋 전에 다시 채워진 값도 커밋 시 버린다."""
+    await _setup(db_session)
+    await unlock_frontier.get(db_session, "s1", "middle_1")
+
+    db_session.add(ChapterProgress(student_id="s1", chapter_id="ch2", is_unlocked=True))
+    await db_session.flush()
+    assert unlock_frontier.metrics()["invalidations"] == 1
+
+    # 커밋 전 조회로 다시 채워진 캐시
+    frontier = await unlock_frontier.get(db_session, "s1", "middle_1")
+    assert frontier.chapter_ids == {"ch1", "ch2"}
+
+    await db_session.commit()
+    assert unlock_frontier.metrics()["invalidations"] == 2
+    assert unlock_frontier.metrics()["students"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unlock_chapter_service_invalidates(db_session):
+    """ChapterService.unlock_chapter(단원 + 첫 개념 해금)가 해금 현황에 반영된다."""
+    await _setup(db_session)
+    assert await unlock_frontier.available_concept_ids(db_session, "s1", "middle_1") == ["c1"]
+
+    assert await ChapterService(db_session).unlock_chapter("s1", "ch2")
+
+    assert sorted(await unlock_frontier.available_concept_ids(db_session, "s1", "middle_1")) == ["c1", "c3"]
+
+
+@pytest.mark.asyncio
+async def test_chapter_edit_invalidates_all(db_session):
+    """단원 구성 편집 시 전체 캐시를 비운다."""
+    await _setup(db_session)
+    db_session.add(ConceptMastery(student_id="s1", concept_id="c3", is_unlocked=True))
+    await db_session.commit()
+    assert await unlock_frontier.available_concept_ids(db_session, "s1", "middle_1") == ["c1"]
+
+    chapter = await db_session.get(Chapter, "ch1")
+    chapter.concept_ids = ["c1", "c2", "c3"]
+    await db_session.commit()
+
+    assert sorted(await unlock_frontier.available_concept_ids(db_session, "s1", "middle_1")) == ["c1", "c3"]
+    assert unlock_frontier.metrics()["students"] == 1
+
+
+@pytest.mark.asyncio
+async def test_grade_without_chapters_fallback(db_session):
+    """단원 데이터가 없는 학년: TestService는 학년 전체 개념, DailyTestService는 빈 목록."""
+    await _setup(db_session)
+    db_session.add(Concept(id="h1", name="고1 개념", grade="high_1", category="concept", part="algebra"))
+    await db_session.commit()
+
+    assert await TestService(db_session)._get_student_available_concept_ids("s1", "high_1") == ["h1"]
+    assert await DailyTestService(db_session)._get_student_available_concept_ids("s1", "high_1") == []